@@ -19,6 +19,7 @@ Purpose:
 """
 
 # Python Library Imports
+import concurrent.futures
 import json
 import logging
 import os
@@ -26,12 +27,14 @@ import paramiko
 import requests
 import shutil
 import socket
+import threading
 from functools import cached_property
 from typing import (
     Any,
     Collection,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -117,6 +120,11 @@ class RibAwsEnv:
     ANDROID_ARM_NODE_HOST_ROLE = "android-arm64-node-host"
     ANDROID_x86_NODE_HOST_ROLE = "android-x86-64-node-host"
 
+    # Maximum number of remote hosts being connected to/commanded at once
+    SSH_MAX_WORKERS = 32
+    # Interval, in seconds, between keepalive packets on cached SSH sessions
+    SSH_KEEPALIVE_INTERVAL = 30
+
     ###
     # Static/class methods
     ###
@@ -475,6 +483,9 @@ class RibAwsEnv:
         self.metadata = metadata
 
         self._ssh_clients: Dict[str, paramiko.SSHClient] = {}
+        self._ssh_client_locks: Dict[str, threading.Lock] = {}
+        self._ssh_clients_lock = threading.Lock()
+        self._ssh_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
 
     ###
     # Internal helper methods
@@ -500,16 +511,65 @@ class RibAwsEnv:
             SSH client
         """
         key = f"{username}@{hostname}:{port}"
-        if (key not in self._ssh_clients) or not ssh_utils.check_ssh_client_connected(
-            self._ssh_clients[key]
-        ):
-            self._ssh_clients[key] = ssh_utils.connect_ssh_client(
-                hostname=hostname,
-                port=port,
-                ssh_key=self._ssh_key,
-                username=username,
-            )
-        return self._ssh_clients[key]
+        # Hold a per-host lock so concurrent callers share one session per host without
+        # serializing connection setup across different hosts
+        with self._ssh_clients_lock:
+            key_lock = self._ssh_client_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if (
+                key not in self._ssh_clients
+            ) or not ssh_utils.check_ssh_client_connected(self._ssh_clients[key]):
+                self._ssh_clients[key] = ssh_utils.connect_ssh_client(
+                    hostname=hostname,
+                    port=port,
+                    ssh_key=self._ssh_key,
+                    username=username,
+                    keepalive_interval=self.SSH_KEEPALIVE_INTERVAL,
+                )
+            return self._ssh_clients[key]
+
+    def _get_ssh_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Purpose:
+            Get the thread pool used to fan out SSH commands, creating it on first use.
+            The pool is reused across commands so that worker threads are not recreated
+            for every remote command.
+        Args:
+            N/A
+        Return:
+            SSH thread pool executor
+        """
+        with self._ssh_clients_lock:
+            if self._ssh_executor is None:
+                self._ssh_executor = threading_utils.create_thread_executor(
+                    max_workers=self.SSH_MAX_WORKERS
+                )
+            return self._ssh_executor
+
+    def close_ssh_clients(self) -> None:
+        """
+        Purpose:
+            Close all cached SSH sessions and shut down the SSH thread pool
+        Args:
+            N/A
+        Return:
+            N/A
+        """
+        with self._ssh_clients_lock:
+            ssh_clients = list(self._ssh_clients.values())
+            self._ssh_clients.clear()
+            self._ssh_client_locks.clear()
+            ssh_executor, self._ssh_executor = self._ssh_executor, None
+
+        for ssh_client in ssh_clients:
+            try:
+                ssh_utils.disconnect_ssh_client(ssh_client)
+            except error_utils.RIB006 as err:
+                logger.debug(f"Error closing SSH client: {err}")
+
+        if ssh_executor:
+            threading_utils.shutdown_thread_executor(ssh_executor)
 
     def _is_ec2_instances_cache_valid(
         self, instances: Mapping[str, Collection[str]]
@@ -1491,6 +1551,46 @@ class RibAwsEnv:
                 ```
         """
 
+        results = {}
+        for job_role, job_hostname, job_return in self.stream_remote_command(
+            command=command,
+            check_exit_status=check_exit_status,
+            print_stdout=print_stdout,
+            role=role,
+            timeout=timeout,
+        ):
+            results.setdefault(job_role, {})
+            results[job_role][job_hostname] = job_return
+
+        return results
+
+    def stream_remote_command(
+        self,
+        command: str,
+        check_exit_status: bool = False,
+        print_stdout: bool = False,
+        role: Optional[str] = None,
+        timeout: int = 60,
+    ) -> Iterator[Tuple[str, str, RemoteCommandResult]]:
+        """
+        Purpose:
+            Executes a command on all remote instances as specified by the role, yielding
+            each host's result as soon as it completes.
+
+            Connection setup and command execution both happen on the shared SSH thread
+            pool, so slow or unreachable hosts do not delay the others. A host that cannot
+            be connected to is reported with an unsuccessful result.
+        Args:
+            command: Command to be executed
+            check_exit_status: If true, verify command exits with a 0 exit code
+            print_stdout: Enable printing of command to stdout of the local terminal (not
+                recommended for parallel execution)
+            role: Role of instance(s) on which to execute the command, or all instances if not set
+            timeout: Time, in seconds, to allow the command to execute
+        Return:
+            Iterator of (role, hostname, command result) tuples, in order of completion
+        """
+
         roles = (
             [role] if role else [ec2_role[0] for ec2_role in self._ec2_instance_roles]
         )
@@ -1503,43 +1603,80 @@ class RibAwsEnv:
             port = 22
             username = "rib"
 
+        # Force the SSH key to be loaded (prompts the user for the password) before
+        # any worker threads need it
+        _ = self._ssh_key
+
         instances = self._get_ec2_instance_ips()
-        thread_executor = threading_utils.create_thread_executor()
+        thread_executor = self._get_ssh_executor()
         futures = {}
         for instance_role in roles:
+            # If the original request was for the bastion role, report cluster manager under bastion
+            job_role = (
+                self.BASTION_ROLE
+                if role == self.BASTION_ROLE
+                and instance_role == self.CLUSTER_MANAGER_ROLE
+                else instance_role
+            )
             for instance_ip in instances.get(instance_role, []):
-                futures[
-                    (instance_role, instance_ip)
-                ] = threading_utils.execute_function_in_thread(
-                    thread_executor,
-                    self._run_ssh_command,
-                    kwargs={
-                        "ssh_client": self._connect_ssh_client(
-                            hostname=instance_ip,
-                            username=username,
-                            port=port,
-                        ),
-                        "command": command,
-                        "check_exit_status": check_exit_status,
-                        "print_stdout": print_stdout,
-                        "timeout": timeout,
-                    },
+                future = thread_executor.submit(
+                    self._connect_and_run_ssh_command,
+                    hostname=instance_ip,
+                    port=port,
+                    username=username,
+                    command=command,
+                    check_exit_status=check_exit_status,
+                    print_stdout=print_stdout,
+                    timeout=timeout,
                 )
+                futures[future] = (job_role, instance_ip)
 
-        thread_results = threading_utils.get_threaded_function_results_as_completed(
-            futures
-        )
-        results = {}
-        for (job_role, job_hostname), job_return in thread_results[
-            "return_values"
-        ].items():
-            # If the original request was for the bastion role, report cluster manager under bastion
-            if role == self.BASTION_ROLE and job_role == self.CLUSTER_MANAGER_ROLE:
-                job_role = self.BASTION_ROLE
-            results.setdefault(job_role, {})
-            results[job_role][job_hostname] = job_return
+        for future in concurrent.futures.as_completed(futures):
+            job_role, job_hostname = futures[future]
+            yield job_role, job_hostname, future.result()
 
-        return results
+    def _connect_and_run_ssh_command(
+        self,
+        hostname: str,
+        port: int,
+        username: str,
+        command: str,
+        check_exit_status: bool,
+        print_stdout: bool,
+        timeout: int,
+    ) -> RemoteCommandResult:
+        """
+        Purpose:
+            Connect to the given remote host (reusing a cached session if possible) and
+            execute the given command
+        Args:
+            hostname: Remote hostname (or IP address)
+            port: SSH server port
+            username: Remote username
+            command: Command to be executed
+            check_exit_status: If true, verify command exits with a 0 exit code
+            print_stdout: Enable printing of command to stdout of the local terminal
+            timeout: Time, in seconds, to allow the command to execute
+        Return:
+            Command result
+        """
+        try:
+            ssh_client = self._connect_ssh_client(
+                hostname=hostname,
+                port=port,
+                username=username,
+            )
+        except Exception as err:
+            logger.warning(f"Unable to connect to {username}@{hostname}:{port}: {err}")
+            return RemoteCommandResult(success=False, stdout=[], stderr=[])
+
+        return self._run_ssh_command(
+            ssh_client=ssh_client,
+            command=command,
+            check_exit_status=check_exit_status,
+            print_stdout=print_stdout,
+            timeout=timeout,
+        )
 
     @staticmethod
     def _run_ssh_command(
@@ -472,6 +472,80 @@ def test__connect_ssh_client_returns_cached_client(connect_ssh_client, aws_env):
     connect_ssh_client.assert_not_called()
 
 
+@patch("rib.utils.ssh_utils.connect_ssh_client")
+def test__connect_ssh_client_enables_keepalive(connect_ssh_client, aws_env):
+    connect_ssh_client.return_value = MagicMock()
+    aws_env._connect_ssh_client(
+        hostname="host-address",
+        port=2222,
+        username="remote-username",
+    )
+    assert (
+        connect_ssh_client.call_args.kwargs["keepalive_interval"]
+        == RibAwsEnv.SSH_KEEPALIVE_INTERVAL
+    )
+
+
+###
+# run_remote_command
+###
+
+
+@pytest.fixture()
+def remote_command_aws_env(aws_env) -> RibAwsEnv:
+    """AWS environment with mocked-out instance lookups and SSH key"""
+    aws_env.__dict__["_ssh_key"] = MagicMock()
+    aws_env.__dict__["_rib_config"] = MagicMock(RACE_AWS_MANAGE_SSH_PORT=2222)
+    aws_env.__dict__["_ec2_instance_roles"] = [
+        ("cluster-manager", 1),
+        ("service-host", 2),
+    ]
+    aws_env._get_ec2_instance_ips = MagicMock(
+        return_value={
+            "cluster-manager": ["1.1.1.1"],
+            "service-host": ["2.2.2.2", "3.3.3.3"],
+        }
+    )
+    aws_env._run_ssh_command = MagicMock(
+        return_value={"success": True, "stdout": [], "stderr": []}
+    )
+    yield aws_env
+    aws_env.close_ssh_clients()
+
+
+def test_run_remote_command_reports_connection_failures_per_host(
+    remote_command_aws_env,
+):
+    def connect(hostname, port, username):
+        if hostname == "3.3.3.3":
+            raise socket.timeout("timed out")
+        return MagicMock()
+
+    remote_command_aws_env._connect_ssh_client = MagicMock(side_effect=connect)
+    assert remote_command_aws_env.run_remote_command("ls") == {
+        "cluster-manager": {
+            "1.1.1.1": {"success": True, "stdout": [], "stderr": []},
+        },
+        "service-host": {
+            "2.2.2.2": {"success": True, "stdout": [], "stderr": []},
+            "3.3.3.3": {"success": False, "stdout": [], "stderr": []},
+        },
+    }
+    assert remote_command_aws_env._run_ssh_command.call_count == 2
+
+
+def test_run_remote_command_reports_cluster_manager_as_bastion(
+    remote_command_aws_env,
+):
+    remote_command_aws_env._connect_ssh_client = MagicMock()
+    assert remote_command_aws_env.run_remote_command("ls", role="bastion") == {
+        "bastion": {"1.1.1.1": {"success": True, "stdout": [], "stderr": []}},
+    }
+    remote_command_aws_env._connect_ssh_client.assert_called_once_with(
+        hostname="1.1.1.1", port=22, username="rib"
+    )
+
+
 ###
 # _is_ec2_instances_cache_valid
 ###
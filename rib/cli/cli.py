@@ -51,8 +51,6 @@ from datetime import timedelta
 from typing import Optional
 
 # Local Python Library Imports
-import rib.commands as rib_commands
-import rib.commands.help_commands as help_commands
 from rib.commands.alias_group import AliasGroup
 from rib.state.rib_state import RaceInTheBoxState
 from rib.utils import log_utils, rib_utils
@@ -90,7 +88,7 @@ click_completion.init()
 ###
 
 
-@click.group(invoke_without_command=False)
+@click.group(cls=AliasGroup, invoke_without_command=False)
 @click.version_option(RIB_CONFIG.RIB_VERSION)
 @click.pass_context
 def race_in_the_box_cli(cli_context: click.core.Context) -> None:
@@ -252,7 +250,7 @@ def testing_command_group(cli_context: click.core.Context) -> None:
 ###
 
 
-def setup_common_deployment_commands(group: click.Group) -> None:
+def setup_common_deployment_commands(group: AliasGroup) -> None:
     """
     Purpose:
         Setup common deployment commands under a mode-specific deployment command group
@@ -262,53 +260,80 @@ def setup_common_deployment_commands(group: click.Group) -> None:
         N/A
     """
     # Deployment Commands
-    group.add_command(rib_commands.deployment_common_commands.copy, aliases=["cp"])
-    group.add_command(rib_commands.deployment_common_commands.clear)
-    group.add_command(rib_commands.deployment_common_commands.reset)
-    group.add_command(rib_commands.deployment_common_commands.kill)
-    group.add_command(rib_commands.deployment_common_commands.info)
-    group.add_command(
-        rib_commands.deployment_common_commands.list_deployments, aliases=["ls"]
+    group.add_lazy_command(
+        "rib.commands.deployment_common_commands:copy", "copy", aliases=["cp"]
     )
-    group.add_command(rib_commands.deployment_common_commands.refresh_plugins)
-    group.add_command(
-        rib_commands.deployment_common_commands.notify_epoch, aliases=["epoch"]
+    group.add_lazy_command("rib.commands.deployment_common_commands:clear", "clear")
+    group.add_lazy_command("rib.commands.deployment_common_commands:reset", "reset")
+    group.add_lazy_command("rib.commands.deployment_common_commands:kill", "kill")
+    group.add_lazy_command("rib.commands.deployment_common_commands:info", "info")
+    group.add_lazy_command(
+        "rib.commands.deployment_common_commands:list_deployments",
+        "list",
+        aliases=["ls"],
+    )
+    group.add_lazy_command(
+        "rib.commands.deployment_common_commands:refresh_plugins", "refresh-plugins"
+    )
+    group.add_lazy_command(
+        "rib.commands.deployment_common_commands:notify_epoch",
+        "notify-epoch",
+        aliases=["epoch"],
+    )
+    group.add_lazy_command(
+        "rib.commands.deployment_common_commands:remove", "remove", aliases=["rm"]
+    )
+    group.add_lazy_command(
+        "rib.commands.deployment_common_commands:rename", "rename", aliases=["mv"]
+    )
+    group.add_lazy_command("rib.commands.deployment_common_commands:start", "start")
+    group.add_lazy_command("rib.commands.deployment_common_commands:stop", "stop")
+    group.add_lazy_command(
+        "rib.commands.deployment_common_commands:set_timezone", "set-timezone"
     )
-    group.add_command(rib_commands.deployment_common_commands.remove, aliases=["rm"])
-    group.add_command(rib_commands.deployment_common_commands.rename, aliases=["mv"])
-    group.add_command(rib_commands.deployment_common_commands.start)
-    group.add_command(rib_commands.deployment_common_commands.stop)
-    group.add_command(rib_commands.deployment_common_commands.set_timezone)
 
-    group.add_command(
-        rib_commands.deployment_common_bridged_commands.bridged_command_group
+    group.add_lazy_command(
+        "rib.commands.deployment_common_bridged_commands:bridged_command_group",
+        "bridged",
     )
 
     # Command groups
-    group.add_command(
-        rib_commands.deployment_common_bootstrap_commands.bootstrap_command_group
+    group.add_lazy_command(
+        "rib.commands.deployment_common_bootstrap_commands:bootstrap_command_group",
+        "bootstrap",
+    )
+    group.add_lazy_command(
+        "rib.commands.deployment_common_config_commands:config_command_group", "config"
+    )
+    group.add_lazy_command(
+        "rib.commands.deployment_common_link_commands:link_command_group", "link"
+    )
+    group.add_lazy_command(
+        "rib.commands.deployment_common_logs_commands:logs_command_group", "logs"
     )
-    group.add_command(
-        rib_commands.deployment_common_config_commands.config_command_group
+    group.add_lazy_command(
+        "rib.commands.deployment_common_message_commands:message_command_group",
+        "message",
     )
-    group.add_command(rib_commands.deployment_common_link_commands.link_command_group)
-    group.add_command(rib_commands.deployment_common_logs_commands.logs_command_group)
-    group.add_command(
-        rib_commands.deployment_common_message_commands.message_command_group
+    group.add_lazy_command(
+        "rib.commands.deployment_common_status_commands:status_command_group", "status"
     )
-    group.add_command(
-        rib_commands.deployment_common_status_commands.status_command_group
+    group.add_lazy_command(
+        "rib.commands.deployment_common_comms_commands:comms_command_group", "comms"
     )
-    group.add_command(rib_commands.deployment_common_comms_commands.comms_command_group)
-    group.add_command(rib_commands.deployment_common_test_commands.test_command_group)
-    group.add_command(
-        rib_commands.deployment_common_testapp_commands.testapp_command_group
+    group.add_lazy_command(
+        "rib.commands.deployment_common_test_commands:test_command_group", "test"
     )
-    group.add_command(
-        rib_commands.deployment_common_daemon_commands.daemon_command_group
+    group.add_lazy_command(
+        "rib.commands.deployment_common_testapp_commands:testapp_command_group",
+        "testapp",
     )
-    group.add_command(
-        rib_commands.deployment_common_voa_commands.deployment_voa_command_group
+    group.add_lazy_command(
+        "rib.commands.deployment_common_daemon_commands:daemon_command_group", "daemon"
+    )
+    group.add_lazy_command(
+        "rib.commands.deployment_common_voa_commands:deployment_voa_command_group",
+        "voa",
     )
 
 
@@ -415,118 +440,164 @@ def setup_race_in_the_box_cli() -> None:
     """
 
     # AWS Commands
-    aws_command_group.add_command(rib_commands.aws_commands.init)
-    aws_command_group.add_command(rib_commands.aws_commands.info)
-    aws_command_group.add_command(rib_commands.aws_commands.verify)
-    aws_command_group.add_command(
-        rib_commands.aws_topology_commands.topology_command_group
+    aws_command_group.add_lazy_command("rib.commands.aws_commands:init", "init")
+    aws_command_group.add_lazy_command("rib.commands.aws_commands:info", "info")
+    aws_command_group.add_lazy_command("rib.commands.aws_commands:verify", "verify")
+    aws_command_group.add_lazy_command(
+        "rib.commands.aws_topology_commands:topology_command_group", "topology"
     )
     aws_command_group.add_command(deprecated_aws_env_command, name="env")
 
     # Config Commands
-    config_command_group.add_command(rib_commands.config_commands.init)
-    config_command_group.add_command(
-        rib_commands.config_commands.list_config, aliases=["ls"]
+    config_command_group.add_lazy_command("rib.commands.config_commands:init", "init")
+    config_command_group.add_lazy_command(
+        "rib.commands.config_commands:list_config", "list", aliases=["ls"]
+    )
+    config_command_group.add_lazy_command(
+        "rib.commands.config_commands:verify", "verify"
+    )
+    config_command_group.add_lazy_command(
+        "rib.commands.config_commands:update", "update"
     )
-    config_command_group.add_command(rib_commands.config_commands.verify)
-    config_command_group.add_command(rib_commands.config_commands.update)
 
     # Deployment Auto Commands
     if is_valid_rib_mode(RIB_MODE) and DEPLOYMENT_NAME:
         setup_common_deployment_commands(deployment_command_group)
 
         if RIB_MODE == "aws":
-            deployment_command_group.add_command(
-                rib_commands.deployment_aws_commands.up
+            deployment_command_group.add_lazy_command(
+                "rib.commands.deployment_aws_commands:up", "up"
             )
-            deployment_command_group.add_command(
-                rib_commands.deployment_aws_commands.down
+            deployment_command_group.add_lazy_command(
+                "rib.commands.deployment_aws_commands:down", "down"
             )
         elif RIB_MODE == "local":
-            deployment_command_group.add_command(
-                rib_commands.deployment_local_commands.up
+            deployment_command_group.add_lazy_command(
+                "rib.commands.deployment_local_commands:up", "up"
             )
-            deployment_command_group.add_command(
-                rib_commands.deployment_local_commands.down
+            deployment_command_group.add_lazy_command(
+                "rib.commands.deployment_local_commands:down", "down"
             )
 
     else:
         setup_deprecated_deployment_commands(deployment_command_group)
 
     # Deployment AWS Commands
-    deployment_aws_command_group.add_command(
-        rib_commands.deployment_aws_commands.active
+    deployment_aws_command_group.add_lazy_command(
+        "rib.commands.deployment_aws_commands:active", "active"
+    )
+    deployment_aws_command_group.add_lazy_command(
+        "rib.commands.deployment_aws_commands:create", "create"
     )
-    deployment_aws_command_group.add_command(
-        rib_commands.deployment_aws_commands.create
+    deployment_aws_command_group.add_lazy_command(
+        "rib.commands.deployment_aws_commands:up", "up"
+    )
+    deployment_aws_command_group.add_lazy_command(
+        "rib.commands.deployment_aws_commands:down", "down"
     )
-    deployment_aws_command_group.add_command(rib_commands.deployment_aws_commands.up)
-    deployment_aws_command_group.add_command(rib_commands.deployment_aws_commands.down)
     setup_common_deployment_commands(deployment_aws_command_group)
 
     # Deployment Local Commands
-    deployment_local_command_group.add_command(
-        rib_commands.deployment_local_commands.active
+    deployment_local_command_group.add_lazy_command(
+        "rib.commands.deployment_local_commands:active", "active"
     )
-    deployment_local_command_group.add_command(
-        rib_commands.deployment_local_commands.create
+    deployment_local_command_group.add_lazy_command(
+        "rib.commands.deployment_local_commands:create", "create"
     )
-    deployment_local_command_group.add_command(
-        rib_commands.deployment_local_commands.down
+    deployment_local_command_group.add_lazy_command(
+        "rib.commands.deployment_local_commands:down", "down"
     )
-    deployment_local_command_group.add_command(
-        rib_commands.deployment_local_commands.up
+    deployment_local_command_group.add_lazy_command(
+        "rib.commands.deployment_local_commands:up", "up"
     )
     setup_common_deployment_commands(deployment_local_command_group)
 
     # Docker Commands
-    docker_command_group.add_command(rib_commands.docker_commands.login)
-    docker_command_group.add_command(rib_commands.docker_commands.verify)
+    docker_command_group.add_lazy_command("rib.commands.docker_commands:login", "login")
+    docker_command_group.add_lazy_command(
+        "rib.commands.docker_commands:verify", "verify"
+    )
 
     # Env AWS Commands
-    env_aws_command_group.add_command(rib_commands.env_aws_commands.active)
-    env_aws_command_group.add_command(
-        rib_commands.env_aws_commands.copy, aliases=["cp"]
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:active", "active"
+    )
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:copy", "copy", aliases=["cp"]
     )
-    env_aws_command_group.add_command(rib_commands.env_aws_commands.create)
-    env_aws_command_group.add_command(rib_commands.env_aws_commands.info)
-    env_aws_command_group.add_command(
-        rib_commands.env_aws_commands.list_envs, aliases=["ls"]
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:create", "create"
     )
-    env_aws_command_group.add_command(rib_commands.env_aws_commands.provision)
-    env_aws_command_group.add_command(
-        rib_commands.env_aws_commands.remove, aliases=["rm"]
+    env_aws_command_group.add_lazy_command("rib.commands.env_aws_commands:info", "info")
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:list_envs", "list", aliases=["ls"]
     )
-    env_aws_command_group.add_command(
-        rib_commands.env_aws_commands.rename, aliases=["mv"]
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:provision", "provision"
+    )
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:remove", "remove", aliases=["rm"]
+    )
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:rename", "rename", aliases=["mv"]
+    )
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:runtime_info", "runtime-info"
+    )
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:status", "status"
+    )
+    env_aws_command_group.add_lazy_command(
+        "rib.commands.env_aws_commands:unprovision", "unprovision"
     )
-    env_aws_command_group.add_command(rib_commands.env_aws_commands.runtime_info)
-    env_aws_command_group.add_command(rib_commands.env_aws_commands.status)
-    env_aws_command_group.add_command(rib_commands.env_aws_commands.unprovision)
 
     # Env Local Commands
-    env_local_command_group.add_command(rib_commands.env_local_commands.capabilities)
-    env_local_command_group.add_command(rib_commands.env_local_commands.info)
-    env_local_command_group.add_command(rib_commands.env_local_commands.status)
+    env_local_command_group.add_lazy_command(
+        "rib.commands.env_local_commands:capabilities", "capabilities"
+    )
+    env_local_command_group.add_lazy_command(
+        "rib.commands.env_local_commands:info", "info"
+    )
+    env_local_command_group.add_lazy_command(
+        "rib.commands.env_local_commands:status", "status"
+    )
 
     # GitHub Group
-    race_in_the_box_cli.add_command(rib_commands.github_commands.github_command_group)
+    race_in_the_box_cli.add_lazy_command(
+        "rib.commands.github_commands:github_command_group",
+        "github",
+        short_help="Commands for configuring GitHub",
+    )
 
     # Help Command
-    race_in_the_box_cli.add_command(help_commands.print_help)
+    race_in_the_box_cli.add_lazy_command(
+        "rib.commands.help_commands:print_help",
+        "help",
+        short_help="Display help information about RiB",
+    )
 
     # RACE Commands
-    race_command_group.add_command(rib_commands.race_commands.versions)
+    race_command_group.add_lazy_command(
+        "rib.commands.race_commands:versions", "versions"
+    )
 
     # Range Config Commands
-    range_config_command_group.add_command(rib_commands.range_config_commands.create)
-    range_config_command_group.add_command(
-        rib_commands.range_config_commands.list_deployment_config, aliases=["ls"]
+    range_config_command_group.add_lazy_command(
+        "rib.commands.range_config_commands:create", "create"
+    )
+    range_config_command_group.add_lazy_command(
+        "rib.commands.range_config_commands:list_deployment_config",
+        "list",
+        aliases=["ls"],
+    )
+    range_config_command_group.add_lazy_command(
+        "rib.commands.range_config_commands:remove", "remove"
     )
-    range_config_command_group.add_command(rib_commands.range_config_commands.remove)
 
     # System Commands
-    system_command_group.add_command(rib_commands.system_commands.verify)
+    system_command_group.add_lazy_command(
+        "rib.commands.system_commands:verify", "verify"
+    )
 
     # Testing Commands
     testing_command_group.add_command(deprecated_test_command, name="deployment")
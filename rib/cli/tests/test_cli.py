@@ -21,14 +21,115 @@
 """
 
 # Python Library Imports
+import click
 import os
+import subprocess
 import sys
 import pytest
 from unittest import mock
 
 # Local Library Imports
 from rib.cli import cli
+from rib.commands.alias_group import AliasGroup
 
 
 def test_setup_race_in_the_box_cli():
     cli.setup_race_in_the_box_cli()
+
+
+# Modules that the CLI must not import until a command that needs them is invoked
+HEAVY_MODULES = [
+    "boto3",
+    "docker",
+    "networkx",
+    "opensearchpy",
+    "pandas",
+    "paramiko",
+    "ppadb",
+    "rib.commands.help_commands",
+    "rib.deployment",
+]
+
+# Generous budget in microseconds for importing the CLI and registering its commands
+# (currently ~0.1s), to catch the command modules being imported eagerly again
+CLI_IMPORT_TIME_BUDGET_US = 1_000_000
+
+
+def _get_lazy_commands(group, path=()):
+    """Yield (path, name, command) for every command registered in the group tree"""
+    for name in group.list_commands(None):
+        cmd = group.get_command(None, name)
+        yield path, name, cmd
+        if isinstance(cmd, click.Group):
+            yield from _get_lazy_commands(cmd, path + (name,))
+
+
+def test_setup_race_in_the_box_cli_lazy_commands_resolve():
+    cli.setup_race_in_the_box_cli()
+    for path, name, cmd in _get_lazy_commands(cli.race_in_the_box_cli):
+        assert cmd is not None, f"rib {' '.join(path + (name,))} failed to load"
+        if not cmd.hidden:
+            assert cmd.name == name, f"rib {' '.join(path)} {name} is named {cmd.name}"
+
+
+def test_setup_race_in_the_box_cli_aliases_resolve():
+    cli.setup_race_in_the_box_cli()
+    deployment_local_group = cli.deployment_local_command_group
+    assert deployment_local_group.get_command(None, "ls").name == "list"
+    assert deployment_local_group.get_command(None, "rm").name == "remove"
+
+
+def test_cli_import_time():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import click, sys\n"
+            "from rib.cli import cli\n"
+            "cli.setup_race_in_the_box_cli()\n"
+            # Render the help of `rib deployment local --help`, listing its commands
+            "group = cli.deployment_local_command_group\n"
+            "group.get_help(click.Context(group, info_name='local'))\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+    # Lines are "import time: <self us> | <cumulative us> | <indented module>"
+    cumulative_us = {
+        fields[2].strip(): int(fields[1])
+        for fields in (
+            line.split(":", 1)[1].split("|")
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and "cumulative" not in line
+        )
+    }
+    assert cumulative_us["rib.cli.cli"] < CLI_IMPORT_TIME_BUDGET_US
+
+
+def _format_commands(group: click.Group, name: str) -> str:
+    """Render the commands section of the help of the group"""
+    formatter = click.HelpFormatter()
+    group.format_commands(click.Context(group, info_name=name), formatter)
+    return formatter.getvalue()
+
+
+def test_setup_race_in_the_box_cli_lazy_commands_listed_as_loaded():
+    cli.setup_race_in_the_box_cli()
+    groups = [(("rib",), cli.race_in_the_box_cli)]
+    while groups:
+        path, group = groups.pop()
+        lazy_listing = _format_commands(group, path[-1])
+        for name in group.list_commands(None):
+            cmd = group.get_command(None, name)
+            if isinstance(cmd, AliasGroup):
+                groups.append((path + (name,), cmd))
+        group.lazy_commands.clear()
+        assert lazy_listing == _format_commands(
+            group, path[-1]
+        ), f"{' '.join(path)} lists its lazy commands differently once loaded"
@@ -15,33 +15,57 @@
 
 """
     Purpose:
-        Export Commands for Importing By Application
+        Export Commands for Importing By Application.
+
+        Command modules are imported on first access (e.g.
+        `rib.commands.aws_commands`) rather than up front, so that running one
+        command doesn't import the dependencies of every other command.
 """
 
-# Export Commands
-from .aws_commands import *
-from .aws_topology_commands import *
-from .config_commands import *
-from .deployment_aws_commands import *
-from .deployment_common_bootstrap_commands import *
-from .deployment_common_bridged_commands import *
-from .deployment_common_commands import *
-from .deployment_common_config_commands import *
-from .deployment_common_daemon_commands import *
-from .deployment_common_link_commands import *
-from .deployment_common_logs_commands import *
-from .deployment_common_message_commands import *
-from .deployment_common_status_commands import *
-from .deployment_common_comms_commands import *
-from .deployment_common_test_commands import *
-from .deployment_common_testapp_commands import *
-from .deployment_common_voa_commands import *
-from .deployment_local_commands import *
-from .docker_commands import *
-from .env_aws_commands import *
-from .env_local_commands import *
-from .github_commands import *
-from .race_commands import *
-from .range_config_commands import *
-from .system_commands import *
-from .testing_commands import *
+# Python Library Imports
+import importlib
+from types import ModuleType
+
+
+_COMMAND_MODULES = {
+    "aws_commands",
+    "aws_topology_commands",
+    "config_commands",
+    "deployment_aws_commands",
+    "deployment_common_bootstrap_commands",
+    "deployment_common_bridged_commands",
+    "deployment_common_commands",
+    "deployment_common_config_commands",
+    "deployment_common_daemon_commands",
+    "deployment_common_link_commands",
+    "deployment_common_logs_commands",
+    "deployment_common_message_commands",
+    "deployment_common_status_commands",
+    "deployment_common_comms_commands",
+    "deployment_common_test_commands",
+    "deployment_common_testapp_commands",
+    "deployment_common_voa_commands",
+    "deployment_local_commands",
+    "docker_commands",
+    "env_aws_commands",
+    "env_local_commands",
+    "github_commands",
+    "race_commands",
+    "range_config_commands",
+    "system_commands",
+    "testing_commands",
+}
+
+
+def __getattr__(name: str) -> ModuleType:
+    """
+    Purpose:
+        Import a command module the first time it is accessed as an attribute
+    Args:
+        name: Name of the command module
+    Returns:
+        Command module
+    """
+    if name in _COMMAND_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
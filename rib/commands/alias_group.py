@@ -15,12 +15,89 @@
 
 """
 Purpose:
-    Custom command group to support aliases
+    Custom command group to support aliases and lazily loaded commands
 """
 
 # Python Library Imports
+import ast
 import click
-from typing import Callable, List, Optional
+import functools
+import importlib
+import importlib.util
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Command decorator arguments that determine how a command is listed in group help
+LISTING_ARGUMENTS = ("help", "short_help", "hidden", "deprecated")
+
+
+class LazyCommand(NamedTuple):
+    """Command that is imported from its module when it is first needed"""
+
+    import_path: str
+    short_help: Optional[str]
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_module(module_name: str) -> Optional[ast.Module]:
+    """
+    Purpose:
+        Parse the source of a module without importing it
+    Args:
+        module_name: Full name of the module
+    Returns:
+        Syntax tree of the module, or None if its source is unavailable
+    """
+    try:
+        spec = importlib.util.find_spec(module_name)
+        with open(spec.origin, "r") as module_file:
+            return ast.parse(module_file.read())
+    except Exception:
+        return None
+
+
+def get_lazy_command_listing(
+    lazy_command: LazyCommand, name: str
+) -> Optional[click.Command]:
+    """
+    Purpose:
+        Get a stand-in for a lazy command with the help, hidden and deprecated
+        settings it is listed with in group help, read from the source of its module
+        instead of importing it
+    Args:
+        lazy_command: Lazily registered command
+        name: Command name
+    Returns:
+        Stand-in command, or None if the settings can't be determined from the
+        source (e.g., they aren't literals), in which case the command must be loaded
+    """
+    if lazy_command.short_help is not None:
+        return click.Command(name, short_help=lazy_command.short_help)
+
+    module_name, attribute = lazy_command.import_path.split(":")
+    module = _parse_module(module_name)
+    if module is None:
+        return None
+
+    for node in module.body:
+        if not isinstance(node, ast.FunctionDef) or node.name != attribute:
+            continue
+        for decorator in node.decorator_list:
+            if not (
+                isinstance(decorator, ast.Call)
+                and isinstance(decorator.func, ast.Attribute)
+                and decorator.func.attr in ("command", "group")
+            ):
+                continue
+            settings = {"help": ast.get_docstring(node, clean=False)}
+            for keyword in decorator.keywords:
+                if keyword.arg is None:
+                    return None
+                if keyword.arg in LISTING_ARGUMENTS:
+                    if not isinstance(keyword.value, ast.Constant):
+                        return None
+                    settings[keyword.arg] = keyword.value.value
+            return click.Command(name, **settings)
+    return None
 
 
 class AliasGroup(click.Group):
@@ -41,6 +118,7 @@ class AliasGroup(click.Group):
         """
         super().__init__(*args, **kwargs)
         self.aliases = {}
+        self.lazy_commands: Dict[str, LazyCommand] = {}
 
     def command(self, *args, **kwargs) -> Callable:
         """
@@ -75,6 +153,94 @@ class AliasGroup(click.Group):
             for alias in aliases:
                 self.aliases[alias] = name
 
+    def add_lazy_command(
+        self,
+        import_path: str,
+        name: str,
+        aliases: Optional[List[str]] = None,
+        short_help: Optional[str] = None,
+    ) -> None:
+        """
+        Purpose:
+            Register a command without importing the module that defines it. The
+            module is imported when the command is invoked (or its help is needed).
+        Args:
+            import_path: Location of the command, as "<module>:<attribute>"
+            name: Command name
+            aliases: Alternative names for the command
+            short_help: Help to show when listing the group's commands (if None, it
+                is read from the source of the command's module, see
+                get_lazy_command_listing)
+        Returns:
+            N/A
+        """
+        self.lazy_commands[name] = LazyCommand(import_path, short_help)
+        if aliases:
+            for alias in aliases:
+                self.aliases[alias] = name
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """
+        Purpose:
+            Get the names of all commands in the group, loaded or not
+        Args:
+            ctx: Click command context
+        Returns:
+            Sorted command names
+        """
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        """
+        Purpose:
+            Write the group's commands into the help formatter, listing lazy commands
+            from their registered short help or the source of their modules instead
+            of loading them
+        Args:
+            ctx: Click command context
+            formatter: Help formatter
+        Returns:
+            N/A
+        """
+        rows = []
+        for cmd_name in self.list_commands(ctx):
+            cmd = None
+            lazy_command = self.lazy_commands.get(cmd_name)
+            if lazy_command:
+                cmd = get_lazy_command_listing(lazy_command, cmd_name)
+            if cmd is None:
+                cmd = self.get_command(ctx, cmd_name)
+            if cmd is None or cmd.hidden:
+                continue
+            rows.append((cmd_name, cmd))
+
+        if rows:
+            limit = formatter.width - 6 - max(len(cmd_name) for cmd_name, _ in rows)
+            with formatter.section("Commands"):
+                formatter.write_dl(
+                    [
+                        (cmd_name, cmd.get_short_help_str(limit))
+                        for cmd_name, cmd in rows
+                    ]
+                )
+
+    def _load_lazy_command(self, cmd_name: str) -> Optional[click.Command]:
+        """
+        Purpose:
+            Import a lazily registered command and add it to the group
+        Args:
+            cmd_name: Command name
+        Returns:
+            Command, or None if no lazy command of that name is registered
+        """
+        lazy_command = self.lazy_commands.pop(cmd_name, None)
+        if not lazy_command:
+            return None
+        module_name, attribute = lazy_command.import_path.split(":")
+        cmd = getattr(importlib.import_module(module_name), attribute)
+        super().add_command(cmd, cmd_name)
+        return cmd
+
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command:
         """
         Purpose:
@@ -86,12 +252,12 @@ class AliasGroup(click.Group):
         Returns:
             Command, or None if no match is found
         """
-        cmd = super().get_command(ctx, cmd_name)
+        cmd = super().get_command(ctx, cmd_name) or self._load_lazy_command(cmd_name)
         if cmd:
             return cmd
 
         alias = self.aliases.get(cmd_name, None)
         if alias:
-            cmd = super().get_command(ctx, alias)
+            cmd = super().get_command(ctx, alias) or self._load_lazy_command(alias)
 
         return cmd
@@ -34,7 +34,10 @@ from rib.commands.deployment_options import (
     nodes_option,
     pass_rib_mode,
 )
-from rib.deployment.rib_deployment import RibDeployment
+from rib.deployment.rib_deployment import (
+    DEFAULT_ARCHIVE_COMPRESSION_LEVEL,
+    RibDeployment,
+)
 from rib.utils import general_utils, error_utils
 
 logger = logging.getLogger(__name__)
@@ -123,6 +126,11 @@ def _validate_json_object(
     flag_value=True,
     help="Do not tar configs after generation",
 )
+@click.option(
+    "--no-cache",
+    flag_value=True,
+    help="Do not restore configs from, or store them in, the config generation cache",
+)
 @pass_rib_mode
 def generate(
     rib_mode: str,
@@ -134,6 +142,7 @@ def generate(
     timeout: int,
     max_iterations: int,
     no_tar: bool,
+    no_cache: bool,
 ) -> None:
     """
     Generate deployment configs for the network manager plugin, all comms channels, and all artifact manager
@@ -161,6 +170,7 @@ def generate(
         timeout=timeout,
         max_iterations=max_iterations,
         skip_config_tar=no_tar,
+        skip_config_cache=no_cache,
     )
 
 
@@ -173,6 +183,14 @@ def generate(
     flag_value=True,
     help="overwrite existing config tars",
 )
+@click.option(
+    "--compression-level",
+    "compression_level",
+    type=click.IntRange(1, 9),
+    default=DEFAULT_ARCHIVE_COMPRESSION_LEVEL,
+    show_default=True,
+    help="gzip compression level of the config tars",
+)
 @pass_rib_mode
 def tar_configs(
     rib_mode: str,
@@ -180,6 +198,7 @@ def tar_configs(
     overwrite: bool,
     timeout: int,
     nodes: Optional[List[str]],
+    compression_level: int,
 ) -> None:
     """
     tar configs for the deployment
@@ -198,7 +217,12 @@ def tar_configs(
             f"Taring configs for all nodes in Deployment: {deployment_name} ({rib_mode})"
         )
 
-    deployment.tar_configs(force=overwrite, timeout=timeout, nodes=nodes)
+    deployment.tar_configs(
+        force=overwrite,
+        timeout=timeout,
+        nodes=nodes,
+        compression_level=compression_level,
+    )
 
 
 @config_command_group.command("publish")
@@ -380,6 +380,12 @@ def send_plan(
 @click.option(
     "--reverse-sort", "reverse_sort", flag_value=True, help="Reverse the sort"
 )
+@click.option(
+    "--summary",
+    "summary",
+    flag_value=True,
+    help="Only print message counts by status and sender/recipient pair",
+)
 @pass_rib_mode
 def list_messages(
     rib_mode: str,
@@ -392,11 +398,26 @@ def list_messages(
     date_to: str = None,
     sort_by: str = "Status",
     reverse_sort: bool = False,
+    summary: bool = False,
 ):
     """
     Get messages from/to a (or all) node(s)
     """
     try:
+        if summary:
+            messaging_utils.get_matching_message_counts(
+                rib_mode=rib_mode,
+                deployment_name=deployment_name,
+                recipient=recipient,
+                sender=sender,
+                test_id=test_id,
+                trace_id=trace_id,
+                date_from=date_from,
+                date_to=date_to,
+                verbose=True,
+            )
+            return
+
         # Verbose controls whether this function prints
         messaging_utils.get_matching_messages(
             rib_mode=rib_mode,
@@ -481,25 +502,42 @@ def verify(
     Verify messages have been received on test-id and secondary filters (sender, recipient, trace-id)
     """
     try:
-        unreceived_count, messages = messaging_utils.get_matching_messages(
-            rib_mode=rib_mode,
-            deployment_name=deployment_name,
-            recipient=recipient,
-            sender=sender,
-            test_id=test_id,
-            trace_id=trace_id,
-            sort_by=sort_by,
-            verbose=verbose,
-        )
+        if verbose:
+            unreceived_count, messages = messaging_utils.get_matching_messages(
+                rib_mode=rib_mode,
+                deployment_name=deployment_name,
+                recipient=recipient,
+                sender=sender,
+                test_id=test_id,
+                trace_id=trace_id,
+                sort_by=sort_by,
+                verbose=verbose,
+            )
+            message_count = len(messages)
+        else:
+            # Individual messages aren't printed, so only counts are needed
+            counts = messaging_utils.get_matching_message_counts(
+                rib_mode=rib_mode,
+                deployment_name=deployment_name,
+                recipient=recipient,
+                sender=sender,
+                test_id=test_id,
+                trace_id=trace_id,
+            )
+            message_count = counts["total"]
+            unreceived_count = (
+                message_count
+                - counts["status"][f"{elasticsearch_utils.MessageStatus.RECEIVED}"]
+            )
     except:
         raise error_utils.RIB605(rib_mode, deployment_name, "message verify")
 
-    if unreceived_count == 0 and len(messages) > 0:
+    if unreceived_count == 0 and message_count > 0:
         click.echo(f"All Messages In {rib_mode}:{test_id} Have Been Received")
     else:
-        if len(messages) > 0:
+        if message_count > 0:
             click.echo(
-                f"{unreceived_count}/{len(messages)} Messages In {rib_mode}:{test_id} Have Not Been Received"
+                f"{unreceived_count}/{message_count} Messages In {rib_mode}:{test_id} Have Not Been Received"
             )
         else:
             click.echo("No Matching Messages Found")
@@ -60,6 +60,7 @@ class RibDeploymentPaths:
         "metadata": "deployment_metadata.json",
         "channel_list": "channel_list.json",
         "race_config": "race-config.json",
+        "distribution_manifest": "distribution_manifest.json",
     }
 
     global_config_filenames = [
@@ -217,6 +218,9 @@ class RibDeploymentPaths:
             {
                 "config": os.path.join(self.dirs["base"], self.filenames["config"]),
                 "metadata": os.path.join(self.dirs["base"], self.filenames["metadata"]),
+                "distribution_manifest": os.path.join(
+                    self.dirs["base"], self.filenames["distribution_manifest"]
+                ),
                 "race_config": os.path.join(
                     self.dirs["race_configs"], self.filenames["race_config"]
                 ),
@@ -106,6 +106,7 @@ def test_verify_expected_files(paths):
         "ansible_tear_down_playbook": f"{docker_rib_state_path}/deployments/aws/test-deployment/ansible/tear-down.yml",
         "channel_list": f"{docker_rib_state_path}/deployments/aws/test-deployment/configs/channel_list.json",
         "config": f"{docker_rib_state_path}/deployments/aws/test-deployment/deployment_config.json",
+        "distribution_manifest": f"{docker_rib_state_path}/deployments/aws/test-deployment/distribution_manifest.json",
         "metadata": f"{docker_rib_state_path}/deployments/aws/test-deployment/deployment_metadata.json",
         "node_distribution": f"{docker_rib_state_path}/deployments/aws/test-deployment/node_distribution.json",
         "node_topology": f"{docker_rib_state_path}/deployments/aws/test-deployment/node_topology.json",
@@ -107,6 +107,7 @@ def test_verify_expected_files(paths):
     assert paths.files == {
         "channel_list": f"{docker_rib_state_path}/deployments/local/test-deployment/configs/channel_list.json",
         "config": f"{docker_rib_state_path}/deployments/local/test-deployment/deployment_config.json",
+        "distribution_manifest": f"{docker_rib_state_path}/deployments/local/test-deployment/distribution_manifest.json",
         "docker_compose": f"{docker_rib_state_path}/deployments/local/test-deployment/docker-compose.yml",
         "metadata": f"{docker_rib_state_path}/deployments/local/test-deployment/deployment_metadata.json",
         "race_config": f"{docker_rib_state_path}/deployments/local/test-deployment/configs/race-config.json",
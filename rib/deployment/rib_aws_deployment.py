@@ -315,6 +315,7 @@ class RibAwsDeployment(RibDeployment):
             data_format="json",
             overwrite=True,
         )
+        deployment.get_deployment_index().update(deployment.config["name"])
 
         if range_config:
             shutil.copy(
@@ -510,6 +511,7 @@ class RibAwsDeployment(RibDeployment):
         timeout: int = 300,
         max_iterations: int = 5,
         skip_config_tar: bool = False,
+        skip_config_cache: bool = False,
     ) -> None:
         """
         Purpose:
@@ -522,6 +524,8 @@ class RibAwsDeployment(RibDeployment):
             timeout (int): timeout for an individual iteration of a config generation script to run
             max_iterations(int): max number of iterations to run config generation through
             skip_config_tar(bool): skip taring configs
+            skip_config_cache(bool): neither restore configs from nor store them in the
+                config generation cache
         Returns:
             N/A
         """
@@ -540,6 +544,7 @@ class RibAwsDeployment(RibDeployment):
             timeout=timeout,
             max_iterations=max_iterations,
             skip_config_tar=skip_config_tar,
+            skip_config_cache=skip_config_cache,
         )
 
     ###
@@ -20,7 +20,11 @@
 
 # Python Library Imports
 import click
+import concurrent.futures
 import copy
+import functools
+import hashlib
+import json
 import logging
 from opensearchpy import OpenSearch as Elasticsearch
 from opensearchpy.exceptions import OpenSearchWarning as ElasticsearchWarning
@@ -29,6 +33,7 @@ from rib.deployment.paths.rib_deployment_paths import RibDeploymentPaths
 import sh
 import shutil
 import tarfile
+import tempfile
 import time
 import io
 import warnings
@@ -38,7 +43,9 @@ import pytz
 from functools import cached_property
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
@@ -61,6 +68,11 @@ from rib.deployment.rib_deployment_config import (
     IncompatibleDeployment,
     NodeConfig,
 )
+from rib.deployment.rib_deployment_index import (
+    DeploymentIndex,
+    DeploymentIndexEntry,
+    create_index_entry,
+)
 import rib.deployment.rib_deployment_rpc as rib_deployment_rpc
 import rib.deployment.status.rib_deployment_status as rib_deployment_status
 from rib.deployment.status.rib_deployment_status import Require
@@ -74,6 +86,8 @@ from rib.utils import (
     voa_utils,
     rib_utils,
     status_utils,
+    system_utils,
+    threading_utils,
 )
 from rib.utils import plugin_utils
 from rib.utils.plugin_utils import CacheStrategy
@@ -81,6 +95,84 @@ from rib.utils.plugin_utils import CacheStrategy
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# gzip compression level for node configs/etc archives. Lower than the tarfile
+# default (9), which is much slower for little size benefit on config files
+DEFAULT_ARCHIVE_COMPRESSION_LEVEL = 6
+
+# Time in seconds between checks of the file server for node archives that are ready
+NODE_ARCHIVE_POLL_INTERVAL = 1.0
+
+# Per-node user responses files written alongside generated configs, kept in the
+# config generation cache
+USER_RESPONSES_FILENAMES = ("user-responses.json", "disabled-user-responses.json")
+
+# Max number of entries kept in the config generation cache, least recently used
+# entries are removed first
+CONFIG_GEN_CACHE_MAX_ENTRIES = 8
+
+
+def _create_node_config_archives(
+    config_tar: str,
+    config_segments: List[Union[str, List[Tuple[str, str]]]],
+    etc_tar: str,
+    etc_dir: str,
+    compression_level: int,
+) -> None:
+    """
+    Purpose:
+        Create the configs and etc archives for a single node. Runs in a worker
+        thread of RibDeployment.tar_configs
+    Args:
+        config_tar: Path to the configs archive to be written
+        config_segments: Contents of the configs archive, in order. Each segment is
+            either the path to a file containing a pre-compressed shared segment or
+            a list of node-specific (path, arcname) sources to be compressed
+        etc_tar: Path to the etc archive to be written
+        etc_dir: Path to the node's etc directory
+        compression_level: gzip compression level (1-9)
+    Return:
+        N/A
+    """
+    segments = []
+    for segment in config_segments:
+        if isinstance(segment, str):
+            with open(segment, "rb") as segment_file:
+                segments.append(segment_file.read())
+        else:
+            segments.append(general_utils.gzip_tar_members(segment, compression_level))
+    general_utils.write_tar_gz_segments(config_tar, segments)
+
+    with tarfile.open(etc_tar, "w:gz", compresslevel=compression_level) as out:
+        # Add etc files
+        out.add(etc_dir, arcname="")
+
+
+def _get_future_result_by_deadline(
+    future: concurrent.futures.Future,
+    deadline: float,
+    batch: Iterable[concurrent.futures.Future],
+) -> Any:
+    """
+    Purpose:
+        Get the result of a future that is part of a batch sharing a single
+        deadline. If the deadline passes, the batch's futures that have not
+        started yet are cancelled
+    Args:
+        future: Future to get the result of
+        deadline: time.monotonic() time by which the whole batch must complete
+        batch: All futures in the batch
+    Return:
+        result: Result of the future
+    Raises:
+        concurrent.futures.TimeoutError: if the deadline passes first
+    """
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except concurrent.futures.TimeoutError:
+        for pending_future in batch:
+            pending_future.cancel()
+        raise
+
 
 class RibDeployment(ABC):
     """
@@ -1041,6 +1133,7 @@ class RibDeployment(ABC):
         timeout: int = 300,
         max_iterations: int = 5,
         skip_config_tar: bool = False,
+        skip_config_cache: bool = False,
     ) -> None:
         """
         Purpose:
@@ -1054,6 +1147,8 @@ class RibDeployment(ABC):
             timeout (int): timeout for an individual iteration of a config generation script to run
             max_iterations(int): max number of iterations to run config generation through
             skip_config_tar(bool): skip taring configs
+            skip_config_cache(bool): neither restore configs from nor store them in the
+                config generation cache
         Returns:
             N/A
         """
@@ -1068,6 +1163,7 @@ class RibDeployment(ABC):
         timeout: int = 300,
         max_iterations: int = 5,
         skip_config_tar: bool = False,
+        skip_config_cache: bool = False,
     ) -> None:
         """
         Purpose:
@@ -1082,6 +1178,8 @@ class RibDeployment(ABC):
             timeout (int): timeout for an individual iteration of a config generation script to run
             max_iterations(int): max number of iterations to run config generation through
             skip_config_tar(bool): skip taring configs
+            skip_config_cache(bool): neither restore configs from nor store them in the
+                config generation cache
         Returns:
             N/A
         """
@@ -1110,6 +1208,74 @@ class RibDeployment(ABC):
             os.mkdir(self.paths.dirs["comms_configs_base"])
             os.mkdir(self.paths.dirs["artifact_manager_configs_base"])
 
+        # Identical inputs produce identical configs, so reuse the outputs of a previous
+        # run when possible (unless forcing a fresh generation or skipping the cache)
+        cache_key = None
+        if not skip_config_cache:
+            cache_key = self._get_config_gen_cache_key(
+                local=local,
+                network_manager_custom_args=network_manager_custom_args,
+                comms_custom_args_map=comms_custom_args_map,
+                artifact_manager_custom_args_map=artifact_manager_custom_args_map,
+                max_iterations=max_iterations,
+            )
+        network_manager_config_gen_status = None
+        if cache_key and not force:
+            network_manager_config_gen_status = self._restore_cached_configs(cache_key)
+
+        if network_manager_config_gen_status is None:
+            network_manager_config_gen_status = self._run_config_generators(
+                local=local,
+                network_manager_custom_args=network_manager_custom_args,
+                comms_custom_args_map=comms_custom_args_map,
+                artifact_manager_custom_args_map=artifact_manager_custom_args_map,
+                timeout=timeout,
+                max_iterations=max_iterations,
+            )
+            if (
+                cache_key
+                and network_manager_config_gen_status.get("status") == "complete"
+            ):
+                self._cache_configs(cache_key)
+
+        if network_manager_config_gen_status:
+            exit_reason = network_manager_config_gen_status.get("reason")
+            if len(exit_reason) > 500:
+                exit_reason = exit_reason[:500] + "..."
+        else:
+            exit_reason = "Network manager failed to produce network-manager-config-gen-status.json"
+        logger.info(
+            f'Network manager config gen status: {network_manager_config_gen_status.get("status")}, reason: {exit_reason}'
+        )
+        if not skip_config_tar:
+            self.tar_configs(force=force)
+
+    def _run_config_generators(
+        self,
+        local: bool,
+        network_manager_custom_args: str,
+        comms_custom_args_map: Dict[str, Any],
+        artifact_manager_custom_args_map: Dict[str, Any],
+        timeout: int,
+        max_iterations: int,
+    ) -> Dict[str, Any]:
+        """
+        Purpose:
+            Run the network manager, comms and artifact manager config generators until
+            the network manager reports that config generation is complete (or the max
+            number of iterations is reached)
+        Args:
+            local (bool): whether or not to include --local flag (which indicates
+                RiB local mode to the generators) to all config generators
+            network_manager_custom_args (str): custom arguments to pass to network manager config generator
+            comms_custom_args_map (dict): map of channel_ids to dict of custom args and values to pass to channel config generators
+            artifact_manager_custom_args_map: map of plugin_ids to dict of custom args and values to pass to artifact manager config generators
+            timeout (int): timeout for an individual iteration of a config generation script to run
+            max_iterations(int): max number of iterations to run config generation through
+        Returns:
+            Network manager config gen status
+        """
+
         try:
             full_channel_list = self.get_deployment_channels_list()
             general_utils.write_data_to_file(
@@ -1162,17 +1328,24 @@ class RibDeployment(ABC):
                         network_manager_user_responses_file, data_format="json"
                     )
 
-                # Run Comms Config Gen for all channels
+                # Run Comms Config Gen for all channels. Each channel generates into its
+                # own directory, so they can run concurrently
+                self._run_config_gens_concurrently(
+                    {
+                        f"Comms ({channel.name})": functools.partial(
+                            self.run_comms_config_gen,
+                            local=local,
+                            comms_custom_args_map=comms_custom_args_map,
+                            channel=channel,
+                            timeout=timeout,
+                        )
+                        for channel in self.config.comms_channels
+                    }
+                )
+
                 fulfilled_requests = []
                 genenesis_link_addresses = {}
                 for channel in self.config.comms_channels:
-                    self.run_comms_config_gen(
-                        local=local,
-                        comms_custom_args_map=comms_custom_args_map,
-                        channel=channel,
-                        timeout=timeout,
-                    )
-
                     # Get genesis link addresses for channel
                     channel_config_dir = f'{self.paths.dirs["comms_configs_base"]}/{channel.kit_name}/{channel.name}'
                     try:
@@ -1261,15 +1434,20 @@ class RibDeployment(ABC):
                     "json",
                 )
 
-            # Run config gen for all artifact manager channels
+            # Run config gen for all artifact manager plugins
+            self._run_config_gens_concurrently(
+                {
+                    f"ArtifactManager ({kit.name})": functools.partial(
+                        self.run_artifact_manager_config_gen,
+                        kit=kit,
+                        local=local,
+                        custom_args_map=artifact_manager_custom_args_map,
+                        timeout=timeout,
+                    )
+                    for kit in self.config.artifact_manager_kits
+                }
+            )
             for kit in self.config.artifact_manager_kits:
-                self.run_artifact_manager_config_gen(
-                    kit=kit,
-                    local=local,
-                    custom_args_map=artifact_manager_custom_args_map,
-                    timeout=timeout,
-                )
-
                 plugin_user_responses_file = f'{self.paths.dirs["artifact_manager_configs_base"]}/{kit.name}/user-responses.json'
                 if os.path.exists(plugin_user_responses_file):
                     user_responses_by_plugin_id[
@@ -1281,7 +1459,7 @@ class RibDeployment(ABC):
             # Create node-specific user response files from plugin responses
             self.create_user_responses(user_responses_by_plugin_id)
         except Exception as err:
-            message = str(err)
+            message = err.msg if isinstance(err, error_utils.RIB355) else str(err)
             if len(message) > 1000:
                 message = message[:1000] + "..."
             raise error_utils.RIB333(
@@ -1290,17 +1468,265 @@ class RibDeployment(ABC):
                 message=message,
             ) from None
 
-        if network_manager_config_gen_status:
-            exit_reason = network_manager_config_gen_status.get("reason")
-            if len(exit_reason) > 500:
-                exit_reason = exit_reason[:500] + "..."
-        else:
-            exit_reason = "Network manager failed to produce network-manager-config-gen-status.json"
-        logger.info(
-            f'Network manager config gen status: {network_manager_config_gen_status.get("status")}, reason: {exit_reason}'
+        return network_manager_config_gen_status
+
+    def _get_config_gen_cache_key(self, **generator_args: Any) -> Optional[str]:
+        """
+        Purpose:
+            Get the content hash of all config generation inputs: the range config, the
+            checksums of the kits that provide the generators, the channels and the
+            generator arguments
+        Args:
+            generator_args: arguments passed to the config generators
+        Returns:
+            Cache key, or None if the inputs could not be read
+        """
+
+        try:
+            with open(self.paths.files["race_config"], "rb") as race_config_file:
+                range_config_checksum = hashlib.sha256(
+                    race_config_file.read()
+                ).hexdigest()
+        except OSError as err:
+            logger.debug(f"Not using config generation cache: {err}")
+            return None
+
+        # Kits downloaded before kit checksums were implemented can't be told apart
+        kit_caches = [
+            self.metadata.race_core_cache,
+            self.metadata.network_manager_kit_cache,
+            *self.metadata.comms_kits_cache.values(),
+            *self.metadata.artifact_manager_kits_cache.values(),
+        ]
+        if any(
+            kit_cache.checksum in ("", "to-be-implemented") for kit_cache in kit_caches
+        ):
+            logger.debug("Not using config generation cache: kit checksums unknown")
+            return None
+
+        inputs = {
+            "rib_version": self.rib_config.RIB_VERSION,
+            "range_config": range_config_checksum,
+            "race_core": self.metadata.race_core_cache.checksum,
+            "network_manager_kit": [
+                self.config.network_manager_kit.name,
+                self.metadata.network_manager_kit_cache.checksum,
+            ],
+            "comms_kits": {
+                name: cache.checksum
+                for name, cache in self.metadata.comms_kits_cache.items()
+            },
+            "comms_channels": [
+                [channel.kit_name, channel.name]
+                for channel in self.config.comms_channels
+            ],
+            "artifact_manager_kits": {
+                name: cache.checksum
+                for name, cache in self.metadata.artifact_manager_kits_cache.items()
+            },
+            "generator_args": generator_args,
+        }
+        return hashlib.sha256(
+            json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def _get_config_gen_cache_dirs(self) -> Dict[str, str]:
+        """
+        Purpose:
+            Get the deployment directories produced by config generation, by the name
+            they are stored under in the config generation cache
+        Args:
+            N/A
+        Returns:
+            Generated config directories, by cache entry name
+        """
+        return {
+            "network-manager": self.paths.dirs["network_manager_configs_base"],
+            "comms": self.paths.dirs["comms_configs_base"],
+            "artifact-manager": self.paths.dirs["artifact_manager_configs_base"],
+        }
+
+    def _get_config_gen_cache_dir(self, cache_key: str) -> str:
+        """
+        Purpose:
+            Get the config generation cache entry directory for the given key
+        Args:
+            cache_key: Hash of the config generation inputs
+        Returns:
+            Path to the cache entry directory
+        """
+        return os.path.join(
+            self.rib_config.RIB_PATHS["docker"]["cache"], "config-gen", cache_key
         )
-        if not skip_config_tar:
-            self.tar_configs(force=force)
+
+    def _cache_configs(self, cache_key: str) -> None:
+        """
+        Purpose:
+            Store the generated configs, channel list and node user responses in the
+            config generation cache under the given key
+        Args:
+            cache_key: Hash of the config generation inputs
+        Returns:
+            N/A
+        """
+
+        cache_dir = self._get_config_gen_cache_dir(cache_key)
+        if os.path.isdir(cache_dir):
+            self._touch_config_gen_cache_entry(cache_dir)
+            return
+
+        tmp_dir = None
+        try:
+            os.makedirs(os.path.dirname(cache_dir), exist_ok=True)
+            # Populate a temporary entry then rename it so that a partially-written entry
+            # is never restored
+            tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(cache_dir), prefix=".tmp-")
+            for name, src_dir in self._get_config_gen_cache_dirs().items():
+                shutil.copytree(src_dir, os.path.join(tmp_dir, name), symlinks=True)
+            shutil.copy2(
+                self.paths.files["channel_list"],
+                os.path.join(tmp_dir, self.paths.filenames["channel_list"]),
+            )
+            for persona in os.listdir(self.paths.dirs["etc"]):
+                for filename in USER_RESPONSES_FILENAMES:
+                    src_file = os.path.join(self.paths.dirs["etc"], persona, filename)
+                    if os.path.isfile(src_file):
+                        os.makedirs(
+                            os.path.join(tmp_dir, "etc", persona), exist_ok=True
+                        )
+                        shutil.copy2(src_file, os.path.join(tmp_dir, "etc", persona))
+            os.rename(tmp_dir, cache_dir)
+        except OSError as err:
+            logger.warning(f"Unable to cache generated configs: {err}")
+            if tmp_dir:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        self._prune_config_gen_cache()
+
+    def _prune_config_gen_cache(self) -> None:
+        """
+        Purpose:
+            Remove the least recently used entries of the config generation cache so
+            that at most CONFIG_GEN_CACHE_MAX_ENTRIES entries are kept
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+
+        cache_root = os.path.join(
+            self.rib_config.RIB_PATHS["docker"]["cache"], "config-gen"
+        )
+        try:
+            # Entries being populated are hidden until complete, so are never removed
+            entries = [
+                entry
+                for entry in os.scandir(cache_root)
+                if entry.is_dir(follow_symlinks=False)
+                and not entry.name.startswith(".")
+            ]
+            entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        except OSError as err:
+            logger.warning(f"Unable to prune config generation cache: {err}")
+            return
+
+        for entry in entries[CONFIG_GEN_CACHE_MAX_ENTRIES:]:
+            logger.debug(f"Removing config generation cache entry {entry.name[:12]}")
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+    @staticmethod
+    def _touch_config_gen_cache_entry(cache_dir: str) -> None:
+        """
+        Purpose:
+            Mark a config generation cache entry as the most recently used
+        Args:
+            cache_dir: Path to the cache entry directory
+        Returns:
+            N/A
+        """
+        try:
+            os.utime(cache_dir)
+        except OSError as err:
+            logger.debug(f"Unable to update config generation cache entry: {err}")
+
+    def _restore_cached_configs(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Purpose:
+            Restore generated configs, channel list and node user responses from the
+            config generation cache
+        Args:
+            cache_key: Hash of the config generation inputs
+        Returns:
+            Network manager config gen status, or None if there was no cached entry
+        """
+
+        cache_dir = self._get_config_gen_cache_dir(cache_key)
+        if not os.path.isdir(cache_dir):
+            return None
+
+        logger.info(f"Restoring generated configs from cache ({cache_key[:12]})")
+        self._touch_config_gen_cache_entry(cache_dir)
+        for name, dest_dir in self._get_config_gen_cache_dirs().items():
+            if os.path.exists(dest_dir):
+                general_utils.remove_dir_file(dest_dir)
+            shutil.copytree(os.path.join(cache_dir, name), dest_dir, symlinks=True)
+        shutil.copy2(
+            os.path.join(cache_dir, self.paths.filenames["channel_list"]),
+            self.paths.files["channel_list"],
+        )
+        cached_etc_dir = os.path.join(cache_dir, "etc")
+        if os.path.isdir(cached_etc_dir):
+            shutil.copytree(cached_etc_dir, self.paths.dirs["etc"], dirs_exist_ok=True)
+
+        return general_utils.load_file_into_memory(
+            f'{self.paths.dirs["network_manager_configs_base"]}/{self.config.network_manager_kit.name}/network-manager-config-gen-status.json',
+            data_format="json",
+        )
+
+    @staticmethod
+    def _run_config_gens_concurrently(
+        config_gens: Dict[str, Callable[[], None]],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Purpose:
+            Run independent config generators on a bounded thread pool, waiting for all
+            of them to finish before reporting any failures
+        Args:
+            config_gens: config generator callables, by description
+            max_workers: max number of generators to run at once (defaults to the
+                number of CPUs)
+        Returns:
+            N/A
+        Raises:
+            Exception: the original error, if a single config generator failed
+            error_utils.RIB355: if multiple config generators failed
+        """
+
+        if not config_gens:
+            return
+
+        max_workers = min(len(config_gens), max_workers or system_utils.get_cpu_count())
+        failures = {}
+        with threading_utils.ContextThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = {
+                executor.submit(config_gen): name
+                for name, config_gen in config_gens.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as err:
+                    failures[futures[future]] = err
+
+        if len(failures) == 1:
+            raise next(iter(failures.values()))
+        if failures:
+            # Report every failure, chained to the first so its traceback is kept
+            raise error_utils.RIB355(failures) from failures[min(failures)]
 
     def run_network_manager_config_gen(
         self,
@@ -1396,6 +1822,7 @@ class RibDeployment(ABC):
         subprocess_utils.run(
             cmd_as_str,
             check=True,
+            logger=logger.getChild(f"config_gen.{channel.name}"),
             shell=True,
             stdout_level=logging.DEBUG,
             timeout=timeout,
@@ -1444,6 +1871,7 @@ class RibDeployment(ABC):
         subprocess_utils.run(
             cmd_as_str,
             check=True,
+            logger=logger.getChild(f"config_gen.{kit.name}"),
             shell=True,
             stdout_level=logging.DEBUG,
             timeout=timeout,
@@ -1473,19 +1901,20 @@ class RibDeployment(ABC):
     # Artifact distribution related methods
     ###
 
-    def copy_plugin_to_distribution_dir(
+    def get_plugin_distribution_artifacts(
         self, plugin_name: str, plugin_type: str
-    ) -> None:
+    ) -> Dict[str, str]:
         """
         Purpose:
-            Copy plugin artifacts to distribution directory as zip files
+            Get the distribution artifact zip files for a plugin
         Args:
             plugin_name: Name of plugin
             plugin_type: Type of plugin (network-manager, comms, core, artifact-manager)
         Return:
-            N/A
+            Plugin artifacts directory to be zipped, by output zip file
         """
 
+        distribution_artifacts = {}
         for (
             platform,
             architecture,
@@ -1507,46 +1936,138 @@ class RibDeployment(ABC):
             if os.path.isdir(platform_artifacts_path):
                 # Copy plugins to distribution dir and prepend platform
                 output_file = f'{self.paths.dirs["distribution_artifacts"]}/{platform}-{architecture}-{node_type}-{plugin_name}.zip'
-                general_utils.zip_directory(
-                    dir_path=platform_artifacts_path,
-                    output_file=output_file,
-                )
-                logger.trace(f"copied {platform_artifacts_path} into {output_file}")
+                distribution_artifacts[output_file] = platform_artifacts_path
 
-    def create_distribution_artifacts(self) -> None:
+        return distribution_artifacts
+
+    def copy_plugin_to_distribution_dir(
+        self, plugin_name: str, plugin_type: str
+    ) -> None:
         """
         Purpose:
-            Create zip archives for plugins and apps to be distributed/used by artifact manager plugins
+            Copy plugin artifacts to distribution directory as zip files
         Args:
+            plugin_name: Name of plugin
+            plugin_type: Type of plugin (network-manager, comms, core, artifact-manager)
+        Return:
             N/A
+        """
+
+        for (
+            output_file,
+            platform_artifacts_path,
+        ) in self.get_plugin_distribution_artifacts(plugin_name, plugin_type).items():
+            general_utils.zip_directory(
+                dir_path=platform_artifacts_path,
+                output_file=output_file,
+            )
+            logger.trace(f"copied {platform_artifacts_path} into {output_file}")
+
+    def create_distribution_artifacts(
+        self, incremental: bool = True, include_digests: bool = False
+    ) -> None:
+        """
+        Purpose:
+            Create zip archives for plugins and apps to be distributed/used by artifact manager plugins.
+
+            In incremental mode, a manifest of the fingerprint of each zip's plugin
+            artifacts is kept and zips whose artifacts are unchanged are not rebuilt.
+            Zips that need to be built are built in parallel.
+        Args:
+            incremental: Whether to reuse existing zips whose artifacts are unchanged
+            include_digests: Whether to fingerprint artifacts by their contents rather
+                than only by their file sizes and modification times
         Return:
             N/A
         """
 
+        distribution_artifacts = {}
+        distribution_artifacts.update(
+            self.get_plugin_distribution_artifacts(
+                self.config.network_manager_kit.name, "network-manager"
+            )
+        )
+        for kit in self.config.comms_kits:
+            distribution_artifacts.update(
+                self.get_plugin_distribution_artifacts(kit.name, "comms")
+            )
+        # Only copy in the apps if the deployment contains non-genesis nodes
+        if self.bootstrap_client_personas:
+            distribution_artifacts.update(
+                self.get_plugin_distribution_artifacts("race", "core")
+            )
+        for kit in self.config.artifact_manager_kits:
+            distribution_artifacts.update(
+                self.get_plugin_distribution_artifacts(kit.name, "artifact-manager")
+            )
+
+        manifest_file = self.paths.files["distribution_manifest"]
+        previous_manifest = {}
+        if incremental and os.path.isfile(manifest_file):
+            try:
+                previous_manifest = general_utils.load_file_into_memory(
+                    manifest_file, data_format="json"
+                )
+            except Exception as err:
+                logger.debug(f"Ignoring invalid distribution manifest: {err}")
+
+        manifest = {
+            os.path.basename(output_file): general_utils.get_directory_fingerprint(
+                platform_artifacts_path, include_digests=include_digests
+            )
+            for output_file, platform_artifacts_path in distribution_artifacts.items()
+        }
+        artifacts_to_zip = {
+            output_file: platform_artifacts_path
+            for output_file, platform_artifacts_path in distribution_artifacts.items()
+            if not os.path.isfile(output_file)
+            or previous_manifest.get(os.path.basename(output_file))
+            != manifest[os.path.basename(output_file)]
+        }
+
         logger.debug(f"Clearing artifact distribution directory...")
 
         dir_contents = general_utils.get_contents_of_dir(
             self.paths.dirs["distribution_artifacts"]
         )
         for item in dir_contents:
+            # Keep zips that are up to date
+            if item in distribution_artifacts and item not in artifacts_to_zip:
+                continue
             general_utils.remove_dir_file(item)
             logger.trace(f"Removed distribution artifact: {item}")
 
-        logger.debug(f"Copying artifacts into distribution directory...")
-
-        self.copy_plugin_to_distribution_dir(
-            self.config.network_manager_kit.name, "network-manager"
+        logger.debug(
+            f"Copying {len(artifacts_to_zip)}/{len(distribution_artifacts)} artifacts "
+            "into distribution directory..."
         )
 
-        for kit in self.config.comms_kits:
-            self.copy_plugin_to_distribution_dir(kit.name, "comms")
+        if artifacts_to_zip:
+            # Don't trust any zip left behind if the build is interrupted
+            if os.path.isfile(manifest_file):
+                os.remove(manifest_file)
 
-        # Only copy in the apps if the deployment contains non-genesis nodes
-        if self.bootstrap_client_personas:
-            self.copy_plugin_to_distribution_dir("race", "core")
+            # Compression happens in zlib, which releases the GIL, so threads are
+            # used rather than forking a (possibly multi-threaded) process
+            with threading_utils.ContextThreadPoolExecutor(
+                max_workers=max(
+                    1, min(system_utils.get_cpu_count(), len(artifacts_to_zip))
+                )
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        general_utils.zip_directory,
+                        dir_path=platform_artifacts_path,
+                        output_file=output_file,
+                    ): (output_file, platform_artifacts_path)
+                    for output_file, platform_artifacts_path in artifacts_to_zip.items()
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    (output_file, platform_artifacts_path) = futures[future]
+                    future.result()
+                    logger.trace(f"copied {platform_artifacts_path} into {output_file}")
 
-        for kit in self.config.artifact_manager_kits:
-            self.copy_plugin_to_distribution_dir(kit.name, "artifact-manager")
+        general_utils.write_data_to_file(manifest_file, manifest, data_format="json")
 
     def get_plugins(
         self,
@@ -1826,6 +2347,10 @@ class RibDeployment(ABC):
             {"name": name},
         )
 
+        deployment_index = self.get_deployment_index()
+        deployment_index.remove(self.config["name"])
+        deployment_index.update(name)
+
     ###
     # Copy Deployment Methods
     ###
@@ -1879,6 +2404,8 @@ class RibDeployment(ABC):
             }
         )
 
+        self.get_deployment_index().update(name)
+
     ###
     # Delete Deployment Methods
     ###
@@ -1911,6 +2438,8 @@ class RibDeployment(ABC):
         # Remove the deployment dir
         shutil.rmtree(self.paths.dirs["base"])
 
+        self.get_deployment_index().remove(self.config["name"])
+
     ###
     # Setup/Teardown Deployment Methods
     ###
@@ -2494,15 +3023,24 @@ class RibDeployment(ABC):
     ###
 
     def tar_configs(
-        self, nodes: Optional[List[str]] = None, timeout: int = 120, force: bool = False
+        self,
+        nodes: Optional[List[str]] = None,
+        timeout: int = 120,
+        force: bool = False,
+        compression_level: int = DEFAULT_ARCHIVE_COMPRESSION_LEVEL,
     ) -> None:
         """
         Purpose:
-            Tar configs
+            Tar configs. Archives are created in parallel on a thread pool (one
+            worker per CPU), and configs shared between nodes are compressed once and
+            reused in each node's archive. All archives share a single deadline: once
+            it passes, archives that haven't started are cancelled and the timeout is
+            raised
         Args:
             nodes: What nodes to tar configs for. If None, all nodes will be used
-            timeout: Time in seconds to timeout if tar fails
+            timeout: Time in seconds allowed to create all of the archives
             force: Ignore status checks
+            compression_level: gzip compression level (1-9) of the archives
         Return:
             N/A
         """
@@ -2523,81 +3061,150 @@ class RibDeployment(ABC):
             force=force,
             offline=active_deployment and active_deployment != self.config["name"],
         )
-        for persona in nodes_with_configs:
-            # Create tar.gz
-            config_tar = "/".join(
-                [
-                    self.paths.dirs["race_configs"],
-                    f"{self.config['name']}_{persona}_configs.tar.gz",
+        if not nodes_with_configs:
+            return
+
+        network_manager_plugin_name = self.config.network_manager_kit.name
+        network_manager_configs = f'{self.paths.dirs["network_manager_configs_base"]}/{network_manager_plugin_name}'
+
+        # Configs shared between genesis nodes, only compressed once
+        genesis_nodes = [
+            persona
+            for persona in nodes_with_configs
+            if persona in self.genesis_personas
+        ]
+        shared_sources: Dict[str, List[Tuple[str, str]]] = {}
+        if genesis_nodes:
+            network_manager_shared_configs = f"{network_manager_configs}/shared/"
+            if os.path.exists(network_manager_shared_configs):
+                shared_sources["network_manager"] = [
+                    (
+                        network_manager_shared_configs,
+                        f"data/configs/{network_manager_plugin_name}",
+                    )
                 ]
-            )
-            if os.path.isfile(config_tar):
-                # No need to have a separate message/check about using force
-                # because the precondition status check will fail if the file
-                # exists and 'force' wasn't used
-                os.remove(config_tar)
-            with tarfile.open(config_tar, "w:gz") as out:
-                # Only provide configs to genesis nodes.
+            if any(
+                persona in self.android_client_personas for persona in genesis_nodes
+            ):
+                shared_sources["android_sdk"] = [
+                    (f'{self.paths.dirs["global_android_configs"]}', "data/configs/sdk")
+                ]
+            if any(
+                persona not in self.android_client_personas for persona in genesis_nodes
+            ):
+                shared_sources["linux_sdk"] = [
+                    (f'{self.paths.dirs["global_linux_configs"]}', "data/configs/sdk")
+                ]
+            for channel in self.config.comms_channels:
+                comms_shared_configs = f'{self.paths.dirs["comms_configs_base"]}/{channel.kit_name}/{channel.name}/shared/'
+                if os.path.exists(comms_shared_configs):
+                    shared_sources[f"comms_{channel.name}"] = [
+                        (
+                            comms_shared_configs,
+                            f"data/configs/{channel.kit_name}/{channel.name}",
+                        )
+                    ]
+
+        # Compression happens in zlib, which releases the GIL, so threads are used
+        # rather than forking a (possibly multi-threaded) process
+        max_workers = max(1, min(system_utils.get_cpu_count(), len(nodes_with_configs)))
+        deadline = time.monotonic() + timeout
+        with tempfile.TemporaryDirectory() as shared_dir, threading_utils.ContextThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            shared_futures = {
+                name: executor.submit(
+                    general_utils.gzip_tar_members, sources, compression_level
+                )
+                for name, sources in shared_sources.items()
+            }
+            shared_segments = {}
+            for name, future in shared_futures.items():
+                shared_segments[name] = f"{shared_dir}/{name}.tar.gz"
+                with open(shared_segments[name], "wb") as segment_file:
+                    segment_file.write(
+                        _get_future_result_by_deadline(
+                            future, deadline, shared_futures.values()
+                        )
+                    )
+
+            node_futures = {}
+            for persona in nodes_with_configs:
+                config_tar = "/".join(
+                    [
+                        self.paths.dirs["race_configs"],
+                        f"{self.config['name']}_{persona}_configs.tar.gz",
+                    ]
+                )
+                if os.path.isfile(config_tar):
+                    # No need to have a separate message/check about using force
+                    # because the precondition status check will fail if the file
+                    # exists and 'force' wasn't used
+                    os.remove(config_tar)
+
+                # Only provide configs to genesis nodes. Segments are in the order
+                # they are extracted, so shared configs override node configs
+                config_segments = []
                 if persona in self.genesis_personas:
                     # Add Network Manager Configs
-                    network_manager_plugin_name = self.config.network_manager_kit.name
-                    out.add(
-                        f'{self.paths.dirs["network_manager_configs_base"]}/{network_manager_plugin_name}/{persona}/',
-                        arcname=f"data/configs/{network_manager_plugin_name}",
+                    config_segments.append(
+                        [
+                            (
+                                f"{network_manager_configs}/{persona}/",
+                                f"data/configs/{network_manager_plugin_name}",
+                            )
+                        ]
                     )
-                    network_manager_shared_configs = f'{self.paths.dirs["network_manager_configs_base"]}/{network_manager_plugin_name}/shared/'
-                    if os.path.exists(network_manager_shared_configs):
-                        out.add(
-                            network_manager_shared_configs,
-                            arcname=f"data/configs/{network_manager_plugin_name}",
-                        )
+                    if "network_manager" in shared_segments:
+                        config_segments.append(shared_segments["network_manager"])
                     # Add Global Configs
                     if persona in self.android_client_personas:
-                        out.add(
-                            f'{self.paths.dirs["global_android_configs"]}',
-                            arcname=f"data/configs/sdk",
-                        )
+                        config_segments.append(shared_segments["android_sdk"])
                     else:
-                        out.add(
-                            f'{self.paths.dirs["global_linux_configs"]}',
-                            arcname=f"data/configs/sdk",
-                        )
+                        config_segments.append(shared_segments["linux_sdk"])
 
                     # Add comms Configs
                     for channel in self.config.comms_channels:
                         comms_persona_configs = f'{self.paths.dirs["comms_configs_base"]}/{channel.kit_name}/{channel.name}/{persona}/'
                         if os.path.exists(comms_persona_configs):
-                            out.add(
-                                comms_persona_configs,
-                                arcname=f"data/configs/{channel.kit_name}/{channel.name}",
+                            config_segments.append(
+                                [
+                                    (
+                                        comms_persona_configs,
+                                        f"data/configs/{channel.kit_name}/{channel.name}",
+                                    )
+                                ]
                             )
-
-                        comms_shared_configs = f'{self.paths.dirs["comms_configs_base"]}/{channel.kit_name}/{channel.name}/shared/'
-                        if os.path.exists(comms_shared_configs):
-                            out.add(
-                                comms_shared_configs,
-                                arcname=f"data/configs/{channel.kit_name}/{channel.name}",
+                        if f"comms_{channel.name}" in shared_segments:
+                            config_segments.append(
+                                shared_segments[f"comms_{channel.name}"]
                             )
 
-                out.close()
+                # Create etc tar.gz
+                etc_tar = "/".join(
+                    [
+                        self.paths.dirs["etc"],
+                        f"{self.config['name']}_{persona}_etc.tar.gz",
+                    ]
+                )
+                if os.path.isfile(etc_tar) and force:
+                    # No need to have a separate message/check about using force
+                    # because the precondition status check will fail if the file
+                    # exists and 'force' wasn't used
+                    os.remove(etc_tar)
+
+                node_futures[persona] = executor.submit(
+                    _create_node_config_archives,
+                    config_tar=config_tar,
+                    config_segments=config_segments,
+                    etc_tar=etc_tar,
+                    etc_dir=f'{self.paths.dirs["etc"]}/{persona}',
+                    compression_level=compression_level,
+                )
 
-            # Create etc tar.gz
-            etc_tar = "/".join(
-                [
-                    self.paths.dirs["etc"],
-                    f"{self.config['name']}_{persona}_etc.tar.gz",
-                ]
-            )
-            if os.path.isfile(etc_tar) and force:
-                # No need to have a separate message/check about using force
-                # because the precondition status check will fail if the file
-                # exists and 'force' wasn't used
-                os.remove(etc_tar)
-            with tarfile.open(etc_tar, "w:gz") as out:
-                # Add etc files
-                out.add(f'{self.paths.dirs["etc"]}/{persona}', arcname="")
-                out.close()
-            logger.info(f"Created configs/etc archives for {persona}")
+            for persona, future in node_futures.items():
+                _get_future_result_by_deadline(future, deadline, node_futures.values())
+                logger.info(f"Created configs/etc archives for {persona}")
 
     def upload_configs(
         self,
@@ -2635,6 +3242,7 @@ class RibDeployment(ABC):
             require=require,
             quiet=quiet,
         )
+        tars_to_upload = []
         for persona in nodes_with_config_tars:
             config_tar = "/".join(
                 [
@@ -2642,7 +3250,7 @@ class RibDeployment(ABC):
                     f"{self.config['name']}_{persona}_configs.tar.gz",
                 ]
             )
-            self.file_server_client.upload_file(config_tar)
+            tars_to_upload.append(config_tar)
 
             etc_tar = "/".join(
                 [
@@ -2650,7 +3258,29 @@ class RibDeployment(ABC):
                     f"{self.config['name']}_{persona}_etc.tar.gz",
                 ]
             )
-            self.file_server_client.upload_file(etc_tar)
+            tars_to_upload.append(etc_tar)
+
+        self.upload_files_to_file_server(tars_to_upload, timeout=timeout)
+
+    def upload_files_to_file_server(self, files: List[str], timeout: int = 120) -> None:
+        """
+        Purpose:
+            Upload files to the file server concurrently. All uploads are attempted
+            before any failure is reported
+        Args:
+            files: Full paths to the local files to upload
+            timeout: Time in seconds to timeout if an upload fails
+        Return:
+            N/A
+        Raises:
+            error_utils.RIB354: if any of the files failed to upload
+        """
+        errors = self.file_server_client.upload_files(files, timeout=timeout)
+        if errors:
+            logger.warning(
+                f"Failed to upload {len(errors)}/{len(files)} files to the file server"
+            )
+            raise error_utils.RIB354(errors)
 
     def install_configs(
         self,
@@ -2681,13 +3311,19 @@ class RibDeployment(ABC):
             force=force,
             quiet=quiet,
         )
-        for node_name in nodes_to_install:
-            pull_etc_only = False if node_name in nodes_with_configs_pushed else True
-            self.race_node_interface.pull_configs(
-                deployment_name=self.config["name"],
-                persona=node_name,
-                etc_only=pull_etc_only,
-            )
+        with self.race_node_interface.batch_actions() as batch:
+            for node_name in nodes_to_install:
+                pull_etc_only = (
+                    False if node_name in nodes_with_configs_pushed else True
+                )
+                self.race_node_interface.pull_configs(
+                    deployment_name=self.config["name"],
+                    persona=node_name,
+                    etc_only=pull_etc_only,
+                )
+
+        if batch.errors:
+            raise error_utils.RIB412(action="install configs", reasons=batch.errors)
 
     def delete_config_tars(self) -> None:
         """
@@ -2750,11 +3386,13 @@ class RibDeployment(ABC):
             self.upload_artifacts(timeout=timeout)
 
         failed_to_start = {}
-        for node_name in can_be_started:
-            try:
-                self.race_node_interface.start_app(node_name)
-            except Exception as error:
-                failed_to_start[node_name] = error
+        with self.race_node_interface.batch_actions() as batch:
+            for node_name in can_be_started:
+                try:
+                    self.race_node_interface.start_app(node_name)
+                except Exception as error:
+                    failed_to_start[node_name] = error
+        failed_to_start.update(batch.errors)
 
         if failed_to_start:
             raise error_utils.RIB412(action="start", reasons=failed_to_start)
@@ -2777,6 +3415,114 @@ class RibDeployment(ABC):
             }
         )
 
+    def _retrieve_node_archives(
+        self,
+        archive_names: Dict[str, str],
+        dest_dir: str,
+        timeout: int,
+        tar_errorlevel: int = 1,
+    ) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Purpose:
+            Retrieve the archives that nodes upload to the file server and extract each
+            one into <dest_dir>/<node name>.
+
+            The file server is listed once per poll interval to find which archives are
+            ready. Ready archives are downloaded concurrently over the file server
+            client's pooled connections and extracted on a separate worker pool, so
+            downloads are not held up by extraction. A node whose download or
+            extraction fails is given one more attempt.
+        Args:
+            archive_names: Name of the archive on the file server, by node name
+            dest_dir: Directory into which to extract the node archives
+            timeout: Time in seconds after which to stop waiting for archives
+            tar_errorlevel: Tarfile errorlevel with which to extract archives
+        Return:
+            Names of the nodes whose archives were not retrieved, and the errors of the
+                nodes that failed to be retrieved
+        """
+        waiting = dict(archive_names)
+        failed: Dict[str, str] = {}
+        in_progress: Dict[concurrent.futures.Future, Tuple[str, str]] = {}
+
+        def download(node_name: str) -> bool:
+            return self.file_server_client.download_file(
+                waiting[node_name],
+                os.path.join(dest_dir, f"{node_name}.tar.gz"),
+                timeout=timeout,
+            )
+
+        def extract(node_name: str) -> None:
+            archive_path = os.path.join(dest_dir, f"{node_name}.tar.gz")
+            node_dir = os.path.join(dest_dir, node_name)
+            os.makedirs(node_dir, exist_ok=True)
+            logger.trace(f"Extracting {archive_path} to {node_dir}")
+            with tarfile.open(archive_path, "r:gz", errorlevel=tar_errorlevel) as tar:
+                tar.extractall(node_dir)
+            os.remove(archive_path)
+
+        deadline = time.monotonic() + timeout
+        next_poll_time = time.monotonic()
+        with threading_utils.ContextThreadPoolExecutor(
+            max_workers=file_server_utils.DOWNLOAD_MAX_WORKERS
+        ) as download_executor, threading_utils.ContextThreadPoolExecutor(
+            max_workers=system_utils.get_cpu_count()
+        ) as extract_executor:
+            while waiting:
+                now = time.monotonic()
+                if now >= deadline and not in_progress:
+                    break
+
+                if now >= next_poll_time and now < deadline:
+                    next_poll_time = now + NODE_ARCHIVE_POLL_INTERVAL
+                    busy_nodes = {node_name for node_name, _ in in_progress.values()}
+                    try:
+                        self.file_server_client.invalidate_file_listing()
+                        listing = self.file_server_client.get_file_listing_snapshot()
+                    except Exception as error:
+                        logger.warning(f"Unable to list file server: {error}")
+                        listing = set()
+                    for node_name, archive_name in waiting.items():
+                        if node_name not in busy_nodes and archive_name in listing:
+                            future = download_executor.submit(download, node_name)
+                            in_progress[future] = (node_name, "download")
+
+                if not in_progress:
+                    time.sleep(max(0.0, min(next_poll_time, deadline) - now))
+                    continue
+
+                # Past the deadline, only wait for the retrievals already in progress
+                done, _ = concurrent.futures.wait(
+                    in_progress,
+                    timeout=(
+                        None
+                        if now >= deadline
+                        else max(0.0, next_poll_time - time.monotonic())
+                    ),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    node_name, stage = in_progress.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        if node_name not in failed:
+                            # This is the first time it failed, let it try once more
+                            failed[node_name] = ""
+                        else:
+                            # It already had a second chance, it's a lost cause
+                            del waiting[node_name]
+                            failed[node_name] = str(error)
+                        continue
+
+                    if stage == "extract":
+                        del waiting[node_name]
+                    elif result:
+                        future = extract_executor.submit(extract, node_name)
+                        in_progress[future] = (node_name, "extract")
+
+        return list(waiting), failed
+
     def rotate_logs(
         self,
         backup_id: Optional[str] = None,
@@ -2829,14 +3575,18 @@ class RibDeployment(ABC):
         )
 
         waiting_for_logs = []
-        for node_name in can_be_rotated:
-            try:
-                self.race_node_interface.rotate_logs(
-                    node_name, backup_id=backup_id, delete=delete
-                )
-                waiting_for_logs.append(node_name)
-            except Exception as error:
-                logger.error(f"Unable to rotate logs for {node_name}: {error}")
+        with self.race_node_interface.batch_actions() as batch:
+            for node_name in can_be_rotated:
+                try:
+                    self.race_node_interface.rotate_logs(
+                        node_name, backup_id=backup_id, delete=delete
+                    )
+                    waiting_for_logs.append(node_name)
+                except Exception as error:
+                    logger.error(f"Unable to rotate logs for {node_name}: {error}")
+        for node_name, error in batch.errors.items():
+            logger.error(f"Unable to rotate logs for {node_name}: {error}")
+            waiting_for_logs.remove(node_name)
 
         if backup_id:
             backup_dir = "/".join([self.paths.dirs["previous-runs"], backup_id])
@@ -2862,39 +3612,16 @@ class RibDeployment(ABC):
             logger.info(
                 f"Waiting for {len(waiting_for_logs)} nodes to backup log files...",
             )
-            failed_to_download = {}
-            command_run_time = datetime.now()
-            while waiting_for_logs:
-                for node_name in waiting_for_logs:
-                    try:
-                        log_bundle_name = f"logs-{backup_id}-{node_name}.tar.gz"
-                        log_bundle_path = "/".join([backup_dir, f"{node_name}.tar.gz"])
-                        if self.file_server_client.download_file(
-                            log_bundle_name, log_bundle_path
-                        ):
-                            log_dir = "/".join([backup_dir, node_name])
-                            os.makedirs(log_dir, exist_ok=True)
-                            with tarfile.open(log_bundle_path, "r:gz") as tar:
-                                tar.extractall(log_dir)
-                            os.remove(log_bundle_path)
-                            waiting_for_logs.remove(node_name)
-                    except Exception as error:
-                        if node_name not in failed_to_download:
-                            # This is the first time it failed, let it try once more
-                            failed_to_download[node_name] = ""
-                        else:
-                            # It already had a second chance, it's a lost cause
-                            waiting_for_logs.remove(node_name)
-                            failed_to_download[node_name] = str(error)
-
-                if not waiting_for_logs:
-                    logger.info("Done waiting for node log files")
-                    break
-
-                if (datetime.now() - command_run_time).seconds > timeout:
-                    break
-
-                time.sleep(1)
+            waiting_for_logs, failed_to_download = self._retrieve_node_archives(
+                {
+                    node_name: f"logs-{backup_id}-{node_name}.tar.gz"
+                    for node_name in waiting_for_logs
+                },
+                backup_dir,
+                timeout=timeout,
+            )
+            if not waiting_for_logs:
+                logger.info("Done waiting for node log files")
 
             # Report any failed downloads
             for node_name, error in failed_to_download.items():
@@ -2957,65 +3684,38 @@ class RibDeployment(ABC):
                     "Choose a different name and rerun the command",
                 )
 
-        log_prefix = "pull_runtime_configs: "
-
         waiting_for_configs = []
-        for node_name in nodes_with_runtime_configs:
-            try:
-                self.race_node_interface.push_runtime_configs(node_name, config_name)
-                waiting_for_configs.append(node_name)
-            except Exception as error:
-                logger.error(f"Unable to save runtime configs for {node_name}: {error}")
+        with self.race_node_interface.batch_actions() as batch:
+            for node_name in nodes_with_runtime_configs:
+                try:
+                    self.race_node_interface.push_runtime_configs(
+                        node_name, config_name
+                    )
+                    waiting_for_configs.append(node_name)
+                except Exception as error:
+                    logger.error(
+                        f"Unable to save runtime configs for {node_name}: {error}"
+                    )
+        for node_name, error in batch.errors.items():
+            logger.error(f"Unable to save runtime configs for {node_name}: {error}")
+            waiting_for_configs.remove(node_name)
 
         logger.info(
             f"Waiting for {len(waiting_for_configs)} nodes to save runtime configs...",
         )
 
         os.makedirs(config_dest_dir, exist_ok=True)
-        failed_to_download = {}
-        command_run_time = datetime.now()
-        while waiting_for_configs:
-            for node_name in waiting_for_configs:
-                try:
-                    config_tar_name = (
-                        f"runtime-configs-{config_name}-{node_name}.tar.gz"
-                    )
-                    config_tar_path = "/".join([config_dest_dir, f"{node_name}.tar.gz"])
-                    if self.file_server_client.download_file(
-                        config_tar_name, config_tar_path
-                    ):
-                        logger.trace(f"{log_prefix}downloaded file: {config_tar_path}")
-                        config_dir = "/".join([config_dest_dir, node_name])
-                        os.makedirs(config_dir, exist_ok=True)
-
-                        logger.trace(
-                            f"{log_prefix}extracting {config_tar_path} to {config_dir} ..."
-                        )
-                        with tarfile.open(config_tar_path, "r:gz", errorlevel=2) as tar:
-                            tar.extractall(config_dir)
-                        logger.trace(
-                            f"{log_prefix}extracted {config_tar_path} to {config_dir}"
-                        )
-
-                        os.remove(config_tar_path)
-                        waiting_for_configs.remove(node_name)
-                except Exception as error:
-                    if node_name not in failed_to_download:
-                        # This is the first time it failed, let it try once more.
-                        failed_to_download[node_name] = ""
-                    else:
-                        # If it failed once before just give up.
-                        waiting_for_configs.remove(node_name)
-                        failed_to_download[node_name] = str(error)
-
-            if not waiting_for_configs:
-                logger.info("Done waiting for node runtime configs")
-                break
-
-            if (datetime.now() - command_run_time).seconds > timeout:
-                break
-
-            time.sleep(1)
+        waiting_for_configs, failed_to_download = self._retrieve_node_archives(
+            {
+                node_name: f"runtime-configs-{config_name}-{node_name}.tar.gz"
+                for node_name in waiting_for_configs
+            },
+            config_dest_dir,
+            timeout=timeout,
+            tar_errorlevel=2,
+        )
+        if not waiting_for_configs:
+            logger.info("Done waiting for node runtime configs")
 
         # Report any failed downloads
         for node_name, error in failed_to_download.items():
@@ -3048,6 +3748,7 @@ class RibDeployment(ABC):
         # Upload the RACE configs to the file server.
         # Iterate over the runtime config directory. It *should* just be a list of
         # directories with the same names as personas in the deployment.
+        tars_to_upload = []
         for persona in os.listdir(config_src_dir):
             persona_config_path = f"{config_src_dir}/{persona}"
             # Check that the directory name is a valid persona.
@@ -3072,7 +3773,7 @@ class RibDeployment(ABC):
                     )
 
             # upload to file server
-            self.file_server_client.upload_file(config_tar)
+            tars_to_upload.append(config_tar)
 
             # Upload /etc/ configs.
             etc_tar = "/".join(
@@ -3081,7 +3782,9 @@ class RibDeployment(ABC):
                     f"{self.config['name']}_{persona}_etc.tar.gz",
                 ]
             )
-            self.file_server_client.upload_file(etc_tar)
+            tars_to_upload.append(etc_tar)
+
+        self.upload_files_to_file_server(tars_to_upload, timeout=timeout)
 
     def list_runtime_configs(self) -> List[str]:
         try:
@@ -3117,11 +3820,13 @@ class RibDeployment(ABC):
         )
 
         node_stop_errors = {}
-        for node_name in can_be_stopped:
-            try:
-                self.race_node_interface.stop_app(node_name)
-            except Exception as error:
-                node_stop_errors[node_name] = error
+        with self.race_node_interface.batch_actions() as batch:
+            for node_name in can_be_stopped:
+                try:
+                    self.race_node_interface.stop_app(node_name)
+                except Exception as error:
+                    node_stop_errors[node_name] = error
+        node_stop_errors.update(batch.errors)
 
         if node_stop_errors:
             raise error_utils.RIB412(action="stop", reasons=node_stop_errors)
@@ -3178,13 +3883,15 @@ class RibDeployment(ABC):
         if not can_be_cleared:
             return
         failed_to_clear = {}
-        for node_name in can_be_cleared:
-            try:
-                self.race_node_interface.clear_configs_and_etc(node_name)
-                if not self.config["nodes"][node_name]["genesis"]:
-                    self.race_node_interface.clear_artifacts(node_name)
-            except Exception as error:
-                failed_to_clear[node_name] = error
+        with self.race_node_interface.batch_actions() as batch:
+            for node_name in can_be_cleared:
+                try:
+                    self.race_node_interface.clear_configs_and_etc(node_name)
+                    if not self.config["nodes"][node_name]["genesis"]:
+                        self.race_node_interface.clear_artifacts(node_name)
+                except Exception as error:
+                    failed_to_clear[node_name] = error
+        failed_to_clear.update(batch.errors)
 
         if failed_to_clear and not force:
             raise error_utils.RIB412(action="clear", reasons=failed_to_clear)
@@ -3286,24 +3993,26 @@ class RibDeployment(ABC):
             force=force,
         )
         failed_to_reset = {}
-        for node_name in can_be_reset:
-            try:
-                self.race_node_interface.clear_configs_and_etc(node_name)
-                if not self.config["nodes"][node_name]["genesis"]:
-                    self.race_node_interface.clear_artifacts(node_name)
-                    self.race_node_interface.pull_configs(
-                        deployment_name=self.config["name"],
-                        persona=node_name,
-                        etc_only=True,
-                    )
-                else:
-                    self.race_node_interface.pull_configs(
-                        deployment_name=self.config["name"],
-                        persona=node_name,
-                        etc_only=False,
-                    )
-            except Exception as error:
-                failed_to_reset[node_name] = error
+        with self.race_node_interface.batch_actions() as batch:
+            for node_name in can_be_reset:
+                try:
+                    self.race_node_interface.clear_configs_and_etc(node_name)
+                    if not self.config["nodes"][node_name]["genesis"]:
+                        self.race_node_interface.clear_artifacts(node_name)
+                        self.race_node_interface.pull_configs(
+                            deployment_name=self.config["name"],
+                            persona=node_name,
+                            etc_only=True,
+                        )
+                    else:
+                        self.race_node_interface.pull_configs(
+                            deployment_name=self.config["name"],
+                            persona=node_name,
+                            etc_only=False,
+                        )
+                except Exception as error:
+                    failed_to_reset[node_name] = error
+        failed_to_reset.update(batch.errors)
 
         if failed_to_reset:
             raise error_utils.RIB412(action="reset", reasons=failed_to_reset)
@@ -3357,11 +4066,13 @@ class RibDeployment(ABC):
         )
 
         failed_to_kill = {}
-        for node_name in can_be_killed:
-            try:
-                self.race_node_interface.kill_app(node_name)
-            except Exception as error:
-                failed_to_kill[node_name] = error
+        with self.race_node_interface.batch_actions() as batch:
+            for node_name in can_be_killed:
+                try:
+                    self.race_node_interface.kill_app(node_name)
+                except Exception as error:
+                    failed_to_kill[node_name] = error
+        failed_to_kill.update(batch.errors)
 
         if failed_to_kill:
             raise error_utils.RIB412(action="kill", reasons=failed_to_kill)
@@ -3985,44 +4696,52 @@ class RibDeployment(ABC):
 
         # Loop through recipients and send messages
         failed_to_send = {}
-        for recipient, senders in recipient_sender_mapping.items():
-            for sender in senders:
-                if sender not in can_send:
-                    continue
+        with self.race_node_interface.batch_actions() as batch:
+            for recipient, senders in recipient_sender_mapping.items():
+                for sender in senders:
+                    if sender not in can_send:
+                        continue
 
-                try:
-                    if message_type == "manual":
-                        if not message_content:
-                            raise error_utils.RIB401(message_type, "message")
-
-                        self.race_node_interface.send_manual_message(
-                            sender=sender,
-                            recipient=recipient,
-                            message=message_content,
-                            test_id=test_id,
-                            network_manager_bypass_route=network_manager_bypass_route,
-                        )
-                    elif message_type == "auto":
-                        if not message_size:
-                            raise error_utils.RIB401(message_type, "message_size")
-                        elif not message_quantity:
-                            raise error_utils.RIB401(message_type, "message_quantity")
-                        elif message_period is None:
-                            raise error_utils.RIB401(message_type, "message_period")
-
-                        self.race_node_interface.send_auto_message(
-                            sender=sender,
-                            recipient=recipient,
-                            period=message_period,
-                            quantity=message_quantity,
-                            size=message_size,
-                            test_id=test_id,
-                            network_manager_bypass_route=network_manager_bypass_route,
-                        )
-                    else:
-                        raise error_utils.RIB006(f"Cannot Send {message_type} Messages")
-                except Exception as error:
-                    failed_to_send[f"{sender} to {recipient}"] = error
+                    try:
+                        if message_type == "manual":
+                            if not message_content:
+                                raise error_utils.RIB401(message_type, "message")
+
+                            with batch.errors_reported_as(f"{sender} to {recipient}"):
+                                self.race_node_interface.send_manual_message(
+                                    sender=sender,
+                                    recipient=recipient,
+                                    message=message_content,
+                                    test_id=test_id,
+                                    network_manager_bypass_route=network_manager_bypass_route,
+                                )
+                        elif message_type == "auto":
+                            if not message_size:
+                                raise error_utils.RIB401(message_type, "message_size")
+                            elif not message_quantity:
+                                raise error_utils.RIB401(
+                                    message_type, "message_quantity"
+                                )
+                            elif message_period is None:
+                                raise error_utils.RIB401(message_type, "message_period")
+
+                            with batch.errors_reported_as(f"{sender} to {recipient}"):
+                                self.race_node_interface.send_auto_message(
+                                    sender=sender,
+                                    recipient=recipient,
+                                    period=message_period,
+                                    quantity=message_quantity,
+                                    size=message_size,
+                                    test_id=test_id,
+                                    network_manager_bypass_route=network_manager_bypass_route,
+                                )
+                        else:
+                            raise error_utils.RIB006(
+                                f"Cannot Send {message_type} Messages"
+                            )
+                    except Exception as error:
+                        failed_to_send[f"{sender} to {recipient}"] = error
+        failed_to_send.update(batch.errors)
 
         if failed_to_send:
             raise error_utils.RIB412(action="send message", reasons=failed_to_send)
@@ -4090,28 +4809,32 @@ class RibDeployment(ABC):
 
         # Loop through recipients and send messages
         failed_to_send = {}
-        for sender, recipients in plan["messages"].items():
-            if sender not in can_send:
-                continue
+        with self.race_node_interface.batch_actions() as batch:
+            for sender, recipients in plan["messages"].items():
+                if sender not in can_send:
+                    continue
 
-            plan_for_sender = {
-                "start-time": start_time,
-                "test-id": test_id,
-                "messages": recipients,
-                "network-manager-bypass-route": network_manager_bypass_route or "",
-            }
+                plan_for_sender = {
+                    "start-time": start_time,
+                    "test-id": test_id,
+                    "messages": recipients,
+                    "network-manager-bypass-route": network_manager_bypass_route or "",
+                }
 
-            if logging.root.level < logging.DEBUG:
-                click.echo(f"Test Plan for {sender}:")
-                click.echo(f"{plan_for_sender}")
+                if logging.root.level < logging.DEBUG:
+                    click.echo(f"Test Plan for {sender}:")
+                    click.echo(f"{plan_for_sender}")
 
-            try:
-                self.race_node_interface.send_message_plan(
-                    sender=sender,
-                    plan=plan_for_sender,
-                )
-            except Exception as error:
-                failed_to_send[sender] = error
+                try:
+                    # One plan is sent per sender, so errors are reported by sender
+                    with batch.errors_reported_as(sender):
+                        self.race_node_interface.send_message_plan(
+                            sender=sender,
+                            plan=plan_for_sender,
+                        )
+                except Exception as error:
+                    failed_to_send[sender] = error
+        failed_to_send.update(batch.errors)
 
         if failed_to_send:
             raise error_utils.RIB412(action="send plan", reasons=failed_to_send)
@@ -4404,6 +5127,8 @@ class RibDeployment(ABC):
         if os.path.isdir(deployment_dir):
             shutil.rmtree(deployment_dir)
 
+        cls.get_deployment_index().remove(name)
+
     @classmethod
     def deployment_exists(cls, name: str) -> bool:
         """
@@ -4452,24 +5177,81 @@ class RibDeployment(ABC):
         compatible = set()
         incompatible = set()
 
-        for name in os.listdir(cls.pathsClass.dirs["mode"]):
-            if os.path.isdir(os.path.join(cls.pathsClass.dirs["mode"], name)):
-                try:
-                    cls.get_deployment(name)
-                    compatible.add(name)
-                except:
-                    incompatible.add(
-                        IncompatibleDeployment(
-                            name=name,
-                            rib_version=cls.get_compatible_rib_version_for(name),
-                        )
-                    )
+        for name, entry in cls.get_deployment_index().get_entries().items():
+            if entry.compatible:
+                compatible.add(name)
+            else:
+                incompatible.add(
+                    IncompatibleDeployment(name=name, rib_version=entry.rib_version)
+                )
 
         return DefinedDeployments(
             compatible=compatible,
             incompatible=incompatible,
         )
 
+    @classmethod
+    def get_deployment_index(cls) -> DeploymentIndex:
+        """
+        Purpose:
+            Get the index of the deployments defined on the local machine
+        Args:
+            N/A
+        Return:
+            Deployment index
+        """
+        return DeploymentIndex(
+            mode_dir=cls.pathsClass.dirs["mode"],
+            rib_version=cls.rib_config.RIB_VERSION,
+            config_filename=cls.pathsClass.filenames["config"],
+            metadata_filename=cls.pathsClass.filenames["metadata"],
+            load_entry=cls.load_deployment_index_entry,
+        )
+
+    @classmethod
+    def load_deployment_index_entry(cls, name: str) -> DeploymentIndexEntry:
+        """
+        Purpose:
+            Load a deployment to create its deployment index entry
+        Args:
+            name: Deployment name
+        Return:
+            Deployment index entry
+        """
+        try:
+            deployment = cls.get_deployment(name)
+            return create_index_entry(
+                name=name,
+                rib_mode=cls.rib_mode,
+                rib_version=deployment.config.rib_version,
+                compatible=True,
+                nodes=deployment.config.nodes,
+                metadata=deployment.metadata.dict(),
+            )
+        except:
+            pass
+
+        # Summarize incompatible deployments with whatever can still be read
+        rib_version = cls.get_compatible_rib_version_for(name)
+        try:
+            return create_index_entry(
+                name=name,
+                rib_mode=cls.rib_mode,
+                rib_version=rib_version,
+                compatible=False,
+                nodes=cls.load_config_json(name).get("nodes", {}),
+                metadata=cls.load_metadata_json(name),
+            )
+        except:
+            return create_index_entry(
+                name=name,
+                rib_mode=cls.rib_mode,
+                rib_version=rib_version,
+                compatible=False,
+                nodes={},
+                metadata={},
+            )
+
     @classmethod
     def get_compatible_rib_version_for(cls, name: str) -> str:
         """
@@ -4516,6 +5298,10 @@ class RibDeployment(ABC):
             # Blacklist some directories
             if deployment_name in (".gitignore", ".DS_Store", "templates"):
                 continue
+            if not os.path.isdir(
+                os.path.join(cls.pathsClass.dirs["mode"], deployment_name)
+            ):
+                continue
 
             # Try to get the deployments, if a deployment throws and exception, ignore
             # it and continue building a list
@@ -4808,8 +5594,8 @@ class RibDeployment(ABC):
             return rib_deployment_cls.get_deployment(name)
         except:
             try:
-                available_deployments = rib_deployment_cls.get_deployments(
-                    ignore_invalid=True
+                available_deployments = (
+                    rib_deployment_cls.get_defined_deployments().compatible
                 )
             except Exception:
                 # Failed to get available deployments, print that deployment doesn't
@@ -0,0 +1,309 @@
+# Copyright 2023 Two Six Technologies
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Purpose:
+    On-disk index of the deployments of a RiB mode, so that deployments can be listed
+    without loading every deployment's config and metadata
+"""
+
+# Python Library Imports
+import json
+import logging
+import os
+import tempfile
+from pydantic import BaseModel
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+
+###
+# Globals
+###
+
+logger = logging.getLogger(__name__)
+
+
+###
+# Constants
+###
+
+INDEX_FILENAME = ".deployment-index.json"
+
+
+###
+# Types
+###
+
+
+class DeploymentIndexEntry(BaseModel):
+    """Summary of a deployment, as stored in the deployment index"""
+
+    name: str
+    rib_mode: str
+    rib_version: str
+    compatible: bool
+
+    android_client_count: int = 0
+    linux_client_count: int = 0
+    linux_server_count: int = 0
+    registry_count: int = 0
+
+    last_up_time: Optional[str] = None
+    last_down_time: Optional[str] = None
+
+    # Modification times of the files the entry was created from
+    config_mtime_ns: Optional[int] = None
+    metadata_mtime_ns: Optional[int] = None
+
+
+# Creates the index entry of the named deployment, from its files on disk
+EntryLoader = Callable[[str], DeploymentIndexEntry]
+
+
+###
+# Functions
+###
+
+
+def create_index_entry(
+    name: str,
+    rib_mode: str,
+    rib_version: str,
+    compatible: bool,
+    nodes: Mapping[str, Any],
+    metadata: Mapping[str, Any],
+) -> DeploymentIndexEntry:
+    """
+    Purpose:
+        Create the index entry of a deployment
+    Args:
+        name: Deployment name
+        rib_mode: RiB mode of the deployment
+        rib_version: RiB version with which the deployment is compatible
+        compatible: Whether the deployment can be loaded by the current RiB version
+        nodes: Node configs of the deployment, by persona
+        metadata: Deployment metadata
+    Return:
+        Deployment index entry
+    """
+    entry = DeploymentIndexEntry(
+        name=name,
+        rib_mode=rib_mode,
+        rib_version=rib_version,
+        compatible=compatible,
+        last_up_time=metadata.get("last_up_time"),
+        last_down_time=metadata.get("last_down_time"),
+    )
+    for node in nodes.values():
+        if node["node_type"] == "registry":
+            entry.registry_count += 1
+        elif node["platform"] == "android":
+            entry.android_client_count += 1
+        elif node["node_type"] == "client":
+            entry.linux_client_count += 1
+        else:
+            entry.linux_server_count += 1
+    return entry
+
+
+def _get_mtime_ns(path: str) -> Optional[int]:
+    """
+    Purpose:
+        Get the modification time of a file
+    Args:
+        path: Path to the file
+    Return:
+        Modification time in nanoseconds, or None if the file does not exist
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class DeploymentIndex:
+    """
+    Purpose:
+        Index of the deployments in a RiB mode's deployments directory.
+
+        Each entry records the modification times of the deployment's config and
+        metadata files, and is recreated when they no longer match. The whole index is
+        discarded when the RiB version changes, since that can change which
+        deployments are compatible.
+    """
+
+    def __init__(
+        self,
+        mode_dir: str,
+        rib_version: str,
+        config_filename: str,
+        metadata_filename: str,
+        load_entry: EntryLoader,
+    ) -> None:
+        """
+        Purpose:
+            Initialize the deployment index
+        Args:
+            mode_dir: Directory containing the deployments of the RiB mode
+            rib_version: Current RiB version
+            config_filename: Name of the config file within a deployment directory
+            metadata_filename: Name of the metadata file within a deployment directory
+            load_entry: Creates the index entry of a deployment from its files
+        Return:
+            N/A
+        """
+        self.mode_dir = mode_dir
+        self.rib_version = rib_version
+        self.config_filename = config_filename
+        self.metadata_filename = metadata_filename
+        self.load_entry = load_entry
+        self.index_file = os.path.join(mode_dir, INDEX_FILENAME)
+
+    def get_entries(self) -> Dict[str, DeploymentIndexEntry]:
+        """
+        Purpose:
+            Get the index entries of all deployments, recreating the entries of
+            deployments that changed since they were indexed
+        Args:
+            N/A
+        Return:
+            Deployment index entries, by deployment name
+        """
+        stored_entries = self._read()
+        entries = {}
+        for name in sorted(os.listdir(self.mode_dir)):
+            if not os.path.isdir(os.path.join(self.mode_dir, name)):
+                continue
+            mtimes = self._get_mtimes(name)
+            entry = stored_entries.get(name)
+            if not entry or (entry.config_mtime_ns, entry.metadata_mtime_ns) != mtimes:
+                entry = self._load_entry(name, mtimes)
+            entries[name] = entry
+
+        if entries != stored_entries:
+            self._write(entries)
+        return entries
+
+    def update(self, name: str) -> None:
+        """
+        Purpose:
+            Recreate the index entry of a deployment from its files
+        Args:
+            name: Deployment name
+        Return:
+            N/A
+        """
+        entries = self._read()
+        entries[name] = self._load_entry(name, self._get_mtimes(name))
+        self._write(entries)
+
+    def remove(self, name: str) -> None:
+        """
+        Purpose:
+            Remove the index entry of a deployment
+        Args:
+            name: Deployment name
+        Return:
+            N/A
+        """
+        entries = self._read()
+        if entries.pop(name, None):
+            self._write(entries)
+
+    def _get_mtimes(self, name: str) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Purpose:
+            Get the modification times of a deployment's config and metadata files
+        Args:
+            name: Deployment name
+        Return:
+            Config and metadata file modification times
+        """
+        deployment_dir = os.path.join(self.mode_dir, name)
+        return (
+            _get_mtime_ns(os.path.join(deployment_dir, self.config_filename)),
+            _get_mtime_ns(os.path.join(deployment_dir, self.metadata_filename)),
+        )
+
+    def _load_entry(
+        self, name: str, mtimes: Tuple[Optional[int], Optional[int]]
+    ) -> DeploymentIndexEntry:
+        """
+        Purpose:
+            Create the index entry of a deployment, recording the modification times
+            of its files from before they were read
+        Args:
+            name: Deployment name
+            mtimes: Config and metadata file modification times
+        Return:
+            Deployment index entry
+        """
+        entry = self.load_entry(name)
+        entry.config_mtime_ns, entry.metadata_mtime_ns = mtimes
+        return entry
+
+    def _read(self) -> Dict[str, DeploymentIndexEntry]:
+        """
+        Purpose:
+            Read the stored index entries
+        Args:
+            N/A
+        Return:
+            Deployment index entries by deployment name (empty if the index does not
+                exist, is unreadable, or is from a different RiB version)
+        """
+        try:
+            with open(self.index_file, "r") as index_file:
+                index = json.load(index_file)
+            if index.get("rib_version") != self.rib_version:
+                return {}
+            return {
+                name: DeploymentIndexEntry.parse_obj(entry)
+                for name, entry in index["deployments"].items()
+            }
+        except FileNotFoundError:
+            return {}
+        except Exception as err:
+            logger.debug(
+                f"Ignoring unreadable deployment index {self.index_file}: {err}"
+            )
+            return {}
+
+    def _write(self, entries: Dict[str, DeploymentIndexEntry]) -> None:
+        """
+        Purpose:
+            Store the index entries. The index is written to a temporary file that
+            then replaces the index, so readers never see a partially-written index.
+        Args:
+            entries: Deployment index entries, by deployment name
+        Return:
+            N/A
+        """
+        index = {
+            "rib_version": self.rib_version,
+            "deployments": {name: entry.dict() for name, entry in entries.items()},
+        }
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.mode_dir, prefix=f"{INDEX_FILENAME}."
+            )
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(index, tmp_file)
+            os.replace(tmp_path, self.index_file)
+        except OSError as err:
+            logger.debug(f"Unable to write deployment index {self.index_file}: {err}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
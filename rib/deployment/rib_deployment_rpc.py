@@ -70,12 +70,15 @@ def execute_for_running_nodes(action: str):
                 app_status=[status_utils.AppStatus.RUNNING],
             )
 
+            # Actions for all nodes are published together in a single pipeline
             failed_to_execute = {}
-            for node_name in can_execute:
-                try:
-                    func(*args, node=node_name, **kwargs)
-                except Exception as error:
-                    failed_to_execute[node_name] = error
+            with deployment.race_node_interface.batch_actions() as batch:
+                for node_name in can_execute:
+                    try:
+                        func(*args, node=node_name, **kwargs)
+                    except Exception as error:
+                        failed_to_execute[node_name] = error
+            failed_to_execute.update(batch.errors)
 
             if failed_to_execute:
                 raise error_utils.RIB412(action=action, reasons=failed_to_execute)
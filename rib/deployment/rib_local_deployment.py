@@ -328,6 +328,7 @@ class RibLocalDeployment(RibDeployment):
                 data_format="json",
                 overwrite=True,
             )
+            deployment.get_deployment_index().update(deployment.config["name"])
 
             if range_config:
                 # Verify range config file exists
@@ -784,6 +785,7 @@ class RibLocalDeployment(RibDeployment):
         timeout: int = 300,
         max_iterations: int = 5,
         skip_config_tar: bool = False,
+        skip_config_cache: bool = False,
     ) -> None:
         """
         Purpose:
@@ -796,6 +798,8 @@ class RibLocalDeployment(RibDeployment):
             timeout (int): timeout for an individual iteration of a config generation script to run
             max_iterations(int): max number of iterations to run config generation through
             skip_config_tar(bool): skip taring configs
+            skip_config_cache(bool): neither restore configs from nor store them in the
+                config generation cache
         Returns:
             N/A
         """
@@ -814,6 +818,7 @@ class RibLocalDeployment(RibDeployment):
             timeout=timeout,
             max_iterations=max_iterations,
             skip_config_tar=skip_config_tar,
+            skip_config_cache=skip_config_cache,
         )
 
     def create_directories(self) -> None:
@@ -27,11 +27,18 @@ import logging
 import os
 import requests
 import time
-from typing import Iterable, List, Dict, Optional, Set, Tuple
+from typing import Iterable, List, Dict, NamedTuple, Optional, Set, Tuple
 
 # Local Python Library Imports
 import rib.deployment.rib_deployment as rib_deployment
-from rib.utils import error_utils, general_utils, redis_utils, status_utils
+from rib.utils import (
+    error_utils,
+    general_utils,
+    redis_utils,
+    status_utils,
+    threading_utils,
+)
+from rib.utils.race_node_utils import NodeStatusDetails, StatusChangeSubscription
 from rib.utils.status_utils import StatusReport
 
 # Set up logger
@@ -44,6 +51,18 @@ disable_status_checks = os.environ.get("RIB_DISABLE_STATUS_CHECK", "").lower() i
     "1",
 ]
 
+# Max number of nodes evaluated concurrently in a single status sweep
+STATUS_SWEEP_MAX_WORKERS = 32
+
+# Time in seconds between full status checks of all nodes when waiting for nodes
+# to match status using node status change notifications
+FULL_STATUS_RECHECK_INTERVAL = 5.0
+
+# Time in seconds between full status checks of all nodes when waiting for status
+# that isn't reported by notifications: configs/etc status (from the file server)
+# and daemons coming up (the first set of their is-alive key)
+UNNOTIFIED_STATUS_RECHECK_INTERVAL = 1.0
+
 
 class Require(general_utils.PrettyEnum):
     """Whether all, any, or none of the requested nodes have to match status criteria"""
@@ -56,6 +75,22 @@ class Require(general_utils.PrettyEnum):
     NONE = auto()
 
 
+class StatusSweepContext(NamedTuple):
+    """
+    Deployment-wide information computed once and shared by all nodes evaluated in
+    a single status sweep
+    """
+
+    # Whether network manager config gen succeeded
+    config_gen_success: bool
+    # Names of the files in the distribution artifacts directory
+    distribution_artifacts: Set[str]
+    # Names of the files in the file server
+    file_server_listing: Set[str]
+    # Daemon and app status details reported by each node
+    node_status_details: Dict[str, NodeStatusDetails]
+
+
 class RibDeploymentStatus:
     """
     Purpose:
@@ -228,17 +263,23 @@ class RibDeploymentStatus:
             matching_nodes = set(personas_to_query)
         else:
             not_matching_nodes = {}
+            check_node_status = bool(
+                app_status
+                or daemon_status
+                or race_status
+                or configs_status
+                or etc_status
+                or artifacts_status
+            )
+            node_status_reports = {}
+            if check_node_status:
+                node_status_reports = self._get_node_status_reports(
+                    personas_to_query, offline=offline
+                )
 
             for persona in personas_to_query:
-                if (
-                    app_status
-                    or daemon_status
-                    or race_status
-                    or configs_status
-                    or etc_status
-                    or artifacts_status
-                ):
-                    node_status = self._get_node_status_report(persona, offline=offline)
+                if check_node_status:
+                    node_status = node_status_reports[persona]
                     if (
                         daemon_status
                         and node_status["children"]["daemon"]["status"]
@@ -440,11 +481,19 @@ class RibDeploymentStatus:
         configs_status: Optional[List[status_utils.ConfigsStatus]] = None,
         etc_status: Optional[List[status_utils.EtcStatus]] = None,
         timeout: int = 120,
+        event_driven: bool = True,
     ) -> None:
         """
         Purpose:
             Wait until the specified set of nodes match the given state criteria, up to
             the given timeout threshold.
+
+            When event driven, only nodes whose status keys changed are re-evaluated
+            as soon as the change is reported by Redis, with a periodic full check of
+            all nodes for missed notifications. The full check runs every second when
+            waiting on status that isn't notified (configs/etc status, or daemons
+            coming up). Otherwise, or if change notifications are unavailable, all
+            nodes are checked every second.
         Args:
             action: Description of the action being executed. Only used for logging and error reporting.
             personas: List of node personas to check
@@ -452,7 +501,11 @@ class RibDeploymentStatus:
             daemon_status: Optional list of expected daemon status (if None, any daemon status
                 will match)
             race_status: Optional list of expected race status (if None, any race status will match)
+            configs_status: Optional list of expected configs status (if None, any configs
+                status will match)
+            etc_status: Optional list of expected etc status (if None, any etc status will match)
             timeout: Time in seconds before raising an error
+            event_driven: Re-evaluate nodes when their status changes instead of polling
         Raises:
             error_utils.RIB332: when nodes fail to transition to expected state within
                 timeout threshold
@@ -464,33 +517,110 @@ class RibDeploymentStatus:
         if not personas:
             return
 
-        click.echo(f"Waiting for {len(personas)} nodes to {action}...", nl=False)
-        command_run_time = datetime.now()
-        how_often_to_print_waiting_status_in_seconds = 30
-        waiting_status_print_counter = 1
-        while True:
-            matching_nodes = self.get_nodes_that_match_status(
+        # Subscribe before the first check so no changes are missed
+        subscription = None
+        if event_driven:
+            subscription = (
+                self.deployment.race_node_interface.subscribe_to_status_changes()
+            )
+
+        full_check_interval = FULL_STATUS_RECHECK_INTERVAL
+        if (
+            configs_status
+            or etc_status
+            or (daemon_status and status_utils.DaemonStatus.RUNNING in daemon_status)
+        ):
+            full_check_interval = UNNOTIFIED_STATUS_RECHECK_INTERVAL
+
+        try:
+            self._wait_for_nodes_to_match_status(
                 action=action,
                 personas=personas,
-                daemon_status=daemon_status,
+                subscription=subscription,
+                full_check_interval=full_check_interval,
                 app_status=app_status,
+                daemon_status=daemon_status,
                 race_status=race_status,
                 configs_status=configs_status,
                 etc_status=etc_status,
-                require=Require.NONE,
-                quiet=True,
+                timeout=timeout,
             )
+        finally:
+            if subscription:
+                subscription.close()
 
-            if set(personas) == set(matching_nodes):
+    def _wait_for_nodes_to_match_status(
+        self,
+        action: str,
+        personas: List[str],
+        subscription: Optional[StatusChangeSubscription],
+        full_check_interval: float,
+        app_status: Optional[List[status_utils.AppStatus]],
+        daemon_status: Optional[List[status_utils.DaemonStatus]],
+        race_status: Optional[List[status_utils.RaceStatus]],
+        configs_status: Optional[List[status_utils.ConfigsStatus]],
+        etc_status: Optional[List[status_utils.EtcStatus]],
+        timeout: int,
+    ) -> None:
+        """
+        Purpose:
+            Wait until the specified set of nodes match the given state criteria (see
+            wait_for_nodes_to_match_status)
+        Args:
+            action: Description of the action being executed
+            personas: List of node personas to check
+            subscription: Node status change subscription (if None, all nodes are
+                polled every second)
+            full_check_interval: Time in seconds between checks of all nodes when
+                using the subscription
+            app_status: Optional list of expected app status
+            daemon_status: Optional list of expected daemon status
+            race_status: Optional list of expected race status
+            configs_status: Optional list of expected configs status
+            etc_status: Optional list of expected etc status
+            timeout: Time in seconds before raising an error
+        Raises:
+            error_utils.RIB332: when nodes fail to transition to expected state within
+                timeout threshold
+        """
+        click.echo(f"Waiting for {len(personas)} nodes to {action}...", nl=False)
+        command_run_time = datetime.now()
+        how_often_to_print_waiting_status_in_seconds = 30
+        waiting_status_print_counter = 1
+        matching_nodes = set()
+        personas_to_check = set(personas)
+        last_full_check_time = time.monotonic()
+        while True:
+            if personas_to_check:
+                checked_matching_nodes = self.get_nodes_that_match_status(
+                    action=action,
+                    personas=[
+                        persona for persona in personas if persona in personas_to_check
+                    ],
+                    daemon_status=daemon_status,
+                    app_status=app_status,
+                    race_status=race_status,
+                    configs_status=configs_status,
+                    etc_status=etc_status,
+                    require=Require.NONE,
+                    quiet=True,
+                )
+                matching_nodes = (matching_nodes - personas_to_check) | set(
+                    checked_matching_nodes
+                )
+
+            if set(personas) == matching_nodes:
                 click.echo("done")
                 break
 
             elapsed_secs = (datetime.now() - command_run_time).seconds
             if elapsed_secs > timeout:
-                personas_in_wrong_state = set(personas) - set(matching_nodes)
+                personas_in_wrong_state = set(personas) - matching_nodes
                 info = [
-                    f"{persona}: {self._get_node_status_report(persona)['status']}"
-                    for persona in sorted(personas_in_wrong_state)
+                    f"{persona}: {report['status']}"
+                    for persona, report in self._get_node_status_reports(
+                        sorted(personas_in_wrong_state)
+                    ).items()
                 ]
                 raise error_utils.RIB332(
                     deployment_name=self.deployment.config["name"],
@@ -509,7 +639,25 @@ class RibDeploymentStatus:
                     nl=False,
                 )
 
-            time.sleep(1)
+            if subscription:
+                try:
+                    changed_personas = self.deployment.race_node_interface.get_personas_with_status_changes(
+                        subscription, timeout=1
+                    )
+                    personas_to_check = changed_personas.intersection(personas)
+                except Exception as err:
+                    # The subscription is closed by wait_for_nodes_to_match_status
+                    logger.debug(f"Falling back to polling node status: {err}")
+                    subscription = None
+
+                if time.monotonic() - last_full_check_time >= full_check_interval:
+                    personas_to_check = set(personas)
+                    last_full_check_time = time.monotonic()
+
+            if not subscription:
+                time.sleep(1)
+                personas_to_check = set(personas)
+
             click.echo(".", nl=False)
 
     def get_node_os_details(
@@ -670,20 +818,107 @@ class RibDeploymentStatus:
         )
 
     def _get_node_status_reports(
-        self, personas: Iterable[str]
+        self, personas: Iterable[str], offline: bool = False
     ) -> Dict[str, StatusReport]:
         """
         Purpose:
-            Get node status reports for all specified personas
+            Get node status reports for all specified personas. Deployment-wide
+            information is only gathered once, and the nodes are evaluated
+            concurrently
         Args:
             personas: List of node personas
+            offline: Only perform offline status checks (i.e., expect that node is down, do not
+                include runtime status)
         Return:
             Dictionary of personas to status reports
         """
-        return {persona: self._get_node_status_report(persona) for persona in personas}
+        personas = list(personas)
+        context = self._get_status_sweep_context(personas, offline=offline)
+
+        def get_report(persona: str) -> StatusReport:
+            return self._get_node_status_report(
+                persona, offline=offline, context=context
+            )
+
+        if len(personas) <= 1:
+            return {persona: get_report(persona) for persona in personas}
+
+        with threading_utils.ContextThreadPoolExecutor(
+            max_workers=min(len(personas), STATUS_SWEEP_MAX_WORKERS)
+        ) as executor:
+            return dict(zip(personas, executor.map(get_report, personas)))
+
+    def _get_status_sweep_context(
+        self, personas: Iterable[str], offline: bool = False
+    ) -> StatusSweepContext:
+        """
+        Purpose:
+            Gather the deployment-wide information needed to evaluate the status of
+            all specified personas
+        Args:
+            personas: List of node personas
+            offline: Only perform offline status checks (i.e., expect that node is down, do not
+                query the nodes)
+        Return:
+            Status sweep context
+        """
+        try:
+            distribution_artifacts = set(
+                os.listdir(self.deployment.paths.dirs["distribution_artifacts"])
+            )
+        except OSError:
+            distribution_artifacts = set()
+
+        return StatusSweepContext(
+            config_gen_success=self.did_config_gen_succeed(),
+            distribution_artifacts=distribution_artifacts,
+            file_server_listing=self._get_file_server_listing(),
+            node_status_details=(
+                self._get_node_status_details(personas) if not offline else {}
+            ),
+        )
+
+    def _get_node_status_details(
+        self, personas: Iterable[str]
+    ) -> Dict[str, NodeStatusDetails]:
+        """
+        Purpose:
+            Get daemon and app status details reported by all specified nodes in
+            a single bulk request
+        Args:
+            personas: List of node personas
+        Return:
+            Dictionary of personas to daemon and app status details
+        """
+        personas = list(personas)
+        try:
+            return self.deployment.race_node_interface.get_status_for_personas(personas)
+        except Exception:
+            return {
+                persona: {"daemon": {"is_error": True}, "app": {"is_error": True}}
+                for persona in personas
+            }
+
+    def _get_file_server_listing(self) -> Set[str]:
+        """
+        Purpose:
+            Get a snapshot of the files in the file server to be shared by all nodes
+            evaluated in a single status sweep
+        Args:
+            N/A
+        Return:
+            Set of files in the file server (empty if the file server is unreachable)
+        """
+        try:
+            return self.deployment.file_server_client.get_file_listing_snapshot()
+        except Exception:
+            return set()
 
     def _get_node_status_report(
-        self, persona: str, offline: bool = False
+        self,
+        persona: str,
+        offline: bool = False,
+        context: Optional[StatusSweepContext] = None,
     ) -> StatusReport:
         """
         Purpose:
@@ -692,6 +927,8 @@ class RibDeploymentStatus:
             persona: Node persona
             offline: Only perform offline status checks (i.e., expect that node is down, do not
                 include runtime status)
+            context: Deployment-wide information shared by all nodes in the status
+                sweep (if None, it will be gathered for just this node)
         Return:
             Node status report
         """
@@ -703,12 +940,25 @@ class RibDeploymentStatus:
         etc_status_reason = None
         artifacts_status_reason = None
 
+        file_server_listing = None
+        node_status_details = None
+        if context is not None:
+            file_server_listing = context.file_server_listing
+            node_status_details = context.node_status_details.get(persona)
+
         # Info from RiB File System
         expected_artifacts_exist = self.do_expected_node_artifacts_exist(persona)
         expected_artifact_tars_exists = self.do_expected_node_artifacts_archives_exist(
-            persona
+            persona,
+            distribution_artifacts=(
+                context.distribution_artifacts if context is not None else None
+            ),
+        )
+        config_gen_success = (
+            context.config_gen_success
+            if context is not None
+            else self.did_config_gen_succeed()
         )
-        config_gen_success = self.did_config_gen_succeed()
         etc_tar_name = self.deployment.get_etc_tar_name(persona=persona)
         configs_tar_name = self.deployment.get_configs_tar_name(persona=persona)
         etc_tar_exists = os.path.isfile(
@@ -723,14 +973,14 @@ class RibDeploymentStatus:
         configs_tar_pushed = False
         try:
             etc_tar_pushed = self.deployment.file_server_client.is_file_on_file_server(
-                etc_tar_name
+                etc_tar_name, listing=file_server_listing
             )
         except Exception:
             pass
         try:
             configs_tar_pushed = (
                 self.deployment.file_server_client.is_file_on_file_server(
-                    configs_tar_name
+                    configs_tar_name, listing=file_server_listing
                 )
             )
         except Exception:
@@ -739,18 +989,22 @@ class RibDeploymentStatus:
         # Info from the Node
         daemon_status_details = {}
         app_status_details = {}
-        try:
-            daemon_status_details = (
-                self.deployment.race_node_interface.get_daemon_status(persona)
-            )
-        except Exception:
-            daemon_status_details = {"is_error": True}
-        try:
-            app_status_details = self.deployment.race_node_interface.get_app_status(
-                persona
-            )
-        except Exception:
-            app_status_details = {"is_error": True}
+        if node_status_details is not None:
+            daemon_status_details = node_status_details["daemon"]
+            app_status_details = node_status_details["app"]
+        elif context is None or not offline:
+            try:
+                daemon_status_details = (
+                    self.deployment.race_node_interface.get_daemon_status(persona)
+                )
+            except Exception:
+                daemon_status_details = {"is_error": True}
+            try:
+                app_status_details = self.deployment.race_node_interface.get_app_status(
+                    persona
+                )
+            except Exception:
+                app_status_details = {"is_error": True}
 
         # Determine Statuses
         daemon_status, daemon_status_reason = (
@@ -1035,16 +1289,27 @@ class RibDeploymentStatus:
     # Individual Information checks
     ###
 
-    def do_expected_node_artifacts_archives_exist(self, persona: str) -> bool:
+    def do_expected_node_artifacts_archives_exist(
+        self, persona: str, distribution_artifacts: Optional[Set[str]] = None
+    ) -> bool:
         """
         Purpose:
             Check if artifacts tar exists for the node
         Args:
             persona: Node persona
+            distribution_artifacts: Names of the files in the distribution artifacts
+                directory (if None, the file system will be checked)
         Return:
             True if the artifacts tar for the node exists
         """
 
+        def archive_exists(archive_name: str) -> bool:
+            if distribution_artifacts is not None:
+                return archive_name in distribution_artifacts
+            return os.path.isfile(
+                f'{self.deployment.paths.dirs["distribution_artifacts"]}/{archive_name}'
+            )
+
         platform = self.deployment.config["nodes"][persona]["platform"]
         architecture = self.deployment.config["nodes"][persona]["architecture"]
         node_type = self.deployment.config["nodes"][persona]["node_type"]
@@ -1054,8 +1319,8 @@ class RibDeploymentStatus:
             return True
 
         # Network manager
-        network_manager_artifacts_tar = f'{self.deployment.paths.dirs["distribution_artifacts"]}/{platform}-{architecture}-{node_type}-{self.deployment.config.network_manager_kit.name}.zip'
-        if not os.path.isfile(network_manager_artifacts_tar):
+        network_manager_artifacts_tar = f"{platform}-{architecture}-{node_type}-{self.deployment.config.network_manager_kit.name}.zip"
+        if not archive_exists(network_manager_artifacts_tar):
             return False
 
         # Comms cannot be checked because we don't know what subset of comms are
@@ -1068,8 +1333,8 @@ class RibDeploymentStatus:
         # Can check for client/server node types. Registries cannot be checked
         # because we don't know what subset of registry apps are expected
         if node_type != "registry":
-            app_tar = f'{self.deployment.paths.dirs["distribution_artifacts"]}/{platform}-{architecture}-{node_type}-race.zip'
-            if not os.path.isfile(app_tar):
+            app_tar = f"{platform}-{architecture}-{node_type}-race.zip"
+            if not archive_exists(app_tar):
                 return False
         return True
 
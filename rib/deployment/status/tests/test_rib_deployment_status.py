@@ -22,6 +22,7 @@
 
 # Python Library Imports
 from datetime import datetime
+import os
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -29,6 +30,7 @@ from unittest.mock import MagicMock, patch
 from rib.deployment.status.rib_local_deployment_status import RibLocalDeploymentStatus
 from rib.deployment.status.rib_deployment_status import Require
 from rib.utils import error_utils, status_utils
+from rib.utils.file_server_utils import FileServerClient
 from rib.utils.status_utils import StatusReport
 
 ###
@@ -346,25 +348,32 @@ def test_get_nodes_that_match_status_no_matches_none_required(status):
 
 
 def test_get_nodes_that_match_status_partial_match(status):
-    status._get_node_status_report = MagicMock(
-        side_effect=[
-            {
-                "status": status_utils.NodeStatus.READY_TO_START,
-                "children": {
-                    "daemon": {"status": status_utils.DaemonStatus.RUNNING},
-                    "app": {"status": status_utils.AppStatus.NOT_RUNNING},
-                    "race": {"status": status_utils.RaceStatus.NOT_REPORTING},
+    # Nodes are evaluated concurrently, so reports are looked up by persona
+    reports = dict(
+        zip(
+            ["race-client-00001", "race-server-00003"],
+            [
+                {
+                    "status": status_utils.NodeStatus.READY_TO_START,
+                    "children": {
+                        "daemon": {"status": status_utils.DaemonStatus.RUNNING},
+                        "app": {"status": status_utils.AppStatus.NOT_RUNNING},
+                        "race": {"status": status_utils.RaceStatus.NOT_REPORTING},
+                    },
                 },
-            },
-            {
-                "status": status_utils.NodeStatus.RUNNING,
-                "children": {
-                    "daemon": {"status": status_utils.DaemonStatus.RUNNING},
-                    "app": {"status": status_utils.AppStatus.RUNNING},
-                    "race": {"status": status_utils.RaceStatus.RUNNING},
+                {
+                    "status": status_utils.NodeStatus.RUNNING,
+                    "children": {
+                        "daemon": {"status": status_utils.DaemonStatus.RUNNING},
+                        "app": {"status": status_utils.AppStatus.RUNNING},
+                        "race": {"status": status_utils.RaceStatus.RUNNING},
+                    },
                 },
-            },
-        ]
+            ],
+        )
+    )
+    status._get_node_status_report = MagicMock(
+        side_effect=lambda persona, **kwargs: reports[persona]
     )
     assert status.get_nodes_that_match_status(
         action="test",
@@ -375,25 +384,32 @@ def test_get_nodes_that_match_status_partial_match(status):
 
 
 def test_get_nodes_that_match_status_partial_match_all_required(status):
-    status._get_node_status_report = MagicMock(
-        side_effect=[
-            {
-                "status": status_utils.NodeStatus.READY_TO_START,
-                "children": {
-                    "daemon": {"status": status_utils.DaemonStatus.RUNNING},
-                    "app": {"status": status_utils.AppStatus.NOT_RUNNING},
-                    "race": {"status": status_utils.RaceStatus.NOT_REPORTING},
+    # Nodes are evaluated concurrently, so reports are looked up by persona
+    reports = dict(
+        zip(
+            ["race-client-00001", "race-server-00003"],
+            [
+                {
+                    "status": status_utils.NodeStatus.READY_TO_START,
+                    "children": {
+                        "daemon": {"status": status_utils.DaemonStatus.RUNNING},
+                        "app": {"status": status_utils.AppStatus.NOT_RUNNING},
+                        "race": {"status": status_utils.RaceStatus.NOT_REPORTING},
+                    },
                 },
-            },
-            {
-                "status": status_utils.NodeStatus.RUNNING,
-                "children": {
-                    "daemon": {"status": status_utils.DaemonStatus.RUNNING},
-                    "app": {"status": status_utils.AppStatus.RUNNING},
-                    "race": {"status": status_utils.RaceStatus.NOT_REPORTING},
+                {
+                    "status": status_utils.NodeStatus.RUNNING,
+                    "children": {
+                        "daemon": {"status": status_utils.DaemonStatus.RUNNING},
+                        "app": {"status": status_utils.AppStatus.RUNNING},
+                        "race": {"status": status_utils.RaceStatus.NOT_REPORTING},
+                    },
                 },
-            },
-        ]
+            ],
+        )
+    )
+    status._get_node_status_report = MagicMock(
+        side_effect=lambda persona, **kwargs: reports[persona]
     )
     with pytest.raises(error_utils.RIB342):
         status.get_nodes_that_match_status(
@@ -459,6 +475,10 @@ def test_get_nodes_that_match_status_defaults_to_all_deployment_personas(
 def test_wait_for_nodes_to_match_status_waits_until_all_match_criteria(
     mock_sleep, mock_datetime, status
 ):
+    # Status change notifications are unavailable, so all nodes are polled
+    status.deployment.race_node_interface.subscribe_to_status_changes = MagicMock(
+        return_value=None
+    )
     status.get_nodes_that_match_status = MagicMock(
         side_effect=[
             set(),
@@ -488,6 +508,10 @@ def test_wait_for_nodes_to_match_status_waits_until_all_match_criteria(
 def test_wait_for_nodes_to_match_status_raises_when_timeout_occurs(
     mock_sleep, mock_datetime, status
 ):
+    # Status change notifications are unavailable, so all nodes are polled
+    status.deployment.race_node_interface.subscribe_to_status_changes = MagicMock(
+        return_value=None
+    )
     status.get_nodes_that_match_status = MagicMock(return_value={"race-client-00001"})
     mock_datetime.now.side_effect = [
         datetime(2022, 2, 2, 10, 0, 0),  # Start time
@@ -513,6 +537,157 @@ def test_wait_for_nodes_to_match_status_raises_when_timeout_occurs(
     assert mock_sleep.call_count == 6
 
 
+@patch("rib.deployment.status.rib_deployment_status.datetime")
+@patch("time.sleep")
+@patch("click.echo", MagicMock())
+def test_wait_for_nodes_to_match_status_only_rechecks_changed_nodes(
+    mock_sleep, mock_datetime, status
+):
+    subscription = MagicMock()
+    status.deployment.race_node_interface.subscribe_to_status_changes = MagicMock(
+        return_value=subscription
+    )
+    status.deployment.race_node_interface.get_personas_with_status_changes = MagicMock(
+        side_effect=[
+            set(),
+            {"race-server-00003", "race-client-00005"},
+        ]
+    )
+    status.get_nodes_that_match_status = MagicMock(
+        side_effect=[
+            {"race-client-00001"},
+            {"race-server-00003"},
+        ]
+    )
+    mock_datetime.now.return_value = datetime(2022, 2, 2, 10, 0, 0)
+
+    status.wait_for_nodes_to_match_status(
+        action="test",
+        personas=["race-client-00001", "race-server-00003"],
+        app_status=[status_utils.AppStatus.RUNNING],
+    )
+
+    assert [
+        call.kwargs["personas"]
+        for call in status.get_nodes_that_match_status.call_args_list
+    ] == [["race-client-00001", "race-server-00003"], ["race-server-00003"]]
+    mock_sleep.assert_not_called()
+    subscription.close.assert_called_once()
+
+
+@patch("rib.deployment.status.rib_deployment_status.datetime")
+@patch("time.sleep")
+@patch("time.monotonic")
+@patch("click.echo", MagicMock())
+def test_wait_for_nodes_to_match_status_periodically_rechecks_all_nodes(
+    mock_monotonic, mock_sleep, mock_datetime, status
+):
+    status.deployment.race_node_interface.subscribe_to_status_changes = MagicMock(
+        return_value=MagicMock()
+    )
+    status.deployment.race_node_interface.get_personas_with_status_changes = MagicMock(
+        return_value=set()
+    )
+    status.get_nodes_that_match_status = MagicMock(
+        side_effect=[
+            {"race-client-00001"},
+            {"race-client-00001", "race-server-00003"},
+        ]
+    )
+    mock_datetime.now.return_value = datetime(2022, 2, 2, 10, 0, 0)
+    mock_monotonic.side_effect = [0.0, 1.0, 5.0, 5.0]
+
+    status.wait_for_nodes_to_match_status(
+        action="test",
+        personas=["race-client-00001", "race-server-00003"],
+        app_status=[status_utils.AppStatus.RUNNING],
+    )
+
+    assert status.get_nodes_that_match_status.call_count == 2
+    assert (
+        status.deployment.race_node_interface.get_personas_with_status_changes.call_count
+        == 2
+    )
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {"configs_status": [status_utils.ConfigsStatus.DOWNLOADED_CONFIGS]},
+        {"etc_status": [status_utils.EtcStatus.READY]},
+        {"daemon_status": [status_utils.DaemonStatus.RUNNING]},
+    ],
+)
+@patch("rib.deployment.status.rib_deployment_status.datetime")
+@patch("time.sleep")
+@patch("time.monotonic")
+@patch("click.echo", MagicMock())
+def test_wait_for_nodes_to_match_status_rechecks_unnotified_status_every_second(
+    mock_monotonic, mock_sleep, mock_datetime, status, criteria
+):
+    status.deployment.race_node_interface.subscribe_to_status_changes = MagicMock(
+        return_value=MagicMock()
+    )
+    status.deployment.race_node_interface.get_personas_with_status_changes = MagicMock(
+        return_value=set()
+    )
+    status.get_nodes_that_match_status = MagicMock(
+        side_effect=[
+            {"race-client-00001"},
+            {"race-client-00001", "race-server-00003"},
+        ]
+    )
+    mock_datetime.now.return_value = datetime(2022, 2, 2, 10, 0, 0)
+    mock_monotonic.side_effect = [0.0, 1.0, 1.0]
+
+    status.wait_for_nodes_to_match_status(
+        action="test",
+        personas=["race-client-00001", "race-server-00003"],
+        **criteria,
+    )
+
+    assert status.get_nodes_that_match_status.call_count == 2
+    assert status.get_nodes_that_match_status.call_args.kwargs["personas"] == [
+        "race-client-00001",
+        "race-server-00003",
+    ]
+
+
+@patch("rib.deployment.status.rib_deployment_status.datetime")
+@patch("time.sleep")
+@patch("click.echo", MagicMock())
+def test_wait_for_nodes_to_match_status_falls_back_to_polling(
+    mock_sleep, mock_datetime, status
+):
+    subscription = MagicMock()
+    status.deployment.race_node_interface.subscribe_to_status_changes = MagicMock(
+        return_value=subscription
+    )
+    status.deployment.race_node_interface.get_personas_with_status_changes = MagicMock(
+        side_effect=Exception("connection lost")
+    )
+    status.get_nodes_that_match_status = MagicMock(
+        side_effect=[
+            {"race-client-00001"},
+            {"race-client-00001", "race-server-00003"},
+        ]
+    )
+    mock_datetime.now.return_value = datetime(2022, 2, 2, 10, 0, 0)
+
+    status.wait_for_nodes_to_match_status(
+        action="test",
+        personas=["race-client-00001", "race-server-00003"],
+        app_status=[status_utils.AppStatus.RUNNING],
+    )
+
+    assert mock_sleep.call_count == 1
+    assert status.get_nodes_that_match_status.call_args.kwargs["personas"] == [
+        "race-client-00001",
+        "race-server-00003",
+    ]
+    subscription.close.assert_called_once()
+
+
 ################################################################################
 # wait_for_services_to_match_status
 ################################################################################
@@ -607,7 +782,7 @@ def test_get_services_status_report(status):
 
 def test_get_app_status_report(status):
     status._get_node_status_report = MagicMock(
-        side_effect=lambda persona: StatusReport(
+        side_effect=lambda persona, **kwargs: StatusReport(
             status=status_utils.NodeStatus.RUNNING
             if persona == "race-client-00001"
             else status_utils.NodeStatus.READY_TO_START
@@ -1167,6 +1342,171 @@ def test__get_node_status_report_app_exception(status):
     )
 
 
+@patch(
+    "rib.deployment.status.rib_deployment_status.RibDeploymentStatus.do_expected_node_artifacts_exist",
+    MagicMock(return_value=True),
+)
+@patch(
+    "rib.deployment.status.rib_deployment_status.RibDeploymentStatus.did_config_gen_succeed",
+    MagicMock(return_value=True),
+)
+@patch(
+    "rib.deployment.status.rib_deployment_status.RibDeploymentStatus.do_expected_node_artifacts_archives_exist",
+    MagicMock(return_value=True),
+)
+def test__get_node_status_reports_uses_bulk_node_status(status):
+    status.deployment.file_server_client.is_file_on_file_server = MagicMock(
+        return_value=True
+    )
+    status.deployment.race_node_interface.get_status_for_personas = MagicMock(
+        return_value={
+            "race-client-00001": {
+                "daemon": {"is_alive": True, "installed": True, "dnsSuccessful": True},
+                "app": {"is_alive": False},
+            },
+            "race-server-00001": {
+                "daemon": {"is_alive": False},
+                "app": {"is_alive": False},
+            },
+        }
+    )
+    status.deployment.race_node_interface.get_daemon_status = MagicMock()
+    status.deployment.race_node_interface.get_app_status = MagicMock()
+
+    reports = status._get_node_status_reports(
+        ["race-client-00001", "race-server-00001"]
+    )
+
+    status.deployment.race_node_interface.get_status_for_personas.assert_called_once_with(
+        ["race-client-00001", "race-server-00001"]
+    )
+    status.deployment.race_node_interface.get_daemon_status.assert_not_called()
+    status.deployment.race_node_interface.get_app_status.assert_not_called()
+    assert (
+        reports["race-client-00001"]["children"]["app"]["status"]
+        == status_utils.AppStatus.NOT_RUNNING
+    )
+    assert (
+        reports["race-server-00001"]["children"]["daemon"]["status"]
+        == status_utils.DaemonStatus.NOT_REPORTING
+    )
+
+
+def test__get_node_status_reports_when_bulk_node_status_fails(status):
+    status._get_node_status_report = MagicMock(return_value=StatusReport())
+    status.deployment.race_node_interface.get_status_for_personas = MagicMock(
+        side_effect=error_utils.RIB408("1 nodes", "connection reset")
+    )
+    status.deployment.file_server_client.get_file_listing_snapshot = MagicMock(
+        side_effect=Exception("connection refused")
+    )
+
+    status._get_node_status_reports(["race-client-00001"])
+
+    context = status._get_node_status_report.call_args.kwargs["context"]
+    assert context.node_status_details == {
+        "race-client-00001": {"daemon": {"is_error": True}, "app": {"is_error": True}}
+    }
+    assert context.file_server_listing == set()
+
+
+@patch(
+    "rib.deployment.status.rib_deployment_status.RibDeploymentStatus.do_expected_node_artifacts_exist",
+    MagicMock(return_value=True),
+)
+@patch(
+    "rib.deployment.status.rib_deployment_status.RibDeploymentStatus.did_config_gen_succeed",
+    MagicMock(return_value=True),
+)
+@patch(
+    "rib.deployment.status.rib_deployment_status.RibDeploymentStatus.do_expected_node_artifacts_archives_exist",
+    MagicMock(return_value=True),
+)
+def test__get_node_status_reports_uses_single_file_server_listing(status):
+    status.deployment.get_etc_tar_name = lambda persona: f"{persona}_etc.tar.gz"
+    status.deployment.get_configs_tar_name = lambda persona: f"{persona}_configs.tar.gz"
+    status.deployment.file_server_client = FileServerClient()
+    status.deployment.file_server_client.get_file_listing_snapshot = MagicMock(
+        return_value={
+            "race-client-00001_etc.tar.gz",
+            "race-client-00001_configs.tar.gz",
+        }
+    )
+    status.deployment.race_node_interface.get_status_for_personas = MagicMock(
+        return_value={
+            "race-client-00001": {"daemon": {}, "app": {}},
+            "race-server-00001": {"daemon": {}, "app": {}},
+        }
+    )
+
+    reports = status._get_node_status_reports(
+        ["race-client-00001", "race-server-00001"]
+    )
+
+    status.deployment.file_server_client.get_file_listing_snapshot.assert_called_once()
+    assert (
+        reports["race-client-00001"]["children"]["etc"]["status"]
+        == status_utils.EtcStatus.ETC_TAR_PUSHED
+    )
+    assert (
+        reports["race-client-00001"]["children"]["configs"]["status"]
+        == status_utils.ConfigsStatus.CONFIGS_TAR_PUSHED
+    )
+    assert (
+        reports["race-server-00001"]["children"]["etc"]["status"]
+        == status_utils.EtcStatus.CONFIG_GEN_SUCCESS
+    )
+
+
+@patch(
+    "rib.deployment.status.rib_deployment_status.RibDeploymentStatus.do_expected_node_artifacts_exist",
+    MagicMock(return_value=True),
+)
+def test__get_node_status_reports_shares_sweep_context(status, tmp_path):
+    personas = [f"race-client-{index:05}" for index in range(1, 51)]
+    (tmp_path / "linux-x86_64-client-network-manager.zip").write_text("")
+    (tmp_path / "linux-x86_64-client-race.zip").write_text("")
+    status.deployment.paths.dirs = {
+        "distribution_artifacts": str(tmp_path),
+        "etc": str(tmp_path),
+        "race_configs": str(tmp_path),
+    }
+    status.deployment.config.__getitem__.side_effect = {
+        "name": "test-deployment",
+        "nodes": {
+            persona: {
+                "platform": "linux",
+                "architecture": "x86_64",
+                "node_type": "client",
+            }
+            for persona in personas
+        },
+    }.get
+    status.deployment.config.network_manager_kit.name = "network-manager"
+    status.deployment.get_etc_tar_name = lambda persona: f"{persona}_etc.tar.gz"
+    status.deployment.get_configs_tar_name = lambda persona: f"{persona}_configs.tar.gz"
+    status.deployment.file_server_client.get_file_listing_snapshot = MagicMock(
+        return_value=set()
+    )
+    status.deployment.race_node_interface.get_status_for_personas = MagicMock(
+        return_value={persona: {"daemon": {}, "app": {}} for persona in personas}
+    )
+    status.did_config_gen_succeed = MagicMock(return_value=True)
+
+    with patch("os.path.isfile", wraps=os.path.isfile) as mock_isfile:
+        reports = status._get_node_status_reports(personas)
+
+    status.did_config_gen_succeed.assert_called_once()
+    # Only the configs/etc tars are checked per node, not the distribution zips
+    assert mock_isfile.call_count == 2 * len(personas)
+    assert list(reports.keys()) == personas
+    assert all(
+        report["children"]["artifacts"]["status"]
+        == status_utils.ArtifactsStatus.ARTIFACT_TARS_EXIST
+        for report in reports.values()
+    )
+
+
 def test__get_node_os_details_returns_values(status):
     status.deployment.race_node_interface.get_daemon_status = MagicMock(
         return_value={"nodePlatform": "linux", "nodeArchitecture": "x86"}
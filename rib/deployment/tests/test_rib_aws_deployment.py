@@ -51,20 +51,21 @@ from .mock_deployment_configs.aws_3x3_default_config import (
 
 
 @pytest.fixture(autouse=True)
-def mock_ssh_utils__run_ssh_command():
+def mock_ssh_utils__run_ssh_command(monkeypatch):
     """
     Purpose:
         Mocks/Monkeypatches the return value for `ssh_utils.run_ssh_command`. Sets
         return to str
     Args:
-        N/A
+        monkeypatch: pytest monkeypatch fixture, restores the original after the test
     """
 
-    ssh_utils.run_ssh_command = MagicMock()
-    ssh_utils.run_ssh_command.return_value = (
+    run_ssh_command = MagicMock()
+    run_ssh_command.return_value = (
         "ssh_utils.run_ssh_command stdout",
         "ssh_utils.run_ssh_command stderr",
     )
+    monkeypatch.setattr(ssh_utils, "run_ssh_command", run_ssh_command)
 
 
 ###
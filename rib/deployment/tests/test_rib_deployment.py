@@ -21,15 +21,20 @@
 """
 
 # Python Library Imports
+import concurrent.futures
+import contextlib
 from datetime import datetime
 import json
 import os
 import pytest
+import time
 from typing import Any, Dict
+import zipfile
 from unittest import mock
 from unittest.mock import MagicMock, patch, create_autospec
 
 # Local Library Imports
+from rib.deployment import rib_deployment
 from rib.deployment.rib_aws_deployment import RibAwsDeployment
 from rib.deployment.rib_deployment import RibDeployment
 from rib.deployment.rib_deployment_config import (
@@ -42,6 +47,7 @@ from rib.deployment.rib_local_deployment import RibLocalDeployment
 from rib.deployment.status.rib_deployment_status import RibDeploymentStatus
 from rib.utils import (
     error_utils,
+    general_utils,
     race_node_utils,
 )
 from rib.utils.plugin_utils import (
@@ -501,6 +507,61 @@ def test_copy_plugin_to_shard_dir_one_so_per_platform(
     assert arcnames == expected_arcnames
 
 
+def test_create_distribution_artifacts_skips_unchanged_artifacts(
+    stub_deployment, tmp_path
+) -> int:
+    """
+    Purpose:
+        Test that incremental distribution artifact creation only rebuilds zips
+        whose plugin artifacts changed, and removes stale zips
+    Args
+        N/A
+    """
+    dist_dir = tmp_path / "dist"
+    dist_dir.mkdir()
+    for plugin in ["plugin_1", "plugin_2"]:
+        (tmp_path / plugin).mkdir()
+        (tmp_path / plugin / "plugin.so").write_text(f"{plugin} v1")
+    (dist_dir / "stale.zip").write_text("stale")
+
+    stub_deployment.paths.dirs = {"distribution_artifacts": str(dist_dir)}
+    stub_deployment.paths.files = {
+        "distribution_manifest": str(tmp_path / "distribution_manifest.json")
+    }
+    stub_deployment.get_plugin_distribution_artifacts = MagicMock(
+        side_effect=lambda plugin_name, plugin_type: {
+            f"{dist_dir}/linux-x86_64-client-{plugin}.zip": str(tmp_path / plugin)
+            for plugin in ["plugin_1", "plugin_2"]
+            if plugin_type == "network-manager"
+        }
+    )
+
+    stub_deployment.create_distribution_artifacts()
+    assert sorted(os.listdir(dist_dir)) == [
+        "linux-x86_64-client-plugin_1.zip",
+        "linux-x86_64-client-plugin_2.zip",
+    ]
+    plugin_1_zip_mtime = os.stat(
+        dist_dir / "linux-x86_64-client-plugin_1.zip"
+    ).st_mtime_ns
+
+    (tmp_path / "plugin_2" / "plugin.so").write_text("plugin_2 v2 (updated)")
+    with patch(
+        "rib.utils.general_utils.remove_dir_file",
+        wraps=general_utils.remove_dir_file,
+    ) as mock_remove:
+        stub_deployment.create_distribution_artifacts()
+
+    # Only the changed plugin's zip is rebuilt
+    mock_remove.assert_called_once_with(f"{dist_dir}/linux-x86_64-client-plugin_2.zip")
+    assert (
+        os.stat(dist_dir / "linux-x86_64-client-plugin_1.zip").st_mtime_ns
+        == plugin_1_zip_mtime
+    )
+    with zipfile.ZipFile(dist_dir / "linux-x86_64-client-plugin_2.zip") as zip_file:
+        assert zip_file.read("plugin_2/plugin.so") == b"plugin_2 v2 (updated)"
+
+
 ################################################################################
 # race.json
 ################################################################################
@@ -953,6 +1014,45 @@ def test_send_message_manual_no_nodes(stub_deployment):
     assert expected_call in race_node_interface.send_manual_message.call_args_list
 
 
+def test_send_message_reports_failed_sends_by_sender_and_recipient(stub_deployment):
+    """
+    Purpose:
+        Test the `deployment.send_message` reports errors publishing the batched
+            messages by sender and recipient
+    Args:
+        stub_deployment: Stub/mock deployment
+    """
+
+    stub_deployment.status.get_nodes_that_match_status = MagicMock(
+        return_value={"race-client-00001", "race-client-00002", "race-client-00003"}
+    )
+    race_node_interface = stub_deployment._race_node_interface
+    batch = race_node_utils.ActionBatch()
+
+    @contextlib.contextmanager
+    def failing_batch_actions():
+        yield batch
+        batch.errors.update({key: Exception("reset") for key in batch.error_keys})
+
+    race_node_interface.batch_actions.side_effect = failing_batch_actions
+    race_node_interface.send_manual_message.side_effect = (
+        lambda sender, recipient, **kwargs: batch.add(sender, {"type": "send"})
+    )
+
+    # Run Test
+    with pytest.raises(error_utils.RIB412) as error:
+        stub_deployment.send_message(
+            message_type="manual",
+            message_content="hello",
+            sender="race-client-00001",
+        )
+
+    # Verify Calls
+    assert "race-client-00001 to race-client-00002: reset" in error.value.msg
+    assert "race-client-00001 to race-client-00003: reset" in error.value.msg
+    assert "\n\trace-client-00001: " not in error.value.msg
+
+
 def test_send_message_manual_no_nodes_partially_up(stub_deployment):
     """
     Purpose:
@@ -1626,3 +1726,57 @@ def test_set_timezone_subset_of_nodes(stub_deployment):
     race_node_interface = stub_deployment._race_node_interface
     assert race_node_interface.set_timezone.call_count == 2
     assert expected_call in race_node_interface.set_timezone.call_args_list
+
+
+################################################################################
+# upload_files_to_file_server
+################################################################################
+
+
+def test_upload_files_to_file_server(stub_deployment):
+    stub_deployment._file_server_client = MagicMock()
+    stub_deployment._file_server_client.upload_files.return_value = {}
+    stub_deployment.upload_files_to_file_server(["/a.tar.gz", "/b.tar.gz"])
+    stub_deployment._file_server_client.upload_files.assert_called_once_with(
+        ["/a.tar.gz", "/b.tar.gz"], timeout=120
+    )
+
+
+def test_upload_files_to_file_server_raises_on_failed_uploads(stub_deployment):
+    stub_deployment._file_server_client = MagicMock()
+    stub_deployment._file_server_client.upload_files.return_value = {
+        "/b.tar.gz": "No such file or directory"
+    }
+    with pytest.raises(error_utils.RIB354) as error:
+        stub_deployment.upload_files_to_file_server(["/a.tar.gz", "/b.tar.gz"])
+    assert "/b.tar.gz: No such file or directory" in error.value.msg
+    assert "/a.tar.gz" not in error.value.msg
+
+
+################################################################################
+# _get_future_result_by_deadline
+################################################################################
+
+
+def test_get_future_result_by_deadline_returns_result():
+    future = concurrent.futures.Future()
+    future.set_result("archive")
+    assert (
+        rib_deployment._get_future_result_by_deadline(
+            future, time.monotonic() + 10, [future]
+        )
+        == "archive"
+    )
+
+
+def test_get_future_result_by_deadline_cancels_batch_when_deadline_passes():
+    running = concurrent.futures.Future()
+    running.set_running_or_notify_cancel()
+    pending = concurrent.futures.Future()
+    with pytest.raises(concurrent.futures.TimeoutError):
+        # Deadline is shared by the batch, so an expired one doesn't wait at all
+        rib_deployment._get_future_result_by_deadline(
+            running, time.monotonic() - 1, [running, pending]
+        )
+    assert pending.cancelled()
+    assert not running.cancelled()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+# Copyright 2023 Two Six Technologies
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+    Purpose:
+        Test File for rib_deployment_index.py
+"""
+
+# Python Library Imports
+import json
+import os
+import pytest
+from unittest.mock import MagicMock
+from mock import patch
+
+# Local Library Imports
+from rib.deployment.rib_deployment_config import IncompatibleDeployment
+from rib.deployment.rib_deployment_index import (
+    INDEX_FILENAME,
+    DeploymentIndex,
+    create_index_entry,
+)
+from rib.deployment.rib_local_deployment import RibLocalDeployment
+
+
+###
+# Fixtures
+###
+
+
+def _write_deployment(mode_dir, name, config=None, metadata=None):
+    """Write the config and metadata files of a deployment"""
+    deployment_dir = mode_dir / name
+    deployment_dir.mkdir(exist_ok=True)
+    (deployment_dir / "deployment_config.json").write_text(json.dumps(config or {}))
+    (deployment_dir / "deployment_metadata.json").write_text(json.dumps(metadata or {}))
+
+
+@pytest.fixture
+def load_entry():
+    """Index entry loader that summarizes every deployment as an empty local one"""
+    return MagicMock(
+        side_effect=lambda name: create_index_entry(
+            name=name,
+            rib_mode="local",
+            rib_version="1.0.0",
+            compatible=True,
+            nodes={},
+            metadata={},
+        )
+    )
+
+
+@pytest.fixture
+def deployment_index(tmp_path, load_entry):
+    """Deployment index of a temporary mode directory"""
+    return DeploymentIndex(
+        mode_dir=str(tmp_path),
+        rib_version="1.0.0",
+        config_filename="deployment_config.json",
+        metadata_filename="deployment_metadata.json",
+        load_entry=load_entry,
+    )
+
+
+###
+# Tests
+###
+
+
+################################################################################
+# create_index_entry
+################################################################################
+
+
+def test_create_index_entry_counts_nodes():
+    nodes = {
+        "race-client-00001": {"platform": "android", "node_type": "client"},
+        "race-client-00002": {"platform": "linux", "node_type": "client"},
+        "race-client-00003": {"platform": "linux", "node_type": "client"},
+        "race-server-00001": {"platform": "linux", "node_type": "server"},
+        "race-registry-00001": {"platform": "linux", "node_type": "registry"},
+    }
+    entry = create_index_entry(
+        name="test",
+        rib_mode="local",
+        rib_version="1.0.0",
+        compatible=True,
+        nodes=nodes,
+        metadata={"last_up_time": "yesterday", "last_down_time": None},
+    )
+    assert entry.android_client_count == 1
+    assert entry.linux_client_count == 2
+    assert entry.linux_server_count == 1
+    assert entry.registry_count == 1
+    assert entry.last_up_time == "yesterday"
+    assert entry.last_down_time is None
+
+
+################################################################################
+# get_entries
+################################################################################
+
+
+def test_get_entries_reuses_unchanged_entries(deployment_index, load_entry, tmp_path):
+    _write_deployment(tmp_path, "a")
+    _write_deployment(tmp_path, "b")
+
+    assert list(deployment_index.get_entries()) == ["a", "b"]
+    assert list(deployment_index.get_entries()) == ["a", "b"]
+    assert load_entry.call_count == 2
+    assert (tmp_path / INDEX_FILENAME).is_file()
+
+
+def test_get_entries_reloads_changed_entries(deployment_index, load_entry, tmp_path):
+    _write_deployment(tmp_path, "a")
+    _write_deployment(tmp_path, "b")
+    deployment_index.get_entries()
+    load_entry.reset_mock()
+
+    metadata_file = tmp_path / "a" / "deployment_metadata.json"
+    stat = metadata_file.stat()
+    os.utime(metadata_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert list(deployment_index.get_entries()) == ["a", "b"]
+    load_entry.assert_called_once_with("a")
+
+
+def test_get_entries_drops_removed_deployments(deployment_index, tmp_path):
+    _write_deployment(tmp_path, "a")
+    _write_deployment(tmp_path, "b")
+    deployment_index.get_entries()
+
+    for filename in os.listdir(tmp_path / "b"):
+        os.remove(tmp_path / "b" / filename)
+    os.rmdir(tmp_path / "b")
+    assert list(deployment_index.get_entries()) == ["a"]
+    assert list(deployment_index._read()) == ["a"]
+
+
+def test_get_entries_discards_index_of_other_rib_version(
+    deployment_index, load_entry, tmp_path
+):
+    _write_deployment(tmp_path, "a")
+    deployment_index.get_entries()
+    load_entry.reset_mock()
+
+    deployment_index.rib_version = "2.0.0"
+    deployment_index.get_entries()
+    load_entry.assert_called_once_with("a")
+
+
+def test_get_entries_ignores_corrupt_index(deployment_index, load_entry, tmp_path):
+    _write_deployment(tmp_path, "a")
+    (tmp_path / INDEX_FILENAME).write_text("not json")
+
+    assert list(deployment_index.get_entries()) == ["a"]
+    load_entry.assert_called_once_with("a")
+
+
+################################################################################
+# update/remove
+################################################################################
+
+
+def test_update_and_remove(deployment_index, load_entry, tmp_path):
+    _write_deployment(tmp_path, "a")
+    deployment_index.update("a")
+    load_entry.assert_called_once_with("a")
+    assert list(deployment_index._read()) == ["a"]
+
+    deployment_index.remove("a")
+    assert deployment_index._read() == {}
+
+
+################################################################################
+# RibDeployment.get_defined_deployments
+################################################################################
+
+
+def test_get_defined_deployments_reads_index(tmp_path):
+    _write_deployment(
+        tmp_path, "legacy", config={"rib_version": "0.1.0", "nodes": {}}, metadata={}
+    )
+    with patch.dict(RibLocalDeployment.pathsClass.dirs, {"mode": str(tmp_path)}):
+        deployments = RibLocalDeployment.get_defined_deployments()
+        assert deployments.compatible == set()
+        assert deployments.incompatible == {
+            IncompatibleDeployment(name="legacy", rib_version="0.1.0")
+        }
+
+        with patch.object(RibLocalDeployment, "get_deployment") as get_deployment:
+            assert RibLocalDeployment.get_defined_deployments() == deployments
+            get_deployment.assert_not_called()
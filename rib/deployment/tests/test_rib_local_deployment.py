@@ -29,6 +29,8 @@ import pytest
 import os
 import tempfile
 import shutil
+import subprocess
+import tarfile
 from unittest import mock
 from unittest.mock import MagicMock, create_autospec
 from mock import patch
@@ -1102,6 +1104,340 @@ def test_generate_plugin_or_channel_configs_complete_with_minimum_loop(
     assert mock_subprocess.call_count == 5
 
 
+@pytest.fixture()
+def config_gen_cache_deployment_obj(example_3x3_local_deployment_obj, tmp_path):
+    """
+    Purpose:
+        Fixture of the example 3x3 local deployment with its race configs, etc, and the
+        config generation cache in a temporary directory and known kit checksums
+    Args:
+        example_3x3_local_deployment_obj: Example configured 3x3 local deployment
+        tmp_path: Temporary directory
+    Return:
+        Deployment with temporary config generation paths
+    """
+
+    deployment = example_3x3_local_deployment_obj
+    race_configs = tmp_path / "configs"
+    for key in [
+        "network_manager_configs_base",
+        "comms_configs_base",
+        "artifact_manager_configs_base",
+    ]:
+        deployment.paths.dirs[key] = str(race_configs / key)
+        os.makedirs(deployment.paths.dirs[key])
+    deployment.paths.dirs["etc"] = str(tmp_path / "etc")
+    deployment.paths.files["race_config"] = str(race_configs / "race-config.json")
+    deployment.paths.files["channel_list"] = str(race_configs / "channel_list.json")
+    Path(deployment.paths.files["race_config"]).write_text('{"range": {}}')
+    deployment.metadata = deployment.metadata.copy(deep=True)
+    deployment.metadata.race_core_cache.checksum = "race-core-checksum"
+
+    with patch.dict(
+        RibDeployment.rib_config.RIB_PATHS["docker"], {"cache": str(tmp_path / "cache")}
+    ):
+        yield deployment
+
+
+def test_config_gen_cache_key_depends_on_inputs(config_gen_cache_deployment_obj):
+    """
+    Purpose:
+        Test the config generation cache key is stable for the same inputs and changes
+        when the range config, kits, or generator arguments change
+    Args
+        config_gen_cache_deployment_obj: Deployment with temporary config gen paths
+    """
+
+    deployment = config_gen_cache_deployment_obj
+    key = deployment._get_config_gen_cache_key(local=True)
+    assert key == deployment._get_config_gen_cache_key(local=True)
+    assert key != deployment._get_config_gen_cache_key(local=False)
+
+    Path(deployment.paths.files["race_config"]).write_text('{"range": {"x": 1}}')
+    changed_range_key = deployment._get_config_gen_cache_key(local=True)
+    assert changed_range_key != key
+
+    deployment.metadata.comms_kits_cache[
+        "test-comms-plugin"
+    ] = deployment.metadata.comms_kits_cache["test-comms-plugin"].copy(
+        update={"checksum": "new-comms-checksum"}
+    )
+    assert deployment._get_config_gen_cache_key(local=True) != changed_range_key
+
+    deployment.metadata.race_core_cache.checksum = "to-be-implemented"
+    assert deployment._get_config_gen_cache_key(local=True) is None
+
+
+def test_config_gen_cache_restores_stored_configs(config_gen_cache_deployment_obj):
+    """
+    Purpose:
+        Test generated configs, channel list and user responses stored in the config
+        generation cache are restored in place of regenerated configs
+    Args
+        config_gen_cache_deployment_obj: Deployment with temporary config gen paths
+    """
+
+    deployment = config_gen_cache_deployment_obj
+    network_manager_dir = os.path.join(
+        deployment.paths.dirs["network_manager_configs_base"],
+        deployment.config.network_manager_kit.name,
+    )
+    os.makedirs(network_manager_dir)
+    status_file = os.path.join(
+        network_manager_dir, "network-manager-config-gen-status.json"
+    )
+    Path(status_file).write_text('{"status": "complete", "reason": "success"}')
+    Path(deployment.paths.files["channel_list"]).write_text("[]")
+    os.makedirs(os.path.join(deployment.paths.dirs["etc"], "race-client-00001"))
+    user_responses_file = os.path.join(
+        deployment.paths.dirs["etc"], "race-client-00001", "user-responses.json"
+    )
+    Path(user_responses_file).write_text("{}")
+
+    assert deployment._restore_cached_configs("key") is None
+    deployment._cache_configs("key")
+
+    shutil.rmtree(deployment.paths.dirs["network_manager_configs_base"])
+    os.remove(deployment.paths.files["channel_list"])
+    os.remove(user_responses_file)
+
+    assert deployment._restore_cached_configs("key") == {
+        "status": "complete",
+        "reason": "success",
+    }
+    assert os.path.isfile(status_file)
+    assert os.path.isfile(deployment.paths.files["channel_list"])
+    assert os.path.isfile(user_responses_file)
+
+
+def test_config_gen_cache_keeps_most_recently_used_entries(
+    config_gen_cache_deployment_obj,
+):
+    """
+    Purpose:
+        Test storing configs in the config generation cache removes the least recently
+        used entries once the cache is full
+    Args
+        config_gen_cache_deployment_obj: Deployment with temporary config gen paths
+    """
+
+    deployment = config_gen_cache_deployment_obj
+    network_manager_dir = os.path.join(
+        deployment.paths.dirs["network_manager_configs_base"],
+        deployment.config.network_manager_kit.name,
+    )
+    os.makedirs(network_manager_dir)
+    Path(network_manager_dir, "network-manager-config-gen-status.json").write_text(
+        '{"status": "complete", "reason": "success"}'
+    )
+    Path(deployment.paths.files["channel_list"]).write_text("[]")
+    os.makedirs(deployment.paths.dirs["etc"])
+    cache_root = os.path.dirname(deployment._get_config_gen_cache_dir("key"))
+
+    with patch("rib.deployment.rib_deployment.CONFIG_GEN_CACHE_MAX_ENTRIES", 2):
+        for mtime, cache_key in enumerate(["a", "b"]):
+            deployment._cache_configs(cache_key)
+            os.utime(deployment._get_config_gen_cache_dir(cache_key), (mtime, mtime))
+        # Using an entry makes it the most recently used
+        deployment._restore_cached_configs("a")
+        deployment._cache_configs("c")
+
+    assert sorted(os.listdir(cache_root)) == ["a", "c"]
+
+
+@patch("rib.utils.subprocess_utils.run")
+def test_generate_plugin_or_channel_configs_skips_cache(
+    mock_subprocess, example_3x3_local_deployment_obj
+) -> int:
+    """
+    Purpose:
+        Test generate_plugin_or_channel_configs neither restores configs from nor
+        stores them in the cache when skipping the cache
+    Args
+        mock_subprocess: mocked subprocess call for testing
+        example_3x3_local_deployment_obj: Example configured 3x3 local deployment for testing
+    """
+
+    deployment = example_3x3_local_deployment_obj
+    deployment._get_config_gen_cache_key = MagicMock(return_value="key")
+    deployment._restore_cached_configs = MagicMock()
+    deployment._run_config_generators = MagicMock(
+        return_value={"status": "complete", "reason": "success"}
+    )
+    deployment._cache_configs = MagicMock()
+
+    deployment.generate_plugin_or_channel_configs(
+        skip_config_tar=True, skip_config_cache=True
+    )
+    deployment._run_config_generators.assert_called_once()
+    deployment._restore_cached_configs.assert_not_called()
+    deployment._cache_configs.assert_not_called()
+
+
+@patch("rib.utils.subprocess_utils.run")
+def test_generate_plugin_or_channel_configs_uses_cache(
+    mock_subprocess, example_3x3_local_deployment_obj
+) -> int:
+    """
+    Purpose:
+        Test generate_plugin_or_channel_configs skips the config generators when the
+        outputs are restored from the cache, and bypasses the cache when forced
+    Args
+        mock_subprocess: mocked subprocess call for testing
+        example_3x3_local_deployment_obj: Example configured 3x3 local deployment for testing
+    """
+
+    deployment = example_3x3_local_deployment_obj
+    deployment._get_config_gen_cache_key = MagicMock(return_value="key")
+    deployment._restore_cached_configs = MagicMock(
+        return_value={"status": "complete", "reason": "success"}
+    )
+    deployment._run_config_generators = MagicMock(
+        return_value={"status": "complete", "reason": "success"}
+    )
+    deployment._cache_configs = MagicMock()
+
+    deployment.generate_plugin_or_channel_configs(skip_config_tar=True)
+    deployment._restore_cached_configs.assert_called_once_with("key")
+    deployment._run_config_generators.assert_not_called()
+    mock_subprocess.assert_not_called()
+
+    with patch("os.mkdir"), patch("rib.utils.general_utils.remove_dir_file"):
+        deployment.generate_plugin_or_channel_configs(force=True, skip_config_tar=True)
+    deployment._restore_cached_configs.assert_called_once()
+    deployment._run_config_generators.assert_called_once()
+    deployment._cache_configs.assert_called_once_with("key")
+
+
+def test_run_config_gens_concurrently_reports_all_failures() -> int:
+    """
+    Purpose:
+        Test _run_config_gens_concurrently runs every generator and reports each failure
+    Args
+        N/A
+    """
+
+    a_failure = RuntimeError("a failed")
+    succeeded = MagicMock()
+    with pytest.raises(error_utils.RIB355) as excinfo:
+        RibDeployment._run_config_gens_concurrently(
+            {
+                "Comms (a)": MagicMock(side_effect=a_failure),
+                "Comms (b)": succeeded,
+                "Comms (c)": MagicMock(side_effect=RuntimeError("c failed")),
+            },
+            max_workers=2,
+        )
+
+    succeeded.assert_called_once()
+    assert excinfo.value.msg == (
+        "Multiple config generators failed:"
+        "\n\tComms (a) config generation failed: a failed"
+        "\n\tComms (c) config generation failed: c failed"
+    )
+    assert excinfo.value.__cause__ is a_failure
+
+
+def test_run_config_gens_concurrently_reraises_single_failure() -> int:
+    """
+    Purpose:
+        Test _run_config_gens_concurrently re-raises the original error when a single
+        generator failed
+    Args
+        N/A
+    """
+
+    failure = subprocess.TimeoutExpired(cmd="generate_configs.sh", timeout=300)
+    with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+        RibDeployment._run_config_gens_concurrently(
+            {"Comms (a)": MagicMock(side_effect=failure), "Comms (b)": MagicMock()}
+        )
+
+    assert excinfo.value is failure
+
+
+################################################################################
+# Node Archive Retrieval
+################################################################################
+
+
+def _make_node_archive(path: str, file_name: str) -> None:
+    """
+    Purpose:
+        Write a node archive containing a single file to the given path
+    Args:
+        path: Path of the archive to write
+        file_name: Name of the file in the archive
+    """
+
+    with tempfile.TemporaryDirectory() as src_dir:
+        Path(src_dir, file_name).write_text(file_name)
+        with tarfile.open(path, "w:gz") as tar:
+            tar.add(os.path.join(src_dir, file_name), arcname=file_name)
+
+
+@patch("rib.deployment.rib_deployment.NODE_ARCHIVE_POLL_INTERVAL", 0.01)
+def test_retrieve_node_archives(example_3x3_local_deployment_obj, tmp_path) -> int:
+    """
+    Purpose:
+        Test _retrieve_node_archives lists the file server once per poll, downloads
+        only the archives that are ready, and extracts every archive
+    Args
+        example_3x3_local_deployment_obj: Example configured 3x3 local deployment for testing
+        tmp_path: Temporary directory
+    """
+
+    deployment = example_3x3_local_deployment_obj
+    listings = [{"a.tar.gz"}, {"a.tar.gz", "b.tar.gz"}]
+    file_server_client = MagicMock()
+    file_server_client.get_file_listing_snapshot.side_effect = lambda: (
+        listings.pop(0) if len(listings) > 1 else listings[0]
+    )
+    file_server_client.download_file.side_effect = (
+        lambda name, path, timeout: _make_node_archive(path, name) or True
+    )
+    deployment._file_server_client = file_server_client
+
+    waiting, failed = deployment._retrieve_node_archives(
+        {"node-a": "a.tar.gz", "node-b": "b.tar.gz"}, str(tmp_path), timeout=10
+    )
+
+    assert waiting == []
+    assert failed == {}
+    assert file_server_client.download_file.call_count == 2
+    assert (tmp_path / "node-a" / "a.tar.gz").read_text() == "a.tar.gz"
+    assert (tmp_path / "node-b" / "b.tar.gz").read_text() == "b.tar.gz"
+    assert not (tmp_path / "node-a.tar.gz").exists()
+
+
+@patch("rib.deployment.rib_deployment.NODE_ARCHIVE_POLL_INTERVAL", 0.01)
+def test_retrieve_node_archives_gives_up_after_second_failure(
+    example_3x3_local_deployment_obj, tmp_path
+) -> int:
+    """
+    Purpose:
+        Test _retrieve_node_archives retries a failed node once, reports the error of
+        the node that failed twice, and stops waiting for archives that never arrive
+    Args
+        example_3x3_local_deployment_obj: Example configured 3x3 local deployment for testing
+        tmp_path: Temporary directory
+    """
+
+    deployment = example_3x3_local_deployment_obj
+    file_server_client = MagicMock()
+    file_server_client.get_file_listing_snapshot.return_value = {"a.tar.gz"}
+    file_server_client.download_file.side_effect = Exception("connection reset")
+    deployment._file_server_client = file_server_client
+
+    waiting, failed = deployment._retrieve_node_archives(
+        {"node-a": "a.tar.gz", "node-b": "b.tar.gz"}, str(tmp_path), timeout=1
+    )
+
+    assert waiting == ["node-b"]
+    assert failed == {"node-a": "connection reset"}
+    assert file_server_client.download_file.call_count == 2
+
+
 @patch("rib.utils.subprocess_utils.run")
 def test_run_network_manager_config_gen_no_optional_flags(
     mock_subprocess, example_3x3_local_deployment_obj
@@ -1260,6 +1596,9 @@ def test_run_comms_config_gen(mock_subprocess, example_3x3_local_deployment_obj)
         expected_call = mock.call(
             " ".join(cmd),
             check=True,
+            logger=logging.getLogger(
+                f"rib.deployment.rib_deployment.config_gen.{channel.name}"
+            ),
             shell=True,
             stdout_level=logging.DEBUG,
             timeout=300,
@@ -1309,6 +1648,9 @@ def test_run_comms_config_gen_custom_args(
     expected_call = mock.call(
         " ".join(cmd),
         check=True,
+        logger=logging.getLogger(
+            "rib.deployment.rib_deployment.config_gen.mockTwoSixDirectCpp"
+        ),
         shell=True,
         stdout_level=logging.DEBUG,
         timeout=300,
@@ -1337,6 +1679,9 @@ def test_run_comms_config_gen_custom_args(
     expected_call = mock.call(
         " ".join(cmd),
         check=True,
+        logger=logging.getLogger(
+            "rib.deployment.rib_deployment.config_gen.mockTwoSixIndirectCpp"
+        ),
         shell=True,
         stdout_level=logging.DEBUG,
         timeout=300,
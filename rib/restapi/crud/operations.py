@@ -116,3 +116,12 @@ def create_operation_log(
     db_session.commit()
     db_session.refresh(line)
     return line
+
+
+def create_operation_logs(
+    db_session: Session, lines: List[DbOperationLogLine]
+) -> List[DbOperationLogLine]:
+    """Add the given operation log lines to the database in a single transaction"""
+    db_session.add_all(lines)
+    db_session.commit()
+    return lines
@@ -89,7 +89,7 @@ def get_queue_operation(
                 state=OperationState.PENDING,
             ),
         )
-        operations_queue.add(db_operation.id)
+        operations_queue.add(db_operation.id, target)
         return {"id": db_operation.id}
 
     return queue_operation
@@ -31,9 +31,13 @@ engine = create_engine(
 
 
 @event.listens_for(Engine, "connect")
-def set_foreign_keys_pragma(db_conn, conn_record):
+def set_sqlite_pragmas(db_conn, conn_record):
     cursor = db_conn.cursor()
     cursor.execute("PRAGMA foreign_keys=ON;")
+    # Write-ahead logging lets API reads proceed while operations are writing logs,
+    # and with it a NORMAL sync level only fsyncs at checkpoints
+    cursor.execute("PRAGMA journal_mode=WAL;")
+    cursor.execute("PRAGMA synchronous=NORMAL;")
     cursor.close()
 
 
@@ -16,21 +16,27 @@
 """ Operations Queue Executor """
 
 # Python Library Imports
+import contextvars
 import importlib
 import json
 import logging
+import os
+import queue
 import sys
+import threading
+import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from fastapi.encoders import jsonable_encoder
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from typing import IO, List, Tuple
+from typing import IO, Any, Deque, Dict, List, Optional, Set, Tuple
 
 # Local Python Library Imports
 from rib.restapi.crud.operations import (
-    create_operation_log,
+    create_operation_logs,
     get_operation,
     get_dangling_operations,
 )
@@ -47,6 +53,11 @@ from rib.utils import error_utils, log_utils
 
 logger = logging.getLogger(__name__)
 
+# Targets with these prefixes share resources, so all of their operations are run one
+# at a time (e.g., only one local deployment can be active, and standing one up
+# starts containers shared by all local deployments)
+SERIALIZED_TARGET_PREFIXES = ["deployment:local:"]
+
 
 def split_function(function: str) -> Tuple[str, str]:
     """Split the full name of a python function into the module and function names"""
@@ -54,6 +65,14 @@ def split_function(function: str) -> Tuple[str, str]:
     return (".".join(parts[0:-1]), parts[-1])
 
 
+def get_schedule_key(target: str) -> str:
+    """Get the key of the queue in which operations for the given target are run"""
+    for prefix in SERIALIZED_TARGET_PREFIXES:
+        if target.startswith(prefix):
+            return prefix.rstrip(":")
+    return target
+
+
 def get_log_level(levelno: int) -> LogLineLevel:
     """Convert the logging level integer into a log line level enum"""
     if levelno == logging.CRITICAL:
@@ -85,34 +104,94 @@ def broadcast_state(operation_id: int, name: str, state: OperationState):
     )
 
 
-class DatabaseLogHandler(logging.Handler):
-    """Custom logging handler to create database records for each logging record"""
+class OperationLogSink:
+    """
+    Buffered sink for operation log lines, writing them to the database (and
+    broadcasting them to subscribers) in batches from a background thread
+    """
+
+    MAX_BATCH_SIZE = 500
+    FLUSH_INTERVAL = 0.25
 
     def __init__(self, operation_id: int):
-        super().__init__(level=log_utils.TRACE)
         self.operation_id = operation_id
+        self._queue: "queue.Queue[Optional[DbOperationLogLine]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"operation-{operation_id}-logs",
+            daemon=True,
+        )
 
-    def emit(self, record: logging.LogRecord) -> None:
-        if "websockets" in record.pathname:
-            return
+    def start(self):
+        """Start the background writer"""
+        self._thread.start()
+
+    def put(self, line: DbOperationLogLine):
+        """Queue the given log line to be written"""
+        self._queue.put(line)
+
+    def close(self):
+        """Write all queued log lines and stop the background writer"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """Collect queued lines into batches, by size or time, and write them"""
+        closed = False
+        while not closed:
+            batch = []
+            line = self._queue.get()
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while line is not None:
+                batch.append(line)
+                if len(batch) >= self.MAX_BATCH_SIZE:
+                    break
+                try:
+                    line = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            closed = line is None
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: List[DbOperationLogLine]):
+        """Bulk-insert the given log lines and broadcast them"""
         try:
-            db_session = SessionLocal()
-            log = create_operation_log(
-                db_session,
-                DbOperationLogLine(
-                    operation_id=self.operation_id,
-                    source=LogLineSource.LOG,
-                    logLevel=get_log_level(record.levelno),
-                    text=record.getMessage(),
-                    time=datetime.fromtimestamp(record.created),
-                ),
+            db_session = SessionLocal(expire_on_commit=False)
+            lines = create_operation_logs(db_session, batch)
+        except Exception as err:
+            # Logging here would be captured right back into this sink
+            sys.__stderr__.write(
+                f"Error writing logs for operation {self.operation_id}: {err}\n"
             )
+            return
         finally:
             db_session.close()
 
-        broadcast_logs(
-            self.operation_id,
-            [log],
+        broadcast_logs(self.operation_id, lines)
+
+
+class DatabaseLogHandler(logging.Handler):
+    """Custom logging handler to create database records for each logging record"""
+
+    def __init__(self, router: "OperationOutputRouter"):
+        super().__init__(level=log_utils.TRACE)
+        self.router = router
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if "websockets" in record.pathname:
+            return
+        sink = self.router.get_sink()
+        if sink is None:
+            return
+        sink.put(
+            DbOperationLogLine(
+                operation_id=sink.operation_id,
+                source=LogLineSource.LOG,
+                logLevel=get_log_level(record.levelno),
+                text=record.getMessage(),
+                time=datetime.fromtimestamp(record.created),
+            )
         )
 
 
@@ -123,12 +202,12 @@ class StreamCapture:
         self,
         source: LogLineSource,
         level: LogLineLevel,
-        operation_id: int,
+        router: "OperationOutputRouter",
         wrapped: IO,
     ):
         self.source = source
         self.level = level
-        self.operation_id = operation_id
+        self.router = router
         self.wrapped = wrapped
 
     def write(self, message: str):
@@ -136,71 +215,137 @@ class StreamCapture:
         now = datetime.now()
         self.wrapped.write(message)
 
-        try:
-            db_session = SessionLocal()
-            lines: List[DbOperationLogLine] = []
-            for line in message.rstrip().splitlines():
-                log = create_operation_log(
-                    db_session,
-                    DbOperationLogLine(
-                        operation_id=self.operation_id,
-                        source=self.source,
-                        logLevel=self.level,
-                        text=line.rstrip(),
-                        time=now,
-                    ),
-                )
-                lines.append(log)
-        finally:
-            db_session.close()
+        sink = self.router.get_sink()
+        if sink is None:
+            return
 
-        if lines:
-            broadcast_logs(self.operation_id, lines)
+        for line in message.rstrip().splitlines():
+            sink.put(
+                DbOperationLogLine(
+                    operation_id=sink.operation_id,
+                    source=self.source,
+                    logLevel=self.level,
+                    text=line.rstrip(),
+                    time=now,
+                )
+            )
 
     def flush(self):
         """Flushes the wrapped stream"""
         self.wrapped.flush()
 
+    def __getattr__(self, name: str) -> Any:
+        """Delegate all other stream attributes to the wrapped stream"""
+        return getattr(self.wrapped, name)
 
-@contextmanager
-def db_logger(operation_id: int) -> None:
-    """Set up logging handlers and stream captures to record all output from the operation"""
-    orig_stdout = sys.stdout
-    orig_stderr = sys.stderr
-    handler = None
-    try:
-        handler = DatabaseLogHandler(operation_id)
-        logging.root.addHandler(handler)
+
+class OperationOutputRouter:
+    """
+    Tracks which operation log sink belongs to which execution context, so that log
+    records and stdout/stderr writes from concurrently executing operations are
+    recorded against the operation that produced them.
+
+    The sink is held in a context variable, so it follows the operation onto worker
+    threads that run in a copy of its context (see
+    threading_utils.ContextThreadPoolExecutor). Output from any other thread is not
+    recorded.
+    """
+
+    def __init__(self):
+        self._sink: contextvars.ContextVar[
+            Optional[OperationLogSink]
+        ] = contextvars.ContextVar("operation_log_sink", default=None)
+        self._handler: Optional[DatabaseLogHandler] = None
+        self._orig_streams: Optional[Tuple[IO, IO]] = None
+
+    def install(self):
+        """Install the logging handler and stdout/stderr captures"""
+        if self._handler:
+            return
+        self._handler = DatabaseLogHandler(self)
+        logging.root.addHandler(self._handler)
+        self._orig_streams = (sys.stdout, sys.stderr)
         sys.stdout = StreamCapture(
-            wrapped=orig_stdout,
+            wrapped=sys.stdout,
             source=LogLineSource.STDOUT,
             level=LogLineLevel.INFO,
-            operation_id=operation_id,
+            router=self,
         )
         sys.stderr = StreamCapture(
-            wrapped=orig_stderr,
+            wrapped=sys.stderr,
             source=LogLineSource.STDERR,
             level=LogLineLevel.ERROR,
-            operation_id=operation_id,
+            router=self,
         )
+
+    def uninstall(self):
+        """Remove the logging handler and restore the original stdout/stderr"""
+        if not self._handler:
+            return
+        logging.root.removeHandler(self._handler)
+        self._handler = None
+        (sys.stdout, sys.stderr) = self._orig_streams
+        self._orig_streams = None
+
+    def register(self, sink: OperationLogSink) -> contextvars.Token:
+        """Record output from the current context to the given sink"""
+        return self._sink.set(sink)
+
+    def unregister(self, token: contextvars.Token):
+        """Stop recording output from the current context to the registered sink"""
+        self._sink.reset(token)
+
+    def get_sink(self) -> Optional[OperationLogSink]:
+        """Get the sink for output from the current context, if any"""
+        return self._sink.get()
+
+
+operation_output = OperationOutputRouter()
+
+
+@contextmanager
+def db_logger(operation_id: int) -> None:
+    """Record all output from the operation running on the current thread (and its workers)"""
+    sink = OperationLogSink(operation_id)
+    sink.start()
+    token = operation_output.register(sink)
+    try:
         yield
     finally:
-        if handler:
-            logging.root.removeHandler(handler)
-        sys.stdout = orig_stdout
-        sys.stderr = orig_stderr
+        operation_output.unregister(token)
+        sink.close()
 
 
 class OperationsQueue:
-    """Operation execution queue, performing all executions in a background thread"""
+    """
+    Operation execution queue, performing executions in background threads.
 
-    def __init__(self):
+    Operations on different targets run concurrently (up to the configured number of
+    workers), while operations on the same target run one at a time in the order in
+    which they were added. Operations on targets that share resources (see
+    SERIALIZED_TARGET_PREFIXES) are run one at a time as if they were on the same
+    target.
+    """
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, max_workers: Optional[int] = None):
         logger.info("Starting operations queue executor")
+        self.max_workers = max_workers or int(
+            os.environ.get("RIB_OPERATIONS_MAX_WORKERS", self.DEFAULT_MAX_WORKERS)
+        )
         self.executor: ThreadPoolExecutor = None
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Deque[int]] = {}
+        self._active_targets: Set[str] = set()
+        self._running = 0
 
     def start(self):
         """Create the executor and clean up dangling operations"""
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="operation"
+        )
+        operation_output.install()
         try:
             db_session = SessionLocal()
             # Clean up any dangling operations from a previous run
@@ -214,11 +359,64 @@ class OperationsQueue:
     def shutdown(self):
         """Shutdown the executor"""
         self.executor.shutdown()
+        operation_output.uninstall()
+
+    def add(self, operation_id: int, target: str):
+        """Add the given operation to the queue for the given target"""
+        logger.debug(f"Scheduling operation {operation_id} for {target}")
+        key = get_schedule_key(target)
+        with self._lock:
+            self._pending.setdefault(key, deque()).append(operation_id)
+            if key in self._active_targets:
+                return
+            self._active_targets.add(key)
+        self.executor.submit(self._execute_next, key)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get the current depth of the queue"""
+        with self._lock:
+            pending = {
+                target: len(operations)
+                for target, operations in self._pending.items()
+                if operations
+            }
+            return {
+                "maxWorkers": self.max_workers,
+                "activeTargets": len(self._active_targets),
+                "runningOperations": self._running,
+                "pendingOperations": sum(pending.values()),
+                "pendingByTarget": pending,
+            }
+
+    def _execute_next(self, key: str):
+        """Execute the next operation in the given queue, then reschedule the queue"""
+        with self._lock:
+            operation_id = self._pending[key].popleft()
+            self._running += 1
 
-    def add(self, operation_id: int):
-        """Add the given operation to the queue"""
-        logger.debug(f"Scheduling operation {operation_id}")
-        self.executor.submit(self._execute, operation_id)
+        try:
+            self._execute(operation_id)
+        finally:
+            with self._lock:
+                self._running -= 1
+                resubmit = bool(self._pending[key])
+                if not resubmit:
+                    self._release(key)
+
+            if resubmit:
+                # Resubmit rather than looping so that busy queues yield their worker
+                # to other queues between operations
+                try:
+                    self.executor.submit(self._execute_next, key)
+                except RuntimeError:
+                    # Shutting down, remaining operations are aborted on next start
+                    with self._lock:
+                        self._release(key)
+
+    def _release(self, key: str):
+        """Mark the given queue as idle, must be called with the lock held"""
+        del self._pending[key]
+        self._active_targets.discard(key)
 
     @staticmethod
     def _execute(operation_id: int):
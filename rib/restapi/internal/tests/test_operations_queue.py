@@ -0,0 +1,285 @@
+# Copyright 2023 Two Six Technologies
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Purpose:
+    Tests for operations_queue.py
+"""
+
+# Python Library Imports
+import logging
+import pytest
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from mock import MagicMock, patch
+from typing import Callable, Dict, List
+
+# Local Library Imports
+from rib.restapi.internal import operations_queue
+from rib.utils import subprocess_utils, threading_utils
+from rib.restapi.internal.operations_queue import (
+    OperationLogSink,
+    OperationOutputRouter,
+    OperationsQueue,
+    get_schedule_key,
+)
+
+
+###
+# Mocks/fixtures
+###
+
+
+class RecordingExecution:
+    """Fake operation execution recording the order and overlap of executions"""
+
+    def __init__(self, targets: Dict[int, str]):
+        self.targets = targets
+        self.lock = threading.Lock()
+        self.executed: List[int] = []
+        self.running: Dict[str, int] = defaultdict(int)
+        self.max_running: Dict[str, int] = defaultdict(int)
+        self.total_running = 0
+        self.max_total_running = 0
+        self.hooks: Dict[int, Callable[[], None]] = {}
+        self.done = threading.Semaphore(0)
+
+    def __call__(self, operation_id: int):
+        key = get_schedule_key(self.targets[operation_id])
+        with self.lock:
+            self.executed.append(operation_id)
+            self.running[key] += 1
+            self.max_running[key] = max(self.max_running[key], self.running[key])
+            self.total_running += 1
+            self.max_total_running = max(self.max_total_running, self.total_running)
+        try:
+            if operation_id in self.hooks:
+                self.hooks[operation_id]()
+        finally:
+            with self.lock:
+                self.running[key] -= 1
+                self.total_running -= 1
+            self.done.release()
+
+    def wait_for(self, count: int):
+        for _ in range(count):
+            assert self.done.acquire(timeout=5)
+
+
+def run_operations(
+    targets: Dict[int, str], hooks: Dict[int, Callable[[], None]] = None
+) -> RecordingExecution:
+    """
+    Purpose:
+        Adds the given operations to a queue and waits for all of them to execute
+    """
+    execution = RecordingExecution(targets)
+    execution.hooks = hooks or {}
+    queue = OperationsQueue(max_workers=4)
+    queue.executor = ThreadPoolExecutor(max_workers=queue.max_workers)
+    with patch.object(OperationsQueue, "_execute", side_effect=execution):
+        for operation_id, target in targets.items():
+            queue.add(operation_id, target)
+        execution.wait_for(len(targets))
+        queue.executor.shutdown()
+    assert queue.get_metrics()["pendingOperations"] == 0
+    assert queue.get_metrics()["activeTargets"] == 0
+    return execution
+
+
+###
+# Tests
+###
+
+
+################################################################################
+# get_schedule_key
+################################################################################
+
+
+def test_get_schedule_key():
+    assert get_schedule_key("deployment:local:a") == "deployment:local"
+    assert get_schedule_key("deployment:local:b") == "deployment:local"
+    assert get_schedule_key("deployment:aws:a") == "deployment:aws:a"
+
+
+################################################################################
+# OperationsQueue
+################################################################################
+
+
+def test_operations_on_same_target_run_in_order():
+    execution = run_operations(
+        {
+            1: "deployment:aws:a",
+            2: "deployment:aws:a",
+            3: "deployment:aws:a",
+            4: "deployment:aws:a",
+        }
+    )
+    assert execution.executed == [1, 2, 3, 4]
+    assert execution.max_running["deployment:aws:a"] == 1
+
+
+def test_operations_on_different_targets_run_concurrently():
+    both_running = threading.Barrier(2, timeout=5)
+    execution = run_operations(
+        {1: "deployment:aws:a", 2: "deployment:aws:b", 3: "deployment:aws:a"},
+        # Each waits for the other to be running, so fails unless run concurrently
+        hooks={1: both_running.wait, 2: both_running.wait},
+    )
+    assert execution.max_total_running == 2
+    assert execution.executed.index(1) < execution.executed.index(3)
+    assert execution.max_running["deployment:aws:a"] == 1
+
+
+def test_operations_on_local_deployments_run_one_at_a_time():
+    execution = run_operations(
+        {
+            1: "deployment:local:a",
+            2: "deployment:local:b",
+            3: "deployment:local:a",
+            4: "deployment:aws:a",
+        },
+        # Give the other local deployment a chance to run alongside it
+        hooks={1: lambda: time.sleep(0.2)},
+    )
+    assert [op for op in execution.executed if op != 4] == [1, 2, 3]
+    assert execution.max_running["deployment:local"] == 1
+
+
+def test_execute_next_does_not_swallow_errors():
+    queue = OperationsQueue(max_workers=1)
+    queue.executor = MagicMock()
+    queue._pending["deployment:aws:a"] = operations_queue.deque([1, 2])
+    queue._active_targets.add("deployment:aws:a")
+
+    with patch.object(
+        OperationsQueue, "_execute", side_effect=RuntimeError("unexpected")
+    ):
+        with pytest.raises(RuntimeError, match="unexpected"):
+            queue._execute_next("deployment:aws:a")
+
+    # The next operation is still scheduled
+    queue.executor.submit.assert_called_once_with(
+        queue._execute_next, "deployment:aws:a"
+    )
+    assert queue.get_metrics()["runningOperations"] == 0
+
+
+def test_execute_next_releases_queue_when_shutting_down():
+    queue = OperationsQueue(max_workers=1)
+    queue.executor = MagicMock()
+    queue.executor.submit.side_effect = RuntimeError("shutdown")
+    queue._pending["deployment:aws:a"] = operations_queue.deque([1, 2])
+    queue._active_targets.add("deployment:aws:a")
+
+    with patch.object(OperationsQueue, "_execute"):
+        queue._execute_next("deployment:aws:a")
+
+    assert queue.get_metrics()["activeTargets"] == 0
+    assert queue.get_metrics()["pendingOperations"] == 0
+
+
+################################################################################
+# OperationOutputRouter
+################################################################################
+
+
+def make_sink(operation_id: int) -> MagicMock:
+    """
+    Purpose:
+        Creates a mock operation log sink
+    """
+    return MagicMock(spec=OperationLogSink, operation_id=operation_id)
+
+
+def get_logged_text(sink: MagicMock) -> List[str]:
+    """
+    Purpose:
+        Gets the text of all lines put to the mock sink
+    """
+    return [call.args[0].text for call in sink.put.call_args_list]
+
+
+def test_get_sink_attributes_output_to_registered_context():
+    router = OperationOutputRouter()
+    sink = make_sink(1)
+    token = router.register(sink)
+    assert router.get_sink() is sink
+
+    router.unregister(token)
+    assert router.get_sink() is None
+
+
+def test_get_sink_ignores_unrelated_threads():
+    router = OperationOutputRouter()
+    token = router.register(make_sink(1))
+    sinks = []
+    thread = threading.Thread(target=lambda: sinks.append(router.get_sink()))
+    thread.start()
+    thread.join()
+    router.unregister(token)
+
+    assert sinks == [None]
+
+
+def test_concurrent_operations_record_output_of_their_workers():
+    router = OperationOutputRouter()
+    sinks = {1: make_sink(1), 2: make_sink(2)}
+    both_registered = threading.Barrier(2, timeout=5)
+    worker_logger = logging.getLogger("test_operations_queue.worker")
+
+    def run_operation(operation_id: int):
+        token = router.register(sinks[operation_id])
+        try:
+            both_registered.wait()
+            with threading_utils.create_thread_executor(max_workers=2) as executor:
+                executor.submit(
+                    worker_logger.warning, f"worker log of {operation_id}"
+                ).result()
+                executor.submit(
+                    subprocess_utils.run,
+                    ["echo", f"subprocess output of {operation_id}"],
+                    stdout_level=logging.WARNING,
+                ).result()
+        finally:
+            router.unregister(token)
+
+    router.install()
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [
+                executor.submit(run_operation, 1),
+                executor.submit(run_operation, 2),
+            ]:
+                future.result()
+        # Subprocess output is logged by a pipe reader thread, so may lag behind
+        deadline = time.monotonic() + 5
+        while (
+            any(len(sink.put.call_args_list) < 2 for sink in sinks.values())
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+    finally:
+        router.uninstall()
+
+    for operation_id, sink in sinks.items():
+        assert sorted(get_logged_text(sink)) == [
+            f"subprocess output of {operation_id}",
+            f"worker log of {operation_id}",
+        ]
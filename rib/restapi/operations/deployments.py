@@ -43,6 +43,7 @@ def generate_configs(deployment_name: str, deployment_mode: str, data: Dict[str,
         max_iterations=params.max_iterations,
         force=params.force,
         skip_config_tar=params.skip_config_tar,
+        skip_config_cache=params.skip_config_cache,
         timeout=params.timeout,
     )
 
@@ -30,6 +30,7 @@ from rib.restapi.schemas.messaging import (
     MessageSendAutoParams,
     MessageSendManualParams,
     MessagesSubsetReport,
+    MessagesSummaryReport,
 )
 from rib.restapi.routers.local_deployment import _operation_name
 
@@ -95,6 +96,35 @@ def get_matching_messages(
         raise error_utils.RIB605(mode, name, "ui - get matching messages")
 
 
+@router.get("/summary", response_model=MessagesSummaryReport)
+def get_matching_messages_summary(
+    mode: str,
+    name: str,
+    request: Request,
+):
+    """Get counts and latency percentiles of matching messages from deployment"""
+    params = request.query_params
+
+    try:
+        summary = messaging_utils.ui_get_matching_messages_summary(
+            rib_mode=mode,
+            deployment_name=name,
+            recipient=params.get("recipient", None),
+            sender=params.get("sender", None),
+            test_id=params.get("test_id", None),
+            trace_id=params.get("trace_id", None),
+            date_from=params.get("date_from", None),
+            date_to=params.get("date_to", None),
+        )
+        return {
+            "rib_mode": mode,
+            "deployment_name": name,
+            **summary,
+        }
+    except:
+        raise error_utils.RIB605(mode, name, "ui - get matching messages summary")
+
+
 ###
 # Operation Routes
 ###
@@ -32,6 +32,7 @@ from rib.restapi.models.operations import DbOperation, OperationState
 from rib.restapi.schemas.operations import (
     OperationLogs,
     OperationQueuedResult,
+    OperationsQueueMetrics,
     OperationsQueuePage,
     QueuedOperation,
     StateChangeRequest,
@@ -71,6 +72,12 @@ def delete_operations(db_session: Session = Depends(get_db)):
     crud.delete_non_running_operations(db_session)
 
 
+@router.get("/metrics", response_model=OperationsQueueMetrics)
+def get_operations_queue_metrics():
+    """Get the current depth of the operations queue"""
+    return operations_queue.get_metrics()
+
+
 @router.websocket("/ws")
 async def get_operations_websocket(websocket: WebSocket):
     """Obtain a websocket for operations queue updates"""
@@ -209,5 +216,5 @@ def retry_operation(operation_id: int, db_session: Session = Depends(get_db)):
             state=OperationState.PENDING,
         ),
     )
-    operations_queue.add(new_operation.id)
+    operations_queue.add(new_operation.id, new_operation.target)
     return {"id": new_operation.id}
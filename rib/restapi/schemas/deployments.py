@@ -239,6 +239,7 @@ class GenerateConfigParams(BaseModel):
     max_iterations: int = 20
     force: bool = False
     skip_config_tar: bool = False
+    skip_config_cache: bool = False
     timeout: int = 300
 
 
@@ -17,11 +17,13 @@
 
 # Python Library Imports
 from pydantic import BaseModel
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from rib.utils.elasticsearch_utils import (
+    LatencyPercentiles,
     MessageTraceUi,
 )
+from rib.utils.messaging_utils import MessageCounts
 
 # Operation Payloads
 
@@ -44,6 +46,14 @@ class MessagesSubsetReport(MessagesReport):
     has_more_pages: bool
 
 
+class MessagesSummaryReport(BaseModel):
+    rib_mode: str
+    deployment_name: str
+    counts: MessageCounts
+    latency: LatencyPercentiles
+    pair_latency: Dict[str, LatencyPercentiles]
+
+
 class MessageSendAutoParams(BaseModel):
     message_period: int = 0
     message_quantity: int
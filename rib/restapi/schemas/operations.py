@@ -18,7 +18,7 @@
 # Python Library Imports
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # Local Python Library Imports
 from rib.restapi.models.operations import LogLineLevel, LogLineSource, OperationState
@@ -52,6 +52,16 @@ class OperationsQueuePage(BaseModel):
     total: int
 
 
+class OperationsQueueMetrics(BaseModel):
+    """Current depth of the operations queue"""
+
+    maxWorkers: int
+    activeTargets: int
+    runningOperations: int
+    pendingOperations: int
+    pendingByTarget: Dict[str, int]
+
+
 class OperationLogLine(BaseModel):
     """A single log line from an executed operation"""
 
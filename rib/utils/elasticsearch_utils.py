@@ -15,24 +15,72 @@
 
 import datetime
 import logging
+import queue
+import sys
+import threading
 from ast import Set
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from typing_extensions import TypedDict, NotRequired
 from enum import Enum, auto
 from opensearchpy import (
     OpenSearch as Elasticsearch,
     OpenSearchException as ElasticsearchException,
+    VERSION as SEARCH_CLIENT_VERSION,
 )
 from opensearchpy.client import logger as es_logger, logging as es_logging
-from rib.utils import general_utils
+from rib.utils import general_utils, threading_utils
 
 # Defaults
 DEFAULT_SCROLL_SIZE = "60s"
 DEFAULT_TIMEOUT = 60
+DEFAULT_AGGREGATION_PAGE_SIZE = 1000
+DEFAULT_STREAM_PAGE_SIZE = 5000
+DEFAULT_SPAN_INDEX = "jaeger-span-*"
+DEFAULT_CLIENT_TIMEOUT = 120
+DEFAULT_CLIENT_MAX_RETRIES = 5
+DEFAULT_CLIENT_POOL_SIZE = 10
+# First search client version with the point-in-time API (create_pit/delete_pit)
+POINT_IN_TIME_MIN_CLIENT_VERSION = (2, 2, 0)
+# Sort of spans paged with search_after, unique so that spans sharing a start time
+# are neither skipped nor repeated across pages
+POINT_IN_TIME_SORT = [
+    {"startTimeMillis": "asc"},
+    {"traceID": "asc"},
+    {"spanID": "asc"},
+]
+# Latency percentiles reported in message summaries
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+# Span fields used to parse message spans
+MESSAGE_SPAN_SOURCE_FIELDS = [
+    "traceID",
+    "spanID",
+    "startTime",
+    "startTimeMillis",
+    "process.serviceName",
+    "tags.key",
+    "tags.value",
+    "references.spanID",
+]
+
+# Span tags parsed into message spans and message path spans
+MESSAGE_SPAN_TAGS = frozenset(
+    [
+        "messageSize",  # will be a string
+        "messageHash",
+        "messageTestId",
+        "messageFrom",
+        "messageTo",
+    ]
+)
+MESSAGE_PATH_SPAN_TAGS = frozenset(["pluginId", "connectionIds"])
 
 es_logger.setLevel(es_logging.ERROR)
 logger = logging.getLogger(__name__)
 
+# Long-lived search clients (and their connection pools), by host
+_search_clients: Dict[str, Elasticsearch] = {}
+_search_clients_lock = threading.Lock()
+
 ###
 # Types
 ###
@@ -69,6 +117,199 @@ class MessagePathSpan(Span):
     parentSpanId: str
 
 
+class CompactMessageSpan:
+    """
+    Message span stored in slots rather than a dict, with dict-style read access so
+    that it can be used wherever a MessageSpan is expected
+    """
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "start_time",
+        "source_persona",
+        "messageSize",
+        "messageHash",
+        "messageTestId",
+        "messageFrom",
+        "messageTo",
+    )
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Purpose:
+            Get a span field
+        Args:
+            key: Field name
+        Return:
+            Field value
+        """
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Purpose:
+            Check if a span field is set
+        Args:
+            key: Field name
+        Return:
+            True if the field is set
+        """
+        return key in self.__slots__ and hasattr(self, key)
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Purpose:
+            Compare the span fields to another span or to a MessageSpan dict
+        Args:
+            other: Span to compare against
+        Return:
+            True if the spans have the same fields
+        """
+        if isinstance(other, (CompactMessageSpan, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Purpose:
+            Get a span field, if set
+        Args:
+            key: Field name
+            default: Value to return if the field is not set
+        Return:
+            Field value
+        """
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def keys(self) -> List[str]:
+        """
+        Purpose:
+            Get the names of the set span fields
+        Args:
+            N/A
+        Return:
+            Field names
+        """
+        return [key for key in self.__slots__ if hasattr(self, key)]
+
+    def to_dict(self) -> MessageSpan:
+        """
+        Purpose:
+            Convert the span to a MessageSpan dict
+        Args:
+            N/A
+        Return:
+            Message span
+        """
+        return MessageSpan(**{key: getattr(self, key) for key in self.keys()})
+
+    def __repr__(self) -> str:
+        return f"CompactMessageSpan({self.to_dict()})"
+
+
+class MessageSpanStore:
+    """
+    Compact store of message spans parsed from elasticsearch query results, indexed by
+    trace ID and by source persona. Persona, trace ID and test ID strings are interned
+    so that they are shared between spans.
+    """
+
+    def __init__(self) -> None:
+        """
+        Purpose:
+            Initialize an empty store
+        Args:
+            N/A
+        Return:
+            N/A
+        """
+        self.by_trace: Dict[str, List[CompactMessageSpan]] = {}
+        self.by_persona: Dict[str, List[CompactMessageSpan]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, raw_span: Dict) -> CompactMessageSpan:
+        """
+        Purpose:
+            Parse a span from an elasticsearch query result and add it to the store
+        Args:
+            raw_span: record to parse
+        Return:
+            Parsed span
+        """
+        source = raw_span["_source"]
+        span = CompactMessageSpan()
+        span.trace_id = _intern(source["traceID"])
+        span.span_id = source["spanID"]
+        span.start_time = source["startTime"]
+        span.source_persona = _intern(source["process"]["serviceName"])
+        for tag in source["tags"]:
+            key = tag["key"]
+            if key in MESSAGE_SPAN_TAGS:
+                value = tag["value"]
+                if key != "messageHash" and key != "messageSize":
+                    value = _intern(value)
+                setattr(span, key, value)
+
+        self.by_trace.setdefault(span.trace_id, []).append(span)
+        self.by_persona.setdefault(span.source_persona, []).append(span)
+        self._count += 1
+        return span
+
+    def extend(self, raw_spans: Iterable[Dict]) -> None:
+        """
+        Purpose:
+            Parse spans from elasticsearch query results and add them to the store
+        Args:
+            raw_spans: records to parse
+        Return:
+            N/A
+        """
+        for raw_span in raw_spans:
+            self.add(raw_span)
+
+    def items(self) -> Iterable[Tuple[str, List[CompactMessageSpan]]]:
+        """
+        Purpose:
+            Get the spans of each trace, so that the store can be used in place of a
+            trace ID to spans mapping
+        Args:
+            N/A
+        Return:
+            (trace ID, spans) pairs
+        """
+        return self.by_trace.items()
+
+    def values(self) -> Iterable[List[CompactMessageSpan]]:
+        """
+        Purpose:
+            Get the spans of each trace
+        Args:
+            N/A
+        Return:
+            Spans of each trace
+        """
+        return self.by_trace.values()
+
+
+def _intern(value: Any) -> Any:
+    """
+    Purpose:
+        Intern a string value so that equal values share the same object
+    Args:
+        value: Value to intern
+    Return:
+        Interned value (or the value itself, if not a string)
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class MessageStatus(general_utils.PrettyEnum):
     """Status of Message Trace on the network"""
 
@@ -95,6 +336,26 @@ class MessageTrace(TypedDict):
     receive_span: MessageSpan
 
 
+class MessageTraceSummary(TypedDict):
+    """Role up of Messages computed by Elasticsearch aggregations (no spans)"""
+
+    trace_id: str
+    status: MessageStatus
+    sender: str
+    recipient: str
+    test_id: str
+    total_time: Optional[float]
+
+
+class LatencyPercentiles(TypedDict):
+    """Distribution of message latencies, in seconds"""
+
+    count: int
+    min: Optional[float]
+    max: Optional[float]
+    percentiles: Dict[str, Optional[float]]
+
+
 class LinkSpanAction(general_utils.PrettyEnum):
     """Actions of a Link Span"""
 
@@ -159,44 +420,19 @@ def parse_span_base_info_ui(span: Span, raw_span_info: Dict):
     span["source_persona"] = raw_span_info["_source"]["process"]["serviceName"]
 
 
-def get_message_spans(spans: List[Dict]):
+def get_message_spans(spans: Iterable[Dict]):
     """
     Purpose:
         Get message spans from elasticsearch query result
     Args:
         spans: records to parse
     Return:
-        source_persona_to_span: {source_persona: List[MessageSpans]}
-        trace_id_to_span: {TraceId: List[MessageSpans]}
+        source_persona_to_span: {source_persona: List[CompactMessageSpan]}
+        trace_id_to_span: {TraceId: List[CompactMessageSpan]}
     """
-    source_persona_to_span = {}
-    trace_id_to_span = {}
-    for span in spans:
-        message = MessageSpan()
-
-        # Get base span info
-        parse_span_base_info(message, span)
-
-        message_tags = [
-            "messageSize",  # will be a string
-            "messageHash",
-            "messageTestId",
-            "messageFrom",
-            "messageTo",
-        ]
-        # Get Message specific info
-        for tag in span["_source"]["tags"]:
-            if tag["key"] in message_tags:
-                message[tag["key"]] = tag["value"]
-
-        # Add to return value
-        trace_id_to_span.setdefault(message["trace_id"], [])
-        source_persona_to_span.setdefault(message["source_persona"], [])
-
-        trace_id_to_span[message["trace_id"]].append(message)
-        source_persona_to_span[message["source_persona"]].append(message)
-
-    return (source_persona_to_span, trace_id_to_span)
+    store = MessageSpanStore()
+    store.extend(spans)
+    return (store.by_persona, store.by_trace)
 
 
 def get_message_spans_ui(spans: List[Dict]):
@@ -217,16 +453,9 @@ def get_message_spans_ui(spans: List[Dict]):
         # Get base span info for ui
         parse_span_base_info_ui(message, span)
 
-        message_tags = [
-            "messageSize",  # will be a string
-            "messageHash",
-            "messageTestId",
-            "messageFrom",
-            "messageTo",
-        ]
         # Get Message specific info
         for tag in span["_source"]["tags"]:
-            if tag["key"] in message_tags:
+            if tag["key"] in MESSAGE_SPAN_TAGS:
                 message[tag["key"]] = tag["value"]
 
         # Add to return value
@@ -251,13 +480,9 @@ def get_message_span_tree(spans: List[Dict]):
     for span in spans:
         message = MessagePathSpan()
         parse_span_base_info(message, span)
-        message_path_tags = [
-            "pluginId",
-            "connectionIds",
-        ]
         # Get Message specific info
         for tag in span["_source"]["tags"]:
-            if tag["key"] in message_path_tags:
+            if tag["key"] in MESSAGE_PATH_SPAN_TAGS:
                 message[tag["key"]] = tag["value"]
 
         if len(span["_source"]["references"]) > 0:
@@ -274,7 +499,7 @@ def getMessageTraces(trace_id_to_span) -> List[MessageTrace]:
     Purpose:
         Get Message Traces from spans. Each Trace ID should have 2 spans.
     Args:
-        trace_id_to_span: Map of Trace IDs to 1-2 spans
+        trace_id_to_span: Map of Trace IDs to 1-2 spans (or a MessageSpanStore)
     Return:
         messages: List of Messsage Traces
     """
@@ -365,6 +590,70 @@ def get_link_spans():
     pass
 
 
+def get_search_client(
+    hostname: str,
+    timeout: int = DEFAULT_CLIENT_TIMEOUT,
+    max_retries: int = DEFAULT_CLIENT_MAX_RETRIES,
+) -> Elasticsearch:
+    """
+    Purpose:
+        Get the shared search client for the given host, creating it on first use.
+        Reusing the client keeps its pooled HTTP connections open between requests.
+    Args:
+        hostname: Elasticsearch host
+        timeout: request timeout, in seconds
+        max_retries: number of times a timed out request is retried
+    Return:
+        search client
+    """
+    with _search_clients_lock:
+        es = _search_clients.get(hostname)
+        if es is None:
+            es = Elasticsearch(
+                hostname,
+                timeout=timeout,
+                max_retries=max_retries,
+                retry_on_timeout=True,
+                maxsize=DEFAULT_CLIENT_POOL_SIZE,
+            )
+            _search_clients[hostname] = es
+        return es
+
+
+def compute_latency_percentiles(
+    latencies: Iterable[float],
+    percentiles: Iterable[int] = LATENCY_PERCENTILES,
+) -> LatencyPercentiles:
+    """
+    Purpose:
+        Compute the distribution of the given message latencies, using linear
+        interpolation between the closest ranks
+    Args:
+        latencies: message latencies, in seconds
+        percentiles: percentiles to compute
+    Return:
+        latency distribution
+    """
+    values = sorted(latencies)
+    result = LatencyPercentiles(
+        count=len(values),
+        min=values[0] if values else None,
+        max=values[-1] if values else None,
+        percentiles={},
+    )
+    for percentile in percentiles:
+        if not values:
+            result["percentiles"][f"p{percentile}"] = None
+            continue
+        rank = (len(values) - 1) * percentile / 100.0
+        lower = int(rank)
+        upper = min(lower + 1, len(values) - 1)
+        result["percentiles"][f"p{percentile}"] = values[lower] + (
+            values[upper] - values[lower]
+        ) * (rank - lower)
+    return result
+
+
 # ui users should use the get_message_list_spans() alternative version for handling pagination
 def get_spans(es, results: list, scroll_size: str = DEFAULT_SCROLL_SIZE) -> list:
     """
@@ -383,15 +672,195 @@ def get_spans(es, results: list, scroll_size: str = DEFAULT_SCROLL_SIZE) -> list
     sid = results["_scroll_id"]
     hits = results["hits"]["hits"]
     records = []
-    while len(hits) > 0:
-        records.extend(hits)
-        page = es.scroll(scroll_id=sid, scroll=scroll_size)
-        sid = page["_scroll_id"]
-        hits = page["hits"]["hits"]
+    try:
+        while len(hits) > 0:
+            records.extend(hits)
+            page = es.scroll(scroll_id=sid, scroll=scroll_size)
+            sid = page["_scroll_id"]
+            hits = page["hits"]["hits"]
+    finally:
+        clear_scroll(es, sid)
 
     return records
 
 
+def clear_scroll(es: Elasticsearch, scroll_id: Optional[str]) -> None:
+    """
+    Purpose:
+        Release a server-side scroll context, ignoring any errors (the context will
+        expire on its own)
+    Args:
+        es: the elasticsearch instance
+        scroll_id: scroll ID of the context to be released
+    Return:
+        N/A
+    """
+    if not scroll_id:
+        return
+    try:
+        es.clear_scroll(scroll_id=scroll_id)
+    except Exception as err:
+        logger.debug(f"Unable to clear scroll context: {err}")
+
+
+def stream_spans(
+    es: Elasticsearch,
+    query: Dict,
+    source_fields: Optional[List[str]] = None,
+    page_size: int = DEFAULT_STREAM_PAGE_SIZE,
+    slices: int = 1,
+    keep_alive: str = DEFAULT_SCROLL_SIZE,
+    index: str = DEFAULT_SPAN_INDEX,
+) -> Iterator[Dict]:
+    """
+    Purpose:
+        Stream the spans matching the query, one page at a time, so that any number of
+        spans can be processed in bounded memory.
+
+        Pages are retrieved with a point-in-time and search_after when both the search
+        client and server support it, otherwise with a scroll. When slicing, each slice is retrieved by
+        its own thread and spans are yielded in the order in which the pages arrive;
+        otherwise spans are yielded in start time order. Server-side contexts are
+        released once the stream is exhausted or closed.
+    Args:
+        es: the elasticsearch instance
+        query: the query to be run
+        source_fields: span fields to retrieve (all fields if not given)
+        page_size: number of spans to retrieve per page
+        slices: number of slices to retrieve in parallel
+        keep_alive: how long to keep server-side contexts alive between pages
+        index: index pattern of the spans (for the point-in-time)
+    Return:
+        Iterator of raw spans
+    """
+    pit_id = None
+    if SEARCH_CLIENT_VERSION >= POINT_IN_TIME_MIN_CLIENT_VERSION:
+        try:
+            pit_id = es.create_pit(index=index, keep_alive=keep_alive)["pit_id"]
+        except Exception as err:
+            logger.debug(f"Point-in-time unavailable, falling back to scroll: {err}")
+
+    try:
+        if slices <= 1:
+            yield from _stream_span_slice(
+                es, query, source_fields, page_size, None, keep_alive, pit_id
+            )
+            return
+
+        # Bound the number of pages held in memory while the consumer catches up
+        pages = queue.Queue(maxsize=slices * 2)
+        stop = object()
+        cancelled = []
+
+        def _produce(slice_id: int) -> None:
+            try:
+                page = []
+                for span in _stream_span_slice(
+                    es,
+                    query,
+                    source_fields,
+                    page_size,
+                    {"id": slice_id, "max": slices},
+                    keep_alive,
+                    pit_id,
+                ):
+                    if cancelled:
+                        return
+                    page.append(span)
+                    if len(page) >= page_size:
+                        pages.put(page)
+                        page = []
+                if page:
+                    pages.put(page)
+            finally:
+                pages.put(stop)
+
+        with threading_utils.ContextThreadPoolExecutor(max_workers=slices) as executor:
+            futures = [executor.submit(_produce, i) for i in range(slices)]
+            try:
+                remaining = slices
+                while remaining:
+                    page = pages.get()
+                    if page is stop:
+                        remaining -= 1
+                        continue
+                    yield from page
+            finally:
+                # Unblock any producers if the consumer stopped early
+                cancelled.append(True)
+                while any(not future.done() for future in futures):
+                    try:
+                        pages.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+            for future in futures:
+                future.result()
+    finally:
+        if pit_id:
+            try:
+                es.delete_pit(body={"pit_id": [pit_id]})
+            except Exception as err:
+                logger.debug(f"Unable to close point-in-time: {err}")
+
+
+def _stream_span_slice(
+    es: Elasticsearch,
+    query: Dict,
+    source_fields: Optional[List[str]],
+    page_size: int,
+    slice_spec: Optional[Dict],
+    keep_alive: str,
+    pit_id: Optional[str],
+) -> Iterator[Dict]:
+    """
+    Purpose:
+        Stream the spans of one slice of the query (see stream_spans)
+    Args:
+        es: the elasticsearch instance
+        query: the query to be run
+        source_fields: span fields to retrieve (all fields if not given)
+        page_size: number of spans to retrieve per page
+        slice_spec: slice of the query to retrieve, if any
+        keep_alive: how long to keep server-side contexts alive between pages
+        pit_id: point-in-time to search, if any (otherwise a scroll is used)
+    Return:
+        Iterator of raw spans
+    """
+    body = dict(query)
+    if slice_spec:
+        body["slice"] = slice_spec
+    kwargs = {"size": page_size, "request_timeout": DEFAULT_TIMEOUT}
+    if source_fields:
+        kwargs["_source_includes"] = source_fields
+
+    if pit_id:
+        body["sort"] = POINT_IN_TIME_SORT
+        search_after = None
+        while True:
+            request = dict(body, pit={"id": pit_id, "keep_alive": keep_alive})
+            if search_after:
+                request["search_after"] = search_after
+            page = es.search(body=request, **kwargs)
+            hits = page["hits"]["hits"]
+            yield from hits
+            if len(hits) < page_size:
+                return
+            search_after = hits[-1]["sort"]
+            pit_id = page.get("pit_id", pit_id)
+
+    page = es.search(body=body, sort="startTimeMillis:asc", scroll=keep_alive, **kwargs)
+    sid = page.get("_scroll_id")
+    try:
+        hits = page["hits"]["hits"]
+        while hits:
+            yield from hits
+            page = es.scroll(scroll_id=sid, scroll=keep_alive)
+            sid = page.get("_scroll_id", sid)
+            hits = page["hits"]["hits"]
+    finally:
+        clear_scroll(es, sid)
+
+
 def get_message_list_spans(results: Dict, page_size: int) -> Tuple[list, list, bool]:
     """
     Purpose:
@@ -421,12 +890,42 @@ def get_message_list_spans(results: Dict, page_size: int) -> Tuple[list, list, b
     return records, search_after, has_more_pages
 
 
+def create_tag_query(key: str, value: str) -> Dict:
+    """
+    Purpose:
+        Create a query clause matching spans that have a tag with the given value
+    Args:
+        key: tag key
+        value: tag value to match
+    Return:
+        query clause
+    """
+    return {
+        "nested": {
+            "path": "tags",
+            "query": {
+                "bool": {
+                    "must": [
+                        {
+                            "term": {"tags.key": key},
+                        },
+                        {"term": {"tags.value": value}},
+                    ]
+                }
+            },
+        }
+    }
+
+
 def create_query(
     persona: str = None,
     actions: List = None,
     trace_id: str = None,
     time_range: list = None,
     range_name: Optional[str] = None,
+    sender: Optional[str] = None,
+    recipient: Optional[str] = None,
+    test_id: Optional[str] = None,
 ) -> Dict:
     """
     Purpose:
@@ -439,6 +938,9 @@ def create_query(
         trace_id: trace id to filter on
         time_range: time range to filter to
         range_name: Name of test range on which to filter
+        sender: sender node to filter on
+        recipient: reciever node to filter on
+        test_id: test ID on which to filter
     Return:
         query
     """
@@ -467,6 +969,12 @@ def create_query(
                 }
             }
         )
+    if sender:
+        mustmatch.append(create_tag_query("messageFrom", sender))
+    if recipient:
+        mustmatch.append(create_tag_query("messageTo", recipient))
+    if test_id:
+        mustmatch.append(create_tag_query("messageTestId", test_id))
 
     filters = [{"match_all": {}}]
     if time_range and len(time_range) > 0:
@@ -543,59 +1051,11 @@ def create_message_list_query(
             }
         )
     if sender:
-        mustmatch.append(
-            {
-                "nested": {
-                    "path": "tags",
-                    "query": {
-                        "bool": {
-                            "must": [
-                                {
-                                    "term": {"tags.key": "messageFrom"},
-                                },
-                                {"term": {"tags.value": sender}},
-                            ]
-                        }
-                    },
-                }
-            }
-        )
+        mustmatch.append(create_tag_query("messageFrom", sender))
     if recipient:
-        mustmatch.append(
-            {
-                "nested": {
-                    "path": "tags",
-                    "query": {
-                        "bool": {
-                            "must": [
-                                {
-                                    "term": {"tags.key": "messageTo"},
-                                },
-                                {"term": {"tags.value": recipient}},
-                            ]
-                        }
-                    },
-                }
-            }
-        )
+        mustmatch.append(create_tag_query("messageTo", recipient))
     if test_id:
-        mustmatch.append(
-            {
-                "nested": {
-                    "path": "tags",
-                    "query": {
-                        "bool": {
-                            "must": [
-                                {
-                                    "term": {"tags.key": "messageTestId"},
-                                },
-                                {"term": {"tags.value": test_id}},
-                            ]
-                        }
-                    },
-                }
-            }
-        )
+        mustmatch.append(create_tag_query("messageTestId", test_id))
 
     filters = [{"match_all": {}}]
     if time_range and len(time_range) > 0:
@@ -678,6 +1138,146 @@ def do_query(es: Elasticsearch, query: Dict) -> Dict:
     return results
 
 
+def create_message_summary_aggregation(
+    page_size: int = DEFAULT_AGGREGATION_PAGE_SIZE,
+    after_key: Optional[Dict] = None,
+) -> Dict:
+    """
+    Purpose:
+        Create an aggregation that summarizes each message trace (sender, recipient,
+        test ID, whether the message hash/size match and the send/receive times)
+        without returning any of the spans themselves
+    Args:
+        page_size: number of traces to summarize per page
+        after_key: composite aggregation key from the previous page, if any
+    Return:
+        aggregation
+    """
+    composite = {
+        "size": page_size,
+        "sources": [{"trace_id": {"terms": {"field": "traceID"}}}],
+    }
+    if after_key:
+        composite["after"] = after_key
+
+    return {
+        "traces": {
+            "composite": composite,
+            "aggs": {
+                "operations": {
+                    "terms": {"field": "operationName", "size": 2},
+                    "aggs": {"start_time": {"min": {"field": "startTime"}}},
+                },
+                "tags": {
+                    "nested": {"path": "tags"},
+                    "aggs": {
+                        "keys": {
+                            "terms": {
+                                "field": "tags.key",
+                                "include": [
+                                    "messageFrom",
+                                    "messageTo",
+                                    "messageTestId",
+                                    "messageHash",
+                                    "messageSize",
+                                ],
+                                "size": 5,
+                            },
+                            "aggs": {
+                                "values": {"terms": {"field": "tags.value", "size": 2}}
+                            },
+                        }
+                    },
+                },
+            },
+        }
+    }
+
+
+def parse_message_trace_summary(bucket: Dict) -> MessageTraceSummary:
+    """
+    Purpose:
+        Get a message trace summary from a message summary aggregation bucket
+    Args:
+        bucket: composite aggregation bucket for a single trace
+    Return:
+        message trace summary
+    """
+    start_times = {
+        operation["key"]: operation["start_time"]["value"]
+        for operation in bucket["operations"]["buckets"]
+    }
+    tag_values = {
+        tag["key"]: [value["key"] for value in tag["values"]["buckets"]]
+        for tag in bucket["tags"]["keys"]["buckets"]
+    }
+
+    summary = MessageTraceSummary(
+        trace_id=bucket["key"]["trace_id"],
+        sender=next(iter(tag_values.get("messageFrom", [])), ""),
+        recipient=next(iter(tag_values.get("messageTo", [])), ""),
+        test_id=next(iter(tag_values.get("messageTestId", [])), ""),
+        total_time=None,
+    )
+
+    if "sendMessage" in start_times and "receiveMessage" in start_times:
+        # Both send and receive spans were found, message was received. Both spans
+        # must report the same hash and size for the message to be intact
+        if (
+            len(tag_values.get("messageHash", [])) <= 1
+            and len(tag_values.get("messageSize", [])) <= 1
+        ):
+            summary["status"] = MessageStatus.RECEIVED
+        else:
+            summary["status"] = MessageStatus.CORRUPTED
+        summary["total_time"] = (
+            start_times["receiveMessage"] - start_times["sendMessage"]
+        ) / 1_000_000.0
+    elif "sendMessage" in start_times:
+        # Send span found, receive is still missing
+        summary["status"] = MessageStatus.SENT
+    else:
+        # This case only happens if the send node fails to post to elasticsearch
+        summary["status"] = MessageStatus.ERROR
+
+    return summary
+
+
+def get_message_trace_summaries(
+    es: Elasticsearch,
+    query: Dict,
+    page_size: int = DEFAULT_AGGREGATION_PAGE_SIZE,
+) -> Iterator[MessageTraceSummary]:
+    """
+    Purpose:
+        Get summaries of all message traces matching the query using composite
+        aggregations, paging through the traces without downloading any spans
+    Args:
+        es: the elasticsearch instance
+        query: the query to be run (as created by create_query)
+        page_size: number of traces to summarize per request
+    Return:
+        message trace summaries
+    """
+    after_key = None
+    while True:
+        body = {
+            "size": 0,
+            "query": query["query"],
+            "aggs": create_message_summary_aggregation(
+                page_size=page_size, after_key=after_key
+            ),
+        }
+        results = es.search(body=body, request_timeout=DEFAULT_TIMEOUT)
+        traces = results.get("aggregations", {}).get("traces", {})
+        for bucket in traces.get("buckets", []):
+            yield parse_message_trace_summary(bucket)
+
+        after_key = traces.get("after_key")
+        if not after_key or len(traces.get("buckets", [])) < page_size:
+            break
+
+
 def log_deployment_metadata(
     es: Elasticsearch, name: str, metadata: Dict[str, Any], indexName: str
 ) -> bool:
@@ -770,6 +1370,8 @@ class ESLinkExtractor:
     ]
     _search_fields = list(_source_fields)
     _search_fields.extend("tags.*")
+    # Span fields used to extract link records
+    _stream_fields = _source_fields + ["process.serviceName", "tags.key", "tags.value"]
 
     def __init__(
         self,
@@ -892,41 +1494,201 @@ class ESLinkExtractor:
         sid = results["_scroll_id"]
         hits = results["hits"]["hits"]
         records = []
-        while len(hits) > 0:
-            for res in hits:
-                # Get the basic set of fields
-                rec = {
-                    k: res["_source"][k]
-                    for k in ESLinkExtractor._source_fields
-                    if k in res["_source"]
-                }
+        try:
+            while len(hits) > 0:
+                for res in hits:
+                    records.append(ESLinkExtractor._parse_link_record(res))
 
-                # Get the required tags
-                for d in res["_source"]["tags"]:
-                    if d["key"] in ESLinkExtractor._wanted_tags:
-                        rec[d["key"]] = d["value"]
+                    # Return if we've gathered required number of records
+                    if self.res_size > 0 and len(records) >= self.res_size:
+                        return records
 
-                # Add the service (node) name
-                if (
-                    "process" in res["_source"]
-                    and "serviceName" in res["_source"]["process"]
-                ):
-                    rec["serviceName"] = res["_source"]["process"]["serviceName"]
-                else:
-                    rec["serviceName"] = ""
+                # pylint: disable-next=unexpected-keyword-arg
+                page = self.es.scroll(scroll_id=sid, scroll=self.scroll_size)
+                sid = page["_scroll_id"]
+                hits = page["hits"]["hits"]
+        finally:
+            clear_scroll(self.es, sid)
 
-                records.append(rec)
+        return records
 
-                # Return if we've gathered required number of records
-                if self.res_size > 0 and len(records) >= self.res_size:
-                    return records
+    def stream_link_records(
+        self,
+        date_range: list = None,
+        services: list = None,
+        method: LinkQueryMethod = LinkQueryMethod.LINK_CURRENT,
+        range_name: Optional[str] = None,
+        slices: int = 1,
+    ) -> Iterator[Dict]:
+        """Stream link records matching the given criteria in bounded memory
 
-            # pylint: disable-next=unexpected-keyword-arg
-            page = self.es.scroll(scroll_id=sid, scroll=self.scroll_size)
-            sid = page["_scroll_id"]
-            hits = page["hits"]["hits"]
+        Only the span fields needed for the link records are retrieved, see
+        stream_spans.
 
-        return records
+        Parameters
+        ----------
+
+        date_range: list
+            A list of [name,value] pairs that specify the date interval for the search
+
+        services: List
+            The service (node) names to match in the search
+
+        method: LinkQueryMethod
+            Type of edges to process
+
+        range_name: str
+            Name of test range on which to filter
+
+        slices: int
+            Number of slices to retrieve in parallel (records are then not in
+            start time order)
+
+        Returns
+        -------
+        Iterator
+            An iterator of dicts
+        """
+
+        query = self.create_link_query(
+            date_range=date_range,
+            services=services,
+            method=method,
+            range_name=range_name,
+        )
+        spans = stream_spans(
+            self.es,
+            query,
+            source_fields=ESLinkExtractor._stream_fields,
+            slices=slices,
+            keep_alive=self.scroll_size,
+        )
+        try:
+            for count, res in enumerate(spans, start=1):
+                yield ESLinkExtractor._parse_link_record(res)
+
+                # Stop if we've gathered required number of records
+                if self.res_size > 0 and count >= self.res_size:
+                    return
+        finally:
+            spans.close()
+
+    @staticmethod
+    def _parse_link_record(res: Dict) -> Dict:
+        """Extract the required fields of a link record from a span
+
+        Parameters
+        ----------
+
+        res: Dict
+            A span returned from a query
+
+        Returns
+        -------
+        Dict
+            The link record
+        """
+
+        # Get the basic set of fields
+        rec = {
+            k: res["_source"][k]
+            for k in ESLinkExtractor._source_fields
+            if k in res["_source"]
+        }
+
+        # Get the required tags
+        for d in res["_source"]["tags"]:
+            if d["key"] in ESLinkExtractor._wanted_tags:
+                rec[d["key"]] = d["value"]
+
+        # Add the service (node) name
+        if "process" in res["_source"] and "serviceName" in res["_source"]["process"]:
+            rec["serviceName"] = res["_source"]["process"]["serviceName"]
+        else:
+            rec["serviceName"] = ""
+
+        return rec
+
+    def create_link_query(
+        self,
+        date_range: list = None,
+        services: list = None,
+        method: LinkQueryMethod = LinkQueryMethod.LINK_CURRENT,
+        range_name: Optional[str] = None,
+    ) -> Dict:
+        """Construct a query to retrieve link artifacts
+
+        Parameters
+        ----------
+
+        date_range: list
+            A list of [name,value] pairs that specify the date interval for the search
+
+        services: List
+            The service (node) names to match in the search
+
+        method: LinkQueryMethod
+            Type of edges to process
+
+        range_name: str
+            Name of test range on which to filter
+
+        Returns
+        -------
+        Dict
+            the query
+        """
+
+        mustmatch = []
+        if services:
+            mustmatch.extend([{"terms": {"process.serviceName": services}}])
+
+        if range_name:
+            mustmatch.extend(
+                [
+                    {
+                        "nested": {
+                            "path": "process.tags",
+                            "query": {
+                                "bool": {
+                                    "must": [
+                                        {
+                                            "term": {"process.tags.key": "range-name"},
+                                        },
+                                        {"term": {"process.tags.value": range_name}},
+                                    ]
+                                }
+                            },
+                        }
+                    }
+                ]
+            )
+
+        if method in [LinkQueryMethod.LINK_EVER, LinkQueryMethod.LINK_CURRENT]:
+            action_terms = ESLinkExtractor._action_terms_link
+        else:
+            # For connections, we need to take both links and connections
+            # into account
+            action_terms = (
+                ESLinkExtractor._action_terms_connection
+                + ESLinkExtractor._action_terms_link
+            )
+        mustmatch.extend([{"terms": {"operationName": action_terms}}])
+
+        filters = [{"match_all": {}}]
+        if date_range and len(date_range) > 0:
+            filters.append({"range": {"startTimeMillis": dict(date_range)}})
+
+        return {
+            "query": {
+                "bool": {
+                    "must": mustmatch,
+                    "should": [],
+                    "filter": filters,
+                    "must_not": [],
+                }
+            }
+        }
 
     def do_query(
         self,
@@ -969,62 +1731,12 @@ class ESLinkExtractor:
 
         if not query:
             # Construct the query if it is not given directly
-            mustmatch = []
-            if services:
-                mustmatch.extend([{"terms": {"process.serviceName": services}}])
-
-            if range_name:
-                mustmatch.extend(
-                    [
-                        {
-                            "nested": {
-                                "path": "process.tags",
-                                "query": {
-                                    "bool": {
-                                        "must": [
-                                            {
-                                                "term": {
-                                                    "process.tags.key": "range-name"
-                                                },
-                                            },
-                                            {
-                                                "term": {
-                                                    "process.tags.value": range_name
-                                                }
-                                            },
-                                        ]
-                                    }
-                                },
-                            }
-                        }
-                    ]
-                )
-
-            if method in [LinkQueryMethod.LINK_EVER, LinkQueryMethod.LINK_CURRENT]:
-                action_terms = ESLinkExtractor._action_terms_link
-            else:
-                # For connections, we need to take both links and connections
-                # into account
-                action_terms = (
-                    ESLinkExtractor._action_terms_connection
-                    + ESLinkExtractor._action_terms_link
-                )
-            mustmatch.extend([{"terms": {"operationName": action_terms}}])
-
-            filters = [{"match_all": {}}]
-            if date_range and len(date_range) > 0:
-                filters.append({"range": {"startTimeMillis": dict(date_range)}})
-
-            query = {
-                "query": {
-                    "bool": {
-                        "must": mustmatch,
-                        "should": [],
-                        "filter": filters,
-                        "must_not": [],
-                    }
-                }
-            }
+            query = self.create_link_query(
+                date_range=date_range,
+                services=services,
+                method=method,
+                range_name=range_name,
+            )
 
         try:
             # pylint: disable=unexpected-keyword-arg
@@ -1061,12 +1773,15 @@ class ESLinkExtractor:
         sid = results["_scroll_id"]
         hits = results["hits"]["hits"]
         records = []
-        while len(hits) > 0:
-            records.extend(hits)
-            # pylint: disable-next=unexpected-keyword-arg
-            page = self.es.scroll(scroll_id=sid, scroll=self.scroll_size)
-            sid = page["_scroll_id"]
-            hits = page["hits"]["hits"]
+        try:
+            while len(hits) > 0:
+                records.extend(hits)
+                # pylint: disable-next=unexpected-keyword-arg
+                page = self.es.scroll(scroll_id=sid, scroll=self.scroll_size)
+                sid = page["_scroll_id"]
+                hits = page["hits"]["hits"]
+        finally:
+            clear_scroll(self.es, sid)
 
         return records
 
@@ -768,7 +768,7 @@ class RIB302(RIB000):
         are alternative options for the user to select from
     """
 
-    def __init__(self, deployment_name, deployments):
+    def __init__(self, deployment_name, deployment_names):
         """
         Purpose:
             Initialization of the exception.
@@ -776,9 +776,7 @@ class RIB302(RIB000):
 
         super().__init__()
 
-        sorted_deployments = sorted(
-            [deployment.config["name"] for deployment in deployments]
-        )
+        sorted_deployments = sorted(deployment_names)
 
         self.msg = f"Deployment '{deployment_name}' Not Found"
         self.suggestion = "Available Deployments:\n\t\t" + "\n\t\t".join(
@@ -1916,6 +1914,53 @@ class RIB353(RIB000):
         self.suggestion = "\tIf you need support for this command/configuration please contact Two Six"
 
 
+class RIB354(RIB000):
+    """
+    Purpose:
+        RIB354 is for files that failed to upload to the file server
+    """
+
+    def __init__(self, errors: Dict[str, str]):
+        """
+        Purpose:
+            Initialization of the exception.
+        """
+
+        super().__init__()
+
+        self.msg = "Failed to upload the following files to the file server:"
+        for file_path, error in errors.items():
+            self.msg += f"\n\t{file_path}: {error}"
+        self.suggestion = (
+            "Verify that the files exist and that the file server is running, "
+            "then retry the command"
+        )
+
+
+class RIB355(RIB000):
+    """
+    Purpose:
+        RIB355 is for multiple plugin config generators that failed concurrently
+    """
+
+    def __init__(self, errors: Dict[str, Exception]):
+        """
+        Purpose:
+            Initialization of the exception.
+        """
+
+        super().__init__()
+
+        self.errors = errors
+        self.msg = "Multiple config generators failed:"
+        for name, error in sorted(errors.items()):
+            self.msg += f"\n\t{name} config generation failed: {error}"
+        self.suggestion = (
+            "Fix the errors of each failed config generator, then retry config "
+            "generation"
+        )
+
+
 ###
 # Race Test App Exceptions
 ###
@@ -20,12 +20,15 @@ Purpose:
 """
 
 # Python Library Imports
+import concurrent.futures
 import logging
 import requests
-from typing import List
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
 
 # Local Python Library Imports
-from rib.utils import ssh_utils
+from rib.utils import ssh_utils, threading_utils
 
 
 ###
@@ -35,6 +38,23 @@ from rib.utils import ssh_utils
 logger = logging.getLogger(__name__)
 
 
+###
+# Constants
+###
+
+# Time in seconds a file listing snapshot is reused before being re-fetched
+FILE_LISTING_TTL = 1.0
+
+# Max number of concurrent uploads to the file server
+UPLOAD_MAX_WORKERS = 16
+
+# Max number of concurrent downloads from the file server
+DOWNLOAD_MAX_WORKERS = 16
+
+# Size in bytes of the chunks in which downloaded files are written
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
 ###
 # Types
 ###
@@ -44,17 +64,38 @@ class FileServerClient:
     """Client for interacting with the orchestration file server"""
 
     remote_url: str
+    listing_ttl: float
 
-    def __init__(self, remote_url: str = "http://rib-file-server:8080") -> None:
+    def __init__(
+        self,
+        remote_url: str = "http://rib-file-server:8080",
+        listing_ttl: float = FILE_LISTING_TTL,
+    ) -> None:
         """
         Purpose:
             Initializes the file server client
         Args:
             remote_url: URL (hostname and port) of the file server
+            listing_ttl: Time in seconds a file listing snapshot remains valid
         Returns:
             N/A
         """
         self.remote_url = remote_url
+        self.listing_ttl = listing_ttl
+        self._listing: Optional[Set[str]] = None
+        self._listing_time = 0.0
+        # Incremented on every invalidation so that a listing fetched while the
+        # file server was being modified is never stored
+        self._listing_generation = 0
+        self._listing_lock = threading.Lock()
+
+        # Reuse connections to the file server across requests
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=max(UPLOAD_MAX_WORKERS, DOWNLOAD_MAX_WORKERS)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def delete_all(self) -> bool:
         """
@@ -67,7 +108,7 @@ class FileServerClient:
         """
         try:
             url = f"{self.remote_url}/clear"
-            resp = requests.post(url)
+            resp = self._session.post(url)
             if resp.status_code != 200:
                 logger.warning(f"Clear returned status code: {resp.status_code}")
                 return False
@@ -75,6 +116,8 @@ class FileServerClient:
         except Exception as err:
             logger.warning(f"Error executing clear: {err}")
             return False
+        finally:
+            self.invalidate_file_listing()
 
     def delete_file(self, remote_file_name: str) -> bool:
         """
@@ -87,7 +130,7 @@ class FileServerClient:
         """
         try:
             url = f"{self.remote_url}/{remote_file_name}"
-            with requests.delete(url) as resp:
+            with self._session.delete(url) as resp:
                 if resp.status_code != 200:
                     logger.warning(
                         f"Delete for {remote_file_name} returned status code: {resp.status_code}"
@@ -97,26 +140,35 @@ class FileServerClient:
         except Exception as err:
             logger.warning(f"Error executing delete for {remote_file_name}: {err}")
             return False
+        finally:
+            self.invalidate_file_listing()
 
-    def download_file(self, remote_file_name: str, local_file_path: str) -> bool:
+    def download_file(
+        self,
+        remote_file_name: str,
+        local_file_path: str,
+        timeout: Optional[int] = None,
+    ) -> bool:
         """
         Purpose:
             Downloads a file from the file server
         Args:
             remote_file_name: Name of the file to be downloaded
             local_file_path: Full path to the local file location to which to download
+            timeout: Time in seconds to wait for the file server to respond (if None,
+                wait indefinitely)
         Returns:
             True if file was successfully downloaded
         """
         url = f"{self.remote_url}/{remote_file_name}"
-        with requests.get(url, stream=True) as resp:
+        with self._session.get(url, stream=True, timeout=timeout) as resp:
             if resp.status_code != 200:
                 logger.warning(
                     f"Download for {remote_file_name} returned status code: {resp.status_code}"
                 )
                 return False
             with open(local_file_path, "wb") as local_file:
-                for chunk in resp.iter_content(chunk_size=8192):
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     local_file.write(chunk)
         return True
 
@@ -129,7 +181,7 @@ class FileServerClient:
         Returns:
             List of files available in the file server
         """
-        resp = requests.get(self.remote_url)
+        resp = self._session.get(self.remote_url)
         if resp.status_code != 200:
             logger.warning(f"Get file listing returned status code: {resp.status_code}")
             return []
@@ -146,8 +198,13 @@ class FileServerClient:
             True if file was successfully uploaded, False on failure.
         """
         url = f"{self.remote_url}/upload"
-        with open(local_file_path, "rb") as local_file:
-            resp = requests.post(url, files={"file": local_file}, timeout=timeout)
+        try:
+            with open(local_file_path, "rb") as local_file:
+                resp = self._session.post(
+                    url, files={"file": local_file}, timeout=timeout
+                )
+        finally:
+            self.invalidate_file_listing()
         if resp.status_code != 200:
             logger.warning(
                 f"Upload for {local_file_path} returned status code: {resp.status_code}"
@@ -155,16 +212,113 @@ class FileServerClient:
             return False
         return True
 
-    def is_file_on_file_server(self, remote_file_name: str) -> bool:
+    def upload_files(
+        self,
+        local_file_paths: Iterable[str],
+        max_workers: int = UPLOAD_MAX_WORKERS,
+        timeout: int = 120,
+    ) -> Dict[str, str]:
+        """
+        Purpose:
+            Uploads files to the file server concurrently, over pooled connections.
+            A failure to upload one file does not prevent the others from being
+            uploaded.
+        Args:
+            local_file_paths: Full paths to the local files to be uploaded.
+            max_workers: Max number of uploads in progress at once.
+            timeout: Time in seconds to wait for each upload request to complete.
+        Returns:
+            Errors of the files that failed to upload, by local file path (empty
+            if all files were successfully uploaded).
+        """
+        errors = {}
+        with threading_utils.ContextThreadPoolExecutor(
+            max_workers=max(1, max_workers)
+        ) as executor:
+            futures = {
+                executor.submit(self.upload_file, local_file_path, timeout): (
+                    local_file_path
+                )
+                for local_file_path in local_file_paths
+            }
+            for future in concurrent.futures.as_completed(futures):
+                local_file_path = futures[future]
+                try:
+                    if not future.result():
+                        errors[local_file_path] = "upload was rejected by file server"
+                except Exception as err:
+                    logger.warning(
+                        f"Error executing upload for {local_file_path}: {err}"
+                    )
+                    errors[local_file_path] = f"{err}"
+        return errors
+
+    def get_file_listing_snapshot(self) -> Set[str]:
+        """
+        Purpose:
+            Gets a snapshot of the names of all files in the file server. The
+            snapshot is reused until it is older than the listing TTL or the
+            contents of the file server are modified through this client.
+        Args:
+            N/A
+        Returns:
+            Set of files available in the file server
+        """
+        with self._listing_lock:
+            if (
+                self._listing is not None
+                and time.monotonic() - self._listing_time < self.listing_ttl
+            ):
+                return self._listing
+            generation = self._listing_generation
+
+        fetch_time = time.monotonic()
+        with self._session.get(self.remote_url) as resp:
+            if resp.status_code != 200:
+                logger.warning(
+                    f"Get file listing returned status code: {resp.status_code}"
+                )
+                return set()
+            listing = set(resp.json().get("files", []))
+
+        with self._listing_lock:
+            # Don't cache a listing that raced a modification of the file server
+            if generation == self._listing_generation:
+                self._listing = listing
+                self._listing_time = fetch_time
+        return listing
+
+    def invalidate_file_listing(self) -> None:
+        """
+        Purpose:
+            Discards the current file listing snapshot, if any, and prevents any
+            listing fetch already in progress from being stored
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+        with self._listing_lock:
+            self._listing_generation += 1
+            self._listing = None
+
+    def is_file_on_file_server(
+        self, remote_file_name: str, listing: Optional[Set[str]] = None
+    ) -> bool:
         """
         Purpose:
             Checks if a file exists in the file server
         Args:
             remote_file_name: Name of the file to look for
+            listing: Snapshot of the file server listing to check against (if None,
+                the file server will be queried)
         Returns:
             True if the file exists in the file server
         """
-        with requests.get(self.remote_url) as resp:
+        if listing is not None:
+            return remote_file_name in listing
+
+        with self._session.get(self.remote_url) as resp:
             if resp.status_code != 200:
                 return False
             if remote_file_name not in str(resp.content):
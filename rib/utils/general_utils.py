@@ -19,8 +19,9 @@
 """
 
 # Python Library Imports
-import distutils
-from distutils import dir_util
+import gzip
+import hashlib
+import io
 import json
 import os
 import pathlib
@@ -32,7 +33,7 @@ import yaml
 from datetime import datetime
 import pytz
 from enum import Enum
-from typing import Any, Dict, Iterable, Mapping, Optional, Set, Union
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple, Union
 from yaml import Loader as YamlLoader
 import zipfile
 
@@ -274,6 +275,45 @@ def make_directory(
     pathlib.Path(dir_path).mkdir(parents=create_parents, exist_ok=ignore_exists)
 
 
+def get_directory_fingerprint(dir_path: str, include_digests: bool = False) -> str:
+    """
+    Purpose:
+        Get a fingerprint of the contents of a directory (or file), which changes
+        if any file is added, removed, renamed or modified
+    Args:
+        dir_path: directory (or file) to fingerprint
+        include_digests: whether to hash file contents rather than only relying on
+            file sizes and modification times
+    Return:
+        fingerprint: hex digest of the contents
+    """
+    fingerprint = hashlib.sha256()
+
+    def add_file(file_path: str, rel_path: str) -> None:
+        file_stat = os.stat(file_path)
+        fingerprint.update(
+            f"{rel_path}\0{file_stat.st_size}\0{file_stat.st_mtime_ns}\0".encode()
+        )
+        if include_digests:
+            with open(file_path, "rb") as file_obj:
+                for chunk in iter(lambda: file_obj.read(1024 * 1024), b""):
+                    fingerprint.update(chunk)
+
+    if os.path.isfile(dir_path):
+        add_file(dir_path, os.path.basename(dir_path))
+    else:
+        for dirname, subdirs, files in os.walk(dir_path):
+            subdirs.sort()
+            rel_dirname = os.path.relpath(dirname, dir_path)
+            fingerprint.update(f"{rel_dirname}/\0".encode())
+            for filename in sorted(files):
+                add_file(
+                    os.path.join(dirname, filename), os.path.join(rel_dirname, filename)
+                )
+
+    return fingerprint.hexdigest()
+
+
 def zip_directory(dir_path: str, output_file: str = "") -> None:
     """
     Purpose:
@@ -348,6 +388,59 @@ def tar_directory(dir_path: str, output_file: str, compression: str = "gz") -> N
             tar.add(os.path.join(dir_path, subdir), arcname=subdir)
 
 
+def create_tar_members(sources: Iterable[Tuple[str, str]]) -> bytes:
+    """
+    Purpose:
+        Create the (uncompressed) tar members for the given sources, without the
+        end-of-archive marker, so they can be combined with other members into a
+        single archive (see write_tar_gz_segments)
+    Args:
+        sources: Paths to add to the archive and the name to give them in the archive
+    Return:
+        tar_members: tar member bytes
+    """
+    tar_buffer = io.BytesIO()
+    with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
+        for source_path, arcname in sources:
+            tar.add(source_path, arcname=arcname)
+        members_size = tar.offset
+    return tar_buffer.getvalue()[:members_size]
+
+
+def gzip_tar_members(
+    sources: Iterable[Tuple[str, str]], compression_level: int = 9
+) -> bytes:
+    """
+    Purpose:
+        Create a gzip-compressed segment of tar members for the given sources, that
+        can be reused across multiple archives written with write_tar_gz_segments
+    Args:
+        sources: Paths to add to the archive and the name to give them in the archive
+        compression_level: gzip compression level (1-9)
+    Return:
+        segment: gzip-compressed tar member bytes
+    """
+    return gzip.compress(create_tar_members(sources), compresslevel=compression_level)
+
+
+def write_tar_gz_segments(output_file: str, segments: Iterable[bytes]) -> None:
+    """
+    Purpose:
+        Write a tar.gz archive from gzip-compressed segments of tar members (as
+        created by gzip_tar_members). Concatenated gzip members decompress as a
+        single stream, so segments are written as-is without being recompressed
+    Args:
+        output_file: Path to tar archive file to be written
+        segments: gzip-compressed tar member segments, in archive order
+    Return:
+        N/A
+    """
+    with open(output_file, "wb") as out:
+        for segment in segments:
+            out.write(segment)
+        out.write(gzip.compress(tarfile.NUL * tarfile.BLOCKSIZE * 2))
+
+
 ###
 # Network
 ###
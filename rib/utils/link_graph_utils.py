@@ -48,6 +48,7 @@ gPlot.drawGraph(layout="spring", showNodeLabels=False, figsize=(25, 25))
 
 
 # Imports
+import concurrent.futures
 import matplotlib.pyplot as plt
 import networkx as nx
 from networkx.algorithms import bipartite
@@ -57,11 +58,59 @@ import json
 import requests
 from collections import defaultdict
 from itertools import cycle
-from networkx.algorithms.distance_measures import eccentricity
-from typing import List, Any, Tuple, Optional
+from typing import Dict, List, Any, Set, Tuple, Optional
 from rib.utils.elasticsearch_utils import LinkQueryMethod
 
 
+def _freeze(value: Any) -> Any:
+    """Convert a value (e.g. an edge and its attributes) to a hashable value
+    that is equal to another converted value if the original values are equal
+    """
+
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _getMaxDepths(
+    adjacency: Dict[Any, List[Any]], sources: List[Any]
+) -> Dict[Any, int]:
+    """Get the distance from each source node to the farthest node reachable
+    from it, by breadth-first traversal
+
+    Parameters
+    ----------
+
+    adjacency: dict
+        Successors of each node in the graph
+    sources: list
+        The nodes from which to traverse
+    """
+
+    maxdepths = {}
+    for source in sources:
+        seen = {source}
+        frontier = [source]
+        depth = 0
+        while True:
+            next_frontier = []
+            for node in frontier:
+                for succ in adjacency[node]:
+                    if succ not in seen:
+                        seen.add(succ)
+                        next_frontier.append(succ)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+            depth += 1
+        maxdepths[source] = depth
+    return maxdepths
+
+
 class LinkGraph:
     """
     A class that provides convenience routines for link graph manipulation
@@ -71,6 +120,15 @@ class LinkGraph:
     CONN_TYPE_DIRECT = "CT_DIRECT"
     CONN_TYPE_INDIRECT = "CT_INDIRECT"
     CONN_TYPE_ATTR = "connType"
+    LINK_REQUIRED_FIELDS = [
+        "operationName",
+        "serviceName",
+        "connectionType",
+        "linkType",
+        "channelGid",
+        "linkId",
+        "linkAddress",
+    ]
 
     @staticmethod
     def linksToGraph(
@@ -97,6 +155,48 @@ class LinkGraph:
         removed_links: list of edges that were removed from the graph
         """
 
+        edges, bip_attrs, removed_links = LinkGraph.extractLinkEdges(df, method)
+
+        G = nx.DiGraph()
+        G.add_edges_from(edges)
+        nx.set_node_attributes(G, bip_attrs, "bipartite")
+        del_edges = [
+            (u, v) for u, v, d in G.edges(data=True) if d["linkId"] in removed_links
+        ]
+        G.remove_edges_from(del_edges)
+        return G, []
+
+    @staticmethod
+    def extractLinkEdges(
+        df: pd.DataFrame,
+        method: LinkQueryMethod = LinkQueryMethod.LINK_CURRENT,
+        connection_counts: Optional[Dict[Tuple[Any, Any], int]] = None,
+    ) -> Tuple[List[Tuple[str, str, dict]], Dict[str, int], Set[Any]]:
+        """Extract the bipartite link graph edges from links within a dataframe
+
+        Records are classified and filtered with column operations and the
+        edges are returned in record order, so that adding them in bulk lets
+        later records override the attributes of earlier records for the same
+        edge.
+
+        Parameters
+        ----------
+
+        df:pd.DataFrame
+            A dataframe of records returned from a previous do_query() operation
+        method:LinkQueryMethod
+            The type of links to use in the creation of the graph
+        connection_counts:dict
+            Open connection counts by (link address, node) prior to the records,
+            updated in place with the counts after the records
+
+        Returns
+        -------
+        edges: list of (u, v, attributes) edges in record order
+        bip_attrs: bipartite set of each node of the added edges
+        removed_links: set of link IDs that were destroyed
+        """
+
         createOps = []
         destroyOps = []
         if method == LinkQueryMethod.CONNECTION_EVER:
@@ -112,107 +212,102 @@ class LinkGraph:
         else:
             raise Exception("Unknown link method")
 
-        G = nx.DiGraph()
-        edgeattrs = defaultdict(lambda: defaultdict(set))
-
-        extant_links = {}
-        connection_counts = defaultdict(lambda: defaultdict(int))
-        removed_links = []
-        bip_attrs = {}
-        for idx, row in df.fillna("").iterrows():
-            reqd_fields = [
-                "operationName",
-                "serviceName",
-                "connectionType",
-                "linkType",
-                "channelGid",
-                "linkId",
-                "linkAddress",
+        if connection_counts is None:
+            connection_counts = {}
+
+        frame = df.reindex(
+            columns=LinkGraph.LINK_REQUIRED_FIELDS
+            + (["personas"] if "personas" in df.columns else [])
+        ).fillna("")
+        operations = frame["operationName"]
+
+        # Skipping CONNECTION_SEND and CONNECTION_RECV because we do not
+        # use them and they are missing some fields, causing lots of
+        # spurious error messages
+        is_used = ~operations.isin(["CONNECTION_SEND", "CONNECTION_RECV"])
+
+        # Ensure that we have all required fields
+        is_complete = (frame[LinkGraph.LINK_REQUIRED_FIELDS] != "").all(axis=1) & set(
+            LinkGraph.LINK_REQUIRED_FIELDS
+        ).issubset(df.columns)
+        is_malformed = is_used & ~is_complete & (operations != "LINK_DESTROYED")
+        for idx in frame.index[is_malformed.to_numpy()]:
+            print(f"Ignoring malformed record at index {idx}")
+
+        frame = frame[is_used & ~is_malformed].reset_index(drop=True)
+        operations = frame["operationName"]
+
+        is_create = operations.isin(createOps)
+        is_close = operations.isin(destroyOps) & (operations == "CONNECTION_CLOSED")
+        is_destroy = operations.isin(destroyOps) & (operations == "LINK_DESTROYED")
+        removed_links = set(frame.loc[is_destroy, "linkId"])
+
+        # Running count of open connections per link address and node, as of each
+        # record
+        connection_keys = [frame["linkAddress"], frame["serviceName"]]
+        connection_deltas = (is_create & (operations == "CONNECTION_OPEN")).astype(
+            int
+        ) - is_close.astype(int)
+        conns = connection_deltas.groupby(connection_keys, sort=False).cumsum()
+        if connection_counts:
+            conns += [
+                connection_counts.get(key, 0)
+                for key in zip(frame["linkAddress"], frame["serviceName"])
             ]
+        connection_counts.update(
+            conns.groupby(connection_keys, sort=False).last().to_dict()
+        )
 
-            # Skipping CONNECTION_SEND and CONNECTION_RECV because we do not
-            # use them and they are missing some fields, causing lots of
-            # spurious error messages
-            if row["operationName"] in {"CONNECTION_SEND", "CONNECTION_RECV"}:
-                continue
-
-            # Ensure that we have all required fields
-            if not (all(key in row and row[key] != "" for key in reqd_fields)):
-                if row["operationName"] != "LINK_DESTROYED":
-                    print(f"Ignoring malformed record at index {idx}")
-                    continue
-
-            src = row["serviceName"]
-            connType = row["connectionType"]
-            linkType = row["linkType"]
-            linkId = row["linkId"]
-            linkAddress = row["linkAddress"]
-            channelGid = row["channelGid"]
-
-            # Add optional fields
-            if "personas" in row:
-                personas = row["personas"]
-            else:
-                personas = ""
-
-            pNode = f"{channelGid}|{linkAddress}"
-
-            addLink = False
-
-            if row["operationName"] in createOps:
-                addLink = True
-                # Increment connection counts
-                if row["operationName"] == "CONNECTION_OPEN":
-                    connection_counts[linkAddress][src] += 1
-
-            elif destroyOps and row["operationName"] in destroyOps:
-                if row["operationName"] == "CONNECTION_CLOSED":
-                    addLink = True
-                    # Decrement connection counts
-                    connection_counts[linkAddress][src] -= 1
-                elif row["operationName"] == "LINK_DESTROYED":
-                    removed_links.append(linkId)
+        is_added = is_create | is_close
+        added = frame[is_added]
+        pNodes = (
+            added["channelGid"].astype(str) + "|" + added["linkAddress"].astype(str)
+        )
+        personasColumn = (
+            added["personas"].tolist() if "personas" in added else [""] * len(added)
+        )
 
+        edges = []
+        bip_attrs = {}
+        for (
+            src,
+            pNode,
+            connType,
+            linkType,
+            linkId,
+            linkAddress,
+            channelGid,
+            personas,
+            conn,
+        ) in zip(
+            added["serviceName"].tolist(),
+            pNodes.tolist(),
+            added["connectionType"].tolist(),
+            added["linkType"].tolist(),
+            added["linkId"].tolist(),
+            added["linkAddress"].tolist(),
+            added["channelGid"].tolist(),
+            personasColumn,
+            conns[is_added].tolist(),
+        ):
+            attrs = {
+                "pKey": pNode,
+                "connType": connType,
+                "linkType": linkType,
+                "linkId": linkId,
+                "linkAddress": linkAddress,
+                "channelGid": channelGid,
+                "personas": personas,
+                "conn": conn,
+            }
             if linkType in ["LT_SEND", "LT_BIDI"]:
-                if addLink:
-                    G.add_edge(
-                        src,
-                        pNode,
-                        pKey=pNode,
-                        connType=connType,
-                        linkType=linkType,
-                        linkId=linkId,
-                        linkAddress=linkAddress,
-                        channelGid=channelGid,
-                        personas=personas,
-                        conn=connection_counts[linkAddress][src],
-                    )
-
+                edges.append((src, pNode, attrs))
             if linkType in ["LT_RECV", "LT_BIDI"]:
-                if addLink:
-                    G.add_edge(
-                        pNode,
-                        src,
-                        pKey=pNode,
-                        connType=connType,
-                        linkType=linkType,
-                        linkId=linkId,
-                        linkAddress=linkAddress,
-                        channelGid=channelGid,
-                        personas=personas,
-                        conn=connection_counts[linkAddress][src],
-                    )
-
-            if addLink:
-                G.nodes[src]["bipartite"] = 0
-                G.nodes[pNode]["bipartite"] = 1
+                edges.append((pNode, src, attrs))
+            bip_attrs[src] = 0
+            bip_attrs[pNode] = 1
 
-        nx.set_node_attributes(G, bip_attrs, "bipartite")
-        del_edges = [
-            (u, v) for u, v, d in G.edges(data=True) if d["linkId"] in removed_links
-        ]
-        G.remove_edges_from(del_edges)
-        return G, []
+        return edges, bip_attrs, removed_links
 
     @staticmethod
     def projectGraph(G):
@@ -342,7 +437,10 @@ class LinkGraph:
 
     @staticmethod
     def updateDirectStats(
-        G: nx.MultiDiGraph, H: nx.MultiDiGraph, pfx: str = ""
+        G: nx.MultiDiGraph,
+        H: nx.MultiDiGraph,
+        pfx: str = "",
+        max_workers: Optional[int] = None,
     ) -> pd.DataFrame:
         """Get statistics associated with direct links
 
@@ -365,6 +463,10 @@ class LinkGraph:
 
         pfx: str
             A prefix string to be appended to the property name
+
+        max_workers: int
+            If greater than 1, the number of processes over which to compute
+            the per-node max depths
         """
 
         if nx.is_empty(H):
@@ -373,13 +475,43 @@ class LinkGraph:
         # Flatten the edges of the multi-digraph
         H_flat = nx.DiGraph(H)
 
-        # descendants
+        # Descendants are the union of the nodes of all strongly connected
+        # components reachable from the node's component, computed in one pass
+        # over the condensation DAG in reverse topological order
+        C = nx.condensation(H_flat)
+        node_bits = {n: 1 << i for i, n in enumerate(H_flat)}
+        reachable = {}
+        for c in reversed(list(nx.topological_sort(C))):
+            mask = 0
+            for n in C.nodes[c]["members"]:
+                mask |= node_bits[n]
+            for succ in C.successors(c):
+                mask |= reachable[succ]
+            reachable[c] = mask
+
+        # Max depth is the distance to the farthest reachable node (i.e. the
+        # eccentricity of the node's BFS tree), so only nodes that reach other
+        # nodes need a traversal
+        adjacency = {n: list(H_flat.successors(n)) for n in H_flat}
+        sources = [n for n in H_flat if H_flat.out_degree(n)]
+        maxdepths = {}
+        if max_workers and max_workers > 1 and len(sources) > 1:
+            chunks = [sources[i::max_workers] for i in range(max_workers)]
+            with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+                for chunk_depths in executor.map(
+                    _getMaxDepths, [adjacency] * len(chunks), chunks
+                ):
+                    maxdepths.update(chunk_depths)
+        else:
+            maxdepths = _getMaxDepths(adjacency, sources)
+
         stats = defaultdict(dict)
         for n in H_flat.nodes:
-            g = nx.bfs_tree(H_flat, n)
-            stats[n][f"D_{pfx}maxdepth"] = eccentricity(g, n)
+            stats[n][f"D_{pfx}maxdepth"] = maxdepths.get(n, 0)
             # Do not include head in the list of descendants
-            stats[n][f"D_{pfx}descendants"] = g.number_of_nodes() - 1
+            stats[n][f"D_{pfx}descendants"] = (
+                bin(reachable[C.graph["mapping"][n]]).count("1") - 1
+            )
         nx.set_node_attributes(G, stats)
 
     @staticmethod
@@ -419,10 +551,10 @@ class LinkGraph:
             # return an empty di-graph
             return nx.MultiDiGraph()
 
-        D = nx.bfs_tree(H, startNode)
+        D = set(nx.bfs_edges(H, startNode))
 
         # preserve any node and edge properties
-        remove = [e for e in H.edges() if e not in D.edges()]
+        remove = [e for e in H.edges() if e not in D]
         H_copy = H.copy()
         H_copy.remove_edges_from(remove)
         return H_copy
@@ -448,11 +580,251 @@ class LinkGraph:
 
         edges = LinkGraph.get_all_edges(G)
         ref_edges = LinkGraph.get_all_edges(G_ref)
-        added = [item for item in edges if item not in ref_edges]
-        removed = [item for item in ref_edges if item not in edges]
+        try:
+            edge_keys = {_freeze(item) for item in edges}
+            ref_edge_keys = {_freeze(item) for item in ref_edges}
+        except TypeError:
+            # Fall back to comparing unhashable attribute values directly
+            added = [item for item in edges if item not in ref_edges]
+            removed = [item for item in ref_edges if item not in edges]
+            return added, removed
+        added = [item for item in edges if _freeze(item) not in ref_edge_keys]
+        removed = [item for item in ref_edges if _freeze(item) not in edge_keys]
         return added, removed
 
 
+class IncrementalLinkGraph:
+    """
+    A bipartite link graph and its projection that are updated in place as new
+    link records arrive, at a cost proportional to the new records
+
+    Applying records in batches yields the same graph as LinkGraph.linksToGraph
+    over all of the records, and the same projection as LinkGraph.projectGraph.
+    As in LinkGraph.projectGraph, parallel projected edges are keyed 0..n-1 (in
+    order of the link nodes they are projected through). The version is
+    incremented whenever the graph changes so that consumers can cheaply detect
+    updates.
+    """
+
+    def __init__(self, method: LinkQueryMethod = LinkQueryMethod.LINK_CURRENT):
+        """
+        Parameters
+        ----------
+
+        method:LinkQueryMethod
+            The type of links to use in the creation of the graph
+        """
+
+        self.method = method
+        self.graph = nx.DiGraph()
+        self.projected = nx.MultiDiGraph()
+        self.version = 0
+        self.excluded = set()
+
+        self._connection_counts = {}
+        self._removed_links = set()
+        # Order in which nodes were first added, to project edges in the same
+        # order as LinkGraph.projectGraph
+        self._node_order = {}
+        # Bipartite edges by link ID and projected edges by bipartite (link) node
+        self._link_edges = defaultdict(set)
+        self._projected_edges = defaultdict(set)
+        # Attributes of the projected edges between each pair of nodes, by the
+        # bipartite (link) node they are projected through
+        self._pair_links = defaultdict(dict)
+
+    def applyLinks(self, df: pd.DataFrame) -> bool:
+        """Apply new link records to the graph
+
+        Parameters
+        ----------
+
+        df:pd.DataFrame
+            A dataframe of records newer than any previously applied records
+
+        Returns
+        -------
+        bool: True if the graph changed
+        """
+
+        if df.empty:
+            return False
+
+        edges, bip_attrs, removed_links = LinkGraph.extractLinkEdges(
+            df, self.method, self._connection_counts
+        )
+        self._removed_links.update(removed_links)
+
+        dirty = set()
+        touched_links = set(removed_links)
+        for u, v, attrs in edges:
+            if u in self.excluded or v in self.excluded:
+                # Keep the other end of the edge, as if the excluded node had been
+                # removed after the edge was added
+                for node in (u, v):
+                    if node not in self.excluded and node not in self.graph:
+                        self.graph.add_node(node)
+                        self._node_order.setdefault(node, len(self._node_order))
+                continue
+            if self.graph.has_edge(u, v):
+                current = self.graph[u][v]
+                if current == attrs:
+                    continue
+                self._link_edges[current["linkId"]].discard((u, v))
+            self.graph.add_edge(u, v, **attrs)
+            self._node_order.setdefault(u, len(self._node_order))
+            self._node_order.setdefault(v, len(self._node_order))
+            self._link_edges[attrs["linkId"]].add((u, v))
+            touched_links.add(attrs["linkId"])
+            dirty.add(attrs["pKey"])
+        nx.set_node_attributes(
+            self.graph,
+            {n: b for n, b in bip_attrs.items() if n not in self.excluded},
+            "bipartite",
+        )
+
+        for linkId in touched_links & self._removed_links:
+            for u, v in self._link_edges.pop(linkId, ()):
+                dirty.add(self.graph[u][v]["pKey"])
+                self.graph.remove_edge(u, v)
+
+        return self._update(dirty)
+
+    def excludeNode(self, node: str) -> bool:
+        """Remove a node from the graph and ignore any later records for it
+
+        Parameters
+        ----------
+
+        node:str
+            The node to exclude
+
+        Returns
+        -------
+        bool: True if the graph changed
+        """
+
+        self.excluded.add(node)
+        if node not in self.graph:
+            return False
+
+        dirty = set()
+        for u, v, d in list(self.graph.in_edges(node, data=True)) + list(
+            self.graph.out_edges(node, data=True)
+        ):
+            self._link_edges[d["linkId"]].discard((u, v))
+            dirty.add(d["pKey"])
+        self.graph.remove_node(node)
+        if node in self.projected:
+            self.projected.remove_node(node)
+        self._update(dirty)
+        return True
+
+    def _update(self, dirty: Set[str]) -> bool:
+        """Re-project the edges through the given bipartite (link) nodes
+
+        Parameters
+        ----------
+
+        dirty:set
+            The bipartite nodes whose edges changed
+
+        Returns
+        -------
+        bool: True if the graph changed
+        """
+
+        if not dirty:
+            return False
+
+        touched_pairs = set()
+        for pNode in dirty:
+            for pair in self._projected_edges.pop(pNode, ()):
+                self._pair_links[pair].pop(pNode, None)
+                touched_pairs.add(pair)
+
+            if pNode not in self.graph:
+                continue
+            bEdges = sorted(
+                list(self.graph.in_edges(pNode, data=True))
+                + list(self.graph.out_edges(pNode, data=True)),
+                key=lambda edge: self._node_order[edge[0]],
+            )
+            senders = [
+                u
+                for u in self.graph.predecessors(pNode)
+                if self.graph.nodes[u].get("bipartite") == 0
+            ]
+            receivers = [
+                v
+                for v in self.graph.successors(pNode)
+                if self.graph.nodes[v].get("bipartite") == 0
+            ]
+            for u in senders:
+                for v in receivers:
+                    if u == v:
+                        continue
+                    self._pair_links[(u, v)][pNode] = self._getProjectedAttrs(
+                        pNode, bEdges, u, v
+                    )
+                    self._projected_edges[pNode].add((u, v))
+                    touched_pairs.add((u, v))
+
+        # Re-add the parallel edges of each changed pair with contiguous keys
+        touched_nodes = set()
+        for u, v in touched_pairs:
+            if self.projected.has_edge(u, v):
+                self.projected.remove_edges_from(
+                    [(u, v, key) for key in list(self.projected[u][v])]
+                )
+            links = self._pair_links[(u, v)]
+            for key, pNode in enumerate(sorted(links)):
+                self.projected.add_edge(u, v, key=key, **links[pNode])
+            if not links:
+                del self._pair_links[(u, v)]
+            touched_nodes.update((u, v))
+
+        for node in touched_nodes:
+            if node in self.projected and not self.projected.degree(node):
+                self.projected.remove_node(node)
+
+        self.version += 1
+        return True
+
+    @staticmethod
+    def _getProjectedAttrs(pNode: str, bEdges: list, u: str, v: str) -> dict:
+        """Get the attributes of a projected edge, as in LinkGraph.projectGraph
+
+        Parameters
+        ----------
+
+        pNode:str
+            The bipartite (link) node through which the edge is projected
+        bEdges:list
+            The bipartite edges incident to the link node
+        u:str
+            The projected edge source
+        v:str
+            The projected edge destination
+        """
+
+        attrs = defaultdict(set)
+        for b_u, b_v, d in bEdges:
+            attrs["connType"].add(d["connType"])
+            attrs["linkType"].add(d["linkType"])
+            attrs["linkId"].add(d["linkId"])
+            attrs["linkAddress"].add(d["linkAddress"])
+            attrs["channelGid"].add(d["channelGid"])
+            attrs["personas"].add(d["personas"])
+
+            base_node = b_u if b_u != pNode else b_v
+            if base_node == u:
+                attrs["conn_out"] = d["conn"]
+            elif base_node == v:
+                attrs["conn_in"] = d["conn"]
+        return attrs
+
+
 class LinkGraphRenderer:
     """
     A class that provides supporting functions for graph rendering
@@ -16,11 +16,13 @@
 # Python Library Imports
 import logging
 import datetime
+import threading
+import time
 import warnings
-from opensearchpy import OpenSearch as Elasticsearch
+from opensearchpy import OpenSearchException as ElasticsearchException
 from opensearchpy.exceptions import OpenSearchWarning as ElasticsearchWarning
 from prettytable import PrettyTable
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple, TypedDict
 
 # Local Python Library Imports
 from rib.deployment.rib_deployment import RibDeployment
@@ -29,12 +31,83 @@ from rib.utils import elasticsearch_utils
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Seconds for which a successful deployment-active check is reused by UI queries
+ACTIVE_CHECK_TTL = 5.0
+_active_check_expiry: Dict[Tuple[str, str], float] = {}
+_active_check_lock = threading.Lock()
+
 
 ###
 # Types
 ###
 
 
+class MessageCounts(TypedDict):
+    """Counts of matching messages by status, overall and per sender/recipient pair"""
+
+    total: int
+    status: Dict[str, int]
+    pairs: Dict[str, Dict[str, int]]
+
+
+class MessageSummary(TypedDict):
+    """Counts and latency distributions of matching messages, overall and per pair"""
+
+    counts: MessageCounts
+    latency: elasticsearch_utils.LatencyPercentiles
+    pair_latency: Dict[str, elasticsearch_utils.LatencyPercentiles]
+
+
+###
+# Helpers
+###
+
+
+def get_date_range(date_from: Optional[str], date_to: Optional[str]) -> List[List[str]]:
+    """
+    Purpose:
+        Convert ISO-formatted filter dates into an Elasticsearch time range
+    Args:
+        date_from: starting date for filter
+        date_to: ending date for filter
+    Return:
+        time range to filter to
+    """
+    date_range = []
+    if date_from:
+        date_exp = datetime.datetime.fromisoformat(date_from).timestamp() * 1000
+        date_range.append(["gte", f"{date_exp}"])
+    if date_to:
+        date_exp = datetime.datetime.fromisoformat(date_to).timestamp() * 1000
+        date_range.append(["lte", f"{date_exp}"])
+    return date_range
+
+
+def verify_deployment_is_active_cached(deployment: RibDeployment, action: str) -> None:
+    """
+    Purpose:
+        Verify that the deployment is the active deployment, reusing a successful
+        check for ACTIVE_CHECK_TTL seconds so that frequently polled queries do not
+        inspect every container on each request
+    Args:
+        deployment: deployment to check
+        action: Description of the action being executed
+    Return:
+        N/A
+    Raises:
+        error_utils.RIB343: when the deployment is not active
+    """
+    key = (deployment.rib_mode, deployment.config["name"])
+    with _active_check_lock:
+        if _active_check_expiry.get(key, 0) > time.monotonic():
+            return
+
+    deployment.status.verify_deployment_is_active(action)
+
+    with _active_check_lock:
+        _active_check_expiry[key] = time.monotonic() + ACTIVE_CHECK_TTL
+
+
 ###
 # Get Messages
 ###
@@ -80,32 +153,30 @@ def get_matching_messages(
     # Elasticsearch service (for this deployment) needs to be up to get messages
     deployment.status.verify_deployment_is_active("get matching messages")
 
-    date_range = []
-    if date_from:
-        date_exp = datetime.datetime.fromisoformat(date_from).timestamp() * 1000
-        date_range.append(["gte", f"{date_exp}"])
-    if date_to:
-        date_exp = datetime.datetime.fromisoformat(date_to).timestamp() * 1000
-        date_range.append(["lte", f"{date_exp}"])
+    date_range = get_date_range(date_from, date_to)
 
     # Query Elasticsearch for send message spans
     warnings.filterwarnings("ignore", category=ElasticsearchWarning)
-    es = Elasticsearch(
-        deployment.get_elasticsearch_hostname(),
-        timeout=120,
-        max_retries=5,
-        retry_on_timeout=True,
-    )
+    es = elasticsearch_utils.get_search_client(deployment.get_elasticsearch_hostname())
 
+    # Filter in the query so only matching spans are returned by Elasticsearch
     query = elasticsearch_utils.create_query(
         actions=["sendMessage", "receiveMessage"],
         trace_id=trace_id,
         time_range=date_range,
         range_name=deployment.get_range_name(),
+        sender=sender,
+        recipient=recipient,
+        test_id=test_id,
+    )
+    spans = elasticsearch_utils.stream_spans(
+        es, query, source_fields=elasticsearch_utils.MESSAGE_SPAN_SOURCE_FIELDS
     )
-    results = elasticsearch_utils.do_query(es=es, query=query)
-    spans = elasticsearch_utils.get_spans(es, results)
-    (_, trace_id_to_span) = elasticsearch_utils.get_message_spans(spans)
+    try:
+        (_, trace_id_to_span) = elasticsearch_utils.get_message_spans(spans)
+    except ElasticsearchException as err:
+        print(f"Search error: {err}")
+        trace_id_to_span = {}
     message_traces = elasticsearch_utils.getMessageTraces(trace_id_to_span)
 
     if verbose:
@@ -127,13 +198,6 @@ def get_matching_messages(
 
     for message in message_traces:
         span = message.get("send_span", message.get("receive_span"))
-        if sender and span["messageFrom"] != sender:
-            continue
-        if recipient and span["messageTo"] != recipient:
-            continue
-        if test_id and span["messageTestId"] != test_id:
-            continue
-        # Current message is a part of our wanted matching subset
         output.append(message)
         if message["status"] != elasticsearch_utils.MessageStatus.RECEIVED:
             messages_to_be_received += 1
@@ -179,6 +243,116 @@ def get_matching_messages(
     return messages_to_be_received, output
 
 
+def get_matching_message_counts(
+    rib_mode: str,
+    deployment_name: str,
+    recipient: Optional[str],
+    sender: Optional[str],
+    test_id: str = None,
+    trace_id: str = None,
+    date_from: str = None,
+    date_to: str = None,
+    verbose: bool = False,
+) -> MessageCounts:
+    """
+    Purpose:
+        Get counts of matching messages by status, overall and per sender/recipient pair,
+        from Elastic Search Instance, print if indicated. Counts are computed by
+        Elasticsearch aggregations so no spans are downloaded.
+    Args:
+        rib_mode: mode that rib is in
+        deployment_name: name of deployment (needs to be active)
+        recipient: filter on given receiving node
+        sender: filter on given sender node
+        test_id: filter on given test_id
+        trace_id: filter on given trace_id
+        date_from: starting date for filter
+        date_to: ending date for filter
+        verbose: flag to turn on printing out tables
+    Return:
+        counts: MessageCounts -> counts of matching messages
+    """
+    # Getting instance of existing deployment
+    deployment = RibDeployment.get_existing_deployment_or_fail(
+        deployment_name, rib_mode
+    )
+
+    # Elasticsearch service (for this deployment) needs to be up to get messages
+    deployment.status.verify_deployment_is_active("get matching message counts")
+
+    date_range = get_date_range(date_from, date_to)
+
+    # Query Elasticsearch for message trace summaries
+    warnings.filterwarnings("ignore", category=ElasticsearchWarning)
+    es = elasticsearch_utils.get_search_client(deployment.get_elasticsearch_hostname())
+
+    query = elasticsearch_utils.create_query(
+        actions=["sendMessage", "receiveMessage"],
+        trace_id=trace_id,
+        time_range=date_range,
+        range_name=deployment.get_range_name(),
+        sender=sender,
+        recipient=recipient,
+        test_id=test_id,
+    )
+    counts = count_message_trace_summaries(
+        elasticsearch_utils.get_message_trace_summaries(es=es, query=query)
+    )
+
+    if verbose:
+        statuses = [f"{status}" for status in elasticsearch_utils.MessageStatus]
+
+        status_table = PrettyTable()
+        status_table.field_names = ["Status", "Count"]
+        for status in statuses:
+            status_table.add_row([status, counts["status"][status]])
+        status_table.add_row(["Total", counts["total"]])
+        print(status_table)
+
+        pair_table = PrettyTable()
+        pair_table.field_names = ["Sender", "Recipient"] + statuses
+        for pair, pair_counts in counts["pairs"].items():
+            (pair_sender, pair_recipient) = pair.split("->", 1)
+            pair_table.add_row(
+                [pair_sender, pair_recipient]
+                + [pair_counts[status] for status in statuses]
+            )
+        pair_table.sortby = "Sender"
+        print(pair_table)
+
+    return counts
+
+
+def count_message_trace_summaries(
+    summaries: Iterable[elasticsearch_utils.MessageTraceSummary],
+) -> MessageCounts:
+    """
+    Purpose:
+        Count message trace summaries by status, overall and per sender/recipient pair
+    Args:
+        summaries: message trace summaries to count
+    Return:
+        counts: MessageCounts -> counts of the messages
+    """
+    statuses = [f"{status}" for status in elasticsearch_utils.MessageStatus]
+    counts = MessageCounts(
+        total=0,
+        status={status: 0 for status in statuses},
+        pairs={},
+    )
+    for summary in summaries:
+        status = f"{summary['status']}"
+        pair_counts = counts["pairs"].setdefault(
+            f"{summary['sender']}->{summary['recipient']}",
+            {status: 0 for status in statuses},
+        )
+        pair_counts[status] += 1
+        counts["status"][status] += 1
+        counts["total"] += 1
+
+    return counts
+
+
 def ui_get_matching_messages(
     rib_mode: str,
     deployment_name: str,
@@ -218,25 +392,14 @@ def ui_get_matching_messages(
     )
 
     # Elasticsearch service (for this deployment) needs to be up to get messages
-    deployment.status.verify_deployment_is_active("ui get matching messages")
+    verify_deployment_is_active_cached(deployment, "ui get matching messages")
 
-    date_range = []
-    if date_from:
-        date_exp = datetime.datetime.fromisoformat(date_from).timestamp() * 1000
-        date_range.append(["gte", f"{date_exp}"])
-    if date_to:
-        date_exp = datetime.datetime.fromisoformat(date_to).timestamp() * 1000
-        date_range.append(["lte", f"{date_exp}"])
+    date_range = get_date_range(date_from, date_to)
 
     # Query Elasticsearch for wanted message spans
     warnings.filterwarnings("ignore", category=ElasticsearchWarning)
 
-    es = Elasticsearch(
-        deployment.get_elasticsearch_hostname(),
-        timeout=120,
-        max_retries=5,
-        retry_on_timeout=True,
-    )
+    es = elasticsearch_utils.get_search_client(deployment.get_elasticsearch_hostname())
 
     query = elasticsearch_utils.create_message_list_query(
         actions=["sendMessage", "receiveMessage"],
@@ -265,3 +428,74 @@ def ui_get_matching_messages(
     output = message_traces
 
     return new_search_after_vals, output, has_more_pages
+
+
+def ui_get_matching_messages_summary(
+    rib_mode: str,
+    deployment_name: str,
+    recipient: Optional[str] = None,
+    sender: Optional[str] = None,
+    test_id: str = None,
+    trace_id: str = None,
+    date_from: str = None,
+    date_to: str = None,
+) -> MessageSummary:
+    """
+    Purpose:
+        Get counts by status and latency percentiles of matching messages, overall and
+        per sender/recipient pair. Traces are summarized by Elasticsearch aggregations
+        so no spans are downloaded.
+    Args:
+        rib_mode: mode that rib is in
+        deployment_name: name of deployment (needs to be active)
+        recipient: filter on given receiving node
+        sender: filter on given sender node
+        test_id: filter on given test_id
+        trace_id: filter on given trace_id
+        date_from: starting date for filter
+        date_to: ending date for filter
+    Return:
+        summary: MessageSummary -> counts and latencies of matching messages
+    """
+    # Getting instance of existing deployment
+    deployment = RibDeployment.get_existing_deployment_or_fail(
+        deployment_name, rib_mode
+    )
+
+    # Elasticsearch service (for this deployment) needs to be up to get messages
+    verify_deployment_is_active_cached(deployment, "ui get matching messages summary")
+
+    warnings.filterwarnings("ignore", category=ElasticsearchWarning)
+    es = elasticsearch_utils.get_search_client(deployment.get_elasticsearch_hostname())
+
+    query = elasticsearch_utils.create_query(
+        actions=["sendMessage", "receiveMessage"],
+        trace_id=trace_id,
+        time_range=get_date_range(date_from, date_to),
+        range_name=deployment.get_range_name(),
+        sender=sender,
+        recipient=recipient,
+        test_id=test_id,
+    )
+    summaries = list(
+        elasticsearch_utils.get_message_trace_summaries(es=es, query=query)
+    )
+
+    latencies = []
+    pair_latencies: Dict[str, List[float]] = {}
+    for summary in summaries:
+        pair = pair_latencies.setdefault(
+            f"{summary['sender']}->{summary['recipient']}", []
+        )
+        if summary["total_time"] is not None:
+            latencies.append(summary["total_time"])
+            pair.append(summary["total_time"])
+
+    return MessageSummary(
+        counts=count_message_trace_summaries(summaries),
+        latency=elasticsearch_utils.compute_latency_percentiles(latencies),
+        pair_latency={
+            pair: elasticsearch_utils.compute_latency_percentiles(pair_times)
+            for pair, pair_times in pair_latencies.items()
+        },
+    )
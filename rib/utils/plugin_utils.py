@@ -364,9 +364,21 @@ def _now() -> str:
 
 
 def _dir_checksum(directory: str) -> str:
-    """Get content checksum of the given directory"""
-    # TODO: implement me
-    return "to-be-implemented"
+    """Get content checksum of the given directory (relative file paths and contents)"""
+
+    if os.path.isfile(directory):
+        return _file_checksum(directory)
+
+    dir_hash = hashlib.md5()
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            file_path = os.path.join(root, filename)
+            dir_hash.update(os.path.relpath(file_path, directory).encode("utf-8"))
+            # Broken symlinks have no content to hash
+            if os.path.isfile(file_path):
+                dir_hash.update(_file_checksum(file_path).encode("utf-8"))
+    return dir_hash.hexdigest()
 
 
 def _file_checksum(file_path: str) -> str:
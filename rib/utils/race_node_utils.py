@@ -19,10 +19,13 @@ Purpose:
 """
 
 # Python Library Imports
+import contextlib
 import json
 import logging
 import redis
-from typing import Dict, TypedDict, List, Optional
+import threading
+import time
+from typing import Dict, Iterable, Iterator, TypedDict, List, Optional, Set, Tuple
 
 # Local Python Library Imports
 from rib.utils import error_utils, redis_utils, voa_utils
@@ -39,6 +42,34 @@ BASE_NODE_IS_ALIVE_KEY = "race.node.is.alive:"
 BASE_APP_STATUS_KEY = "race.app.status:"
 BASE_APP_IS_ALIVE_KEY = "race.app.is.alive:"
 
+# Max number of nodes whose status keys are requested in a single MGET
+STATUS_MGET_BATCH_SIZE = 250
+
+# Keys written by node daemons that reflect the status of the node
+STATUS_KEY_PREFIXES = [
+    BASE_NODE_STATUS_KEY,
+    BASE_APP_STATUS_KEY,
+]
+
+# Heartbeat keys re-set by node daemons while the node is alive. Only their
+# removal is a status change, so they are observed through these key events
+# rather than through every (re)set of the key
+IS_ALIVE_KEY_PREFIXES = [
+    BASE_NODE_IS_ALIVE_KEY,
+    BASE_APP_IS_ALIVE_KEY,
+]
+IS_ALIVE_KEY_EVENTS = ["expired", "del"]
+
+# Keyspace notification classes needed to observe changes to the status keys:
+# keyspace events (K), keyevent events (E), string commands ($), generic
+# commands (g), expired keys (x)
+STATUS_KEYSPACE_EVENTS = "KE$gx"
+
+# Key holding the keyspace notification settings to restore while they are changed
+# by status change subscriptions. Its presence on the next subscription means a
+# previous process exited (e.g., was killed) without restoring the settings
+KEYSPACE_EVENTS_TO_RESTORE_KEY = "rib.notify-keyspace-events.restore"
+
 
 ###
 # Globals
@@ -47,6 +78,11 @@ BASE_APP_IS_ALIVE_KEY = "race.app.is.alive:"
 
 logger = logging.getLogger(__name__)
 
+# Keyspace notification settings changed by status change subscriptions, by Redis
+# server, as (number of open subscriptions, value to restore once all are closed)
+_keyspace_events_lock = threading.Lock()
+_keyspace_events_users: Dict[Tuple, Tuple[int, Optional[str]]] = {}
+
 
 ###
 # Types
@@ -68,6 +104,147 @@ class AppStatusDetails(TypedDict):
     timestamp: str
 
 
+class NodeStatusDetails(TypedDict):
+    """Info/status reported by the RACE node daemon and app for a single node"""
+
+    daemon: DaemonStatusDetails
+    app: AppStatusDetails
+
+
+class ActionBatch:
+    """Action commands queued to be published to RACE nodes in a single pipeline"""
+
+    # Queued (persona, action) commands, in order
+    actions: List[Tuple[str, Dict]]
+    # Key under which an error publishing each queued action is reported
+    error_keys: List[str]
+    # Errors publishing the actions, by error key (set once the batch is published)
+    errors: Dict[str, Exception]
+
+    def __init__(self) -> None:
+        """
+        Purpose:
+            Initializes an empty batch
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+        self.actions = []
+        self.error_keys = []
+        self.errors = {}
+        self._error_key: Optional[str] = None
+
+    def add(self, persona: str, action: Dict) -> None:
+        """
+        Purpose:
+            Queues an action command to be published
+        Args:
+            persona: RACE node persona
+            action: Action command
+        Returns:
+            N/A
+        """
+        self.actions.append((persona, action))
+        self.error_keys.append(self._error_key or persona)
+
+    @contextlib.contextmanager
+    def errors_reported_as(self, error_key: str) -> Iterator[None]:
+        """
+        Purpose:
+            Reports errors publishing the actions queued within the context under
+            the given key rather than under the persona of the node
+        Args:
+            error_key: Key under which to report errors (e.g., "sender to recipient")
+        Returns:
+            N/A
+        """
+        previous_error_key = self._error_key
+        self._error_key = error_key
+        try:
+            yield
+        finally:
+            self._error_key = previous_error_key
+
+
+class StatusChangeSubscription:
+    """
+    Subscription to changes of the status keys of all nodes. Keyspace
+    notification settings changed to create the subscription are restored once
+    it (and every other subscription to the same Redis server) is closed
+    """
+
+    def __init__(
+        self, pubsub: redis.client.PubSub, redis_client: redis.Redis, server: Tuple
+    ) -> None:
+        """
+        Purpose:
+            Initializes the subscription
+        Args:
+            pubsub: Redis subscription to the status key notifications
+            redis_client: Client of the Redis server
+            server: Redis server whose keyspace notification settings are in use
+        Returns:
+            N/A
+        """
+        self._pubsub = pubsub
+        self._redis_client = redis_client
+        self._server = server
+        self._closed = False
+
+    def get_message(self, timeout: float = 0.0) -> Optional[Dict]:
+        """
+        Purpose:
+            Gets the next status key notification
+        Args:
+            timeout: Max time in seconds to wait for a notification
+        Returns:
+            Notification message, or None if none was received before the timeout
+        """
+        return self._pubsub.get_message(timeout=timeout)
+
+    def close(self) -> None:
+        """
+        Purpose:
+            Closes the subscription, restoring the keyspace notification settings
+            if this was the last open subscription
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._pubsub.close()
+        _release_keyspace_events(self._redis_client, self._server)
+
+
+def _release_keyspace_events(redis_client: redis.Redis, server: Tuple) -> None:
+    """
+    Purpose:
+        Releases a use of the keyspace notification settings of a Redis server,
+        restoring the original settings once there are no more uses
+    Args:
+        redis_client: Client of the Redis server
+        server: Redis server whose keyspace notification settings were in use
+    Returns:
+        N/A
+    """
+    with _keyspace_events_lock:
+        users, events_to_restore = _keyspace_events_users.pop(server, (1, None))
+        if users > 1:
+            _keyspace_events_users[server] = (users - 1, events_to_restore)
+            return
+        if events_to_restore is None:
+            return
+        try:
+            redis_client.config_set("notify-keyspace-events", events_to_restore)
+            redis_client.delete(KEYSPACE_EVENTS_TO_RESTORE_KEY)
+        except Exception as err:
+            logger.debug(f"Unable to restore keyspace notifications: {err}")
+
+
 class RaceNodeInterface:
     """Interface for interacting with RACE nodes through a Redis client"""
 
@@ -85,6 +262,8 @@ class RaceNodeInterface:
         self.redis_client = redis_utils.create_redis_client(redis_host)
         if not self.redis_client:
             raise error_utils.RIB407()
+        # Action batch currently being queued by each thread
+        self._batches = threading.local()
 
     ###
     # Properties
@@ -139,39 +318,14 @@ class RaceNodeInterface:
 
         # if redis is not running, we can report the node as down
         if not self.connected:
-            return {
-                "installed": False,
-                "configsPresent": False,
-                "deployment": "",
-                "timestamp": "",
-                "is_alive": False,
-                "dnsSuccessful": False,
-                "nodePlatform": "",
-                "nodeArchitecture": "",
-            }
+            return self._get_unreachable_daemon_status()
 
         try:
-            status_str = self.redis_client.get(f"{BASE_NODE_STATUS_KEY}{persona}")
-            if not status_str:
-                status = {
-                    "installed": False,
-                    "configsPresent": False,
-                    "deployment": "",
-                    "timestamp": "",
-                    "dnsSuccessful": False,
-                    "nodePlatform": "",
-                    "nodeArchitecture": "",
-                }
-            else:
-                status = json.loads(status_str)
-
-            is_alive_str = self.redis_client.get(f"{BASE_NODE_IS_ALIVE_KEY}{persona}")
-            if not is_alive_str:
-                is_alive_str = "false"
-            status["is_alive"] = is_alive_str.lower() == "true"
-
-            logger.trace(f"Node status for {persona}: {status}")
-            return status
+            return self._parse_daemon_status(
+                persona,
+                self.redis_client.get(f"{BASE_NODE_STATUS_KEY}{persona}"),
+                self.redis_client.get(f"{BASE_NODE_IS_ALIVE_KEY}{persona}"),
+            )
 
         except Exception as err:
             logger.warning(f"Error getting node status for {persona}: {err}")
@@ -187,31 +341,299 @@ class RaceNodeInterface:
             App status details
         """
         try:
-            status_str = self.redis_client.get(f"{BASE_APP_STATUS_KEY}{persona}")
-            if not status_str:
-                status = {
-                    "timestamp": "",
-                    "sdkStatus": "",
-                }
-            else:
-                status = json.loads(status_str)
-
-            is_alive_str = self.redis_client.get(f"{BASE_APP_IS_ALIVE_KEY}{persona}")
-            if not is_alive_str:
-                is_alive_str = "false"
-            status["is_alive"] = is_alive_str.lower() == "true"
-
-            logger.trace(f"App status for {persona}: {status}")
-            return status
+            return self._parse_app_status(
+                persona,
+                self.redis_client.get(f"{BASE_APP_STATUS_KEY}{persona}"),
+                self.redis_client.get(f"{BASE_APP_IS_ALIVE_KEY}{persona}"),
+            )
 
         except Exception as err:
             # logger.warning(f"Error getting app status for {persona}: {err}")
             raise error_utils.RIB409(persona, str(err))
 
+    def get_status_for_personas(
+        self, personas: Iterable[str]
+    ) -> Dict[str, NodeStatusDetails]:
+        """
+        Purpose:
+            Get daemon and app status for all specified nodes. Connectivity is
+            checked once and all status keys are fetched with pipelined MGETs, so
+            the number of round trips to Redis does not grow with the number of
+            nodes.
+
+            Status details for a node whose keys could not be parsed will contain
+            `is_error: True` rather than failing the entire request.
+        Args:
+            personas: RACE node personas
+        Returns:
+            Dictionary of personas to daemon and app status details
+        Raises:
+            error_utils.RIB408: if unable to retrieve the status keys from Redis
+        """
+
+        personas = list(personas)
+        if not personas:
+            return {}
+
+        # if redis is not running, we can report all nodes as down
+        if not self.connected:
+            return {
+                persona: {
+                    "daemon": self._get_unreachable_daemon_status(),
+                    "app": self._parse_app_status(persona, None, None),
+                }
+                for persona in personas
+            }
+
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for batch_start in range(0, len(personas), STATUS_MGET_BATCH_SIZE):
+                keys = []
+                for persona in personas[
+                    batch_start : batch_start + STATUS_MGET_BATCH_SIZE
+                ]:
+                    keys.extend(
+                        [
+                            f"{BASE_NODE_STATUS_KEY}{persona}",
+                            f"{BASE_NODE_IS_ALIVE_KEY}{persona}",
+                            f"{BASE_APP_STATUS_KEY}{persona}",
+                            f"{BASE_APP_IS_ALIVE_KEY}{persona}",
+                        ]
+                    )
+                pipeline.mget(keys)
+            values = [value for batch in pipeline.execute() for value in batch]
+        except Exception as err:
+            logger.warning(
+                f"Error getting node status for {len(personas)} nodes: {err}"
+            )
+            raise error_utils.RIB408(f"{len(personas)} nodes", str(err))
+
+        statuses = {}
+        for index, persona in enumerate(personas):
+            (
+                node_status_str,
+                node_is_alive_str,
+                app_status_str,
+                app_is_alive_str,
+            ) = values[index * 4 : (index + 1) * 4]
+
+            try:
+                daemon_status = self._parse_daemon_status(
+                    persona, node_status_str, node_is_alive_str
+                )
+            except Exception as err:
+                logger.warning(f"Error getting node status for {persona}: {err}")
+                daemon_status = {"is_error": True}
+
+            try:
+                app_status = self._parse_app_status(
+                    persona, app_status_str, app_is_alive_str
+                )
+            except Exception:
+                app_status = {"is_error": True}
+
+            statuses[persona] = {"daemon": daemon_status, "app": app_status}
+
+        return statuses
+
     ###
     # Active Deployments
     ###
 
+    @contextlib.contextmanager
+    def batch_actions(self) -> Iterator[ActionBatch]:
+        """
+        Purpose:
+            Queues all action commands sent by the current thread within the context
+            and publishes them in a single Redis pipeline when the context exits.
+            Errors publishing the actions are recorded in the batch's errors instead
+            of being raised. Nested batches are queued into the outermost batch.
+        Args:
+            N/A
+        Returns:
+            Action batch
+        Example:
+            ```
+            with race_node_interface.batch_actions() as batch:
+                for persona in personas:
+                    race_node_interface.start_app(persona)
+            failed_to_start = batch.errors
+            ```
+        """
+        batch = getattr(self._batches, "current", None)
+        if batch is not None:
+            yield batch
+            return
+
+        batch = ActionBatch()
+        self._batches.current = batch
+        try:
+            yield batch
+        finally:
+            self._batches.current = None
+        batch.errors.update(
+            self.send_action_commands(batch.actions, error_keys=batch.error_keys)
+        )
+
+    def send_action_commands(
+        self,
+        actions: Iterable[Tuple[str, Dict]],
+        error_keys: Optional[List[str]] = None,
+    ) -> Dict[str, Exception]:
+        """
+        Purpose:
+            Sends action commands to RACE nodes in a single Redis pipeline
+        Args:
+            actions: (persona, action) commands to be sent
+            error_keys: Key under which to report an error for each action (if
+                None, errors are reported by persona)
+        Return:
+            Errors publishing the actions, by error key (empty if all were published)
+        """
+        actions = list(actions)
+        if not actions:
+            return {}
+        if error_keys is None:
+            error_keys = [persona for persona, _ in actions]
+
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for persona, action in actions:
+                channel = f"{BASE_ACTIONS_CHANNEL}{persona}"
+                action_str = json.dumps(action)
+                logger.trace(f"Publishing {action_str} to {channel}")
+                pipeline.publish(channel, action_str)
+            results = pipeline.execute(raise_on_error=False)
+        except Exception as err:
+            results = [err] * len(actions)
+
+        errors = {}
+        for (persona, action), error_key, result in zip(actions, error_keys, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Error publishing action to {persona}: {action}: {result}"
+                )
+                errors[error_key] = error_utils.RIB410(
+                    persona, action.get("type", ""), str(result)
+                )
+        return errors
+
+    def subscribe_to_status_changes(self) -> Optional[StatusChangeSubscription]:
+        """
+        Purpose:
+            Subscribes to changes of the status keys of all nodes, enabling Redis
+            keyspace notifications if they aren't already. The notification
+            settings are restored once all subscriptions are closed. If a previous
+            process changed the settings but exited without restoring them, they
+            are restored once this process's subscriptions are closed instead
+        Args:
+            N/A
+        Returns:
+            Subscription to wait on with get_personas_with_status_changes, or None
+            if keyspace notifications are unavailable
+        """
+        connection_kwargs = self.redis_client.connection_pool.connection_kwargs
+        server = (connection_kwargs.get("host"), connection_kwargs.get("port"))
+        db = connection_kwargs.get("db", 0)
+        try:
+            with _keyspace_events_lock:
+                users, events_to_restore = _keyspace_events_users.get(server, (0, None))
+                if not users:
+                    current_events = self.redis_client.config_get(
+                        "notify-keyspace-events"
+                    ).get("notify-keyspace-events", "")
+                    # Settings left changed by a process that didn't restore them
+                    events_to_restore = self.redis_client.get(
+                        KEYSPACE_EVENTS_TO_RESTORE_KEY
+                    )
+                    # A is an alias for all event types, including $, g and x
+                    missing_events = "".join(
+                        event
+                        for event in STATUS_KEYSPACE_EVENTS
+                        if event not in current_events
+                        and not (event not in "KE" and "A" in current_events)
+                    )
+                    if missing_events:
+                        if events_to_restore is None:
+                            events_to_restore = current_events
+                            # Recorded first so the change can't go unrestored
+                            self.redis_client.set(
+                                KEYSPACE_EVENTS_TO_RESTORE_KEY, current_events
+                            )
+                        self.redis_client.config_set(
+                            "notify-keyspace-events",
+                            f"{current_events}{missing_events}",
+                        )
+                _keyspace_events_users[server] = (users + 1, events_to_restore)
+        except Exception as err:
+            logger.debug(f"Unable to enable keyspace notifications: {err}")
+            return None
+
+        try:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.psubscribe(
+                *[f"__keyspace@{db}__:{prefix}*" for prefix in STATUS_KEY_PREFIXES]
+            )
+            pubsub.subscribe(
+                *[f"__keyevent@{db}__:{event}" for event in IS_ALIVE_KEY_EVENTS]
+            )
+        except Exception as err:
+            logger.debug(f"Unable to subscribe to node status changes: {err}")
+            _release_keyspace_events(self.redis_client, server)
+            return None
+
+        return StatusChangeSubscription(pubsub, self.redis_client, server)
+
+    @staticmethod
+    def get_personas_with_status_changes(
+        subscription: StatusChangeSubscription, timeout: float
+    ) -> Set[str]:
+        """
+        Purpose:
+            Waits for any node's status keys to change
+        Args:
+            subscription: Subscription created by subscribe_to_status_changes
+            timeout: Max time in seconds to wait for a change
+        Returns:
+            Personas of all nodes whose status keys changed (empty if none changed
+            before the timeout)
+        """
+
+        def get_persona(message: Dict) -> Optional[str]:
+            if message["channel"].startswith("__keyevent@"):
+                # Channel is __keyevent@<db>__:<event>, data is the key
+                key, prefixes = message["data"], IS_ALIVE_KEY_PREFIXES
+            else:
+                # Channel is __keyspace@<db>__:<key>
+                key, prefixes = message["channel"].split(":", 1)[-1], (
+                    STATUS_KEY_PREFIXES
+                )
+            for prefix in prefixes:
+                if key.startswith(prefix):
+                    return key[len(prefix) :]
+            return None
+
+        personas = set()
+        deadline = time.monotonic() + timeout
+        while not personas:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            message = subscription.get_message(timeout=remaining)
+            if message:
+                personas.add(get_persona(message))
+                # Ignore notifications for keys other than status keys
+                personas.discard(None)
+
+        # Collect all other changes that have already been received
+        message = subscription.get_message()
+        while message:
+            personas.add(get_persona(message))
+            message = subscription.get_message()
+
+        personas.discard(None)
+        return personas
+
     def set_active_deployment(self, deployment_name: str) -> None:
         """
         Purpose:
@@ -875,6 +1297,90 @@ class RaceNodeInterface:
     # Internal helper functions
     ###
 
+    @staticmethod
+    def _get_unreachable_daemon_status() -> DaemonStatusDetails:
+        """
+        Purpose:
+            Get the daemon status to report for a node when Redis is unreachable
+        Args:
+            N/A
+        Return:
+            Daemon status details
+        """
+        return {
+            "installed": False,
+            "configsPresent": False,
+            "deployment": "",
+            "timestamp": "",
+            "is_alive": False,
+            "dnsSuccessful": False,
+            "nodePlatform": "",
+            "nodeArchitecture": "",
+        }
+
+    @staticmethod
+    def _parse_daemon_status(
+        persona: str, status_str: Optional[str], is_alive_str: Optional[str]
+    ) -> DaemonStatusDetails:
+        """
+        Purpose:
+            Build the daemon status for a node from its raw Redis values
+        Args:
+            persona: RACE node persona
+            status_str: Value of the node status key (JSON)
+            is_alive_str: Value of the node is-alive key
+        Return:
+            Daemon status details
+        """
+        if not status_str:
+            status = {
+                "installed": False,
+                "configsPresent": False,
+                "deployment": "",
+                "timestamp": "",
+                "dnsSuccessful": False,
+                "nodePlatform": "",
+                "nodeArchitecture": "",
+            }
+        else:
+            status = json.loads(status_str)
+
+        if not is_alive_str:
+            is_alive_str = "false"
+        status["is_alive"] = is_alive_str.lower() == "true"
+
+        logger.trace(f"Node status for {persona}: {status}")
+        return status
+
+    @staticmethod
+    def _parse_app_status(
+        persona: str, status_str: Optional[str], is_alive_str: Optional[str]
+    ) -> AppStatusDetails:
+        """
+        Purpose:
+            Build the app status for a node from its raw Redis values
+        Args:
+            persona: RACE node persona
+            status_str: Value of the app status key (JSON)
+            is_alive_str: Value of the app is-alive key
+        Return:
+            App status details
+        """
+        if not status_str:
+            status = {
+                "timestamp": "",
+                "sdkStatus": "",
+            }
+        else:
+            status = json.loads(status_str)
+
+        if not is_alive_str:
+            is_alive_str = "false"
+        status["is_alive"] = is_alive_str.lower() == "true"
+
+        logger.trace(f"App status for {persona}: {status}")
+        return status
+
     def _send_action_command(self, persona: str, action: Dict) -> None:
         """
         Purpose:
@@ -886,6 +1392,11 @@ class RaceNodeInterface:
         Return:
             N/A
         """
+        batch = getattr(self._batches, "current", None)
+        if batch is not None:
+            batch.add(persona, action)
+            return
+
         try:
             channel = f"{BASE_ACTIONS_CHANNEL}{persona}"
             action_str = json.dumps(action)
@@ -29,7 +29,7 @@ from typing import Optional
 
 # Local Python Library Imports
 from rib.config.config import Config
-from rib.utils import error_utils, general_utils, ssh_utils
+from rib.utils import error_utils, general_utils
 
 
 ###
@@ -541,6 +541,9 @@ def is_ssh_key_present() -> bool:
         N/A
     """
 
+    # Imported here so that loading RiB configs at CLI startup doesn't import paramiko
+    from rib.utils import ssh_utils
+
     try:
         ssh_utils.get_rib_ssh_key()
     except Exception as err:
@@ -20,15 +20,18 @@
 
 # Python Library Imports
 import click
+import codecs
 import getpass
 import logging
 import os
 import paramiko
 import pexpect
 import scp
+import select
 import socket
+import time
 import timeout_decorator
-from typing import Iterable, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple
 
 # Local Library Imports
 from rib.utils import error_utils
@@ -37,6 +40,8 @@ from rib.utils import error_utils
 logger = logging.getLogger(__name__)
 cached_ssh_keys = {}
 RIB_PRIVATE_KEY_FILE = "/root/.ssh/rib_private_key"
+SSH_RECV_BUFFER_SIZE = 64 * 1024
+SSH_SELECT_INTERVAL = 0.5
 
 
 ###
@@ -193,6 +198,7 @@ def connect_ssh_client(
     ssh_key: paramiko.pkey.PKey,
     port: int = 22,
     timeout: int = 10,
+    keepalive_interval: int = 0,
 ) -> paramiko.client.SSHClient:
     """
     Purpose:
@@ -205,6 +211,7 @@ def connect_ssh_client(
         ssh_key: obj representation of the key to use
         port: The port of the server to ssh with
         timeout: Timeout of the connection
+        keepalive_interval: Seconds between keepalive packets, or 0 to disable
     Returns:
         ssh_client: obj representation of the ssh connection
     Raises:
@@ -224,6 +231,8 @@ def connect_ssh_client(
             pkey=ssh_key,
             timeout=timeout,
         )
+        if keepalive_interval:
+            ssh_client.get_transport().set_keepalive(keepalive_interval)
     except paramiko.ssh_exception.PasswordRequiredException as _:
         # key not accepted by server
         raise error_utils.RIB006("SSH key was not accepted by server")
@@ -285,26 +294,125 @@ def check_ssh_client_connected(ssh_client: paramiko.client.SSHClient) -> bool:
 ###
 
 
+class SshOutputCapture:
+    """
+    Purpose:
+        Accumulates the raw output of one SSH channel stream (stdout or stderr).
+
+        Received bytes are appended to a single buffer and decoded once at the end.
+        When output is being printed or streamed to a line callback, chunks are also
+        decoded incrementally so multibyte characters split across reads are kept
+        intact.
+    """
+
+    def __init__(
+        self,
+        stream_name: str,
+        print_output: bool = False,
+        line_callback: Optional[Callable[[str, str], None]] = None,
+    ) -> None:
+        """
+        Purpose:
+            Initialize the capture
+        Args:
+            stream_name: Name of the captured stream, passed to the line callback
+            print_output: Print output to the local terminal as it is received
+            line_callback: Called with (stream name, line) for each complete line
+        Return:
+            N/A
+        """
+        self.stream_name = stream_name
+        self.print_output = print_output
+        self.line_callback = line_callback
+        self._buffer = bytearray()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial_line = ""
+
+    def feed(self, data: bytes) -> None:
+        """
+        Purpose:
+            Add received bytes to the capture
+        Args:
+            data: Received bytes
+        Return:
+            N/A
+        """
+        self._buffer += data
+        if self.print_output or self.line_callback:
+            self._emit(self._decoder.decode(data))
+
+    def finish(self) -> None:
+        """
+        Purpose:
+            Flush any partially-decoded character or unterminated line at end of stream
+        Args:
+            N/A
+        Return:
+            N/A
+        """
+        if self.print_output or self.line_callback:
+            self._emit(self._decoder.decode(b"", final=True))
+            if self._partial_line and self.line_callback:
+                self.line_callback(self.stream_name, self._partial_line)
+            self._partial_line = ""
+
+    def lines(self) -> List[str]:
+        """
+        Purpose:
+            Get the captured output split into lines
+        Args:
+            N/A
+        Return:
+            Captured output lines
+        """
+        return self._buffer.decode("utf-8", errors="replace").splitlines()
+
+    def _emit(self, text: str) -> None:
+        """
+        Purpose:
+            Print and/or pass complete lines of decoded text to the line callback
+        Args:
+            text: Newly decoded text
+        Return:
+            N/A
+        """
+        if not text:
+            return
+        if self.print_output:
+            print(text, end="")
+        if self.line_callback:
+            lines = (self._partial_line + text).split("\n")
+            self._partial_line = lines.pop()
+            for line in lines:
+                self.line_callback(self.stream_name, line.rstrip("\r"))
+
+
 def run_ssh_command(
     ssh_client: paramiko.client.SSHClient,
     command: str,
     timeout: int = 60,
     print_stdout: bool = False,
     check_exit_status: bool = False,
+    line_callback: Optional[Callable[[str, str], None]] = None,
 ) -> Tuple[Iterable[str], Iterable[str]]:
     """
     Purpose:
-        Disconnect from the remote server
+        Run a command on the remote server.
+
+        Stdout and stderr are drained together as data arrives so a busy stderr cannot
+        fill the channel window and stall the remote process.
     Args:
         ssh_client (paramiko.client.SSHClient): Object representation of the ssh
             connection.
         command: Command to run on the remote server.
-        timeout: How long to wait (in seconds) for the command to
-            complete. Defaults to 60 seconds.
+        timeout: How long to wait (in seconds) for the command to produce
+            output or complete. Defaults to 60 seconds.
         print_stdout: Flag to enable printing stdout of the command to
             stdout of the local terminal. Defaults to False.
         check_exit_status: Flag to enable raising an exception if the
             command returns a non-zero exit code. Defaults to False.
+        line_callback: Called with ("stdout" or "stderr", line) for each line of
+            output as it is received. Defaults to None.
     Returns:
         Tuple[Iterable[str], Iterable[str]]: stdout and stderr of the command.
     Raises:
@@ -312,8 +420,8 @@ def run_ssh_command(
         error_utils.RIB006: An unkown error occurred while running the command.
     """
 
-    stdout = ""
-    stderr = ""
+    stdout = SshOutputCapture("stdout", print_stdout, line_callback)
+    stderr = SshOutputCapture("stderr", print_stdout, line_callback)
     try:
         ssh_channel = ssh_client.get_transport().open_session()
         ssh_channel.settimeout(timeout)
@@ -322,27 +430,38 @@ def run_ssh_command(
         # ssh_channel.set_combine_stderr(True)
         ssh_channel.exec_command(command)
 
-        RECV_BUFFER_SIZE = 128
+        last_activity = time.monotonic()
         while True:
-            output_data = ssh_channel.recv(RECV_BUFFER_SIZE)
-            if not output_data:
+            select.select([ssh_channel], [], [], SSH_SELECT_INTERVAL)
+
+            received = False
+            while ssh_channel.recv_ready():
+                stdout.feed(ssh_channel.recv(SSH_RECV_BUFFER_SIZE))
+                received = True
+            while ssh_channel.recv_stderr_ready():
+                stderr.feed(ssh_channel.recv_stderr(SSH_RECV_BUFFER_SIZE))
+                received = True
+
+            if received:
+                last_activity = time.monotonic()
+            elif (
+                ssh_channel.exit_status_ready()
+                and not ssh_channel.recv_ready()
+                and not ssh_channel.recv_stderr_ready()
+            ):
                 break
-            output_data_str = output_data.decode("utf-8")
-            if print_stdout:
-                print(output_data_str, end="")
-            stdout += output_data_str
+            elif time.monotonic() - last_activity > timeout:
+                raise socket.timeout(f"no output for {timeout} seconds")
 
-        while True:
-            output_data = ssh_channel.recv_stderr(RECV_BUFFER_SIZE)
-            if not output_data:
-                break
-            output_data_str = output_data.decode("utf-8")
-            if print_stdout:
-                print(output_data_str, end="")
-            stderr += output_data_str
+        stdout.finish()
+        stderr.finish()
 
         if check_exit_status and ssh_channel.recv_exit_status() != 0:
-            raise Exception(f"failed to run ssh command: {command}\n{stdout}\n{stderr}")
+            raise Exception(
+                "failed to run ssh command: {}\n{}\n{}".format(
+                    command, "\n".join(stdout.lines()), "\n".join(stderr.lines())
+                )
+            )
     except paramiko.buffered_pipe.PipeTimeout as err:
         raise error_utils.RIB006(f"ssh command: timed out: {err}") from None
     except socket.timeout as err:
@@ -350,7 +469,7 @@ def run_ssh_command(
     except Exception as err:
         raise error_utils.RIB006(err) from None
 
-    return (stdout.splitlines(), stderr.splitlines())
+    return (stdout.lines(), stderr.lines())
 
 
 ###
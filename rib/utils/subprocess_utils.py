@@ -19,8 +19,10 @@ Purpose:
 """
 
 # Python Library Imports
+import contextvars
 import logging
 import os
+import signal
 import subprocess
 import threading
 from typing import Optional
@@ -45,6 +47,8 @@ class LogPipe(threading.Thread):
         self.fdRead, self.fdWrite = os.pipe()
         self.reader = os.fdopen(self.fdRead)
         self.buffer = [] if capture else None
+        # Record output in the context of the thread that started the command
+        self.context = contextvars.copy_context()
         self.start()
 
     def fileno(self):
@@ -53,6 +57,10 @@ class LogPipe(threading.Thread):
 
     def run(self):
         """Reads from the pipe and records with the logger"""
+        self.context.run(self._read)
+
+    def _read(self):
+        """Reads lines from the pipe until it is closed"""
         for line in iter(self.reader.readline, ""):
             self.logger.log(self.level, line.strip("\n"))
             if self.buffer is not None:
@@ -72,6 +80,26 @@ class LogPipe(threading.Thread):
         pass
 
 
+def _kill_process_tree(proc: subprocess.Popen, process_group: bool) -> None:
+    """
+    Purpose:
+        Kills the given process and, if it leads its own process group, every process
+        in that group
+    Args:
+        proc: Process to be killed
+        process_group: Whether the process was started in its own process group
+    Returns:
+        N/A
+    """
+    if process_group:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            # Every process in the group has already exited
+            pass
+    proc.kill()
+
+
 def run(
     *args,
     capture_output: bool = False,
@@ -94,7 +122,8 @@ def run(
         logger: Logger to use for logging stdout and stderr
         stderr_level: Log level to use for stderr
         stdout_level: Log level to use for stdout
-        timeout: Number of seconds to allow the command to run before timing out
+        timeout: Number of seconds to allow the command to run before timing out (the
+            command and every process it spawned are then killed)
         kwargs: Keyword args forwarded to the subprocess.Popen constructor
     Returns:
         Completed process
@@ -114,9 +143,19 @@ def run(
         stderr_pipe = LogPipe(logger, stderr_level, capture=capture_output)
         stderr = stderr_pipe
 
+    # Run timed commands in their own process group so that a timeout kills every
+    # process they spawned (e.g. the children of a `sh -c` wrapper)
+    new_session = kwargs.setdefault("start_new_session", timeout is not None)
+
     try:
         proc = subprocess.Popen(*args, stderr=stderr, stdout=stdout, **kwargs)
-        stdout_data, stderr_data = proc.communicate(timeout=timeout)
+        try:
+            stdout_data, stderr_data = proc.communicate(timeout=timeout)
+        except BaseException:
+            # Don't leave the timed out (or interrupted) process running
+            _kill_process_tree(proc, process_group=new_session)
+            proc.communicate()
+            raise
         if check and proc.returncode:
             raise subprocess.CalledProcessError(
                 proc.returncode, proc.args, output=proc.stdout, stderr=proc.stderr
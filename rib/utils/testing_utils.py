@@ -22,13 +22,14 @@
 from copy import deepcopy
 import warnings
 from opensearchpy import OpenSearch as Elasticsearch
+from opensearchpy import OpenSearchException as ElasticsearchException
 from opensearchpy.exceptions import OpenSearchWarning as ElasticsearchWarning
 import click
 import json
 import logging
 import time
 from dataclasses import asdict, dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from rib.deployment.rib_aws_deployment import RibAwsDeployment
 
 # Local Python Library Imports
@@ -45,6 +46,16 @@ from rib.utils import error_utils, general_utils, elasticsearch_utils, status_ut
 logger = logging.getLogger(__name__)
 
 
+###
+# Constants
+###
+
+
+# Spans are indexed by Elasticsearch some time after they start, so each incremental
+# evaluation query re-reads this many milliseconds before the latest span seen so far
+EVALUATION_QUERY_OVERLAP_MILLIS = 30_000
+
+
 ###
 # Custom Dataclasses
 ###
@@ -1169,6 +1180,172 @@ class RaceTest:
             print_single_test_case_report(test_result_to_print=test_result)
 
 
+###
+# Message Test Evaluation
+###
+
+
+class MessageMatchCounter:
+    """
+    Purpose:
+        Incrementally matches sendMessage/receiveMessage spans for a messages test,
+        keeping per sender/recipient pair match counts across evaluation polls so that
+        each poll only has to process the spans that are new since the previous one
+    """
+
+    def __init__(
+        self,
+        test_id: str,
+        recipient_sender_mapping: Dict[str, List[str]],
+        expected_message_size: Optional[int] = None,
+    ) -> None:
+        """
+        Purpose:
+            Initialize the counter
+        Args:
+            test_id: Test ID set for messages
+            recipient_sender_mapping: mapping of sender/receiver pairs
+            expected_message_size: expected size of messages (used for auto messages only)
+        Returns:
+            N/A
+        """
+        self.test_id = test_id
+        self.recipients = set(recipient_sender_mapping.keys())
+        self.expected_message_size = expected_message_size
+        self.latest_start_time_millis: Optional[int] = None
+        self._msg_count: Dict[str, int] = {}  # {"sender->recipient": msg count}
+        # Spans of traces whose send/receive pair has not matched yet
+        self._trace_id_to_span: Dict[str, List[elasticsearch_utils.MessageSpan]] = {}
+        # {(trace id, span id, source persona): span start time in milliseconds}
+        self._seen_spans: Dict[Tuple[str, str, str], int] = {}
+
+    def add_spans(self, spans: Iterable[elasticsearch_utils.MessageSpan]) -> None:
+        """
+        Purpose:
+            Add message spans to the counter. Spans that have already been added are
+            ignored, so overlapping query results may be safely added.
+
+            Spans older than the query overlap window are forgotten, as they cannot be
+            returned by the next incremental query, and traces are forgotten as soon as
+            their send/receive pair has matched.
+        Args:
+            spans: Message spans to add
+        Returns:
+            N/A
+        """
+        for span in spans:
+            span_key = (span["trace_id"], span["span_id"], span["source_persona"])
+            if span_key in self._seen_spans:
+                continue
+            start_time_millis = int(span["start_time"]) // 1000
+            self._seen_spans[span_key] = start_time_millis
+
+            if (
+                self.latest_start_time_millis is None
+                or start_time_millis > self.latest_start_time_millis
+            ):
+                self.latest_start_time_millis = start_time_millis
+
+            if span.get("messageTestId") != self.test_id:
+                continue
+
+            # Each receive/send pair is counted once, when the later of the two spans
+            # is added
+            trace_spans = self._trace_id_to_span.setdefault(span["trace_id"], [])
+            trace_spans.append(span)
+            is_trace_matched = False
+            for other_span in trace_spans:
+                if self._is_match(receive_span=span, send_span=other_span):
+                    self._add_match(span)
+                    is_trace_matched = True
+                if other_span is not span and self._is_match(
+                    receive_span=other_span, send_span=span
+                ):
+                    self._add_match(other_span)
+                    is_trace_matched = True
+            if is_trace_matched:
+                del self._trace_id_to_span[span["trace_id"]]
+
+        self._prune_seen_spans()
+
+    def get_count(self, sender: str, recipient: str) -> int:
+        """
+        Purpose:
+            Get the number of matched messages between the given sender and recipient
+        Args:
+            sender: Sender persona
+            recipient: Recipient persona
+        Returns:
+            Number of matched messages
+        """
+        return self._msg_count.get(f"{sender}->{recipient}", 0)
+
+    def _prune_seen_spans(self) -> None:
+        """
+        Purpose:
+            Forget spans that started before the overlap window of the next incremental
+            query, since that query cannot return them again
+        Args:
+            N/A
+        Returns:
+            N/A
+        """
+        if self.latest_start_time_millis is None:
+            return
+        cutoff_millis = self.latest_start_time_millis - EVALUATION_QUERY_OVERLAP_MILLIS
+        self._seen_spans = {
+            span_key: start_time_millis
+            for span_key, start_time_millis in self._seen_spans.items()
+            if start_time_millis >= cutoff_millis
+        }
+
+    def _is_match(
+        self,
+        receive_span: elasticsearch_utils.MessageSpan,
+        send_span: elasticsearch_utils.MessageSpan,
+    ) -> bool:
+        """
+        Purpose:
+            Check if the given spans are the receiveMessage span created on a recipient
+            node and the matching sendMessage span created on the sender node
+        Args:
+            receive_span: Candidate receiveMessage span
+            send_span: Candidate sendMessage span
+        Returns:
+            True if the spans match
+        """
+        if (
+            receive_span["source_persona"] not in self.recipients
+            or receive_span["messageTo"] != receive_span["source_persona"]
+        ):
+            return False
+        if send_span["source_persona"] != receive_span["messageFrom"]:
+            return False
+        if send_span["messageHash"] != receive_span["messageHash"]:
+            # confirm message hash is the same on send/receive spans
+            return False
+        if (
+            self.expected_message_size
+            and int(send_span["messageSize"]) != self.expected_message_size
+        ):
+            # for auto messages check the size
+            return False
+        return True
+
+    def _add_match(self, receive_span: elasticsearch_utils.MessageSpan) -> None:
+        """
+        Purpose:
+            Add a matched message to the count for its sender/recipient pair
+        Args:
+            receive_span: receiveMessage span of the matched message
+        Returns:
+            N/A
+        """
+        message_key = f"{receive_span['messageFrom']}->{receive_span['source_persona']}"
+        self._msg_count.setdefault(message_key, 0)
+        self._msg_count[message_key] += 1
+
+
 ###
 # General Utility Functions
 ###
@@ -1249,80 +1426,62 @@ def evaluate_messages_test(
 
     warnings.filterwarnings("ignore", category=ElasticsearchWarning)
     es = Elasticsearch(elasticsearch_host_name)
-    query = elasticsearch_utils.create_query(
-        actions=["sendMessage", "receiveMessage"],
-        # We need to search 5+ seconds prior to first send because of
-        # the Android timing bug RACE2-2211
-        time_range=[["gt", f"{start_time - 5000}"]],
-        range_name=range_name,
+    # We need to search 5+ seconds prior to first send because of
+    # the Android timing bug RACE2-2211
+    earliest_query_time = start_time - 5000
+    message_match_counter = MessageMatchCounter(
+        test_id=test_id,
+        recipient_sender_mapping=recipient_sender_mapping,
+        expected_message_size=expected_message_size,
     )
 
     end_time = (start_time / 1000) + run_time
 
     is_test_over = False
     while not is_test_over:
-        msg_count = {}  # {"sender->recipient": msg count}
         is_test_over = time.time() > end_time
         temp_test_result = deepcopy(test_result)
-        # Query elasticsearch for new traces
-        results = elasticsearch_utils.do_query(es=es, query=query)
-        spans = elasticsearch_utils.get_spans(es, results)
-        (
-            source_persona_to_span,
-            trace_id_to_span,
-        ) = elasticsearch_utils.get_message_spans(spans)
 
+        # Query elasticsearch only for traces that are new since the last query
+        query_time = earliest_query_time
+        if message_match_counter.latest_start_time_millis is not None:
+            query_time = max(
+                earliest_query_time,
+                message_match_counter.latest_start_time_millis
+                - EVALUATION_QUERY_OVERLAP_MILLIS,
+            )
+        query = elasticsearch_utils.create_query(
+            actions=["sendMessage", "receiveMessage"],
+            time_range=[["gt", f"{query_time}"]],
+            range_name=range_name,
+            test_id=test_id,
+        )
+        spans = elasticsearch_utils.stream_spans(
+            es, query, source_fields=elasticsearch_utils.MESSAGE_SPAN_SOURCE_FIELDS
+        )
+        try:
+            (_, trace_id_to_span) = elasticsearch_utils.get_message_spans(spans)
+        except ElasticsearchException as err:
+            print(f"Search error: {err}")
+            trace_id_to_span = {}
+        for trace_spans in trace_id_to_span.values():
+            message_match_counter.add_spans(trace_spans)
+
+        # Verify expected message count for each sender->receiver pair
         for recipient, senders in recipient_sender_mapping.items():
-            # spans_from_recipient_node include sendMessage and receiveMessage spans from multiple
-            # tests
-            spans_from_recipient_node = source_persona_to_span.get(recipient, [])
-
-            for receive_span in spans_from_recipient_node:
-                if (
-                    receive_span["messageTestId"] != test_id
-                    or receive_span["messageTo"] != recipient
-                ):
-                    # filter spans so we are left with receiveMessage from this test created on
-                    # the recipient persona only
-                    continue
-                # There should be 2 spans with matching trace ids, the receiveMessage span from the
-                # recipient and the sendMessage span from the sender
-                matching_trace_spans = trace_id_to_span.get(
-                    receive_span["trace_id"], []
-                )
-                for span in matching_trace_spans:
-                    if span["source_persona"] != receive_span["messageFrom"]:
-                        # ignore the receiveMessage span we got the trace id from earlier
-                        continue
-                    if span["messageHash"] != receive_span["messageHash"]:
-                        # confirm message hash is the same on send/receive spans
-                        continue
-                    if (
-                        expected_message_size
-                        and int(span["messageSize"]) != expected_message_size
-                    ):
-                        # for auto messages check the size
-                        continue
-                    # sender span found for given receive span, add to message count for
-                    # sender/receiver pair
-                    message_key = f"{receive_span['messageFrom']}->{recipient}"
-                    msg_count.setdefault(message_key, 0)
-                    msg_count[message_key] += 1
-
-            # Verify expected message count for sender->receiver pair now that all spans for the
-            # receiver have been acounted for
             for sender in senders:
                 message_key = f"{sender}->{recipient}"
+                actual_message_matches = message_match_counter.get_count(
+                    sender=sender, recipient=recipient
+                )
                 temp_test_result.total += 1
                 if (
-                    msg_count.get(message_key)
-                    and msg_count[message_key] == expected_message_count
+                    actual_message_matches
+                    and actual_message_matches == expected_message_count
                 ):
                     temp_test_result.passed += 1
                 else:
                     temp_test_result.failed += 1
-                    msg_count.setdefault(message_key, 0)
-                    actual_message_matches = msg_count[message_key]
                     temp_test_result.failed_expectations.append(
                         f"{message_key}: msg count: expected {expected_message_count}, "
                         f"actual {actual_message_matches}"
@@ -1330,7 +1489,7 @@ def evaluate_messages_test(
 
         # End test if all passed or if time is up
         if is_test_over or temp_test_result.total == temp_test_result.passed:
-            test_result = deepcopy(temp_test_result)
+            test_result = temp_test_result
             break
         time.sleep(evaluation_interval)
 
@@ -149,3 +149,392 @@ def test_get_message_spans():
     result = elasticsearch_utils.get_message_spans(sample_input)
 
     assert result == expected_output
+
+
+def test_create_query_filters_on_message_tags():
+    query = elasticsearch_utils.create_query(
+        actions=["sendMessage", "receiveMessage"],
+        sender="race-client-00001",
+        recipient="race-client-00002",
+        test_id="default",
+    )
+
+    must = query["query"]["bool"]["must"]
+    assert (
+        elasticsearch_utils.create_tag_query("messageFrom", "race-client-00001") in must
+    )
+    assert (
+        elasticsearch_utils.create_tag_query("messageTo", "race-client-00002") in must
+    )
+    assert elasticsearch_utils.create_tag_query("messageTestId", "default") in must
+
+
+def _create_summary_bucket(trace_id, operations, tags):
+    return {
+        "key": {"trace_id": trace_id},
+        "operations": {
+            "buckets": [
+                {"key": operation, "start_time": {"value": start_time}}
+                for operation, start_time in operations.items()
+            ]
+        },
+        "tags": {
+            "keys": {
+                "buckets": [
+                    {
+                        "key": key,
+                        "values": {"buckets": [{"key": value} for value in values]},
+                    }
+                    for key, values in tags.items()
+                ]
+            }
+        },
+    }
+
+
+def test_parse_message_trace_summary_received():
+    bucket = _create_summary_bucket(
+        "trace-1",
+        {"sendMessage": 1_000_000, "receiveMessage": 3_500_000},
+        {
+            "messageFrom": ["race-client-00001"],
+            "messageTo": ["race-client-00002"],
+            "messageTestId": ["default"],
+            "messageHash": ["abc"],
+            "messageSize": ["13"],
+        },
+    )
+
+    summary = elasticsearch_utils.parse_message_trace_summary(bucket)
+
+    assert summary == elasticsearch_utils.MessageTraceSummary(
+        trace_id="trace-1",
+        status=elasticsearch_utils.MessageStatus.RECEIVED,
+        sender="race-client-00001",
+        recipient="race-client-00002",
+        test_id="default",
+        total_time=2.5,
+    )
+
+
+def test_parse_message_trace_summary_corrupted():
+    bucket = _create_summary_bucket(
+        "trace-1",
+        {"sendMessage": 1_000_000, "receiveMessage": 3_500_000},
+        {"messageHash": ["abc", "def"], "messageSize": ["13"]},
+    )
+
+    summary = elasticsearch_utils.parse_message_trace_summary(bucket)
+
+    assert summary["status"] == elasticsearch_utils.MessageStatus.CORRUPTED
+
+
+def test_parse_message_trace_summary_sent_and_error():
+    sent = elasticsearch_utils.parse_message_trace_summary(
+        _create_summary_bucket("trace-1", {"sendMessage": 1_000_000}, {})
+    )
+    error = elasticsearch_utils.parse_message_trace_summary(
+        _create_summary_bucket("trace-2", {"receiveMessage": 1_000_000}, {})
+    )
+
+    assert sent["status"] == elasticsearch_utils.MessageStatus.SENT
+    assert sent["total_time"] is None
+    assert error["status"] == elasticsearch_utils.MessageStatus.ERROR
+
+
+def test_get_message_trace_summaries_pages_through_aggregation():
+    es = mock.MagicMock()
+    es.search.side_effect = [
+        {
+            "aggregations": {
+                "traces": {
+                    "after_key": {"trace_id": "trace-2"},
+                    "buckets": [
+                        _create_summary_bucket("trace-1", {"sendMessage": 1}, {}),
+                        _create_summary_bucket("trace-2", {"sendMessage": 1}, {}),
+                    ],
+                }
+            }
+        },
+        {
+            "aggregations": {
+                "traces": {
+                    "after_key": {"trace_id": "trace-3"},
+                    "buckets": [
+                        _create_summary_bucket("trace-3", {"sendMessage": 1}, {}),
+                    ],
+                }
+            }
+        },
+    ]
+    query = elasticsearch_utils.create_query(actions=["sendMessage"])
+
+    summaries = list(
+        elasticsearch_utils.get_message_trace_summaries(es, query, page_size=2)
+    )
+
+    assert [summary["trace_id"] for summary in summaries] == [
+        "trace-1",
+        "trace-2",
+        "trace-3",
+    ]
+    assert es.search.call_count == 2
+    second_body = es.search.call_args_list[1].kwargs["body"]
+    assert second_body["size"] == 0
+    assert second_body["aggs"]["traces"]["composite"]["after"] == {
+        "trace_id": "trace-2"
+    }
+
+
+################################################################################
+# get_search_client
+################################################################################
+
+
+@mock.patch("rib.utils.elasticsearch_utils.Elasticsearch")
+def test_get_search_client_reuses_client_per_host(mock_es):
+    mock_es.side_effect = lambda *args, **kwargs: mock.MagicMock()
+    with mock.patch.dict(elasticsearch_utils._search_clients, clear=True):
+        first = elasticsearch_utils.get_search_client("host-1")
+        assert elasticsearch_utils.get_search_client("host-1") is first
+        assert elasticsearch_utils.get_search_client("host-2") is not first
+    assert mock_es.call_count == 2
+
+
+################################################################################
+# compute_latency_percentiles
+################################################################################
+
+
+def test_compute_latency_percentiles():
+    latency = elasticsearch_utils.compute_latency_percentiles(
+        [4.0, 1.0, 3.0, 2.0], percentiles=[0, 50, 100]
+    )
+    assert latency == {
+        "count": 4,
+        "min": 1.0,
+        "max": 4.0,
+        "percentiles": {"p0": 1.0, "p50": 2.5, "p100": 4.0},
+    }
+
+
+def test_compute_latency_percentiles_when_empty():
+    latency = elasticsearch_utils.compute_latency_percentiles([], percentiles=[50])
+    assert latency == {
+        "count": 0,
+        "min": None,
+        "max": None,
+        "percentiles": {"p50": None},
+    }
+
+
+################################################################################
+# stream_spans
+################################################################################
+
+
+def _create_hit(span_id: str, sort_value: int = 0) -> dict:
+    return {"_source": {"spanID": span_id}, "sort": [sort_value, "trace", span_id]}
+
+
+def _create_search_client(point_in_time: bool = True) -> mock.MagicMock:
+    es = mock.MagicMock(spec=elasticsearch_utils.Elasticsearch)
+    if point_in_time:
+        es.create_pit.return_value = {"pit_id": "pit-1"}
+    else:
+        es.create_pit.side_effect = Exception("unsupported")
+    return es
+
+
+def test_stream_spans_pages_with_point_in_time():
+    es = _create_search_client()
+    es.search.side_effect = [
+        {
+            "pit_id": "pit-2",
+            "hits": {"hits": [_create_hit("a", 1), _create_hit("b", 1)]},
+        },
+        {"pit_id": "pit-2", "hits": {"hits": [_create_hit("c", 1)]}},
+    ]
+    query = elasticsearch_utils.create_query(actions=["sendMessage"])
+
+    spans = list(
+        elasticsearch_utils.stream_spans(
+            es, query, source_fields=["spanID"], page_size=2
+        )
+    )
+
+    assert [span["_source"]["spanID"] for span in spans] == ["a", "b", "c"]
+    es.create_pit.assert_called_once_with(
+        index=elasticsearch_utils.DEFAULT_SPAN_INDEX,
+        keep_alive=elasticsearch_utils.DEFAULT_SCROLL_SIZE,
+    )
+    first_call, second_call = es.search.call_args_list
+    assert first_call.kwargs["body"]["pit"]["id"] == "pit-1"
+    assert first_call.kwargs["body"]["sort"] == elasticsearch_utils.POINT_IN_TIME_SORT
+    assert "search_after" not in first_call.kwargs["body"]
+    assert second_call.kwargs["body"]["pit"]["id"] == "pit-2"
+    # Spans sharing a start time are told apart by the tiebreakers
+    assert second_call.kwargs["body"]["search_after"] == [1, "trace", "b"]
+    assert second_call.kwargs["_source_includes"] == ["spanID"]
+    assert "pit" not in query
+    es.scroll.assert_not_called()
+    es.delete_pit.assert_called_once_with(body={"pit_id": ["pit-1"]})
+
+
+@mock.patch("rib.utils.elasticsearch_utils.SEARCH_CLIENT_VERSION", (1, 1, 0))
+def test_stream_spans_uses_scroll_with_older_client():
+    es = _create_search_client()
+    es.search.return_value = {
+        "_scroll_id": "scroll-1",
+        "hits": {"hits": [_create_hit("a")]},
+    }
+    es.scroll.return_value = {"_scroll_id": "scroll-1", "hits": {"hits": []}}
+
+    spans = list(elasticsearch_utils.stream_spans(es, {"query": {}}))
+
+    assert [span["_source"]["spanID"] for span in spans] == ["a"]
+    es.create_pit.assert_not_called()
+    es.delete_pit.assert_not_called()
+
+
+def test_stream_spans_falls_back_to_scroll():
+    es = _create_search_client(point_in_time=False)
+    es.search.return_value = {
+        "_scroll_id": "scroll-1",
+        "hits": {"hits": [_create_hit("a")]},
+    }
+    es.scroll.side_effect = [
+        {"_scroll_id": "scroll-2", "hits": {"hits": [_create_hit("b")]}},
+        {"_scroll_id": "scroll-2", "hits": {"hits": []}},
+    ]
+
+    spans = list(elasticsearch_utils.stream_spans(es, {"query": {}}))
+
+    assert [span["_source"]["spanID"] for span in spans] == ["a", "b"]
+    assert (
+        es.search.call_args.kwargs["scroll"] == elasticsearch_utils.DEFAULT_SCROLL_SIZE
+    )
+    es.clear_scroll.assert_called_once_with(scroll_id="scroll-2")
+    es.delete_pit.assert_not_called()
+
+
+def test_stream_spans_releases_scroll_when_closed_early():
+    es = _create_search_client(point_in_time=False)
+    es.search.return_value = {
+        "_scroll_id": "scroll-1",
+        "hits": {"hits": [_create_hit("a"), _create_hit("b")]},
+    }
+
+    spans = elasticsearch_utils.stream_spans(es, {"query": {}})
+    assert next(spans)["_source"]["spanID"] == "a"
+    spans.close()
+
+    es.scroll.assert_not_called()
+    es.clear_scroll.assert_called_once_with(scroll_id="scroll-1")
+
+
+def test_stream_spans_retrieves_slices_in_parallel():
+    es = _create_search_client(point_in_time=False)
+    es.search.side_effect = lambda body, **kwargs: {
+        "_scroll_id": f"scroll-{body['slice']['id']}",
+        "hits": {"hits": [_create_hit(f"span-{body['slice']['id']}")]},
+    }
+    es.scroll.return_value = {"hits": {"hits": []}}
+
+    spans = list(elasticsearch_utils.stream_spans(es, {"query": {}}, slices=3))
+
+    assert sorted(span["_source"]["spanID"] for span in spans) == [
+        "span-0",
+        "span-1",
+        "span-2",
+    ]
+    assert sorted(
+        call.kwargs["body"]["slice"]["max"] for call in es.search.call_args_list
+    ) == [3, 3, 3]
+    assert sorted(
+        call.kwargs["scroll_id"] for call in es.clear_scroll.call_args_list
+    ) == ["scroll-0", "scroll-1", "scroll-2"]
+
+
+################################################################################
+# MessageSpanStore
+################################################################################
+
+
+def _create_raw_message_span(
+    trace_id: str, span_id: str, persona: str, start_time: int
+) -> dict:
+    tags = {
+        "messageSize": "13",
+        "messageHash": "hash",
+        "messageTestId": "test",
+        "messageFrom": "race-client-00001",
+        "messageTo": "race-client-00002",
+        "unused": "value",
+    }
+    return {
+        "_source": {
+            "traceID": trace_id,
+            "spanID": span_id,
+            "startTime": start_time,
+            "process": {"serviceName": persona},
+            "tags": [{"key": key, "value": value} for key, value in tags.items()],
+        }
+    }
+
+
+def test_message_span_store_indexes_spans():
+    store = elasticsearch_utils.MessageSpanStore()
+    store.extend(
+        [
+            _create_raw_message_span("trace-1", "span-1", "race-client-00001", 1000),
+            _create_raw_message_span("trace-1", "span-2", "race-client-00002", 3000),
+            _create_raw_message_span("trace-2", "span-3", "race-client-00001", 5000),
+        ]
+    )
+
+    assert len(store) == 3
+    assert [span["span_id"] for span in store.by_trace["trace-1"]] == [
+        "span-1",
+        "span-2",
+    ]
+    assert [span["span_id"] for span in store.by_persona["race-client-00001"]] == [
+        "span-1",
+        "span-3",
+    ]
+    send_span = store.by_trace["trace-1"][0]
+    assert send_span.messageTo is store.by_trace["trace-1"][1].source_persona
+    assert "unused" not in send_span
+    assert send_span.get("unused", "default") == "default"
+    assert send_span.to_dict() == {
+        "trace_id": "trace-1",
+        "span_id": "span-1",
+        "start_time": 1000,
+        "source_persona": "race-client-00001",
+        "messageSize": "13",
+        "messageHash": "hash",
+        "messageTestId": "test",
+        "messageFrom": "race-client-00001",
+        "messageTo": "race-client-00002",
+    }
+    with pytest.raises(KeyError):
+        elasticsearch_utils.CompactMessageSpan()["messageHash"]
+
+
+def test_get_message_traces_from_store():
+    store = elasticsearch_utils.MessageSpanStore()
+    store.extend(
+        [
+            _create_raw_message_span("trace-1", "span-1", "race-client-00001", 1000),
+            _create_raw_message_span("trace-1", "span-2", "race-client-00002", 3000),
+            _create_raw_message_span("trace-2", "span-3", "race-client-00001", 5000),
+        ]
+    )
+
+    traces = elasticsearch_utils.getMessageTraces(store)
+
+    assert [trace["status"] for trace in traces] == [
+        elasticsearch_utils.MessageStatus.RECEIVED,
+        elasticsearch_utils.MessageStatus.SENT,
+    ]
+    assert traces[0]["total_time"] == 0.002
@@ -0,0 +1,248 @@
+# Copyright 2023 Two Six Technologies
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Purpose:
+    Tests for file_server_utils.py
+"""
+
+# Python Library Imports
+import pytest
+from mock import patch
+
+# Local Library Imports
+from rib.utils import file_server_utils
+
+
+###
+# Mocks/fixtures
+###
+
+
+@pytest.fixture
+def file_server_client() -> file_server_utils.FileServerClient:
+    """
+    Purpose:
+        Creates a file server client for a mock file server
+    """
+    return file_server_utils.FileServerClient(remote_url="http://file-server")
+
+
+###
+# Tests
+###
+
+
+################################################################################
+# get_file_listing_snapshot
+################################################################################
+
+
+def test_get_file_listing_snapshot(file_server_client, requests_mock):
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz", "b.tar.gz"]})
+    assert file_server_client.get_file_listing_snapshot() == {"a.tar.gz", "b.tar.gz"}
+
+
+def test_get_file_listing_snapshot_is_reused_within_ttl(
+    file_server_client, requests_mock
+):
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz"]})
+    file_server_client.get_file_listing_snapshot()
+    file_server_client.get_file_listing_snapshot()
+    assert requests_mock.call_count == 1
+
+
+def test_get_file_listing_snapshot_is_refetched_after_ttl(
+    file_server_client, requests_mock
+):
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz"]})
+    with patch("time.monotonic", side_effect=[100.0, 100.5, 101.5, 101.5]):
+        file_server_client.get_file_listing_snapshot()
+        file_server_client.get_file_listing_snapshot()
+        file_server_client.get_file_listing_snapshot()
+    assert requests_mock.call_count == 2
+
+
+def test_get_file_listing_snapshot_is_not_cached_on_error(
+    file_server_client, requests_mock
+):
+    requests_mock.get("http://file-server", status_code=500)
+    assert file_server_client.get_file_listing_snapshot() == set()
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz"]})
+    assert file_server_client.get_file_listing_snapshot() == {"a.tar.gz"}
+
+
+def test_get_file_listing_snapshot_is_invalidated_by_upload(
+    file_server_client, requests_mock, tmp_path
+):
+    local_file = tmp_path / "b.tar.gz"
+    local_file.write_text("contents")
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz"]})
+    requests_mock.post("http://file-server/upload")
+    file_server_client.get_file_listing_snapshot()
+    file_server_client.upload_file(str(local_file))
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz", "b.tar.gz"]})
+    assert file_server_client.get_file_listing_snapshot() == {"a.tar.gz", "b.tar.gz"}
+
+
+def test_get_file_listing_snapshot_is_invalidated_by_delete(
+    file_server_client, requests_mock
+):
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz"]})
+    requests_mock.delete("http://file-server/a.tar.gz")
+    file_server_client.get_file_listing_snapshot()
+    file_server_client.delete_file("a.tar.gz")
+    requests_mock.get("http://file-server", json={"files": []})
+    assert file_server_client.get_file_listing_snapshot() == set()
+
+
+def test_get_file_listing_snapshot_is_invalidated_by_delete_all(
+    file_server_client, requests_mock
+):
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz"]})
+    requests_mock.post("http://file-server/clear")
+    file_server_client.get_file_listing_snapshot()
+    file_server_client.delete_all()
+    requests_mock.get("http://file-server", json={"files": []})
+    assert file_server_client.get_file_listing_snapshot() == set()
+
+
+def test_get_file_listing_snapshot_is_invalidated_after_upload_completes(
+    file_server_client, requests_mock, tmp_path
+):
+    local_file = tmp_path / "b.tar.gz"
+    local_file.write_text("contents")
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz"]})
+
+    def fetch_listing_during_upload(request, context):
+        # Another thread takes a snapshot while the upload is in flight
+        file_server_client.get_file_listing_snapshot()
+        return ""
+
+    requests_mock.post("http://file-server/upload", text=fetch_listing_during_upload)
+    file_server_client.upload_file(str(local_file))
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz", "b.tar.gz"]})
+    assert file_server_client.get_file_listing_snapshot() == {"a.tar.gz", "b.tar.gz"}
+
+
+def test_get_file_listing_snapshot_is_not_stored_if_invalidated_mid_fetch(
+    file_server_client, requests_mock
+):
+    def invalidate_during_fetch(request, context):
+        # Another thread modifies the file server while the listing is in flight
+        file_server_client.invalidate_file_listing()
+        return {"files": ["a.tar.gz"]}
+
+    requests_mock.get("http://file-server", json=invalidate_during_fetch)
+    assert file_server_client.get_file_listing_snapshot() == {"a.tar.gz"}
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz", "b.tar.gz"]})
+    assert file_server_client.get_file_listing_snapshot() == {"a.tar.gz", "b.tar.gz"}
+
+
+################################################################################
+# is_file_on_file_server
+################################################################################
+
+
+def test_is_file_on_file_server_with_listing(file_server_client, requests_mock):
+    assert file_server_client.is_file_on_file_server("a.tar.gz", listing={"a.tar.gz"})
+    assert not file_server_client.is_file_on_file_server(
+        "b.tar.gz", listing={"a.tar.gz"}
+    )
+    assert requests_mock.call_count == 0
+
+
+def test_is_file_on_file_server_without_listing(file_server_client, requests_mock):
+    requests_mock.get("http://file-server", json={"files": ["a.tar.gz"]})
+    assert file_server_client.is_file_on_file_server("a.tar.gz")
+    assert not file_server_client.is_file_on_file_server("b.tar.gz")
+
+
+################################################################################
+# download_file
+################################################################################
+
+
+def test_download_file(file_server_client, requests_mock, tmp_path):
+    requests_mock.get("http://file-server/a.tar.gz", content=b"contents")
+    local_file_path = tmp_path / "a.tar.gz"
+    assert file_server_client.download_file("a.tar.gz", str(local_file_path), 10)
+    assert local_file_path.read_bytes() == b"contents"
+    assert requests_mock.last_request.timeout == 10
+
+
+def test_download_file_not_found(file_server_client, requests_mock, tmp_path):
+    requests_mock.get("http://file-server/a.tar.gz", status_code=404)
+    local_file_path = tmp_path / "a.tar.gz"
+    assert not file_server_client.download_file("a.tar.gz", str(local_file_path))
+    assert not local_file_path.exists()
+
+
+################################################################################
+# upload_files
+################################################################################
+
+
+def test_upload_files(file_server_client, requests_mock, tmp_path):
+    files = []
+    for name in ["a.tar.gz", "b.tar.gz", "c.tar.gz"]:
+        (tmp_path / name).write_bytes(b"data")
+        files.append(str(tmp_path / name))
+    requests_mock.post("http://file-server/upload")
+
+    assert file_server_client.upload_files(files, max_workers=2) == {}
+    assert requests_mock.call_count == 3
+
+
+def test_upload_files_reports_errors_per_file(
+    file_server_client, requests_mock, tmp_path
+):
+    (tmp_path / "a.tar.gz").write_bytes(b"data")
+    (tmp_path / "b.tar.gz").write_bytes(b"bad")
+    # Later registrations take precedence, so rejected uploads are the fallback
+    requests_mock.post("http://file-server/upload", status_code=500)
+    requests_mock.post(
+        "http://file-server/upload",
+        additional_matcher=lambda request: b"bad" not in request.body,
+    )
+
+    errors = file_server_client.upload_files(
+        [
+            str(tmp_path / "a.tar.gz"),
+            str(tmp_path / "b.tar.gz"),
+            str(tmp_path / "missing.tar.gz"),
+        ]
+    )
+
+    assert set(errors.keys()) == {
+        str(tmp_path / "b.tar.gz"),
+        str(tmp_path / "missing.tar.gz"),
+    }
+
+
+def test_upload_files_invalidates_listing(file_server_client, requests_mock, tmp_path):
+    (tmp_path / "a.tar.gz").write_bytes(b"data")
+    requests_mock.get("http://file-server", json={"files": []})
+    requests_mock.post("http://file-server/upload")
+
+    file_server_client.get_file_listing_snapshot()
+    file_server_client.upload_files([str(tmp_path / "a.tar.gz")])
+    file_server_client.get_file_listing_snapshot()
+
+    assert [request.method for request in requests_mock.request_history] == [
+        "GET",
+        "POST",
+        "GET",
+    ]
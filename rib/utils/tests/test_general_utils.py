@@ -25,6 +25,7 @@ import os
 import pathlib
 import pytest
 import sys
+import tarfile
 from datetime import datetime
 from unittest import mock
 from unittest.mock import MagicMock, patch
@@ -466,3 +467,83 @@ def test_zip_directory(
         "top_dir/sub_dir",
         "top_dir/sub_dir/second_level_file",
     ]
+
+
+def test_write_tar_gz_segments(tmp_path: pathlib.PosixPath) -> int:
+    """
+    Purpose:
+        Test that an archive written from pre-compressed segments is a single
+        valid tar.gz, with later segments overriding earlier ones
+    Args:
+        N/A
+    """
+    node_dir = tmp_path / "node"
+    node_dir.mkdir()
+    (node_dir / "config.json").write_text("node")
+    (node_dir / "node-only.json").write_text("node-only")
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir()
+    (shared_dir / "config.json").write_text("shared")
+
+    shared_segment = general_utils.gzip_tar_members(
+        [(str(shared_dir), "data/configs")], compression_level=1
+    )
+    output_file = str(tmp_path / "configs.tar.gz")
+    general_utils.write_tar_gz_segments(
+        output_file,
+        [
+            general_utils.gzip_tar_members([(str(node_dir), "data/configs")]),
+            shared_segment,
+        ],
+    )
+
+    extract_dir = tmp_path / "extracted"
+    with tarfile.open(output_file, "r:gz") as tar:
+        tar.extractall(extract_dir)
+
+    assert (extract_dir / "data/configs/config.json").read_text() == "shared"
+    assert (extract_dir / "data/configs/node-only.json").read_text() == "node-only"
+
+
+def test_write_tar_gz_segments_empty(tmp_path: pathlib.PosixPath) -> int:
+    """
+    Purpose:
+        Test that an archive written with no segments is a valid empty tar.gz
+    Args:
+        N/A
+    """
+    output_file = str(tmp_path / "configs.tar.gz")
+    general_utils.write_tar_gz_segments(output_file, [])
+
+    with tarfile.open(output_file, "r:gz") as tar:
+        assert tar.getmembers() == []
+
+
+def test_get_directory_fingerprint(tmp_path: pathlib.PosixPath) -> int:
+    """
+    Purpose:
+        Test that a directory fingerprint only changes when the contents change
+    Args:
+        N/A
+    """
+    (tmp_path / "sub_dir").mkdir()
+    (tmp_path / "sub_dir" / "file").write_text("data")
+    os.utime(tmp_path / "sub_dir" / "file", ns=(1_000_000_000, 1_000_000_000))
+
+    fingerprint = general_utils.get_directory_fingerprint(str(tmp_path))
+    assert general_utils.get_directory_fingerprint(str(tmp_path)) == fingerprint
+
+    # Same size and mtime is only detected when including digests
+    digest_fingerprint = general_utils.get_directory_fingerprint(
+        str(tmp_path), include_digests=True
+    )
+    (tmp_path / "sub_dir" / "file").write_text("DATA")
+    os.utime(tmp_path / "sub_dir" / "file", ns=(1_000_000_000, 1_000_000_000))
+    assert general_utils.get_directory_fingerprint(str(tmp_path)) == fingerprint
+    assert (
+        general_utils.get_directory_fingerprint(str(tmp_path), include_digests=True)
+        != digest_fingerprint
+    )
+
+    (tmp_path / "sub_dir" / "new_file").write_text("")
+    assert general_utils.get_directory_fingerprint(str(tmp_path)) != fingerprint
@@ -0,0 +1,471 @@
+# Copyright 2023 Two Six Technologies
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Purpose:
+    Tests for link_graph_utils.py
+"""
+
+# Python Library Imports
+from collections import defaultdict
+import networkx as nx
+import pandas as pd
+import pytest
+import random
+
+# Local Library Imports
+from rib.utils.elasticsearch_utils import LinkQueryMethod
+from rib.utils.link_graph_utils import IncrementalLinkGraph, LinkGraph
+
+
+###
+# Mocks/fixtures
+###
+
+
+LINK_COLUMNS = [
+    "operationName",
+    "serviceName",
+    "connectionType",
+    "linkType",
+    "channelGid",
+    "linkId",
+    "linkAddress",
+]
+
+
+def make_links(records) -> pd.DataFrame:
+    """
+    Purpose:
+        Creates a dataframe of link records, as extracted from Elasticsearch
+    """
+    return pd.DataFrame(records, columns=LINK_COLUMNS)
+
+
+@pytest.fixture
+def links() -> pd.DataFrame:
+    """
+    Purpose:
+        Link records between two clients and a server over a direct and an
+        indirect channel, including malformed and destroyed links
+    """
+    return make_links(
+        [
+            ["LINK_CREATED", "client-1", "CT_DIRECT", "LT_SEND", "direct", "L1", "a"],
+            ["LINK_LOADED", "server-1", "CT_DIRECT", "LT_RECV", "direct", "L2", "a"],
+            ["LINK_CREATED", "server-1", "CT_INDIRECT", "LT_BIDI", "ind", "L3", "b"],
+            # Missing link address
+            ["LINK_CREATED", "client-2", "CT_DIRECT", "LT_SEND", "direct", "L4", None],
+            # Null channel
+            ["LINK_CREATED", "client-2", "CT_DIRECT", "LT_SEND", None, "L5", "c"],
+            # Not used, and missing fields
+            ["CONNECTION_SEND", "client-1", None, None, None, None, None],
+            ["LINK_CREATED", "client-2", "CT_INDIRECT", "LT_BIDI", "ind", "L6", "b"],
+            # Destroyed links are applied even if missing fields
+            ["LINK_DESTROYED", "server-1", None, None, None, "L3", None],
+        ]
+    )
+
+
+def link_attrs(
+    connType: str, linkType: str, channelGid: str, linkId: str, linkAddress: str
+) -> dict:
+    """
+    Purpose:
+        Creates the attributes of a bipartite link graph edge
+    """
+    return {
+        "pKey": f"{channelGid}|{linkAddress}",
+        "connType": connType,
+        "linkType": linkType,
+        "linkId": linkId,
+        "linkAddress": linkAddress,
+        "channelGid": channelGid,
+        "personas": "",
+        "conn": 0,
+    }
+
+
+###
+# Tests
+###
+
+
+################################################################################
+# linksToGraph
+################################################################################
+
+
+def test_links_to_graph_link_current(links, capsys):
+    G, removed = LinkGraph.linksToGraph(links, LinkQueryMethod.LINK_CURRENT)
+
+    assert removed == []
+    assert dict(G.nodes(data="bipartite")) == {
+        "client-1": 0,
+        "direct|a": 1,
+        "server-1": 0,
+        "ind|b": 1,
+        "client-2": 0,
+    }
+    direct = link_attrs("CT_DIRECT", "LT_SEND", "direct", "L1", "a")
+    direct_recv = link_attrs("CT_DIRECT", "LT_RECV", "direct", "L2", "a")
+    indirect = link_attrs("CT_INDIRECT", "LT_BIDI", "ind", "L6", "b")
+    assert list(G.edges(data=True)) == [
+        ("client-1", "direct|a", direct),
+        ("direct|a", "server-1", direct_recv),
+        ("ind|b", "client-2", indirect),
+        ("client-2", "ind|b", indirect),
+    ]
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Ignoring malformed record at index 3",
+        "Ignoring malformed record at index 4",
+    ]
+
+
+def test_links_to_graph_link_ever(links):
+    G, _ = LinkGraph.linksToGraph(links, LinkQueryMethod.LINK_EVER)
+
+    indirect = link_attrs("CT_INDIRECT", "LT_BIDI", "ind", "L3", "b")
+    assert list(G.edges(data=True)) == [
+        (
+            "client-1",
+            "direct|a",
+            link_attrs("CT_DIRECT", "LT_SEND", "direct", "L1", "a"),
+        ),
+        (
+            "direct|a",
+            "server-1",
+            link_attrs("CT_DIRECT", "LT_RECV", "direct", "L2", "a"),
+        ),
+        ("server-1", "ind|b", indirect),
+        ("ind|b", "server-1", indirect),
+        ("ind|b", "client-2", link_attrs("CT_INDIRECT", "LT_BIDI", "ind", "L6", "b")),
+        ("client-2", "ind|b", link_attrs("CT_INDIRECT", "LT_BIDI", "ind", "L6", "b")),
+    ]
+
+
+def test_links_to_graph_connection_current():
+    send = ["client-1", "CT_DIRECT", "LT_SEND", "direct", "L1", "a"]
+    recv = ["server-1", "CT_DIRECT", "LT_RECV", "direct", "L2", "a"]
+    links = make_links(
+        [
+            ["CONNECTION_OPEN", *send],
+            ["CONNECTION_OPEN", *send],
+            ["CONNECTION_OPEN", *recv],
+            ["CONNECTION_CLOSED", *send],
+            ["LINK_CREATED", "server-1", "CT_DIRECT", "LT_SEND", "direct", "L3", "b"],
+        ]
+    )
+    G, _ = LinkGraph.linksToGraph(links, LinkQueryMethod.CONNECTION_CURRENT)
+
+    # Later records for the same edge override earlier ones, and connection
+    # counts are tracked per link address and node
+    assert list(G.edges(data=True)) == [
+        (
+            "client-1",
+            "direct|a",
+            {**link_attrs("CT_DIRECT", "LT_SEND", "direct", "L1", "a"), "conn": 1},
+        ),
+        (
+            "direct|a",
+            "server-1",
+            {**link_attrs("CT_DIRECT", "LT_RECV", "direct", "L2", "a"), "conn": 1},
+        ),
+    ]
+
+
+def test_links_to_graph_missing_column():
+    links = make_links(
+        [["LINK_CREATED", "client-1", "CT_DIRECT", "LT_SEND", "direct", "L1", "a"]]
+    ).drop(columns=["linkAddress"])
+    G, _ = LinkGraph.linksToGraph(links, LinkQueryMethod.LINK_CURRENT)
+    assert G.number_of_nodes() == 0
+
+
+def test_links_to_graph_unknown_method(links):
+    with pytest.raises(Exception, match="Unknown link method"):
+        LinkGraph.linksToGraph(links, "not a method")
+
+
+################################################################################
+# IncrementalLinkGraph
+################################################################################
+
+
+def random_links(rng: random.Random, count: int) -> pd.DataFrame:
+    """
+    Purpose:
+        Creates random link records over a small set of nodes and links, so that
+        links are often re-created, overridden and destroyed
+    """
+    operations = [
+        "LINK_CREATED",
+        "LINK_LOADED",
+        "LINK_DESTROYED",
+        "CONNECTION_OPEN",
+        "CONNECTION_CLOSED",
+    ]
+    records = []
+    for _ in range(count):
+        channel = rng.choice(["direct", "ind"])
+        records.append(
+            [
+                rng.choice(operations),
+                rng.choice(["client-1", "client-2", "server-1", "server-2"]),
+                "CT_DIRECT" if channel == "direct" else "CT_INDIRECT",
+                rng.choice(["LT_SEND", "LT_RECV", "LT_BIDI"]),
+                channel,
+                rng.choice(["L1", "L2", "L3", "L4"]),
+                rng.choice(["a", "b"]),
+            ]
+        )
+    return make_links(records)
+
+
+def projected_edges(P: nx.MultiDiGraph) -> dict:
+    """
+    Purpose:
+        Gets the attributes of the parallel edges between each pair of nodes of a
+        projected graph, checking that they are keyed 0..n-1
+    """
+    edges = defaultdict(list)
+    for u, v, key, attrs in P.edges(keys=True, data=True):
+        edges[(u, v)].append((key, sorted(attrs.items(), key=str)))
+    for pair, pair_edges in edges.items():
+        assert sorted(key for key, _ in pair_edges) == list(range(len(pair_edges)))
+        edges[pair] = sorted((str(attrs) for _, attrs in pair_edges))
+    return dict(edges)
+
+
+def assert_matches_full_rebuild(
+    link_graph: IncrementalLinkGraph, links: pd.DataFrame
+) -> None:
+    """
+    Purpose:
+        Checks that an incremental link graph is the same as a graph built from
+        all of its records, with the excluded nodes removed
+    """
+    G, _ = LinkGraph.linksToGraph(links, link_graph.method)
+    G.remove_nodes_from(link_graph.excluded)
+
+    assert dict(link_graph.graph.nodes(data=True)) == dict(G.nodes(data=True))
+    assert {(u, v): d for u, v, d in link_graph.graph.edges(data=True)} == {
+        (u, v): d for u, v, d in G.edges(data=True)
+    }
+    P = LinkGraph.projectGraph(G)
+    assert set(link_graph.projected.nodes) == set(P.nodes)
+    assert projected_edges(link_graph.projected) == projected_edges(P)
+
+
+@pytest.mark.parametrize("method", list(LinkQueryMethod))
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_link_graph_matches_full_rebuild(method, seed):
+    rng = random.Random(seed)
+    links = random_links(rng, 40)
+
+    link_graph = IncrementalLinkGraph(method)
+    start = 0
+    while start < len(links):
+        end = start + rng.randint(1, 8)
+        link_graph.applyLinks(links.iloc[start:end])
+        assert_matches_full_rebuild(link_graph, links.iloc[:end])
+        start = end
+
+
+@pytest.mark.parametrize("method", list(LinkQueryMethod))
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_link_graph_matches_full_rebuild_with_excluded_node(method, seed):
+    rng = random.Random(seed)
+    links = random_links(rng, 40)
+
+    link_graph = IncrementalLinkGraph(method)
+    link_graph.applyLinks(links.iloc[:20])
+    link_graph.excludeNode("server-1")
+    assert_matches_full_rebuild(link_graph, links.iloc[:20])
+    link_graph.applyLinks(links.iloc[20:])
+    assert_matches_full_rebuild(link_graph, links)
+
+
+def test_incremental_link_graph_destroy_and_recreate():
+    link = ["client-1", "CT_DIRECT", "LT_SEND", "direct", "L1", "a"]
+    recv = ["server-1", "CT_DIRECT", "LT_RECV", "direct", "L2", "a"]
+    links = make_links(
+        [
+            ["LINK_CREATED", *link],
+            ["LINK_CREATED", *recv],
+            ["LINK_DESTROYED", *link],
+            ["LINK_CREATED", *link],
+        ]
+    )
+
+    link_graph = IncrementalLinkGraph(LinkQueryMethod.LINK_CURRENT)
+    assert link_graph.applyLinks(links.iloc[:2])
+    assert list(link_graph.projected.edges(keys=True)) == [("client-1", "server-1", 0)]
+
+    # A destroyed link ID stays destroyed, even if re-created
+    assert link_graph.applyLinks(links.iloc[2:3])
+    assert list(link_graph.projected.edges) == []
+    link_graph.applyLinks(links.iloc[3:])
+    assert list(link_graph.projected.edges) == []
+    assert_matches_full_rebuild(link_graph, links)
+
+
+def test_incremental_link_graph_parallel_edge_keys():
+    links = make_links(
+        [
+            ["LINK_CREATED", "client-1", "CT_DIRECT", "LT_SEND", "direct", "L1", "a"],
+            ["LINK_CREATED", "server-1", "CT_DIRECT", "LT_RECV", "direct", "L2", "a"],
+            ["LINK_CREATED", "client-1", "CT_DIRECT", "LT_SEND", "direct", "L3", "b"],
+            ["LINK_CREATED", "server-1", "CT_DIRECT", "LT_RECV", "direct", "L4", "b"],
+            ["LINK_DESTROYED", "client-1", None, None, None, "L1", None],
+        ]
+    )
+
+    link_graph = IncrementalLinkGraph(LinkQueryMethod.LINK_CURRENT)
+    link_graph.applyLinks(links.iloc[:4])
+    assert sorted(link_graph.projected.edges(keys=True)) == [
+        ("client-1", "server-1", 0),
+        ("client-1", "server-1", 1),
+    ]
+
+    # Keys stay contiguous once a parallel edge is removed
+    link_graph.applyLinks(links.iloc[4:])
+    assert list(link_graph.projected.edges(keys=True)) == [("client-1", "server-1", 0)]
+    assert link_graph.projected["client-1"]["server-1"][0]["linkId"] == {"L3", "L4"}
+    assert_matches_full_rebuild(link_graph, links)
+
+
+################################################################################
+# updateDirectStats
+################################################################################
+
+
+@pytest.fixture
+def direct_network() -> nx.MultiDiGraph:
+    """
+    Purpose:
+        A direct link network with a cycle, a self-loop, parallel edges and a
+        node that reaches no other nodes
+    """
+    return nx.MultiDiGraph(
+        [
+            # a -> b -> c -> a cycle, with a tail c -> d -> e
+            ("a", "b"),
+            ("b", "c"),
+            ("c", "a"),
+            ("c", "d"),
+            ("d", "e"),
+            ("d", "e"),
+            # Self-loops
+            ("e", "e"),
+            ("f", "f"),
+            # Reaches into the cycle
+            ("g", "a"),
+        ]
+    )
+
+
+DIRECT_NETWORK_STATS = {
+    "a": {"D_maxdepth": 4, "D_descendants": 4},
+    "b": {"D_maxdepth": 3, "D_descendants": 4},
+    "c": {"D_maxdepth": 2, "D_descendants": 4},
+    "d": {"D_maxdepth": 1, "D_descendants": 1},
+    "e": {"D_maxdepth": 0, "D_descendants": 0},
+    "f": {"D_maxdepth": 0, "D_descendants": 0},
+    "g": {"D_maxdepth": 5, "D_descendants": 5},
+}
+
+
+def test_update_direct_stats(direct_network):
+    G = nx.MultiDiGraph(direct_network)
+    LinkGraph.updateDirectStats(G, direct_network)
+    assert dict(G.nodes(data=True)) == DIRECT_NETWORK_STATS
+
+
+def test_update_direct_stats_in_worker_processes(direct_network):
+    G = nx.MultiDiGraph(direct_network)
+    LinkGraph.updateDirectStats(G, direct_network, max_workers=3)
+    assert dict(G.nodes(data=True)) == DIRECT_NETWORK_STATS
+
+
+def test_update_direct_stats_with_prefix(direct_network):
+    G = nx.MultiDiGraph(direct_network)
+    LinkGraph.updateDirectStats(G, direct_network, pfx="x_")
+    assert G.nodes["g"] == {"D_x_maxdepth": 5, "D_x_descendants": 5}
+
+
+def test_update_direct_stats_empty_network():
+    G = nx.MultiDiGraph([("a", "b")])
+    LinkGraph.updateDirectStats(G, nx.MultiDiGraph())
+    assert dict(G.nodes(data=True)) == {"a": {}, "b": {}}
+
+
+################################################################################
+# rollUp
+################################################################################
+
+
+def test_roll_up(direct_network):
+    R = LinkGraph.rollUp(direct_network, "b")
+
+    # Only the edges of the breadth-first tree from the start node remain
+    assert sorted(R.edges()) == [
+        ("b", "c"),
+        ("c", "a"),
+        ("c", "d"),
+        ("d", "e"),
+        ("d", "e"),
+    ]
+    assert set(R.nodes) == set(direct_network.nodes)
+
+
+def test_roll_up_missing_start_node(direct_network):
+    assert nx.is_empty(LinkGraph.rollUp(direct_network, "z"))
+
+
+################################################################################
+# getDelta
+################################################################################
+
+
+def test_get_delta():
+    G_ref = nx.MultiDiGraph()
+    G_ref.add_edge("a", "b", linkId={"L1"}, conn_out=1)
+    G_ref.add_edge("b", "c", linkId={"L2"})
+    G = nx.MultiDiGraph()
+    G.add_edge("a", "b", linkId={"L1"}, conn_out=2)
+    G.add_edge("b", "c", linkId={"L2"})
+    G.add_edge("c", "a", linkId={"L3"})
+
+    added, removed = LinkGraph.getDelta(G, G_ref)
+    assert added == [
+        ("a", "b", {"linkId": {"L1"}, "conn_out": 2}),
+        ("c", "a", {"linkId": {"L3"}}),
+    ]
+    assert removed == [("a", "b", {"linkId": {"L1"}, "conn_out": 1})]
+
+
+def test_get_delta_unhashable_attributes():
+    # Attribute values that can't be frozen are compared directly
+    G_ref = nx.MultiDiGraph()
+    G_ref.add_edge("a", "b", data=bytearray(b"1"))
+    G = nx.MultiDiGraph()
+    G.add_edge("a", "b", data=bytearray(b"1"))
+    G.add_edge("b", "a", data=bytearray(b"2"))
+
+    added, removed = LinkGraph.getDelta(G, G_ref)
+    assert added == [("b", "a", {"data": bytearray(b"2")})]
+    assert removed == []
@@ -195,3 +195,24 @@ def test_channel_plugin_has_external_services_missing_some_scripts():
         assert not plugin_utils.channel_plugin_has_external_services(
             "test_channel", "test_path"
         )
+
+
+def test_dir_checksum_depends_on_paths_and_contents(tmp_path):
+    """
+    Purpose:
+        Test _dir_checksum is stable and changes when file contents or paths change
+    Args
+        tmp_path: Temporary directory
+    """
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "file.txt").write_text("contents")
+    checksum = plugin_utils._dir_checksum(str(tmp_path))
+    assert checksum == plugin_utils._dir_checksum(str(tmp_path))
+
+    (tmp_path / "sub" / "file.txt").write_text("changed")
+    changed_contents_checksum = plugin_utils._dir_checksum(str(tmp_path))
+    assert changed_contents_checksum != checksum
+
+    (tmp_path / "sub" / "file.txt").rename(tmp_path / "sub" / "renamed.txt")
+    assert plugin_utils._dir_checksum(str(tmp_path)) != changed_contents_checksum
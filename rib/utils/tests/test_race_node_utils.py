@@ -20,11 +20,11 @@ Purpose:
 
 # Python Library Imports
 import pytest
-from mock import MagicMock, patch
+from mock import MagicMock, call, patch
 from typing import Dict, Optional
 
 # Local Library Imports
-from rib.utils import race_node_utils, redis_utils
+from rib.utils import error_utils, race_node_utils, redis_utils
 
 
 ###
@@ -180,3 +180,352 @@ def test_get_app_status_when_all_keys_exist(mock_redis_client):
     app_status = race_node_interface.get_app_status("race-client-00001")
     assert app_status["is_alive"] == True
     assert app_status["timestamp"] == "now"
+
+
+################################################################################
+# race_node_utils.get_status_for_personas
+################################################################################
+
+
+@patch("rib.utils.redis_utils.is_connected", MagicMock(return_value=False))
+def test_get_status_for_personas_when_not_connected(mock_redis_client):
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    statuses = race_node_interface.get_status_for_personas(
+        ["race-client-00001", "race-server-00001"]
+    )
+    assert set(statuses.keys()) == {"race-client-00001", "race-server-00001"}
+    for status in statuses.values():
+        assert status["daemon"]["is_alive"] == False
+        assert status["daemon"]["installed"] == False
+        assert status["app"]["is_alive"] == False
+    mock_redis_client.pipeline.assert_not_called()
+
+
+def test_get_status_for_personas_with_no_personas(mock_redis_client):
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    assert race_node_interface.get_status_for_personas([]) == {}
+    mock_redis_client.pipeline.assert_not_called()
+
+
+def test_get_status_for_personas_uses_single_pipeline(mock_redis_client):
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [
+        [
+            '{"installed":true}',
+            "true",
+            '{"timestamp":"now"}',
+            "true",
+            None,
+            None,
+            None,
+            None,
+        ]
+    ]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    statuses = race_node_interface.get_status_for_personas(
+        ["race-client-00001", "race-server-00001"]
+    )
+
+    mock_redis_client.pipeline.assert_called_once()
+    mock_pipeline.mget.assert_called_once_with(
+        [
+            "race.node.status:race-client-00001",
+            "race.node.is.alive:race-client-00001",
+            "race.app.status:race-client-00001",
+            "race.app.is.alive:race-client-00001",
+            "race.node.status:race-server-00001",
+            "race.node.is.alive:race-server-00001",
+            "race.app.status:race-server-00001",
+            "race.app.is.alive:race-server-00001",
+        ]
+    )
+    mock_pipeline.execute.assert_called_once()
+    mock_redis_client.get.assert_not_called()
+
+    assert statuses["race-client-00001"]["daemon"]["is_alive"] == True
+    assert statuses["race-client-00001"]["daemon"]["installed"] == True
+    assert statuses["race-client-00001"]["app"]["is_alive"] == True
+    assert statuses["race-client-00001"]["app"]["timestamp"] == "now"
+    assert statuses["race-server-00001"]["daemon"]["is_alive"] == False
+    assert statuses["race-server-00001"]["daemon"]["installed"] == False
+    assert statuses["race-server-00001"]["app"]["is_alive"] == False
+    assert statuses["race-server-00001"]["app"]["timestamp"] == ""
+
+
+@patch("rib.utils.race_node_utils.STATUS_MGET_BATCH_SIZE", 1)
+def test_get_status_for_personas_batches_mgets(mock_redis_client):
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [
+        [None, "true", None, None],
+        [None, None, None, "true"],
+    ]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    statuses = race_node_interface.get_status_for_personas(
+        ["race-client-00001", "race-server-00001"]
+    )
+
+    assert mock_pipeline.mget.call_count == 2
+    mock_pipeline.execute.assert_called_once()
+    assert statuses["race-client-00001"]["daemon"]["is_alive"] == True
+    assert statuses["race-client-00001"]["app"]["is_alive"] == False
+    assert statuses["race-server-00001"]["daemon"]["is_alive"] == False
+    assert statuses["race-server-00001"]["app"]["is_alive"] == True
+
+
+def test_get_status_for_personas_with_invalid_status(mock_redis_client):
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [["not-json", "true", None, None]]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    statuses = race_node_interface.get_status_for_personas(["race-client-00001"])
+    assert statuses["race-client-00001"]["daemon"] == {"is_error": True}
+    assert statuses["race-client-00001"]["app"]["is_alive"] == False
+
+
+def test_get_status_for_personas_when_pipeline_fails(mock_redis_client):
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.side_effect = Exception("connection reset")
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    with pytest.raises(error_utils.RIB408):
+        race_node_interface.get_status_for_personas(["race-client-00001"])
+
+
+################################################################################
+# subscribe_to_status_changes
+################################################################################
+
+
+def test_subscribe_to_status_changes_enables_keyspace_notifications(
+    mock_redis_client,
+):
+    mock_redis_client.config_get.return_value = {"notify-keyspace-events": "Ex"}
+    mock_redis_client.get.return_value = None
+    mock_redis_client.connection_pool.connection_kwargs = {"db": 0}
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    subscription = race_node_interface.subscribe_to_status_changes()
+
+    mock_redis_client.config_set.assert_called_once_with(
+        "notify-keyspace-events", "ExK$g"
+    )
+    pubsub = mock_redis_client.pubsub.return_value
+    pubsub.psubscribe.assert_called_once_with(
+        "__keyspace@0__:race.node.status:*",
+        "__keyspace@0__:race.app.status:*",
+    )
+    pubsub.subscribe.assert_called_once_with(
+        "__keyevent@0__:expired",
+        "__keyevent@0__:del",
+    )
+    subscription.close()
+
+
+def test_subscribe_to_status_changes_keeps_existing_notifications(
+    mock_redis_client,
+):
+    mock_redis_client.config_get.return_value = {"notify-keyspace-events": "AKE"}
+    mock_redis_client.get.return_value = None
+    mock_redis_client.connection_pool.connection_kwargs = {}
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    subscription = race_node_interface.subscribe_to_status_changes()
+    assert subscription
+    subscription.close()
+    mock_redis_client.config_set.assert_not_called()
+
+
+def test_subscribe_to_status_changes_restores_notifications_on_close(
+    mock_redis_client,
+):
+    mock_redis_client.config_get.return_value = {"notify-keyspace-events": "Ex"}
+    mock_redis_client.get.return_value = None
+    mock_redis_client.connection_pool.connection_kwargs = {"db": 0}
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    subscription = race_node_interface.subscribe_to_status_changes()
+    subscription.close()
+
+    mock_redis_client.pubsub.return_value.close.assert_called_once()
+    assert mock_redis_client.config_set.call_args_list == [
+        call("notify-keyspace-events", "ExK$g"),
+        call("notify-keyspace-events", "Ex"),
+    ]
+    mock_redis_client.set.assert_called_once_with(
+        race_node_utils.KEYSPACE_EVENTS_TO_RESTORE_KEY, "Ex"
+    )
+    mock_redis_client.delete.assert_called_once_with(
+        race_node_utils.KEYSPACE_EVENTS_TO_RESTORE_KEY
+    )
+
+
+def test_subscribe_to_status_changes_restores_notifications_left_changed(
+    mock_redis_client,
+):
+    # A previous process enabled notifications and was killed before restoring them
+    mock_redis_client.config_get.return_value = {"notify-keyspace-events": "ExK$g"}
+    mock_redis_client.get.return_value = "Ex"
+    mock_redis_client.connection_pool.connection_kwargs = {"db": 0}
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    subscription = race_node_interface.subscribe_to_status_changes()
+    subscription.close()
+
+    mock_redis_client.set.assert_not_called()
+    mock_redis_client.config_set.assert_called_once_with("notify-keyspace-events", "Ex")
+    mock_redis_client.delete.assert_called_once_with(
+        race_node_utils.KEYSPACE_EVENTS_TO_RESTORE_KEY
+    )
+
+
+def test_subscribe_to_status_changes_restores_notifications_after_last_close(
+    mock_redis_client,
+):
+    mock_redis_client.config_get.return_value = {"notify-keyspace-events": ""}
+    mock_redis_client.get.return_value = None
+    mock_redis_client.connection_pool.connection_kwargs = {"db": 0}
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    first = race_node_interface.subscribe_to_status_changes()
+    second = race_node_interface.subscribe_to_status_changes()
+    mock_redis_client.config_get.assert_called_once()
+
+    first.close()
+    first.close()
+    assert mock_redis_client.config_set.call_count == 1
+    second.close()
+    mock_redis_client.config_set.assert_called_with("notify-keyspace-events", "")
+
+
+def test_subscribe_to_status_changes_when_unavailable(mock_redis_client):
+    mock_redis_client.config_get.side_effect = Exception("unknown command")
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    assert race_node_interface.subscribe_to_status_changes() is None
+
+
+################################################################################
+# get_personas_with_status_changes
+################################################################################
+
+
+def test_get_personas_with_status_changes():
+    subscription = MagicMock()
+    subscription.get_message.side_effect = [
+        None,
+        {"channel": "__keyevent@0__:expired", "data": "some.other.key"},
+        {
+            "channel": "__keyevent@0__:expired",
+            "data": "race.node.is.alive:race-client-00002",
+        },
+        {"channel": "__keyspace@0__:race.app.status:race-server-00001"},
+        {"channel": "__keyspace@0__:race.node.status:race-client-00001"},
+        None,
+    ]
+
+    assert race_node_utils.RaceNodeInterface.get_personas_with_status_changes(
+        subscription, timeout=10
+    ) == {"race-client-00001", "race-client-00002", "race-server-00001"}
+
+
+@patch("time.monotonic", MagicMock(side_effect=[100.0, 100.5, 101.0]))
+def test_get_personas_with_status_changes_times_out():
+    subscription = MagicMock()
+    subscription.get_message.return_value = None
+
+    assert (
+        race_node_utils.RaceNodeInterface.get_personas_with_status_changes(
+            subscription, timeout=1
+        )
+        == set()
+    )
+    assert subscription.get_message.call_count == 2
+
+
+################################################################################
+# batch_actions
+################################################################################
+
+
+def test_batch_actions_publishes_in_single_pipeline(mock_redis_client):
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [1, 1]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    with race_node_interface.batch_actions() as batch:
+        race_node_interface.start_app("race-client-00001")
+        with race_node_interface.batch_actions() as nested_batch:
+            race_node_interface.stop_app("race-server-00001")
+        assert nested_batch is batch
+        mock_pipeline.publish.assert_not_called()
+
+    mock_redis_client.publish.assert_not_called()
+    mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+    assert [call.args[0] for call in mock_pipeline.publish.call_args_list] == [
+        "race.node.actions:race-client-00001",
+        "race.node.actions:race-server-00001",
+    ]
+    mock_pipeline.execute.assert_called_once_with(raise_on_error=False)
+    assert batch.errors == {}
+
+    # Actions outside of a batch are published immediately
+    race_node_interface.start_app("race-client-00001")
+    mock_redis_client.publish.assert_called_once()
+
+
+def test_batch_actions_records_errors(mock_redis_client):
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [1, Exception("connection reset")]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    with race_node_interface.batch_actions() as batch:
+        race_node_interface.start_app("race-client-00001")
+        race_node_interface.start_app("race-server-00001")
+
+    assert list(batch.errors) == ["race-server-00001"]
+    assert isinstance(batch.errors["race-server-00001"], error_utils.RIB410)
+
+
+def test_batch_actions_records_errors_under_reported_keys(mock_redis_client):
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.side_effect = Exception("connection reset")
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    with race_node_interface.batch_actions() as batch:
+        for recipient in ["race-server-00001", "race-server-00002"]:
+            with batch.errors_reported_as(f"race-client-00001 to {recipient}"):
+                race_node_interface.send_manual_message(
+                    sender="race-client-00001", recipient=recipient, message="hi"
+                )
+        race_node_interface.start_app("race-client-00002")
+
+    assert set(batch.errors) == {
+        "race-client-00001 to race-server-00001",
+        "race-client-00001 to race-server-00002",
+        "race-client-00002",
+    }
+
+
+def test_send_action_commands_when_pipeline_fails(mock_redis_client):
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.side_effect = Exception("connection reset")
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    race_node_interface = race_node_utils.RaceNodeInterface()
+    errors = race_node_interface.send_action_commands(
+        [
+            ("race-client-00001", {"type": "start"}),
+            ("race-server-00001", {"type": "start"}),
+        ]
+    )
+    assert set(errors) == {"race-client-00001", "race-server-00001"}
+    assert race_node_interface.send_action_commands([]) == {}
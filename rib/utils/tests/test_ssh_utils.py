@@ -166,6 +166,22 @@ def test_connect_ssh_client_return_client(rsa_private_key) -> int:
     assert returned_ssh_client.connect.call_count == 1
 
 
+@patch("paramiko.SSHClient", MagicMock())
+def test_connect_ssh_client_enables_keepalive(rsa_private_key) -> int:
+    """
+    Purpose:
+        Test connect_ssh_client sets the transport keepalive when requested
+    Args:
+        rsa_private_key: loaded RSA private key
+    """
+
+    returned_ssh_client = ssh_utils.connect_ssh_client(
+        "fake_host", "fake_user", rsa_private_key, keepalive_interval=30
+    )
+
+    returned_ssh_client.get_transport().set_keepalive.assert_called_once_with(30)
+
+
 ################################################################################
 # disconnect_ssh_client
 ################################################################################
@@ -256,6 +272,91 @@ def test_check_ssh_client_connected_disconnected() -> int:
 ################################################################################
 
 
+class FakeSshChannel:
+    """Minimal paramiko channel stand-in that hands out queued output chunks"""
+
+    def __init__(self, stdout_chunks, stderr_chunks, exit_status=0):
+        self.stdout_chunks = list(stdout_chunks)
+        self.stderr_chunks = list(stderr_chunks)
+        self.exit_status = exit_status
+
+    def settimeout(self, timeout):
+        pass
+
+    def exec_command(self, command):
+        pass
+
+    def recv_ready(self):
+        return bool(self.stdout_chunks)
+
+    def recv_stderr_ready(self):
+        return bool(self.stderr_chunks)
+
+    def recv(self, nbytes):
+        return self.stdout_chunks.pop(0)
+
+    def recv_stderr(self, nbytes):
+        return self.stderr_chunks.pop(0)
+
+    def exit_status_ready(self):
+        return True
+
+    def recv_exit_status(self):
+        return self.exit_status
+
+
+def _fake_ssh_client(channel):
+    ssh_client = MagicMock()
+    ssh_client.get_transport.return_value.open_session.return_value = channel
+    return ssh_client
+
+
+@patch("rib.utils.ssh_utils.select.select", MagicMock())
+def test_run_ssh_command_captures_split_multibyte_output() -> int:
+    """
+    Purpose:
+        Test run_ssh_command decodes output split mid-character and streams lines
+    Args:
+        N/A
+    """
+
+    snowman = "\u2603".encode("utf-8")
+    channel = FakeSshChannel(
+        stdout_chunks=[b"first " + snowman[:1], snowman[1:] + b"\nsecond"],
+        stderr_chunks=[b"warn\n"],
+    )
+    line_callback = MagicMock()
+
+    stdout, stderr = ssh_utils.run_ssh_command(
+        _fake_ssh_client(channel), "cmd", line_callback=line_callback
+    )
+
+    assert stdout == ["first \u2603", "second"]
+    assert stderr == ["warn"]
+    assert line_callback.call_args_list == [
+        mock.call("stdout", "first \u2603"),
+        mock.call("stderr", "warn"),
+        mock.call("stdout", "second"),
+    ]
+
+
+@patch("rib.utils.ssh_utils.select.select", MagicMock())
+def test_run_ssh_command_raises_on_bad_exit_status() -> int:
+    """
+    Purpose:
+        Test run_ssh_command raises when check_exit_status is set and the command fails
+    Args:
+        N/A
+    """
+
+    channel = FakeSshChannel(stdout_chunks=[], stderr_chunks=[b"boom\n"], exit_status=1)
+
+    with pytest.raises(error_utils.RIB006, match="boom"):
+        ssh_utils.run_ssh_command(
+            _fake_ssh_client(channel), "cmd", check_exit_status=True
+        )
+
+
 # SCP Functions
 
 
@@ -0,0 +1,85 @@
+# Copyright 2023 Two Six Technologies
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Purpose:
+    Tests for subprocess_utils.py
+"""
+
+# Python Library Imports
+import os
+import pytest
+import subprocess
+import time
+
+# Local Library Imports
+from rib.utils import subprocess_utils
+
+
+###
+# Mocks/fixtures
+###
+
+
+def is_process_running(pid: int) -> bool:
+    """
+    Purpose:
+        Checks if the process with the given ID is running (and not a zombie)
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as stat_file:
+            return stat_file.read().split(")")[-1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+###
+# Tests
+###
+
+
+################################################################################
+# run
+################################################################################
+
+
+def test_run_captures_output():
+    proc = subprocess_utils.run(
+        "echo out; echo err >&2", shell=True, capture_output=True
+    )
+    assert proc.returncode == 0
+    assert proc.stdout == "out"
+    assert proc.stderr == "err"
+
+
+def test_run_check_raises_on_failure():
+    with pytest.raises(subprocess.CalledProcessError):
+        subprocess_utils.run("exit 3", shell=True, check=True)
+
+
+def test_run_timeout_kills_spawned_processes(tmp_path):
+    pid_file = tmp_path / "pid"
+    with pytest.raises(subprocess.TimeoutExpired):
+        subprocess_utils.run(
+            f"sleep 30 & echo $! > {pid_file}; wait",
+            shell=True,
+            timeout=1,
+        )
+
+    pid = int(pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while is_process_running(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not is_process_running(pid)
@@ -761,7 +761,7 @@ def create_message_span_maps(
     MagicMock(),
 )
 @patch(
-    "rib.utils.elasticsearch_utils.get_spans",
+    "rib.utils.elasticsearch_utils.stream_spans",
     MagicMock(),
 )
 @patch(
@@ -825,7 +825,7 @@ def test_evaluate_messages_test_default_success(
     MagicMock(),
 )
 @patch(
-    "rib.utils.elasticsearch_utils.get_spans",
+    "rib.utils.elasticsearch_utils.stream_spans",
     MagicMock(),
 )
 @patch(
@@ -888,7 +888,7 @@ def test_evaluate_messages_test_multiple_messages_success(
     MagicMock(),
 )
 @patch(
-    "rib.utils.elasticsearch_utils.get_spans",
+    "rib.utils.elasticsearch_utils.stream_spans",
     MagicMock(),
 )
 @patch(
@@ -960,7 +960,7 @@ def test_evaluate_messages_test_duplicate_messages_failure(
     MagicMock(),
 )
 @patch(
-    "rib.utils.elasticsearch_utils.get_spans",
+    "rib.utils.elasticsearch_utils.stream_spans",
     MagicMock(),
 )
 @patch(
@@ -1025,7 +1025,7 @@ def test_evaluate_messages_test_recipient_missing(
     MagicMock(),
 )
 @patch(
-    "rib.utils.elasticsearch_utils.get_spans",
+    "rib.utils.elasticsearch_utils.stream_spans",
     MagicMock(),
 )
 @patch(
@@ -1090,7 +1090,7 @@ def test_evaluate_messages_test_sender_missing(
     MagicMock(),
 )
 @patch(
-    "rib.utils.elasticsearch_utils.get_spans",
+    "rib.utils.elasticsearch_utils.stream_spans",
     MagicMock(),
 )
 @patch(
@@ -1155,7 +1155,7 @@ def test_evaluate_messages_test_message_hash_corrupted(
     MagicMock(),
 )
 @patch(
-    "rib.utils.elasticsearch_utils.get_spans",
+    "rib.utils.elasticsearch_utils.stream_spans",
     MagicMock(),
 )
 @patch(
@@ -1220,7 +1220,7 @@ def test_evaluate_messages_test_message_size_corrupted(
     MagicMock(),
 )
 @patch(
-    "rib.utils.elasticsearch_utils.get_spans",
+    "rib.utils.elasticsearch_utils.stream_spans",
     MagicMock(),
 )
 @patch(
@@ -1287,6 +1287,182 @@ def test_evaluate_messages_test_message_count_incorrect(
         assert len(error_matches) == 1
 
 
+@patch(
+    "rib.utils.testing_utils.Elasticsearch",
+    MagicMock(),
+)
+@patch(
+    "rib.utils.elasticsearch_utils.do_query",
+    MagicMock(),
+)
+@patch(
+    "rib.utils.elasticsearch_utils.stream_spans",
+    MagicMock(),
+)
+@patch("time.time", Mock(side_effect=[0, 1]))
+@patch("time.sleep", Mock())
+@patch("rib.utils.elasticsearch_utils.create_query")
+@patch("rib.utils.elasticsearch_utils.get_message_spans")
+def test_evaluate_messages_test_queries_incrementally(
+    mock_get_message_spans, mock_create_query, mock_local_x2x_deployment
+) -> int:
+    """
+    Purpose:
+        Test evaluate_messages_test only queries for new spans on each poll and matches
+        send/receive spans that are returned by different polls
+    Args:
+        mock_get_message_spans: mock object to create testable spans
+        mock_create_query: mock object to verify queries
+        mock_local_x2x_deployment: a mock 2x2 deployment
+    """
+    recipient_sender_mapping = {"race-client-00001": ["race-client-00002"]}
+    (send_span, receive_span) = create_spans_for_message(
+        sender="race-client-00002",
+        receiver="race-client-00001",
+        trace_id="trace-1",
+        messageHash="hash",
+    )
+    send_span["start_time"] = 100_000_000
+    receive_span["start_time"] = 160_000_000
+    mock_get_message_spans.side_effect = [
+        ({}, {"trace-1": [send_span]}),
+        ({}, {"trace-1": [send_span, receive_span]}),
+    ]
+
+    myResult = testing_utils.evaluate_messages_test(
+        elasticsearch_host_name="elasticsearch",
+        test_id="UT-TEST",
+        start_time=10_000,
+        run_time=240,
+        test_result=testing_utils.TestResult("unit_test"),
+        expected_message_count=1,
+        recipient_sender_mapping=recipient_sender_mapping,
+    )
+
+    assert myResult.total == 1
+    assert myResult.passed == 1
+    assert mock_create_query.call_count == 2
+    assert mock_create_query.call_args_list[0].kwargs["time_range"] == [["gt", "5000"]]
+    assert mock_create_query.call_args_list[1].kwargs["time_range"] == [
+        ["gt", f"{100_000 - testing_utils.EVALUATION_QUERY_OVERLAP_MILLIS}"]
+    ]
+    for call in mock_create_query.call_args_list:
+        assert call.kwargs["test_id"] == "UT-TEST"
+
+
+###
+# MessageMatchCounter
+###
+
+
+def test_MessageMatchCounter_ignores_duplicate_spans() -> int:
+    counter = testing_utils.MessageMatchCounter(
+        test_id="UT-TEST",
+        recipient_sender_mapping={"race-client-00001": ["race-client-00002"]},
+    )
+    spans = create_spans_for_message(
+        sender="race-client-00002",
+        receiver="race-client-00001",
+        trace_id="trace-1",
+        messageHash="hash",
+    )
+    counter.add_spans(spans)
+    counter.add_spans(spans)
+    assert counter.get_count("race-client-00002", "race-client-00001") == 1
+
+
+def test_MessageMatchCounter_matches_receive_before_send() -> int:
+    counter = testing_utils.MessageMatchCounter(
+        test_id="UT-TEST",
+        recipient_sender_mapping={"race-client-00001": ["race-client-00002"]},
+    )
+    (send_span, receive_span) = create_spans_for_message(
+        sender="race-client-00002",
+        receiver="race-client-00001",
+        trace_id="trace-1",
+        messageHash="hash",
+    )
+    counter.add_spans([receive_span])
+    assert counter.get_count("race-client-00002", "race-client-00001") == 0
+    counter.add_spans([send_span])
+    assert counter.get_count("race-client-00002", "race-client-00001") == 1
+
+
+def test_MessageMatchCounter_ignores_other_tests_and_recipients() -> int:
+    counter = testing_utils.MessageMatchCounter(
+        test_id="OTHER-TEST",
+        recipient_sender_mapping={"race-client-00001": ["race-client-00002"]},
+    )
+    counter.add_spans(
+        create_spans_for_message(
+            sender="race-client-00002",
+            receiver="race-client-00001",
+            trace_id="trace-1",
+            messageHash="hash",
+        )
+    )
+    assert counter.get_count("race-client-00002", "race-client-00001") == 0
+
+    counter = testing_utils.MessageMatchCounter(
+        test_id="UT-TEST",
+        recipient_sender_mapping={"race-client-00002": ["race-client-00001"]},
+    )
+    counter.add_spans(
+        create_spans_for_message(
+            sender="race-client-00002",
+            receiver="race-client-00001",
+            trace_id="trace-1",
+            messageHash="hash",
+        )
+    )
+    assert counter.get_count("race-client-00002", "race-client-00001") == 0
+
+
+def test_MessageMatchCounter_forgets_matched_traces_and_old_spans() -> int:
+    counter = testing_utils.MessageMatchCounter(
+        test_id="UT-TEST",
+        recipient_sender_mapping={"race-client-00001": ["race-client-00002"]},
+    )
+    (old_send_span, old_receive_span) = create_spans_for_message(
+        sender="race-client-00002",
+        receiver="race-client-00001",
+        trace_id="trace-1",
+        messageHash="hash-1",
+    )
+    (unmatched_send_span, _) = create_spans_for_message(
+        sender="race-client-00002",
+        receiver="race-client-00001",
+        trace_id="trace-2",
+        messageHash="hash-2",
+    )
+    (new_send_span, new_receive_span) = create_spans_for_message(
+        sender="race-client-00002",
+        receiver="race-client-00001",
+        trace_id="trace-3",
+        messageHash="hash-3",
+    )
+    old_send_span["start_time"] = 100_000_000
+    old_receive_span["start_time"] = 101_000_000
+    unmatched_send_span["start_time"] = 102_000_000
+    new_send_span["start_time"] = 200_000_000
+    new_receive_span["start_time"] = 201_000_000
+
+    counter.add_spans([old_send_span, old_receive_span, unmatched_send_span])
+    assert counter.get_count("race-client-00002", "race-client-00001") == 1
+    assert list(counter._trace_id_to_span) == ["trace-2"]
+    assert len(counter._seen_spans) == 3
+
+    counter.add_spans([new_send_span, new_receive_span])
+    assert counter.get_count("race-client-00002", "race-client-00001") == 2
+    # Unmatched traces are kept so that late receives still match
+    assert list(counter._trace_id_to_span) == ["trace-2"]
+    # Only spans inside the overlap window of the next query are remembered
+    assert set(counter._seen_spans) == {
+        ("trace-3", new_send_span["span_id"], "race-client-00002"),
+        ("trace-3", new_receive_span["span_id"], "race-client-00001"),
+    }
+
+
 ###
 # RaceTest evaluate_call_to_messages_test
 ###
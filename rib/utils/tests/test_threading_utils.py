@@ -21,7 +21,7 @@
 """
 
 # Python Library Imports
-import concurrent.futures
+import contextvars
 import os
 import sys
 import pytest
@@ -106,7 +106,7 @@ def test_create_thread_executor():
 
     thread_executor = threading_utils.create_thread_executor()
 
-    assert type(thread_executor) == concurrent.futures.thread.ThreadPoolExecutor
+    assert type(thread_executor) == threading_utils.ContextThreadPoolExecutor
 
 
 ######
@@ -127,6 +127,28 @@ def test_shutdown_thread_executor():
     threading_utils.shutdown_thread_executor(thread_executor)
 
 
+def test_create_thread_executor_propagates_context():
+    """
+    Purpose:
+        Test Threading Utils executors run functions in the context of the submitter
+    Args:
+        N/A
+    """
+
+    context_var = contextvars.ContextVar("context_var", default=None)
+    thread_executor = threading_utils.create_thread_executor(max_workers=1)
+
+    token = context_var.set("submitter")
+    try:
+        future = thread_executor.submit(context_var.get)
+    finally:
+        context_var.reset(token)
+
+    assert future.result() == "submitter"
+    assert thread_executor.submit(context_var.get).result() is None
+    threading_utils.shutdown_thread_executor(thread_executor)
+
+
 ######
 # get_threaded_function_results_as_completed
 ######
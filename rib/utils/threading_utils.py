@@ -20,6 +20,7 @@
 
 # Python Library Imports
 import concurrent.futures
+import contextvars
 
 # Local Library Imports
 from rib.utils import error_utils
@@ -40,6 +41,23 @@ class ThreadedFunctionNotComplete(Exception):
     pass
 
 
+###
+# Executors
+###
+
+
+class ContextThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
+    """
+    Purpose:
+        Thread pool running each submitted function in a copy of the context of the
+        submitting thread, so that context variables (e.g., the operation that output
+        is attributed to) follow the work onto the pool's threads
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
 ###
 # Executor Functions
 ###
@@ -56,14 +74,14 @@ def create_thread_executor(max_workers=None):
     """
 
     if max_workers:
-        return concurrent.futures.ThreadPoolExecutor(
+        return ContextThreadPoolExecutor(
             max_workers=max_workers,
             thread_name_prefix="",  # TODO, would like to get name from threads
             # initializer=None,
             # initargs=()
         )
     else:
-        return concurrent.futures.ThreadPoolExecutor(
+        return ContextThreadPoolExecutor(
             thread_name_prefix="",
             # initializer=None,
             # initargs=()
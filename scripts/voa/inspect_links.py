@@ -78,6 +78,14 @@ class InspectLinksArgHelper(ArgHelper):
             help="Rollup graph",
         )
 
+        self.parser.add_argument(
+            "--stats-workers",
+            dest="stats_workers",
+            type=int,
+            default=1,
+            help="Number of processes over which to compute direct link stats",
+        )
+
         self.parser.add_argument(
             "--to-csv",
             dest="to_csv",
@@ -130,7 +138,7 @@ if __name__ == "__main__":
 
     if args.show_stats:
         # Add stats corresponding to main graph
-        LinkGraph.updateDirectStats(fullG, dirG)
+        LinkGraph.updateDirectStats(fullG, dirG, max_workers=args.stats_workers)
         LinkGraph.updateIndirectStats(fullG, indirG)
 
         stats_df = LinkGraph.getStatsDataframe(fullG)
@@ -140,7 +148,6 @@ if __name__ == "__main__":
         LinkGraphSerializer.serialize_graph(fullG, args.json_file, args.render_endpoint)
 
     if args.save_plot_dir or args.show_plot:
-
         # If roll-up options are given generate that plot
 
         addedLinks = removedLinks = None
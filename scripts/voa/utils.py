@@ -34,6 +34,7 @@ import threading
 from datetime import datetime
 
 from rib.utils.link_graph_utils import (
+    IncrementalLinkGraph,
     LinkGraph,
     LinkQueryMethod,
     LinkGraphRenderer,
@@ -64,11 +65,9 @@ class GraphPoller:
 
         # A common lock to protect several members
         self.worker_lock = threading.Lock()
-        self.full_graph = None
-        self.serialized_graph = None
-        self.attacked = set()
+        self.link_graph = IncrementalLinkGraph(self.args.method)
         self.thread_terminate = False
-        (self.full_graph, _, self.initial_ts) = self._refresh_graph()
+        self.initial_ts = self._refresh_graph()
 
     def get_base_graph(self):
         """
@@ -77,9 +76,9 @@ class GraphPoller:
 
         """
         with self.worker_lock:
-            if not self.full_graph or nx.is_empty(self.full_graph):
+            if nx.is_empty(self.link_graph.graph):
                 return None
-            P = LinkGraph.projectGraph(self.full_graph)
+            P = self.link_graph.projected.copy()
         return P
 
     def start_worker(self) -> None:
@@ -113,53 +112,32 @@ class GraphPoller:
             ts_str = datetime.fromtimestamp(ts / 1000.0)
             date_range = [["gt", f"{ts_str}"]]
 
-        results = self.qObj.do_query(
-            timeout=self.args.timeout,
-            date_range=date_range,
-            method=self.args.method,
-            range_name=self.args.range,
-        )
-        if results:
-            links = self.qObj.extract_link_records(results)
-        else:
+        try:
+            links = list(
+                self.qObj.stream_link_records(
+                    date_range=date_range,
+                    method=self.args.method,
+                    range_name=self.args.range,
+                )
+            )
+        except ElasticsearchException as err:
+            print(f"Search error: {err}")
             links = []
         linkdf = pd.DataFrame(links)
         if not linkdf.empty:
             linkdf.sort_values(by=["startTimeMillis"], inplace=True)
         return linkdf
 
-    def _extract_graph(self, linkdf: pd.DataFrame) -> Tuple[nx.MultiDiGraph, list, int]:
+    def _refresh_graph(self, ts: int = None) -> int:
         """
         Purpose:
-            Extract a graph representation from the provided dataframe
-
-        Args:
-            linkdf: a dataframe containing link information
-
-        Returns:
-            A tuple containing the graph, a list of links that were removed,
-            and the timestamp for the last record in the dataframe used to
-            generate the graph.
-        """
-        # Convert returned records to a graph using link information
-        if linkdf.empty:
-            return (None, None, None)
-        G, removed_links = LinkGraph.linksToGraph(linkdf, method=self.args.method)
-        last_ts = linkdf["startTimeMillis"].iloc[-1]
-        return (G, removed_links, last_ts)
-
-    def _refresh_graph(self, ts: int = None) -> Tuple[nx.MultiDiGraph, list, int]:
-        """
-        Purpose:
-            Construct a graph based after refreshing link information
+            Apply new link information to the graph
 
         Args:
             ts: the timestamp beyond which to fetch results
 
         Returns:
-            A tuple containing the graph, a list of links that were removed,
-            and the timestamp for the last record in the dataframe used to
-            generate the graph.
+            The timestamp for the last record applied to the graph
         """
         if self.args.from_csv:
             with open(self.args.from_csv) as fp:
@@ -171,20 +149,13 @@ class GraphPoller:
         if linkdf.empty:
             # return the current timestamp since we want to preserve what is
             # latest
-            return (None, None, ts)
-        return self._extract_graph(linkdf)
+            return ts
 
-    def _get_filtered_graph(self, G: nx.MultiDiGraph) -> nx.MultiDiGraph:
-        """
-        Purpose:
-            Filter attacked nodes from the provided graph and return a new
-            graph
-        """
+        # Only the new records are applied, so this is proportional to the
+        # number of new records rather than the size of the graph
         with self.worker_lock:
-            for n in self.attacked:
-                if n in G:
-                    G.remove_node(n)
-        return G
+            self.link_graph.applyLinks(linkdf)
+        return linkdf["startTimeMillis"].iloc[-1]
 
     def update_attacked(
         self, node: str, new_suspects: List[str], plot_name: str
@@ -202,25 +173,17 @@ class GraphPoller:
             The updated graph.
         """
 
-        with self.worker_lock:
-            newG = self.full_graph.copy()
-        newG = self._get_filtered_graph(newG)
-
         # First display the attack progression if needed
-        P = LinkGraph.projectGraph(newG)
         if self.args.save_plot_dir or self.args.show_plot:
+            with self.worker_lock:
+                P = self.link_graph.projected.copy()
             AgentHelper.draw_agent_graph(self.args, P, node, new_suspects, plot_name)
 
-        # Next update the current graph representation
-        with self.worker_lock:
-            self.attacked.add(node)
-        newG.remove_node(node)
-        P = LinkGraph.projectGraph(newG)
-
-        json_data = nx.json_graph.node_link_data(newG)
-        curr_serialized = LinkGraphSerializer.get_serialized(json_data)
+        # Next update the current graph representation, which the worker will
+        # pick up from the graph version
         with self.worker_lock:
-            self.serialized_graph = curr_serialized
+            self.link_graph.excludeNode(node)
+            P = self.link_graph.projected.copy()
 
         return P
 
@@ -229,22 +192,17 @@ class GraphPoller:
         Purpose:
             Main worker loop for the poller
         """
-        prev_cmp = None
+        prev_version = None
         last_ts = self.initial_ts
         while True:
+            # If the graph has changed, persist or send along its projection
             with self.worker_lock:
-                full_graph = self.full_graph.copy()
-
-            # Get a serialized representation of the current graph
-            curr_graph = self._get_filtered_graph(full_graph)
-            json_data = nx.json_graph.node_link_data(curr_graph)
-            curr_cmp = LinkGraphSerializer.get_serialized(json_data)
-
-            # If serialized representation has changed, persist or send it along
-            if not prev_cmp or curr_cmp != prev_cmp:
-                prev_cmp = curr_cmp
-                # Serialize the projected graph
-                P = LinkGraph.projectGraph(curr_graph)
+                if self.link_graph.version != prev_version:
+                    prev_version = self.link_graph.version
+                    P = self.link_graph.projected.copy()
+                else:
+                    P = None
+            if P is not None:
                 LinkGraphSerializer.serialize_graph(
                     P, self.args.json_file, self.args.render_endpoint
                 )
@@ -260,27 +218,7 @@ class GraphPoller:
 
             # refresh the graph if needed
             if self.args.refresh > 0:
-                (
-                    new_graph,
-                    removed_links,
-                    last_ts,
-                ) = self._refresh_graph(ts=last_ts)
-
-                with self.worker_lock:
-                    if new_graph:
-                        for (u, v, d) in LinkGraph.get_all_edges(new_graph):
-                            if (u, v) in self.full_graph.edges():
-                                self.full_graph[u][v]["conn"] += d["conn"]
-                            else:
-                                self.full_graph.add_edge(u, v, **d)
-                            # Remove the link if there are no active connections
-                            if self.full_graph[u][v]["conn"] <= 0:
-                                removed_links.append((u, v))
-
-                    if removed_links:
-                        for (u, v) in removed_links:
-                            if (u, v) in self.full_graph.edges():
-                                self.full_graph.remove_edge(u, v)
+                last_ts = self._refresh_graph(ts=last_ts)
 
 
 class AgentHelper: